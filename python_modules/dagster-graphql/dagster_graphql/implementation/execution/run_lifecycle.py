@@ -2,7 +2,7 @@
 
 from dagster import check
 from dagster.core.execution.plan.resume_retry import get_retry_steps_from_parent_run
-from dagster.core.execution.plan.state import KnownExecutionState
+from dagster.core.execution.plan.state import KNOWN_STATE_EVENT_TYPES, KnownExecutionState
 from dagster.core.storage.pipeline_run import PipelineRunStatus
 from dagster.core.storage.tags import RESUME_RETRY_TAG
 from dagster.core.utils import make_new_run_id
@@ -28,7 +28,10 @@ def compute_step_keys_to_execute(graphene_info, execution_params):
         known_state = None
         if execution_params.execution_metadata.parent_run_id and execution_params.step_keys:
             known_state = KnownExecutionState.for_reexecution(
-                instance.all_logs(execution_params.execution_metadata.parent_run_id),
+                instance.all_logs(
+                    execution_params.execution_metadata.parent_run_id,
+                    of_type=KNOWN_STATE_EVENT_TYPES,
+                ),
                 execution_params.step_keys,
             )
 
@@ -140,6 +140,7 @@
     solid,
     static_partitioned_config,
     success_hook,
+    threaded_executor,
     weekly_partitioned_config,
     weekly_schedule,
 )
@@ -226,6 +227,7 @@
     RootInputManagerDefinition,
     root_input_manager,
 )
+from dagster.core.storage.shared_memory_io_manager import shared_memory_io_manager
 from dagster.core.storage.tags import MEMOIZED_RUN_TAG
 from dagster.core.types.config_schema import (
     DagsterTypeLoader,
@@ -478,6 +480,7 @@ def __dir__():
     "in_process_executor",
     "multiprocess_executor",
     "multiple_process_executor_requirements",
+    "threaded_executor",
     "build_reconstructable_job",
     "reconstructable",
     "reexecute_pipeline_iterator",
@@ -614,6 +617,7 @@ def __dir__():
     "fs_io_manager",
     "mem_io_manager",
     "custom_path_fs_io_manager",
+    "shared_memory_io_manager",
     # warnings
     "ExperimentalWarning",
     # Versioning / Memoization
@@ -1,23 +1,119 @@
-from typing import TYPE_CHECKING, Mapping
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Mapping, Optional, Tuple
 
 from dagster import check
 from dagster.core.host_representation.external_data import ExternalRepositoryData
 from dagster.serdes import deserialize_as
+from dagster.serdes.utils import hash_str
 
 if TYPE_CHECKING:
     from dagster.core.host_representation import RepositoryLocation
     from dagster.grpc.client import DagsterGrpcClient
 
+# The repository data most recently downloaded for each repository of each location, along with
+# the hash of its serialized form that the server reports when listing repositories, and the size
+# of its serialized form. Only the latest data of each repository is kept, and the least recently
+# used entries are evicted once the serialized data of all entries adds up to more than
+# MAX_CACHED_EXTERNAL_REPOSITORY_DATA_BYTES.
+MAX_CACHED_EXTERNAL_REPOSITORY_DATA_BYTES = 64 * 1024 * 1024
+_CachedRepositoryData = Tuple[str, ExternalRepositoryData, int]
+_external_repository_data_cache: "OrderedDict[Tuple[str, str], _CachedRepositoryData]" = (
+    OrderedDict()
+)
+_external_repository_data_cache_bytes = 0
+_external_repository_data_cache_lock = threading.Lock()
+
+
+def _get_cached_external_repository_data(
+    location_name: str, repository_name: str, data_hash: str
+) -> Optional[ExternalRepositoryData]:
+    key = (location_name, repository_name)
+    with _external_repository_data_cache_lock:
+        if key not in _external_repository_data_cache:
+            return None
+
+        cached_hash, external_repository_data, _ = _external_repository_data_cache[key]
+        if cached_hash != data_hash:
+            return None
+
+        _external_repository_data_cache.move_to_end(key)
+        return external_repository_data
+
+
+def _cache_external_repository_data(
+    location_name: str,
+    repository_name: str,
+    data_hash: str,
+    external_repository_data: ExternalRepositoryData,
+    serialized_size: int,
+) -> None:
+    global _external_repository_data_cache_bytes  # pylint: disable=global-statement
+
+    key = (location_name, repository_name)
+    with _external_repository_data_cache_lock:
+        if key in _external_repository_data_cache:
+            _external_repository_data_cache_bytes -= _external_repository_data_cache.pop(key)[2]
+
+        if serialized_size > MAX_CACHED_EXTERNAL_REPOSITORY_DATA_BYTES:
+            return
+
+        _external_repository_data_cache[key] = (
+            data_hash,
+            external_repository_data,
+            serialized_size,
+        )
+        _external_repository_data_cache_bytes += serialized_size
+        while _external_repository_data_cache_bytes > MAX_CACHED_EXTERNAL_REPOSITORY_DATA_BYTES:
+            _, (_, _, evicted_size) = _external_repository_data_cache.popitem(last=False)
+            _external_repository_data_cache_bytes -= evicted_size
+
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", repository_location: "RepositoryLocation"
+    api_client: "DagsterGrpcClient",
+    repository_location: "RepositoryLocation",
+    repository_data_hashes: Optional[Mapping[str, str]] = None,
 ) -> Mapping[str, ExternalRepositoryData]:
+    return {
+        repository_name: external_repository_data
+        for repository_name, (
+            external_repository_data,
+            _,
+        ) in sync_get_streaming_external_repositories_data_and_hashes_grpc(
+            api_client, repository_location, repository_data_hashes
+        ).items()
+    }
+
+
+def sync_get_streaming_external_repositories_data_and_hashes_grpc(
+    api_client: "DagsterGrpcClient",
+    repository_location: "RepositoryLocation",
+    repository_data_hashes: Optional[Mapping[str, str]] = None,
+) -> Mapping[str, Tuple[ExternalRepositoryData, str]]:
+    """Like sync_get_streaming_external_repositories_data_grpc, but also returns the hash of the
+    serialized data of each repository, computed the same way as the hashes that the server
+    reports when listing repositories."""
     from dagster.core.host_representation import ExternalRepositoryOrigin, RepositoryLocation
 
     check.inst_param(repository_location, "repository_location", RepositoryLocation)
+    repository_data_hashes = check.opt_dict_param(
+        repository_data_hashes, "repository_data_hashes", key_type=str, value_type=str
+    )
 
     repo_datas = {}
     for repository_name in repository_location.repository_names:  # type: ignore
+        data_hash = repository_data_hashes.get(repository_name)
+        cached_external_repository_data = (
+            _get_cached_external_repository_data(
+                repository_location.name, repository_name, data_hash
+            )
+            if data_hash
+            else None
+        )
+        if cached_external_repository_data:
+            repo_datas[repository_name] = (cached_external_repository_data, data_hash)
+            continue
+
         external_repository_chunks = list(
             api_client.streaming_external_repository(
                 external_repository_origin=ExternalRepositoryOrigin(
@@ -27,15 +123,25 @@ def sync_get_streaming_external_repositories_data_grpc(
             )
         )
 
+        serialized_external_repository_data = "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
+        )
         external_repository_data = deserialize_as(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
+            serialized_external_repository_data,
             ExternalRepositoryData,
         )
 
-        repo_datas[repository_name] = external_repository_data
+        if data_hash:
+            _cache_external_repository_data(
+                repository_location.name,
+                repository_name,
+                data_hash,
+                external_repository_data,
+                len(serialized_external_repository_data),
+            )
+
+        repo_datas[repository_name] = (
+            external_repository_data,
+            data_hash or hash_str(serialized_external_repository_data),
+        )
     return repo_datas
@@ -1,12 +1,15 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List, Union
 
 from dagster import check
 from dagster.core.definitions.schedule_definition import ScheduleExecutionData
 from dagster.core.errors import DagsterUserCodeProcessError
-from dagster.core.host_representation.external_data import ExternalScheduleExecutionErrorData
+from dagster.core.host_representation.external_data import (
+    ExternalScheduleBatchExecutionData,
+    ExternalScheduleExecutionErrorData,
+)
 from dagster.core.host_representation.handle import RepositoryHandle
 from dagster.core.instance import DagsterInstance
-from dagster.grpc.types import ExternalScheduleExecutionArgs
+from dagster.grpc.types import ExternalScheduleBatchExecutionArgs, ExternalScheduleExecutionArgs
 from dagster.serdes import deserialize_as
 from dagster.seven.compat.pendulum import PendulumDateTime
 
@@ -67,3 +70,37 @@ def sync_get_external_schedule_execution_data_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_external_schedule_batch_execution_data_grpc(
+    api_client: "DagsterGrpcClient",
+    instance: DagsterInstance,
+    repository_handle: RepositoryHandle,
+    schedule_name: str,
+    scheduled_execution_times: List[Any],
+) -> List[Union[ScheduleExecutionData, ExternalScheduleExecutionErrorData]]:
+    check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+    check.str_param(schedule_name, "schedule_name")
+    check.list_param(
+        scheduled_execution_times, "scheduled_execution_times", of_type=PendulumDateTime
+    )
+    check.invariant(scheduled_execution_times, "scheduled_execution_times must not be empty")
+
+    origin = repository_handle.get_external_origin()
+    result = deserialize_as(
+        api_client.external_schedule_batch_execution(
+            external_schedule_batch_execution_args=ExternalScheduleBatchExecutionArgs(
+                repository_origin=origin,
+                instance_ref=instance.get_ref(),
+                schedule_name=schedule_name,
+                scheduled_execution_timestamps=[
+                    scheduled_execution_time.timestamp()
+                    for scheduled_execution_time in scheduled_execution_times
+                ],
+                scheduled_execution_timezone=scheduled_execution_times[0].timezone.name,
+            )
+        ),
+        ExternalScheduleBatchExecutionData,
+    )
+
+    return result.results
@@ -41,12 +41,16 @@ def sync_get_external_sensor_execution_data_grpc(
     last_completion_time: Optional[float],
     last_run_key: Optional[str],
     cursor: Optional[str],
+    timeout: Optional[float] = None,
 ) -> SensorExecutionData:
+    from dagster.grpc.client import DEFAULT_GRPC_TIMEOUT
+
     check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
     check.str_param(sensor_name, "sensor_name")
     check.opt_float_param(last_completion_time, "last_completion_time")
     check.opt_str_param(last_run_key, "last_run_key")
     check.opt_str_param(cursor, "cursor")
+    check.opt_numeric_param(timeout, "timeout")
 
     origin = repository_handle.get_external_origin()
 
@@ -59,7 +63,8 @@ def sync_get_external_sensor_execution_data_grpc(
                 last_completion_time=last_completion_time,
                 last_run_key=last_run_key,
                 cursor=cursor,
-            )
+            ),
+            timeout=timeout if timeout else DEFAULT_GRPC_TIMEOUT,
         ),
         (SensorExecutionData, ExternalSensorExecutionErrorData),
     )
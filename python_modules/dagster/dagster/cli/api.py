@@ -13,7 +13,11 @@
 from dagster.core.definitions.reconstructable import ReconstructablePipeline
 from dagster.core.errors import DagsterExecutionInterruptedError
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.api import (
+    create_execution_plan,
+    create_step_execution_plan,
+    execute_plan_iterator,
+)
 from dagster.core.execution.run_cancellation_thread import start_run_cancellation_thread
 from dagster.core.instance import DagsterInstance
 from dagster.core.origin import DEFAULT_DAGSTER_ENTRY_POINT, get_python_environment_entry_point
@@ -352,13 +356,29 @@ def _execute_step_command_body(
             args.pipeline_origin
         ).subset_for_execution_from_existing_pipeline(pipeline_run.solids_to_execute)
 
-        execution_plan = create_execution_plan(
-            recon_pipeline,
-            run_config=pipeline_run.run_config,
-            step_keys_to_execute=args.step_keys_to_execute,
-            mode=pipeline_run.mode,
-            known_state=args.known_state,
-        )
+        if args.step_keys_to_execute is None:
+            execution_plan = create_execution_plan(
+                recon_pipeline,
+                run_config=pipeline_run.run_config,
+                mode=pipeline_run.mode,
+                known_state=args.known_state,
+            )
+        else:
+            # rebuild the plan for just the steps to execute from the snapshot persisted for the run
+            execution_plan_snapshot_id = pipeline_run.execution_plan_snapshot_id
+            execution_plan_snapshot = (
+                instance.get_execution_plan_snapshot(execution_plan_snapshot_id)
+                if execution_plan_snapshot_id
+                else None
+            )
+            execution_plan = create_step_execution_plan(
+                recon_pipeline,
+                pipeline_run,
+                step_keys_to_execute=args.step_keys_to_execute,
+                known_state=args.known_state,
+                execution_plan_snapshot=execution_plan_snapshot,
+                execution_plan_snapshot_id=execution_plan_snapshot_id,
+            )
 
         yield from execute_plan_iterator(
             execution_plan,
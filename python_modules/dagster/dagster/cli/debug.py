@@ -9,6 +9,8 @@
 from dagster.core.storage.pipeline_run import PipelineRunStatus, RunsFilter
 from dagster.serdes import deserialize_as
 
+IMPORT_EVENTS_BATCH_SIZE = 1000
+
 
 def _recent_failed_runs_text(instance):
     lines = []
@@ -86,5 +88,9 @@ def import_command(input_files: Tuple[str, ...]):
             if not instance.has_run(run.run_id):
                 instance.add_run(run)
 
-                for event in tqdm(debug_payload.event_list):
-                    instance.store_event(event)
+                event_list = debug_payload.event_list
+                with tqdm(total=len(event_list)) as progress:
+                    for i in range(0, len(event_list), IMPORT_EVENTS_BATCH_SIZE):
+                        batch = event_list[i : i + IMPORT_EVENTS_BATCH_SIZE]
+                        instance.store_events(batch)
+                        progress.update(len(batch))
@@ -4,6 +4,8 @@
 
 from dagster import check
 from dagster.core.instance import DagsterInstance
+from dagster.core.storage.event_log.retention import EventLogRetentionPolicy
+from dagster.utils import merge_dicts
 
 
 @click.group(name="instance")
@@ -65,3 +67,84 @@ def reindex_command():
         click.echo("$DAGSTER_HOME: {}\n".format(home))
 
         instance.reindex(click.echo)
+
+
+@instance_cli.command(
+    name="compact",
+    help="Purge old event log rows according to a retention policy, by default the one "
+    "configured in the event_log_retention settings of the instance.",
+)
+@click.option(
+    "--max-age-days",
+    type=click.FLOAT,
+    help="Purge the events of runs created more than this many days ago.",
+)
+@click.option(
+    "--run-status",
+    "run_statuses",
+    multiple=True,
+    help="Only purge the events of runs in this status. Can be repeated. Defaults to SUCCESS, "
+    "FAILURE and CANCELED.",
+)
+@click.option(
+    "--event-type",
+    "event_types",
+    multiple=True,
+    help="Only purge events of this type (e.g. LOGS_CAPTURED, ENGINE_EVENT, or STEP_INPUT). Can "
+    "be repeated. Defaults to LOGS_CAPTURED and ENGINE_EVENT.",
+)
+@click.option("--batch-size", type=click.INT, help="Number of rows deleted per transaction.")
+@click.option(
+    "--archive-dir",
+    type=click.Path(file_okay=False),
+    help="Write the purged rows to a gzipped JSON lines file in this directory.",
+)
+def compact_command(max_age_days, run_statuses, event_types, batch_size, archive_dir):
+    with DagsterInstance.get() as instance:
+        if instance.is_ephemeral:
+            click.echo(
+                "$DAGSTER_HOME is not set; ephemeral instances cannot be compacted.  If you "
+                "intended to compact a persistent instance, please ensure that $DAGSTER_HOME is "
+                "set accordingly."
+            )
+            return
+
+        if not instance.event_log_storage.supports_event_retention:
+            click.echo(
+                "The event log storage of the instance does not support event log retention, so "
+                "its events cannot be compacted."
+            )
+            return
+
+        settings = merge_dicts(
+            instance.event_log_retention_settings,
+            {
+                key: value
+                for key, value in {
+                    "max_age_days": max_age_days,
+                    "run_statuses": list(run_statuses) or None,
+                    "event_types": list(event_types) or None,
+                    "batch_size": batch_size,
+                    "archive_dir": archive_dir,
+                }.items()
+                if value is not None
+            },
+        )
+        if "max_age_days" not in settings:
+            raise click.UsageError(
+                "--max-age-days must be set when no event_log_retention settings are configured "
+                "for the instance."
+            )
+
+        click.echo("$DAGSTER_HOME: {}\n".format(os.environ.get("DAGSTER_HOME")))
+
+        result = instance.compact_event_logs(
+            EventLogRetentionPolicy.from_settings(settings), print_fn=click.echo
+        )
+
+        click.echo(
+            f"Purged {result.rows_purged} event log rows from {result.runs_scanned} runs in "
+            f"{result.elapsed_seconds:.2f} seconds."
+        )
+        if result.archive_path:
+            click.echo(f"Archived purged rows to {result.archive_path}")
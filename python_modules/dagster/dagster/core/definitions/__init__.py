@@ -51,6 +51,7 @@
     in_process_executor,
     multiple_process_executor_requirements,
     multiprocess_executor,
+    threaded_executor,
 )
 from .graph_definition import GraphDefinition
 from .hook_definition import HookDefinition
@@ -3,7 +3,7 @@
 from typing import Any, Dict, Optional
 
 from dagster import check
-from dagster.builtins import Int
+from dagster.builtins import Bool, Int
 from dagster.config import Field, Selector
 from dagster.core.definitions.configurable import (
     ConfiguredDefinitionConfigSchema,
@@ -12,6 +12,8 @@
 from dagster.core.definitions.reconstructable import ReconstructablePipeline
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
 from dagster.core.execution.retries import RetryMode, get_retries_config
+from dagster.core.execution.step_ordering import StepOrdering, get_step_ordering_config
+from dagster.core.execution.tag_concurrency_limits import get_tag_concurrency_limits_config_type
 
 from .definition_config_schema import convert_user_facing_definition_config_schema
 
@@ -206,12 +208,36 @@ def _core_in_process_executor_creation(config: Dict[str, Any]):
         # shouldn't need to .get() here - issue with defaults in config setup
         retries=RetryMode.from_config(config["retries"]),
         marker_to_close=config.get("marker_to_close"),
+        release_outputs=config.get("release_outputs", False),
+        async_max_concurrent=config["asyncio"]["max_concurrent"] if "asyncio" in config else None,
     )
 
 
 IN_PROC_CONFIG = {
     "retries": get_retries_config(),
     "marker_to_close": Field(str, is_required=False),
+    "release_outputs": Field(
+        Bool,
+        is_required=False,
+        default_value=False,
+        description="Whether the IO managers release each step output once every step that "
+        "loads it has succeeded, to bound the memory and disk used by long runs. Outputs of steps "
+        "that failed are kept, so the run can be re-executed from failure.",
+    ),
+    "asyncio": Field(
+        {
+            "max_concurrent": Field(
+                Int,
+                is_required=False,
+                default_value=100,
+                description="The maximum number of steps with async compute functions that are "
+                "executed concurrently.",
+            ),
+        },
+        is_required=False,
+        description="Execute the steps of solids with async compute functions concurrently, on a "
+        "single event loop.",
+    ),
 }
 
 
@@ -233,6 +259,31 @@ def in_process_executor(init_context):
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    By default, every step output is kept by its IO manager for the whole run. To bound the memory
+    and disk used by long runs, outputs can instead be released by their IO manager once every step
+    that loads them has succeeded:
+
+    .. code-block:: yaml
+
+        execution:
+          in_process:
+            config:
+              release_outputs: true
+
+    Steps of ops whose compute function is an ``async def`` function or an async generator are
+    executed one at a time by default. With ``asyncio``, they are instead scheduled on a single
+    event loop, and up to ``max_concurrent`` of them are executed concurrently as their upstream
+    steps complete. Their events are still logged in the order in which each step emits them, but
+    their stdout and stderr are not captured separately for each step.
+
+    .. code-block:: yaml
+
+        execution:
+          in_process:
+            config:
+              asyncio:
+                max_concurrent: 20
     """
     return _core_in_process_executor_creation(init_context.executor_config)
 
@@ -263,11 +314,22 @@ def _core_multiprocess_executor_creation(config: Dict[str, Any]):
     if start_selector:
         start_method, start_cfg = list(start_selector.items())[0]
 
+    reuse_processes = False
+    reuse_cfg = {}
+    reuse_selector = config.get("reuse_processes")
+    if reuse_selector:
+        reuse_mode, reuse_cfg = list(reuse_selector.items())[0]
+        reuse_processes = reuse_mode == "enabled"
+
     return MultiprocessExecutor(
         max_concurrent=config["max_concurrent"],
         retries=RetryMode.from_config(config["retries"]),
         start_method=start_method,
         explicit_forkserver_preload=start_cfg.get("preload_modules"),
+        reuse_processes=reuse_processes,
+        max_steps_per_process=reuse_cfg.get("max_steps_per_process"),
+        max_process_memory_mb=reuse_cfg.get("max_process_memory_mb"),
+        step_ordering=StepOrdering.from_config(config.get("step_ordering")),
     )
 
 
@@ -298,6 +360,34 @@ def _core_multiprocess_executor_creation(config: Dict[str, Any]):
         ),
     ),
     "retries": get_retries_config(),
+    "reuse_processes": Field(
+        Selector(
+            {
+                "enabled": {
+                    "max_steps_per_process": Field(
+                        Int,
+                        is_required=False,
+                        description="Replace a worker process after it has executed this many "
+                        "steps.",
+                    ),
+                    "max_process_memory_mb": Field(
+                        Int,
+                        is_required=False,
+                        description="Replace a worker process once its peak resident set size "
+                        "exceeds this many megabytes.",
+                    ),
+                },
+                "disabled": {},
+            }
+        ),
+        is_required=False,
+        description=(
+            "Whether steps are executed by a pool of long-lived worker processes, which load the "
+            "job and the instance once per run, instead of in a new process per step. Defaults "
+            "to disabled."
+        ),
+    ),
+    "step_ordering": get_step_ordering_config(),
 }
 
 
@@ -324,13 +414,109 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    By default, each step is executed in a new process. To amortize the cost of starting a process,
+    loading the job and the instance across steps, steps can instead be executed by a pool of
+    long-lived worker processes, which can be replaced after executing a number of steps or once
+    they use too much memory:
+
+    .. code-block:: yaml
+
+        execution:
+          multiprocess:
+            config:
+              reuse_processes:
+                enabled:
+                  max_steps_per_process: 100
+                  max_process_memory_mb: 1024
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    Steps with the same priority can also be ordered by the longest path from each step to the end
+    of the job, weighted by the durations of the steps in the most recent successful runs of the
+    job, so that long chains of steps are started before cheap independent steps:
+
+    .. code-block:: yaml
+
+        execution:
+          multiprocess:
+            config:
+              step_ordering:
+                critical_path:
+                  history_run_limit: 5
     """
     return _core_multiprocess_executor_creation(init_context.executor_config)
 
 
+def _core_threaded_executor_creation(config: Dict[str, Any]):
+    from dagster.core.executor.threaded import ThreadedExecutor
+
+    return ThreadedExecutor(
+        retries=RetryMode.from_config(config["retries"]),
+        max_concurrent=config["max_concurrent"],
+        tag_concurrency_limits=config.get("tag_concurrency_limits"),
+        step_ordering=StepOrdering.from_config(config.get("step_ordering")),
+    )
+
+
+THREADED_CONFIG = {
+    "max_concurrent": Field(Int, is_required=False, default_value=0),
+    "retries": get_retries_config(),
+    "tag_concurrency_limits": Field(
+        get_tag_concurrency_limits_config_type(),
+        is_required=False,
+        description="A set of limits that are applied to steps with particular tags. "
+        "If a value is set, the limit is applied to only that key-value pair. "
+        "If no value is set, the limit is applied across all values of that key. "
+        "If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit "
+        "will apply to the number of unique values for that key.",
+    ),
+    "step_ordering": get_step_ordering_config(),
+}
+
+
+@executor(
+    name="threaded",
+    config_schema=THREADED_CONFIG,
+)
+def threaded_executor(init_context):
+    """The threaded executor executes each step in a thread of the run process.
+
+    Steps share the resources and the memory of the process, so outputs are handed from step to
+    step without being serialized, when using the default IO manager. Since Python code holds the
+    global interpreter lock, steps only execute in parallel while they spend their time in code
+    that releases it, like NumPy, pyarrow or database drivers. To configure the threaded executor,
+    include a fragment such as the following in your config:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            max_concurrent: 8
+            tag_concurrency_limits:
+              - key: database
+                value: warehouse
+                limit: 2
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many steps may run
+    concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
+    :py:func:`python:multiprocessing.cpu_count`. ``tag_concurrency_limits`` further limits the
+    number of steps with particular tags that run at once.
+
+    Steps of ops with ``async def`` compute functions or async generators are scheduled on a single
+    event loop. The compute logs of each step capture what it writes to ``sys.stdout`` and
+    ``sys.stderr``, but not what subprocesses or extensions write directly to the file descriptors
+    of the process. When the run is interrupted, no further steps are started and the coroutines of
+    running async steps are cancelled, while the other running steps are left to finish, since
+    threads can not be interrupted.
+
+    Execution priority and step ordering can be configured as for the
+    :py:func:`multiprocess_executor`.
+    """
+    return _core_threaded_executor_creation(init_context.executor_config)
+
+
 default_executors = [in_process_executor, multiprocess_executor]
 
 
@@ -1046,6 +1046,10 @@ def name(self) -> str:
     def description(self) -> Optional[str]:
         return self._description
 
+    @property
+    def repository_data(self) -> RepositoryData:
+        return self._repository_data
+
     @property
     def pipeline_names(self) -> List[str]:
         """List[str]: Names of all pipelines/jobs in the repository"""
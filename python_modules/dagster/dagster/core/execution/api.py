@@ -6,16 +6,26 @@
 from dagster.core.definitions import IPipeline, JobDefinition, PipelineDefinition
 from dagster.core.definitions.pipeline_base import InMemoryPipeline
 from dagster.core.definitions.pipeline_definition import PipelineSubsetDefinition
-from dagster.core.errors import DagsterExecutionInterruptedError, DagsterInvariantViolationError
+from dagster.core.errors import (
+    DagsterExecutionInterruptedError,
+    DagsterExecutionStepNotFoundError,
+    DagsterInvariantViolationError,
+)
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.context.system import PlanOrchestrationContext
 from dagster.core.execution.plan.execute_plan import inner_plan_execution_iterator
 from dagster.core.execution.plan.outputs import StepOutputHandle
 from dagster.core.execution.plan.plan import ExecutionPlan
-from dagster.core.execution.plan.state import KnownExecutionState
+from dagster.core.execution.plan.state import KNOWN_STATE_EVENT_TYPES, KnownExecutionState
+from dagster.core.execution.resources_init import (
+    get_transitive_required_resource_keys,
+    resource_initialization_manager,
+)
 from dagster.core.execution.retries import RetryMode
 from dagster.core.instance import DagsterInstance, InstanceRef
 from dagster.core.selector import parse_step_selection
+from dagster.core.snap import ExecutionPlanSnapshot
+from dagster.core.storage.io_manager import IOManager, IOManagerDefinition
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 from dagster.core.system_config.objects import ResolvedRunConfig
 from dagster.core.telemetry import log_repo_stats, telemetry_wrapper
@@ -762,6 +772,55 @@ def create_execution_plan(
     )
 
 
+def create_step_execution_plan(
+    pipeline: IPipeline,
+    pipeline_run: PipelineRun,
+    step_keys_to_execute: List[str],
+    known_state: Optional[KnownExecutionState] = None,
+    execution_plan_snapshot: Optional[ExecutionPlanSnapshot] = None,
+    execution_plan_snapshot_id: Optional[str] = None,
+) -> ExecutionPlan:
+    """Creates the execution plan used to execute some of the steps of a run that is in progress,
+    e.g. in a step subprocess.
+
+    If the given snapshot is the one persisted for the run, the plan is rebuilt from it, which
+    skips resolving the run config and building the plan from the pipeline definition. Otherwise,
+    the plan is created from scratch.
+    """
+    pipeline = _check_pipeline(pipeline)
+    check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+    check.list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+    check.opt_inst_param(known_state, "known_state", KnownExecutionState)
+    check.opt_inst_param(execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot)
+    check.opt_str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
+
+    if (
+        execution_plan_snapshot
+        and execution_plan_snapshot.can_reconstruct_plan
+        and pipeline_run.execution_plan_snapshot_id
+        and execution_plan_snapshot_id == pipeline_run.execution_plan_snapshot_id
+    ):
+        try:
+            return ExecutionPlan.rebuild_from_snapshot(
+                pipeline_run.pipeline_name,
+                execution_plan_snapshot,
+                step_keys_to_execute=step_keys_to_execute,
+                known_state=known_state,
+            )
+        except DagsterExecutionStepNotFoundError:
+            # the steps are not part of the plan persisted for the run, e.g. if they were selected
+            # by a call to execute_plan, so fall back to building the plan
+            pass
+
+    return create_execution_plan(
+        pipeline,
+        run_config=pipeline_run.run_config,
+        mode=pipeline_run.mode,
+        step_keys_to_execute=step_keys_to_execute,
+        known_state=known_state,
+    )
+
+
 def pipeline_execution_iterator(
     pipeline_context: PlanOrchestrationContext, execution_plan: ExecutionPlan
 ) -> Iterator[DagsterEvent]:
@@ -841,11 +900,60 @@ def pipeline_execution_iterator(
                 "Steps failed: {}.".format(failed_steps),
             )
         else:
+            try:
+                _cleanup_io_managers_for_run(pipeline_context)
+            except Exception:  # pylint: disable=broad-except
+                pipeline_context.log.warning(
+                    "Failed to clean up the outputs of the run: {}".format(
+                        serializable_error_info_from_exc_info(sys.exc_info()).to_string()
+                    )
+                )
             event = DagsterEvent.pipeline_success(pipeline_context)
         if not generator_closed:
             yield event
 
 
+def _cleanup_io_managers_for_run(pipeline_context: PlanOrchestrationContext):
+    """Let the IO manager resources of a run that succeeded, which opt in through their definition,
+    clean up the outputs they stored. Other resources are not initialized.
+    """
+    pipeline_def = pipeline_context.pipeline.get_definition()
+    pipeline_run = pipeline_context.pipeline_run
+    resource_defs = pipeline_def.get_mode_definition(pipeline_run.mode).resource_defs
+
+    io_manager_keys = {
+        resource_key
+        for resource_key, resource_def in resource_defs.items()
+        if isinstance(resource_def, IOManagerDefinition) and resource_def.cleans_up_runs
+    }
+    if not io_manager_keys:
+        return
+
+    resolved_run_config = ResolvedRunConfig.build(
+        pipeline_def, pipeline_run.run_config, mode=pipeline_run.mode
+    )
+    resources_manager = resource_initialization_manager(
+        resource_defs=resource_defs,
+        resource_configs=resolved_run_config.resources,
+        log_manager=pipeline_context.log,
+        execution_plan=None,
+        pipeline_run=pipeline_run,
+        resource_keys_to_init=get_transitive_required_resource_keys(io_manager_keys, resource_defs),
+        instance=pipeline_context.instance,
+        emit_persistent_events=False,
+        pipeline_def_for_backwards_compat=None,
+    )
+    list(resources_manager.generate_setup_events())
+    try:
+        resources = resources_manager.get_object().resource_instance_dict
+        for resource_key in sorted(io_manager_keys):
+            io_manager = resources.get(resource_key)
+            if isinstance(io_manager, IOManager):
+                io_manager.cleanup_run(pipeline_run.run_id)
+    finally:
+        list(resources_manager.generate_teardown_events())
+
+
 class ExecuteRunWithPlanIterable:
     """Utility class to consolidate execution logic.
 
@@ -1008,7 +1116,7 @@ def _resolve_reexecute_step_selection(
     if parent_pipeline_run.solid_selection:
         pipeline = pipeline.subset_for_execution(parent_pipeline_run.solid_selection)
 
-    parent_logs = instance.all_logs(parent_pipeline_run.run_id)
+    parent_logs = instance.all_logs(parent_pipeline_run.run_id, of_type=KNOWN_STATE_EVENT_TYPES)
     parent_plan = create_execution_plan(
         pipeline,
         parent_pipeline_run.run_config,
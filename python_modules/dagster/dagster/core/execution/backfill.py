@@ -3,7 +3,7 @@
 
 from dagster import check
 from dagster.core.execution.plan.resume_retry import get_retry_steps_from_parent_run
-from dagster.core.execution.plan.state import KnownExecutionState
+from dagster.core.execution.plan.state import KNOWN_STATE_EVENT_TYPES, KnownExecutionState
 from dagster.core.host_representation import (
     ExternalPartitionSet,
     ExternalPipeline,
@@ -244,7 +244,7 @@ def create_backfill_run(
         step_keys_to_execute = backfill_job.reexecution_steps
         if last_run and last_run.status == PipelineRunStatus.SUCCESS:
             known_state = KnownExecutionState.for_reexecution(
-                instance.all_logs(parent_run_id),
+                instance.all_logs(parent_run_id, of_type=KNOWN_STATE_EVENT_TYPES),
                 step_keys_to_execute,
             )
         else:
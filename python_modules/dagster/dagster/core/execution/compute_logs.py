@@ -1,3 +1,4 @@
+import contextvars
 import io
 import os
 import subprocess
@@ -31,6 +32,108 @@ def mirror_stream_to_file(stream, filepath):
             yield pids
 
 
+class _TeeStream:
+    """Writes to a file, mirroring what is written to another stream"""
+
+    def __init__(self, file_stream, stream):
+        self._file_stream = file_stream
+        self._stream = stream
+
+    def write(self, data):
+        self._stream.write(data)
+        return self._file_stream.write(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        self._stream.flush()
+        self._file_stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+# where the current thread mirrors what it writes to sys.stdout and sys.stderr. Context variables
+# are copied to the tasks that a thread schedules on an event loop, so the output of coroutines is
+# mirrored along with the rest of the output of the thread that scheduled them
+_stdout_mirror: contextvars.ContextVar = contextvars.ContextVar("stdout_mirror", default=None)
+_stderr_mirror: contextvars.ContextVar = contextvars.ContextVar("stderr_mirror", default=None)
+
+
+class _ThreadStreamRouter:
+    """Stands in for sys.stdout or sys.stderr, sending what each thread writes to the stream set
+    for that thread, if any, and to the original stream otherwise"""
+
+    def __init__(self, stream, mirror):
+        self._stream = stream
+        self._mirror = mirror
+
+    @property
+    def _current(self):
+        return self._mirror.get() or self._stream
+
+    @contextmanager
+    def mirror_thread_to_file(self, file_stream):
+        token = self._mirror.set(_TeeStream(file_stream, self._stream))
+        try:
+            yield
+        finally:
+            self._mirror.reset(token)
+
+    def write(self, data):
+        return self._current.write(data)
+
+    def writelines(self, lines):
+        return self._current.writelines(lines)
+
+    def flush(self):
+        return self._current.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._current, name)
+
+
+@contextmanager
+def route_thread_streams():
+    """Replaces sys.stdout and sys.stderr so that threads can each capture what they write to them,
+    see mirror_thread_streams_to_files."""
+    if isinstance(sys.stdout, _ThreadStreamRouter) and isinstance(sys.stderr, _ThreadStreamRouter):
+        yield
+        return
+
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = _ThreadStreamRouter(stdout, _stdout_mirror)
+    sys.stderr = _ThreadStreamRouter(stderr, _stderr_mirror)
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
+@contextmanager
+def mirror_thread_streams_to_files(stdout_path, stderr_path):
+    """Mirrors what the current thread writes to sys.stdout and sys.stderr to files, while they are
+    routed with route_thread_streams. Unlike mirror_stream_to_file, output written to the file
+    descriptors of the process, for instance by subprocesses, is not captured."""
+    ensure_file(stdout_path)
+    ensure_file(stderr_path)
+
+    if not isinstance(sys.stdout, _ThreadStreamRouter) or not isinstance(
+        sys.stderr, _ThreadStreamRouter
+    ):
+        yield
+        return
+
+    stdout, stderr = sys.stdout, sys.stderr
+    with open(stdout_path, "a+", buffering=1) as stdout_file, open(
+        stderr_path, "a+", buffering=1
+    ) as stderr_file:
+        with stdout.mirror_thread_to_file(stdout_file), stderr.mirror_thread_to_file(stderr_file):
+            yield
+
+
 def should_disable_io_stream_redirect():
     # See https://stackoverflow.com/a/52377087
     # https://www.python.org/dev/peps/pep-0528/
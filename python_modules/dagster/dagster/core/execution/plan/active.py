@@ -1,7 +1,11 @@
+import heapq
+import itertools
 import time
-from typing import Callable, Dict, Iterator, List, Optional, Set, cast
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, cast
 
 from dagster import check
+from dagster.core.definitions.dependency import NodeHandle
 from dagster.core.errors import (
     DagsterExecutionInterruptedError,
     DagsterInvariantViolationError,
@@ -11,18 +15,17 @@
 from dagster.core.execution.context.system import PlanOrchestrationContext
 from dagster.core.execution.plan.state import KnownExecutionState, StepOutputVersionData
 from dagster.core.execution.retries import RetryMode, RetryState
-from dagster.core.storage.tags import PRIORITY_TAG
+from dagster.core.execution.step_ordering import priority_sort_key
+from dagster.core.execution.tag_concurrency_limits import TagConcurrencyLimitsCounter
 from dagster.utils.interrupts import pop_captured_interrupt
 
+from .handle import StepHandle
+from .inputs import StepInput
 from .outputs import StepOutputData, StepOutputHandle
 from .plan import ExecutionPlan
 from .step import ExecutionStep
 
 
-def _default_sort_key(step: ExecutionStep) -> float:
-    return int(step.tags.get(PRIORITY_TAG, 0)) * -1
-
-
 class ActiveExecution:
     """State machine used to track progress through execution of an ExecutionPlan"""
 
@@ -33,6 +36,8 @@ def __init__(
         retry_state: RetryState,
         sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
         step_output_versions: Optional[List[StepOutputVersionData]] = None,
+        release_outputs: bool = False,
+        tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
     ):
         self._plan: ExecutionPlan = check.inst_param(
             execution_plan, "execution_plan", ExecutionPlan
@@ -45,20 +50,41 @@ def __init__(
                 sort_key_fn,
                 "sort_key_fn",
             )
-            or _default_sort_key
+            or priority_sort_key
         )
 
         self._step_output_versions = check.opt_list_param(
             step_output_versions, "step_output_versions", of_type=StepOutputVersionData
         )
 
+        # limits on the number of steps with particular tags that are in flight at once
+        self._tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, "tag_concurrency_limits", of_type=dict
+        )
+
         self._context_guard: bool = False  # Prevent accidental direct use
 
         # We decide what steps to skip based on what outputs are yielded by upstream steps
         self._step_outputs: Set[StepOutputHandle] = set()
 
-        # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = self._plan.get_executable_step_deps()
+        # All steps to be executed start out here in _pending, see _add_pending
+        self._pending: Dict[str, Set[str]] = {}
+
+        # The dependencies of every step that has been added to _pending
+        self._step_deps: Dict[str, Set[str]] = {}
+
+        # Instead of checking every pending step on each _update call, each pending step tracks
+        # the number of its upstream steps that have not yet succeeded or been skipped, and each
+        # upstream step tracks the pending steps waiting on it. Pending steps that can make
+        # progress, because all of their upstream steps succeeded or were skipped or because one
+        # of them failed or was abandoned, move to _ready and are checked on the next _update call.
+        self._unmet_dep_counts: Dict[str, int] = {}
+        self._waiting_steps: Dict[str, Set[str]] = defaultdict(set)
+        self._ready: Set[str] = set()
+
+        # preserves the order in which steps were added to _pending, for deterministic scheduling
+        self._pending_order: Dict[str, int] = {}
+        self._sequence = itertools.count()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -69,8 +95,9 @@ def __init__(
         )
         self._new_dynamic_mappings: bool = False
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # steps move in to these buckets as a result of _update calls. _executable is a heap
+        # ordered by the sort key of each step, then by the order it became executable in
+        self._executable: List[Tuple[float, int, str]] = []
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -90,7 +117,24 @@ def __init__(
 
         self._interrupted: bool = False
 
+        # When releasing outputs, every step output consumed by a step in the plan tracks the
+        # steps that have yet to succeed consuming it. Once they all have, and no unresolved step
+        # might still consume it, the output moves to _pending_release, see get_outputs_to_release
+        self._release_outputs: bool = check.bool_param(release_outputs, "release_outputs")
+        self._output_consumers: Dict[StepOutputHandle, Set[str]] = {}
+        self._unresolved_dep_solids: Set[NodeHandle] = (
+            self._get_unresolved_dep_solids() if self._release_outputs else set()
+        )
+        # outputs consumed by steps that are not part of this execution, like the unselected
+        # steps of a step subset, are kept so that those steps can be executed later
+        self._outputs_consumed_outside_plan: Set[Tuple[str, str]] = (
+            self._get_outputs_consumed_outside_plan() if self._release_outputs else set()
+        )
+        self._pending_release: List[StepOutputHandle] = []
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
         self._update()
 
     def __enter__(self):
@@ -106,7 +150,10 @@ def __exit__(self, exc_type, exc_value, traceback):
 
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                self._executable_keys()
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             state_str = "{pending_str}{in_flight_str}{action_str}{retry_str}".format(
                 in_flight_str="\nSteps still in flight: {}".format(self._in_flight)
@@ -147,68 +194,177 @@ def __exit__(self, exc_type, exc_value, traceback):
                     )
                 )
 
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._step_deps[step_key] = deps
+        self._pending_order[step_key] = next(self._sequence)
+
+        unmet_deps = 0
+        can_progress = False
+        for dep in deps:
+            if dep in self._success or dep in self._skipped:
+                continue
+            if dep in self._failed or dep in self._abandoned:
+                can_progress = True
+                continue
+
+            unmet_deps += 1
+            self._waiting_steps[dep].add(step_key)
+
+        self._unmet_dep_counts[step_key] = unmet_deps
+        if can_progress or unmet_deps == 0:
+            self._ready.add(step_key)
+
+        if self._release_outputs:
+            for step_input in self.get_step_by_key(step_key).step_inputs:
+                for source_handle in step_input.get_step_output_handle_dependencies():
+                    self._output_consumers.setdefault(source_handle, set()).add(step_key)
+
+    def _notify_waiting_steps(self, step_key: str, succeeded: bool) -> None:
+        """Updates the pending steps downstream of a step that reached a terminal state"""
+        for waiting_key in self._waiting_steps.pop(step_key, set()):
+            if waiting_key not in self._pending:
+                continue
+
+            if succeeded:
+                self._unmet_dep_counts[waiting_key] -= 1
+                if self._unmet_dep_counts[waiting_key] == 0:
+                    self._ready.add(waiting_key)
+            else:
+                self._ready.add(waiting_key)
+
+    def _get_unresolved_dep_solids(self) -> Set[NodeHandle]:
+        """The solids whose outputs steps that have yet to be resolved from dynamic outputs
+        depend on
+        """
+        step_handles_to_execute = set(self._plan.step_handles_to_execute)
+        dep_solids = set()
+        for unresolved_step_handles in self._plan.resolvable_map.values():
+            for unresolved_step_handle in unresolved_step_handles:
+                if unresolved_step_handle not in step_handles_to_execute:
+                    continue
+
+                unresolved_step = self._plan.get_step(unresolved_step_handle)
+                for dep_key in unresolved_step.get_all_dependency_keys():
+                    dep_solids.add(StepHandle.parse_from_key(dep_key).solid_handle)
+
+        return dep_solids
+
+    def _get_outputs_consumed_outside_plan(self) -> Set[Tuple[str, str]]:
+        """The step keys and output names of the outputs that steps in the plan which are not
+        executed depend on
+        """
+        step_handles_to_execute = set(self._plan.step_handles_to_execute)
+        outputs = set()
+        for step in self._plan.steps:
+            if step.handle in step_handles_to_execute:
+                continue
+
+            for step_input in step.step_inputs:
+                if isinstance(step_input, StepInput):
+                    source_handles = step_input.get_step_output_handle_dependencies()
+                else:
+                    source_handles = step_input.get_step_output_handle_deps_with_placeholders()
+
+                outputs.update(
+                    (source_handle.step_key, source_handle.output_name)
+                    for source_handle in source_handles
+                )
+
+        return outputs
+
+    def _release_consumed_outputs(self, step_key: str) -> None:
+        for step_input in self.get_step_by_key(step_key).step_inputs:
+            for source_handle in step_input.get_step_output_handle_dependencies():
+                consumers = self._output_consumers.get(source_handle)
+                if consumers is None:
+                    continue
+
+                consumers.discard(step_key)
+                self._check_release(source_handle)
+
+    def _check_release(self, step_output_handle: StepOutputHandle) -> None:
+        # outputs of steps that did not execute as part of this plan, like the outputs of a parent
+        # run when re-executing, are never released
+        if (
+            self._output_consumers[step_output_handle]
+            or step_output_handle.step_key not in self._success
+            or StepHandle.parse_from_key(step_output_handle.step_key).solid_handle
+            in self._unresolved_dep_solids
+            or (step_output_handle.step_key, step_output_handle.output_name)
+            in self._outputs_consumed_outside_plan
+        ):
+            return
+
+        del self._output_consumers[step_output_handle]
+        if step_output_handle in self._step_outputs:
+            self._pending_release.append(step_output_handle)
+
+    def _push_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (self._sort_key_fn(self.get_step_by_key(step_key)), next(self._sequence), step_key),
+        )
+
+    def _executable_keys(self) -> List[str]:
+        return [step_key for _, _, step_key in sorted(self._executable)]
+
     def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed
         """
-        new_steps_to_execute = []
-        new_steps_to_skip = []
-        new_steps_to_abandon = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._successful_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
-            # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
-                new_steps_to_abandon.append(step_key)
-
-            # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
-                step = self.get_step_by_key(step_key)
-
-                # The base case is downstream step won't skip
-                should_skip = False
-
-                # If there is at least one of the step's inputs, none of whose upstream steps has
-                # yielded an output, we should skip that step.
-                for step_input in step.step_inputs:
-                    missing_source_handles = [
-                        source_handle
-                        for source_handle in step_input.get_step_output_handle_dependencies()
-                        if source_handle.step_key in requirements
-                        and source_handle not in self._step_outputs
-                    ]
-                    if missing_source_handles:
-                        if len(missing_source_handles) == len(
-                            step_input.get_step_output_handle_dependencies()
-                        ):
-                            should_skip = True
-                            break
-
-                if should_skip:
-                    new_steps_to_skip.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
+            if self._release_outputs:
+                # outputs that were only held for steps that have now been resolved can be released
+                self._unresolved_dep_solids = self._get_unresolved_dep_solids()
+                for step_output_handle, consumers in list(self._output_consumers.items()):
+                    if not consumers:
+                        self._check_release(step_output_handle)
 
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+        for step_key in sorted(self._ready, key=self._pending_order.__getitem__):
+            requirements = self._pending.pop(step_key)
+            del self._unmet_dep_counts[step_key]
+            del self._pending_order[step_key]
 
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+            # If any upstream deps failed - this is not executable
+            if any(dep in self._failed or dep in self._abandoned for dep in requirements):
+                self._pending_abandon.append(step_key)
+                continue
+
+            # All the upstream steps of the step are complete or skipped
+            step = self.get_step_by_key(step_key)
+
+            # The base case is downstream step won't skip
+            should_skip = False
+
+            # If there is at least one of the step's inputs, none of whose upstream steps has
+            # yielded an output, we should skip that step.
+            for step_input in step.step_inputs:
+                missing_source_handles = [
+                    source_handle
+                    for source_handle in step_input.get_step_output_handle_dependencies()
+                    if source_handle.step_key in requirements
+                    and source_handle not in self._step_outputs
+                ]
+                if missing_source_handles:
+                    if len(missing_source_handles) == len(
+                        step_input.get_step_output_handle_dependencies()
+                    ):
+                        should_skip = True
+                        break
+
+            if should_skip:
+                self._pending_skip.append(step_key)
+            else:
+                self._push_executable(step_key)
 
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+        self._ready.clear()
 
         ready_to_retry = []
         tick_time = time.time()
@@ -217,7 +373,7 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._waiting_to_retry[key]
 
     def sleep_til_ready(self) -> None:
@@ -253,31 +409,46 @@ def get_steps_to_execute(self, limit: Optional[int] = None) -> List[ExecutionSte
         check.opt_int_param(limit, "limit")
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
+        tag_concurrency_limits_counter = (
+            TagConcurrencyLimitsCounter(
+                self._tag_concurrency_limits,
+                [self.get_step_by_key(step_key) for step_key in self._in_flight],
+            )
+            if self._tag_concurrency_limits
+            else None
         )
 
-        if limit:
-            steps = steps[:limit]
+        steps = []
+        blocked = []
+        while self._executable and (not limit or len(steps) < limit):
+            entry = heapq.heappop(self._executable)
+            step = self.get_step_by_key(entry[2])
+            if tag_concurrency_limits_counter:
+                if tag_concurrency_limits_counter.is_blocked(step):
+                    # stays executable, keeping its place, until steps with the same tags finish
+                    blocked.append(entry)
+                    continue
+                tag_concurrency_limits_counter.update_counters_with_launched_item(step)
 
-        for step in steps:
+            steps.append(step)
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
+        for entry in blocked:
+            heapq.heappush(self._executable, entry)
+
         return steps
 
     def get_steps_to_skip(self) -> List[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
             self._prep_for_dynamic_outputs(step)
 
         return sorted(steps, key=self._sort_key_fn)
@@ -286,14 +457,22 @@ def get_steps_to_abandon(self) -> List[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
+    def get_outputs_to_release(self) -> List[StepOutputHandle]:
+        """The step outputs that every step consuming them has succeeded with, since the last call.
+        Only tracked when the execution was started with release_outputs.
+        """
+        outputs_to_release = self._pending_release
+        self._pending_release = []
+        return outputs_to_release
+
     def plan_events_iterator(self, pipeline_context) -> Iterator[DagsterEvent]:
         """Process all steps that can be skipped and abandoned"""
 
@@ -346,20 +525,28 @@ def plan_events_iterator(self, pipeline_context) -> Iterator[DagsterEvent]:
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._notify_waiting_steps(step_key, succeeded=False)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
+        self._notify_waiting_steps(step_key, succeeded=True)
+
+        # the inputs of steps that did not succeed are kept, so that they can be re-executed
+        if self._release_outputs:
+            self._release_consumed_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
+        self._notify_waiting_steps(step_key, succeeded=True)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._notify_waiting_steps(step_key, succeeded=False)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -379,11 +566,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._notify_waiting_steps(step_key, succeeded=False)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -1,5 +1,8 @@
 import asyncio
+import concurrent.futures
 import inspect
+import threading
+from contextlib import contextmanager
 from typing import Any, AsyncGenerator, Callable, Dict, Iterator, List, Set, Union
 
 from dagster import check
@@ -13,7 +16,11 @@
     NodeHandle,
     Output,
 )
-from dagster.core.errors import DagsterExecutionStepExecutionError, DagsterInvariantViolationError
+from dagster.core.errors import (
+    DagsterExecutionInterruptedError,
+    DagsterExecutionStepExecutionError,
+    DagsterInvariantViolationError,
+)
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.compute import SolidExecutionContext
 from dagster.core.execution.context.system import StepExecutionContext
@@ -97,7 +104,30 @@ def _validate_event(event: Any, step_context: StepExecutionContext) -> SolidOutp
     return event
 
 
+# The event loop that the async compute functions of steps executed in the current thread are
+# scheduled on, when it is run by another thread. See async_plan_execution_iterator
+_shared_event_loop = threading.local()
+
+
+@contextmanager
+def shared_event_loop(loop: asyncio.AbstractEventLoop) -> Iterator[None]:
+    _shared_event_loop.loop = loop
+    try:
+        yield
+    finally:
+        _shared_event_loop.loop = None
+
+
+async def _anext(async_gen: AsyncGenerator) -> Any:
+    return await async_gen.__anext__()
+
+
 def gen_from_async_gen(async_gen: AsyncGenerator) -> Iterator:
+    shared_loop = getattr(_shared_event_loop, "loop", None)
+    if shared_loop:
+        yield from _gen_from_async_gen_on_shared_loop(async_gen, shared_loop)
+        return
+
     loop = asyncio.get_event_loop()
     while True:
         try:
@@ -106,6 +136,22 @@ def gen_from_async_gen(async_gen: AsyncGenerator) -> Iterator:
             return
 
 
+def _gen_from_async_gen_on_shared_loop(
+    async_gen: AsyncGenerator, loop: asyncio.AbstractEventLoop
+) -> Iterator:
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(_anext(async_gen), loop).result()
+        except StopAsyncIteration:
+            return
+        except concurrent.futures.CancelledError as err:
+            # the coroutines of steps that are still running are cancelled when the run is
+            # interrupted
+            raise DagsterExecutionInterruptedError(
+                "Execution of the async compute function was cancelled"
+            ) from err
+
+
 def _yield_compute_results(
     step_context: StepExecutionContext, inputs: Dict[str, Any], compute_fn: Callable
 ) -> Iterator[SolidOutputUnion]:
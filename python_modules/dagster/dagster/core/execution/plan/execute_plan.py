@@ -1,9 +1,15 @@
+import asyncio
+import inspect
+import queue
 import sys
-from contextlib import ExitStack
-from typing import Iterator, List, cast
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
 
 from dagster import check
 from dagster.core.definitions import Failure, HookExecutionResult, RetryRequested
+from dagster.core.definitions.decorators.solid import DecoratedSolidFunction
 from dagster.core.errors import (
     DagsterError,
     DagsterExecutionInterruptedError,
@@ -12,7 +18,9 @@
     user_code_error_boundary,
 )
 from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.compute_logs import route_thread_streams
 from dagster.core.execution.context.system import PlanExecutionContext, StepExecutionContext
+from dagster.core.execution.plan.compute import shared_event_loop
 from dagster.core.execution.plan.execute_step import core_dagster_event_sequence_for_step
 from dagster.core.execution.plan.objects import (
     ErrorSource,
@@ -21,97 +29,432 @@
     UserFailureData,
     step_failure_event_from_exc_info,
 )
+from dagster.core.execution.plan.outputs import StepOutputHandle
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.step import ExecutionStep
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
+# how long the thread iterating async_plan_execution_iterator or threaded_plan_execution_iterator
+# waits for events of the steps executing in threads, before checking for finished steps again
+STEP_THREAD_POLL_INTERVAL = 0.1
+
+# how the stdout and stderr of a step are captured: for the whole process, or for the thread
+# executing the step
+_PROCESS_LOG_CAPTURE = "process"
+_THREAD_LOG_CAPTURE = "thread"
+
 
 def inner_plan_execution_iterator(
-    pipeline_context: PlanExecutionContext, execution_plan: ExecutionPlan
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    release_outputs: bool = False,
 ) -> Iterator[DagsterEvent]:
     check.inst_param(pipeline_context, "pipeline_context", PlanExecutionContext)
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.bool_param(release_outputs, "release_outputs")
 
-    with execution_plan.start(retry_mode=pipeline_context.retry_mode) as active_execution:
+    with execution_plan.start(
+        retry_mode=pipeline_context.retry_mode, release_outputs=release_outputs
+    ) as active_execution:
 
-        # It would be good to implement a reference tracking algorithm here to
-        # garbage collect results that are no longer needed by any steps
+        # When releasing outputs, the IO managers release the outputs that no remaining step
+        # needs, to bound the memory and disk used by the run
         # https://github.com/dagster-io/dagster/issues/811
         while not active_execution.is_complete:
             step = active_execution.get_next_step()
-            step_context = cast(
-                StepExecutionContext,
-                pipeline_context.for_step(
-                    step, active_execution.retry_state.get_attempt_count(step.key)
-                ),
+            step_context = _get_step_context(pipeline_context, active_execution, step)
+            step_event_list: List[DagsterEvent] = []
+
+            yield from _execute_step_with_log_capture(
+                pipeline_context, active_execution, step_context, step_event_list
             )
-            step_event_list = []
-
-            missing_resources = [
-                resource_key
-                for resource_key in step_context.required_resource_keys
-                if not hasattr(step_context.resources, resource_key)
-            ]
-            check.invariant(
-                len(missing_resources) == 0,
-                (
-                    "Expected step context for solid {solid_name} to have all required resources, but "
-                    "missing {missing_resources}."
-                ).format(solid_name=step_context.solid.name, missing_resources=missing_resources),
+            yield from _finish_step(
+                pipeline_context, execution_plan, active_execution, step_context, step_event_list
             )
 
-            # capture all of the logs for this step
-            with ExitStack() as stack:
-                log_capture_error = None
-                try:
-                    stack.enter_context(
-                        pipeline_context.instance.compute_log_manager.watch(
-                            step_context.pipeline_run, step_context.step.key
-                        )
-                    )
-                except Exception as e:
+
+def async_plan_execution_iterator(
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    release_outputs: bool = False,
+) -> Iterator[DagsterEvent]:
+    """Executes the steps of the plan in process, running up to max_concurrent steps with async
+    compute functions concurrently. Their coroutines are scheduled on a single event loop, run by
+    a separate thread.
+
+    The rest of the execution of each async step, like loading its inputs and handling its outputs,
+    happens in a thread of its own, which waits on the event loop whenever the compute function
+    awaits. Steps with synchronous compute functions are executed one at a time, by the thread
+    iterating this function, as inner_plan_execution_iterator does. Events are always yielded and
+    handled by the thread iterating this function, in the order in which each step emitted them.
+
+    The compute logs of each async step capture what its thread and its coroutines write to
+    sys.stdout and sys.stderr, see ComputeLogManager.watch_thread. So do the compute logs of
+    synchronous steps that execute while async steps are running.
+    """
+    check.inst_param(pipeline_context, "pipeline_context", PlanExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.int_param(max_concurrent, "max_concurrent")
+    check.invariant(max_concurrent > 0, "max_concurrent must be positive")
+    check.bool_param(release_outputs, "release_outputs")
+
+    with route_thread_streams():
+        yield from _concurrent_plan_execution_iterator(
+            pipeline_context,
+            execution_plan,
+            max_concurrent,
+            execute_in_thread_fn=_is_async_step,
+            log_capture=_THREAD_LOG_CAPTURE,
+            release_outputs=release_outputs,
+        )
+
+
+def threaded_plan_execution_iterator(
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
+    tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
+) -> Iterator[DagsterEvent]:
+    """Executes the steps of the plan in process, running up to max_concurrent steps at once, each
+    in a thread of its own. Steps with async compute functions are scheduled on a single event loop.
+
+    The compute logs of each step capture what its thread writes to sys.stdout and sys.stderr, see
+    ComputeLogManager.watch_thread. Events are yielded and handled by the thread iterating this
+    function, in the order in which each step emitted them.
+    """
+    check.inst_param(pipeline_context, "pipeline_context", PlanExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.int_param(max_concurrent, "max_concurrent")
+    check.invariant(max_concurrent > 0, "max_concurrent must be positive")
+
+    with route_thread_streams():
+        yield from _concurrent_plan_execution_iterator(
+            pipeline_context,
+            execution_plan,
+            max_concurrent,
+            execute_in_thread_fn=lambda _step_context: True,
+            log_capture=_THREAD_LOG_CAPTURE,
+            sort_key_fn=sort_key_fn,
+            tag_concurrency_limits=tag_concurrency_limits,
+        )
+
+
+def _concurrent_plan_execution_iterator(
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    execute_in_thread_fn: Callable[[StepExecutionContext], bool],
+    log_capture: str,
+    release_outputs: bool = False,
+    sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
+    tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
+) -> Iterator[DagsterEvent]:
+    event_queue: "queue.Queue[Tuple[str, DagsterEvent, bool]]" = queue.Queue()
+    running: Dict[str, Tuple[Future, StepExecutionContext, List[DagsterEvent]]] = {}
+    stopping = False
+
+    with execution_plan.start(
+        retry_mode=pipeline_context.retry_mode,
+        sort_key_fn=sort_key_fn,
+        release_outputs=release_outputs,
+        tag_concurrency_limits=tag_concurrency_limits,
+    ) as active_execution, _running_event_loop() as loop, ThreadPoolExecutor(
+        max_workers=max_concurrent, thread_name_prefix="dagster-step"
+    ) as step_threads:
+        try:
+            while (not stopping and not active_execution.is_complete) or running:
+                if active_execution.check_for_interrupts():
                     yield DagsterEvent.engine_event(
-                        pipeline_context=pipeline_context,
-                        message="Exception while setting up compute log capture",
-                        event_specific_data=EngineEventData(
-                            error=serializable_error_info_from_exc_info(sys.exc_info())
-                        ),
-                        step_handle=step_context.step.handle,
+                        pipeline_context,
+                        "Received termination signal - waiting for the steps executing in "
+                        "threads to finish",
+                        EngineEventData.interrupted(list(running.keys())),
+                    )
+                    stopping = True
+                    active_execution.mark_interrupted()
+                    # threads can not be interrupted, but coroutines can be cancelled
+                    loop.call_soon_threadsafe(_cancel_all_tasks, loop)
+
+                steps = []
+                if not stopping and not running and not active_execution.is_complete:
+                    # waits for steps that are up for retry to be ready
+                    steps = [active_execution.get_next_step()]
+                if not stopping and len(running) + len(steps) < max_concurrent:
+                    steps += active_execution.get_steps_to_execute(
+                        limit=max_concurrent - len(running) - len(steps)
                     )
-                    log_capture_error = e
 
-                if not log_capture_error:
-                    yield DagsterEvent.capture_logs(
-                        step_context, log_key=step_context.step.key, steps=[step_context.step]
+                for step in steps:
+                    step_context = _get_step_context(pipeline_context, active_execution, step)
+                    if execute_in_thread_fn(step_context):
+                        running[step.key] = (
+                            step_threads.submit(
+                                _execute_step_in_thread,
+                                loop,
+                                pipeline_context,
+                                step_context,
+                                log_capture,
+                                event_queue,
+                            ),
+                            step_context,
+                            [],
+                        )
+                        continue
+
+                    step_event_list: List[DagsterEvent] = []
+                    yield from _execute_step_with_log_capture(
+                        pipeline_context,
+                        active_execution,
+                        step_context,
+                        step_event_list,
+                        # capturing the process-wide file descriptors would also capture what the
+                        # steps executing in threads write meanwhile
+                        log_capture=log_capture if running else _PROCESS_LOG_CAPTURE,
+                    )
+                    yield from _finish_step(
+                        pipeline_context,
+                        execution_plan,
+                        active_execution,
+                        step_context,
+                        step_event_list,
                     )
 
-                for step_event in check.generator(_dagster_event_sequence_for_step(step_context)):
-                    check.inst(step_event, DagsterEvent)
-                    step_event_list.append(step_event)
+                # every event of a finished step is in the queue before its future is done, so
+                # the queue is drained after collecting the finished steps
+                finished_keys = [key for key, (future, _, _) in running.items() if future.done()]
+                for step_key, step_event, is_step_event in _drain_queue(
+                    event_queue, block=not steps and not finished_keys
+                ):
+                    if is_step_event:
+                        running[step_key][2].append(step_event)
                     yield step_event
-                    active_execution.handle_event(step_event)
+                    if is_step_event:
+                        active_execution.handle_event(step_event)
+
+                for step_key in finished_keys:
+                    future, step_context, step_event_list = running.pop(step_key)
+                    # raise the errors that are raised by steps executed in process, like
+                    # interrupts or failures when raise_on_error is set
+                    future.result()
+                    active_execution.verify_complete(pipeline_context, step_key)
+                    yield from _finish_step(
+                        pipeline_context,
+                        execution_plan,
+                        active_execution,
+                        step_context,
+                        step_event_list,
+                    )
+        finally:
+            if running:
+                # cancel the coroutines of the steps that are still running, so that their
+                # threads finish
+                loop.call_soon_threadsafe(_cancel_all_tasks, loop)
+
+        if stopping:
+            raise DagsterExecutionInterruptedError()
+
+
+def _get_step_context(
+    pipeline_context: PlanExecutionContext, active_execution, step
+) -> StepExecutionContext:
+    step_context = cast(
+        StepExecutionContext,
+        pipeline_context.for_step(step, active_execution.retry_state.get_attempt_count(step.key)),
+    )
+
+    missing_resources = [
+        resource_key
+        for resource_key in step_context.required_resource_keys
+        if not hasattr(step_context.resources, resource_key)
+    ]
+    check.invariant(
+        len(missing_resources) == 0,
+        (
+            "Expected step context for solid {solid_name} to have all required resources, but "
+            "missing {missing_resources}."
+        ).format(solid_name=step_context.solid.name, missing_resources=missing_resources),
+    )
+    return step_context
+
+
+def _execute_step_with_log_capture(
+    pipeline_context: PlanExecutionContext,
+    active_execution,
+    step_context: StepExecutionContext,
+    step_event_list: List[DagsterEvent],
+    log_capture: str = _PROCESS_LOG_CAPTURE,
+) -> Iterator[DagsterEvent]:
+    for event, is_step_event in _dagster_event_sequence_with_log_capture(
+        pipeline_context, step_context, log_capture
+    ):
+        if is_step_event:
+            step_event_list.append(event)
+        yield event
+        if is_step_event:
+            active_execution.handle_event(event)
+
+    active_execution.verify_complete(pipeline_context, step_context.step.key)
+
+
+def _dagster_event_sequence_with_log_capture(
+    pipeline_context: PlanExecutionContext, step_context: StepExecutionContext, log_capture: str
+) -> Iterator[Tuple[DagsterEvent, bool]]:
+    """Yields the events of executing the step, along with whether each was emitted by the step,
+    rather than by the compute log capture.
+    """
+    # capture all of the logs for this step
+    with ExitStack() as stack:
+        log_capture_error = None
+        compute_log_manager = pipeline_context.instance.compute_log_manager
+        try:
+            if log_capture == _PROCESS_LOG_CAPTURE:
+                stack.enter_context(
+                    compute_log_manager.watch(step_context.pipeline_run, step_context.step.key)
+                )
+            elif log_capture == _THREAD_LOG_CAPTURE:
+                stack.enter_context(
+                    compute_log_manager.watch_thread(
+                        step_context.pipeline_run, step_context.step.key
+                    )
+                )
+        except Exception as e:
+            yield DagsterEvent.engine_event(
+                pipeline_context=pipeline_context,
+                message="Exception while setting up compute log capture",
+                event_specific_data=EngineEventData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                ),
+                step_handle=step_context.step.handle,
+            ), False
+            log_capture_error = e
 
-                active_execution.verify_complete(pipeline_context, step.key)
+        if not log_capture_error:
+            yield DagsterEvent.capture_logs(
+                step_context, log_key=step_context.step.key, steps=[step_context.step]
+            ), False
 
-                try:
-                    stack.close()
-                except Exception:
-                    yield DagsterEvent.engine_event(
-                        pipeline_context=pipeline_context,
-                        message="Exception while cleaning up compute log capture",
-                        event_specific_data=EngineEventData(
-                            error=serializable_error_info_from_exc_info(sys.exc_info())
-                        ),
-                        step_handle=step_context.step.handle,
-                    )
+        for step_event in check.generator(_dagster_event_sequence_for_step(step_context)):
+            check.inst(step_event, DagsterEvent)
+            yield step_event, True
+
+        try:
+            stack.close()
+        except Exception:
+            yield DagsterEvent.engine_event(
+                pipeline_context=pipeline_context,
+                message="Exception while cleaning up compute log capture",
+                event_specific_data=EngineEventData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                ),
+                step_handle=step_context.step.handle,
+            ), False
+
+
+def _finish_step(
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    active_execution,
+    step_context: StepExecutionContext,
+    step_event_list: List[DagsterEvent],
+) -> Iterator[DagsterEvent]:
+    # process skips from failures or uncovered inputs
+    for event in active_execution.plan_events_iterator(pipeline_context):
+        step_event_list.append(event)
+        yield event
+
+    # pass a list of step events to hooks
+    for hook_event in _trigger_hook(step_context, step_event_list):
+        yield hook_event
+
+    for step_output_handle in active_execution.get_outputs_to_release():
+        yield from _release_output(pipeline_context, execution_plan, step_output_handle)
+
+
+def _is_async_step(step_context: StepExecutionContext) -> bool:
+    if step_context.step_launcher:
+        return False
+
+    compute_fn = step_context.solid_def.compute_fn
+    if not isinstance(compute_fn, DecoratedSolidFunction):
+        return False
+
+    return inspect.iscoroutinefunction(compute_fn.decorated_fn) or inspect.isasyncgenfunction(
+        compute_fn.decorated_fn
+    )
 
-            # process skips from failures or uncovered inputs
-            for event in active_execution.plan_events_iterator(pipeline_context):
-                step_event_list.append(event)
-                yield event
 
-            # pass a list of step events to hooks
-            for hook_event in _trigger_hook(step_context, step_event_list):
-                yield hook_event
+def _execute_step_in_thread(
+    loop: asyncio.AbstractEventLoop,
+    pipeline_context: PlanExecutionContext,
+    step_context: StepExecutionContext,
+    log_capture: str,
+    event_queue: "queue.Queue[Tuple[str, DagsterEvent, bool]]",
+) -> None:
+    with shared_event_loop(loop):
+        for event, is_step_event in _dagster_event_sequence_with_log_capture(
+            pipeline_context, step_context, log_capture
+        ):
+            event_queue.put((step_context.step.key, event, is_step_event))
+
+
+def _drain_queue(
+    event_queue: "queue.Queue[Tuple[str, DagsterEvent, bool]]", block: bool
+) -> Iterator[Tuple[str, DagsterEvent, bool]]:
+    try:
+        if block:
+            yield event_queue.get(timeout=STEP_THREAD_POLL_INTERVAL)
+        while True:
+            yield event_queue.get_nowait()
+    except queue.Empty:
+        return
+
+
+@contextmanager
+def _running_event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="dagster-event-loop", daemon=True)
+    thread.start()
+    try:
+        yield loop
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    # asyncio.all_tasks was added in Python 3.7
+    all_tasks = asyncio.all_tasks if hasattr(asyncio, "all_tasks") else asyncio.Task.all_tasks
+    for task in all_tasks(loop):
+        task.cancel()
+
+
+def _release_output(
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    step_output_handle: StepOutputHandle,
+) -> Iterator[DagsterEvent]:
+    step_context = cast(
+        StepExecutionContext,
+        pipeline_context.for_step(
+            execution_plan.get_executable_step_by_key(step_output_handle.step_key)
+        ),
+    )
+    try:
+        step_context.get_io_manager(step_output_handle).release_output(
+            step_context.get_output_context(step_output_handle)
+        )
+    except Exception:
+        yield DagsterEvent.engine_event(
+            pipeline_context=pipeline_context,
+            message=f'Exception while releasing output "{step_output_handle.output_name}"',
+            event_specific_data=EngineEventData(
+                error=serializable_error_info_from_exc_info(sys.exc_info())
+            ),
+            step_handle=step_context.step.handle,
+        )
 
 
 def _trigger_hook(
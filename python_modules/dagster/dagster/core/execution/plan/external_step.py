@@ -79,9 +79,9 @@ def launch_step(
         events_data = file_manager.read_data(events_file_handle)
         all_events = deserialize_value(pickle.loads(events_data))
 
+        # write the pickled events from the external instance to the local instance
+        step_context.instance.handle_new_events(all_events)
         for event in all_events:
-            # write each pickled event from the external instance to the local instance
-            step_context.instance.handle_new_event(event)
             if event.is_dagster_event:
                 yield event.dagster_event
 
@@ -226,8 +226,7 @@ def external_instance_from_step_run_ref(
         instance.add_run(run._replace(pipeline_snapshot_id=None))
     # the can_load() function on the step context currently depends on reading output events
     # from the instance, so we make sure the remote instance has the relevant events
-    for entry in step_run_ref.upstream_output_events:
-        instance.handle_new_event(entry)
+    instance.handle_new_events(list(step_run_ref.upstream_output_events))
     if event_listener_fn:
         instance.add_event_listener(step_run_ref.run_id, event_listener_fn)
     return instance
@@ -1,6 +1,7 @@
 from collections import OrderedDict, defaultdict
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Dict,
     FrozenSet,
@@ -918,6 +919,8 @@ def start(
         self,
         retry_mode: RetryMode,
         sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
+        release_outputs: bool = False,
+        tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
     ) -> "ActiveExecution":
         from .active import ActiveExecution
 
@@ -927,6 +930,8 @@ def start(
             self.known_state.get_retry_state() if self.known_state else RetryState(),
             sort_key_fn,
             self.known_state.step_output_versions if self.known_state else [],
+            release_outputs,
+            tag_concurrency_limits,
         )
 
     def step_handle_for_single_step_plans(
@@ -1014,7 +1019,23 @@ def rebuild_step_input(step_input_snap):
             )
 
     @staticmethod
-    def rebuild_from_snapshot(pipeline_name, execution_plan_snapshot):
+    def rebuild_from_snapshot(
+        pipeline_name, execution_plan_snapshot, step_keys_to_execute=None, known_state=None
+    ):
+        """Rebuilds an ExecutionPlan from a snapshot, without resolving any config.
+
+        By default, the plan executes the steps selected by the snapshot, from its initial known
+        state. If step_keys_to_execute is set, the plan instead executes just those steps of the
+        snapshot, resolving any dynamic steps using the given known state.
+        """
+        check.opt_list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+        known_state = check.opt_inst_param(
+            known_state,
+            "known_state",
+            KnownExecutionState,
+            default=execution_plan_snapshot.initial_known_state,
+        )
+
         if not execution_plan_snapshot.can_reconstruct_plan:
             raise DagsterInvariantViolationError(
                 "Tried to reconstruct an old ExecutionPlanSnapshot that was created before snapshots "
@@ -1080,15 +1101,27 @@ def rebuild_from_snapshot(pipeline_name, execution_plan_snapshot):
             step_dict,
             step_dict_by_key,
             step_handles_to_execute,
-            execution_plan_snapshot.initial_known_state,
+            known_state,
         )
 
+        if step_keys_to_execute is not None:
+            # the steps resolved from dynamic outputs have now been added to step_dict
+            step_handles_to_execute = [
+                StepHandle.parse_from_key(key) for key in step_keys_to_execute
+            ]
+            executable_map, resolvable_map = _compute_step_maps(
+                step_dict,
+                step_dict_by_key,
+                step_handles_to_execute,
+                known_state,
+            )
+
         return ExecutionPlan(
             step_dict,
             executable_map,
             resolvable_map,
             step_handles_to_execute,
-            execution_plan_snapshot.initial_known_state,
+            known_state,
             execution_plan_snapshot.artifacts_persisted,
             executor_name=execution_plan_snapshot.executor_name,
         )
@@ -1219,14 +1252,11 @@ def should_skip_step(execution_plan: ExecutionPlan, instance: DagsterInstance, r
         # do not skip when all the inputs come from non-optional outputs
         return False
 
-    # find all yielded step outputs
-    all_logs = instance.all_logs(run_id)
-    yielded_step_output_handles = set()
-    for event_record in all_logs:
-        if event_record.dagster_event and event_record.dagster_event.is_successful_output:
-            yielded_step_output_handles.add(
-                event_record.dagster_event.event_specific_data.step_output_handle
-            )
+    # find the yielded step outputs of the upstream steps
+    yielded_step_output_handles = instance.get_yielded_step_outputs(
+        run_id,
+        step_keys=sorted({source_handle.step_key for source_handle in optional_source_handles}),
+    )
 
     # If there is at least one of the step's inputs, none of whose upstream steps has
     # yielded an output, we should skip that step.
@@ -1324,7 +1354,7 @@ def _get_executable_step_deps(
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
         step = cast(ExecutionStep, step_dict[handle])
@@ -2,11 +2,20 @@
 from typing import Dict, List, NamedTuple, cast
 
 from dagster import check
+from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
 from dagster.core.execution.plan.outputs import StepOutputHandle
 from dagster.core.execution.retries import RetryState
 from dagster.serdes import whitelist_for_serdes
 
+# the event types that KnownExecutionState.derive_from_logs reads, so that callers can avoid
+# fetching every event of a run
+KNOWN_STATE_EVENT_TYPES = {
+    DagsterEventType.STEP_OUTPUT,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_SUCCESS,
+}
+
 
 @whitelist_for_serdes
 class StepOutputVersionData(NamedTuple):
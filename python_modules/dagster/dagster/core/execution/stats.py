@@ -1,6 +1,5 @@
-from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, List, NamedTuple, Optional, cast
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, cast
 
 from dagster import check
 from dagster.core.definitions import ExpectationResult
@@ -85,101 +84,194 @@ class StepEventStatus(Enum):
     IN_PROGRESS = "IN_PROGRESS"
 
 
+# The event types that contribute to per-step stats
+STEP_STATS_EVENT_TYPES = [
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.ENGINE_EVENT,
+]
+
+
 def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
 ) -> List["RunStepKeyStatsSnapshot"]:
-    by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
-    markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    records = list(records)
+    step_stats_states: Dict[str, Dict[str, Any]] = {}
     for event in records:
         if not event.is_dagster_event:
             continue
-        dagster_event = event.get_dagster_event()
 
-        step_key = dagster_event.step_key
+        step_key = event.get_dagster_event().step_key
         if not step_key:
             continue
 
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
-            by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-            by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
+        if is_step_stats_event(event):
+            apply_event_to_step_stats_state(step_stats_states.setdefault(step_key, {}), event)
+
+    materialization_events, expectation_results = collect_step_stats_results(records)
+    snapshots = [
+        step_stats_from_state(
+            run_id,
+            step_key,
+            state,
+            materialization_events=materialization_events.get(step_key),
+            expectation_results=expectation_results.get(step_key),
+        )
+        for step_key, state in step_stats_states.items()
+    ]
+    return [snapshot for snapshot in snapshots if snapshot]
+
+
+# The event types whose events are listed in the step stats, rather than only counted in the state
+STEP_STATS_RESULT_EVENT_TYPES = [
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+]
+
+
+def collect_step_stats_results(
+    records: Iterable[EventLogEntry],
+) -> Tuple[Dict[str, List[EventLogEntry]], Dict[str, List[ExpectationResult]]]:
+    """Collects the materialization events and expectation results of each step, which the step
+    stats state only counts."""
+    materialization_events: Dict[str, List[EventLogEntry]] = {}
+    expectation_results: Dict[str, List[ExpectationResult]] = {}
+    for event in records:
+        if not event.is_dagster_event or not event.get_dagster_event().step_key:
+            continue
+
+        dagster_event = event.get_dagster_event()
         if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
-            materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
-            by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+            materialization_events.setdefault(dagster_event.step_key, []).append(event)
+        elif dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
             expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
-            expectation_result = expectation_data.expectation_result
-            step_expectation_results = by_step_key[step_key].get("expectation_results", [])
-            step_expectation_results.append(expectation_result)
-            by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
-            DagsterEventType.STEP_UP_FOR_RETRY,
-            DagsterEventType.STEP_RESTARTED,
-        ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type == DagsterEventType.ENGINE_EVENT:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
-                else:
-                    markers[step_key][key]["start"] = event.timestamp
-
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
-                else:
-                    markers[step_key][key]["end"] = event.timestamp
-
-    for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
-        step_attempts = []
-        attempt_start = step_stats.get("start_time")
-
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-                step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
-                )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
-        if step_stats.get("end_time"):
-            step_attempts.append(
-                RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
+            expectation_results.setdefault(dagster_event.step_key, []).append(
+                expectation_data.expectation_result
             )
-        else:
-            by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
-        attempts[step_key] = step_attempts
-
-    return [
-        RunStepKeyStatsSnapshot(
-            run_id=run_id,
-            step_key=step_key,
-            attempts_list=attempts[step_key],
-            markers=[
-                RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
-                for marker in markers[step_key].values()
-            ],
-            **value,
+
+    return materialization_events, expectation_results
+
+
+def is_step_stats_event(event: EventLogEntry) -> bool:
+    """Whether the event contributes to the stats of the step it belongs to."""
+    if not event.is_dagster_event:
+        return False
+
+    dagster_event = event.get_dagster_event()
+    if not dagster_event.step_key or dagster_event.event_type not in STEP_STATS_EVENT_TYPES:
+        return False
+
+    if dagster_event.event_type == DagsterEventType.ENGINE_EVENT:
+        return bool(
+            dagster_event.engine_event_data.marker_start
+            or dagster_event.engine_event_data.marker_end
         )
-        for step_key, value in by_step_key.items()
-    ]
+
+    return True
+
+
+def apply_event_to_step_stats_state(state: Dict[str, Any], event: EventLogEntry):
+    """Folds a single step stats event into the running stats state of the step it belongs to.
+
+    The state is a plain dict that can be round-tripped through `serialize_value`, so that SQL
+    event log storages can persist it and keep it up to date as events are stored. It only holds
+    timestamps and counts, so that its size does not grow with the number of materializations and
+    expectation results of the step, which are collected by `collect_step_stats_results` instead.
+    """
+    dagster_event = event.get_dagster_event()
+    event_type = dagster_event.event_type
+
+    if event_type == DagsterEventType.ENGINE_EVENT:
+        marker_start = dagster_event.engine_event_data.marker_start
+        marker_end = dagster_event.engine_event_data.marker_end
+        markers = state.setdefault("markers", {})
+        if marker_start:
+            markers.setdefault(marker_start, {"key": marker_start})["start"] = event.timestamp
+        if marker_end:
+            markers.setdefault(marker_end, {"key": marker_end})["end"] = event.timestamp
+        return
+
+    if event_type in (DagsterEventType.STEP_UP_FOR_RETRY, DagsterEventType.STEP_RESTARTED):
+        state.setdefault("attempt_events", []).append([event_type.value, event.timestamp])
+        if event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+            return
+
+    stats = state.setdefault("stats", {})
+    if event_type == DagsterEventType.STEP_START:
+        stats["start_time"] = event.timestamp
+        stats["attempts"] = 1
+    elif event_type == DagsterEventType.STEP_RESTARTED:
+        stats["attempts"] = int(stats.get("attempts") or 0) + 1
+    elif event_type == DagsterEventType.STEP_SUCCESS:
+        stats["end_time"] = event.timestamp
+        stats["status"] = StepEventStatus.SUCCESS.value
+    elif event_type == DagsterEventType.STEP_FAILURE:
+        stats["end_time"] = event.timestamp
+        stats["status"] = StepEventStatus.FAILURE.value
+    elif event_type == DagsterEventType.STEP_SKIPPED:
+        stats["end_time"] = event.timestamp
+        stats["status"] = StepEventStatus.SKIPPED.value
+    elif event_type == DagsterEventType.ASSET_MATERIALIZATION:
+        stats["materialization_count"] = int(stats.get("materialization_count") or 0) + 1
+    elif event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+        stats["expectation_count"] = int(stats.get("expectation_count") or 0) + 1
+
+
+def step_stats_result_counts(state: Dict[str, Any]) -> int:
+    """The number of materializations and expectation results counted in the state of a step."""
+    stats = state.get("stats") or {}
+    return int(stats.get("materialization_count") or 0) + int(stats.get("expectation_count") or 0)
+
+
+def step_stats_from_state(
+    run_id: str,
+    step_key: str,
+    state: Dict[str, Any],
+    materialization_events: Optional[List[EventLogEntry]] = None,
+    expectation_results: Optional[List[ExpectationResult]] = None,
+) -> Optional["RunStepKeyStatsSnapshot"]:
+    """Builds the stats snapshot for a step from the state built up by
+    `apply_event_to_step_stats_state`, and the results collected by `collect_step_stats_results`.
+    Returns None if no step lifecycle event has been seen yet."""
+    stats = state.get("stats")
+    if stats is None:
+        return None
+
+    step_attempts = []
+    attempt_start = stats.get("start_time")
+    for event_type_value, timestamp in state.get("attempt_events", []):
+        if event_type_value == DagsterEventType.STEP_UP_FOR_RETRY.value:
+            step_attempts.append(RunStepMarker(start_time=attempt_start, end_time=timestamp))
+        elif event_type_value == DagsterEventType.STEP_RESTARTED.value:
+            attempt_start = timestamp
+
+    if stats.get("end_time"):
+        step_attempts.append(RunStepMarker(start_time=attempt_start, end_time=stats["end_time"]))
+        status = StepEventStatus(stats["status"]) if stats.get("status") else None
+    else:
+        status = StepEventStatus.IN_PROGRESS
+
+    return RunStepKeyStatsSnapshot(
+        run_id=run_id,
+        step_key=step_key,
+        status=status,
+        start_time=stats.get("start_time"),
+        end_time=stats.get("end_time"),
+        materialization_events=materialization_events,
+        expectation_results=expectation_results,
+        attempts=stats.get("attempts"),
+        attempts_list=step_attempts,
+        markers=[
+            RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
+            for marker in state.get("markers", {}).values()
+        ],
+    )
 
 
 @whitelist_for_serdes
@@ -0,0 +1,194 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Set
+
+from dagster import Field, Int, Selector, check
+from dagster.core.storage.tags import PRIORITY_TAG
+from dagster.core.utils import toposort_flatten
+
+if TYPE_CHECKING:
+    from dagster.core.execution.context.system import PlanOrchestrationContext
+    from dagster.core.execution.plan.plan import ExecutionPlan
+    from dagster.core.execution.plan.step import ExecutionStep
+    from dagster.core.instance import DagsterInstance
+
+DEFAULT_HISTORY_RUN_LIMIT = 5
+
+
+def get_step_ordering_config():
+    return Field(
+        Selector(
+            {
+                "priority": {},
+                "critical_path": {
+                    "history_run_limit": Field(
+                        Int,
+                        is_required=False,
+                        default_value=DEFAULT_HISTORY_RUN_LIMIT,
+                        description="The number of most recent successful runs of the job whose "
+                        "step durations are used to weight the paths through the plan.",
+                    ),
+                },
+            }
+        ),
+        is_required=False,
+        default_value={"priority": {}},
+        description=(
+            "The order in which steps that are ready to execute are started. With priority, steps "
+            "are ordered by their dagster/priority tag. With critical_path, steps with the same "
+            "priority are then ordered by the longest path from the step to the end of the plan, "
+            "weighted by the durations of the steps in previous runs of the job."
+        ),
+    )
+
+
+def priority_sort_key(step: "ExecutionStep") -> float:
+    return int(step.tags.get(PRIORITY_TAG, 0)) * -1
+
+
+class StepOrdering(ABC):
+    """Decides the order in which an executor starts the steps that are ready to execute"""
+
+    @abstractmethod
+    def get_sort_key_fn(
+        self, plan_context: "PlanOrchestrationContext", execution_plan: "ExecutionPlan"
+    ) -> Callable[["ExecutionStep"], float]:
+        """Returns the sort key used to order ready steps, lowest first"""
+
+    @staticmethod
+    def from_config(config_value: Optional[Dict[str, Dict]]) -> "StepOrdering":
+        for selector, selector_config in (config_value or {}).items():
+            if selector == "critical_path":
+                return CriticalPathStepOrdering(
+                    history_run_limit=selector_config.get("history_run_limit")
+                )
+            check.invariant(selector == "priority", f"Unexpected step ordering {selector}")
+
+        return PriorityStepOrdering()
+
+
+class PriorityStepOrdering(StepOrdering):
+    """Orders steps by their dagster/priority tag, highest first"""
+
+    def get_sort_key_fn(self, plan_context, execution_plan):
+        return priority_sort_key
+
+
+class CriticalPathStepOrdering(StepOrdering):
+    """Orders steps by their dagster/priority tag, then by the longest path from the step to the
+    end of the plan, longest first. Paths are weighted by the average duration of each step in the
+    most recent successful runs of the same job.
+    """
+
+    def __init__(self, history_run_limit: Optional[int] = None):
+        self._history_run_limit = check.opt_int_param(
+            history_run_limit, "history_run_limit", DEFAULT_HISTORY_RUN_LIMIT
+        )
+
+    def get_sort_key_fn(self, plan_context, execution_plan):
+        step_durations = get_historical_step_durations(
+            plan_context.instance,
+            plan_context.pipeline_run.pipeline_name,
+            self._history_run_limit,
+            exclude_run_id=plan_context.run_id,
+        )
+        return critical_path_sort_key_fn(execution_plan, step_durations)
+
+
+def _solid_handle_str(step_key: str) -> str:
+    from dagster.core.execution.plan.handle import StepHandle
+
+    # steps resolved from dynamic outputs share the durations and dependencies of their solid
+    return StepHandle.parse_from_key(step_key).solid_handle.to_string()
+
+
+def get_historical_step_durations(
+    instance: "DagsterInstance",
+    pipeline_name: str,
+    limit: int,
+    exclude_run_id: Optional[str] = None,
+) -> Dict[str, float]:
+    """Returns the average duration of the successful steps of each solid in the most recent
+    successful runs of a pipeline, keyed by solid handle.
+    """
+    from dagster.core.execution.stats import StepEventStatus
+    from dagster.core.storage.pipeline_run import PipelineRunStatus, RunsFilter
+
+    runs = instance.get_runs(
+        filters=RunsFilter(pipeline_name=pipeline_name, statuses=[PipelineRunStatus.SUCCESS]),
+        limit=limit + 1 if exclude_run_id else limit,
+    )
+
+    durations = defaultdict(list)
+    for run in [run for run in runs if run.run_id != exclude_run_id][:limit]:
+        for step_stats in instance.get_run_step_stats(run.run_id):
+            if (
+                step_stats.status != StepEventStatus.SUCCESS
+                or step_stats.start_time is None
+                or step_stats.end_time is None
+            ):
+                continue
+            durations[_solid_handle_str(step_stats.step_key)].append(
+                step_stats.end_time - step_stats.start_time
+            )
+
+    return {
+        solid_handle: sum(solid_durations) / len(solid_durations)
+        for solid_handle, solid_durations in durations.items()
+    }
+
+
+def get_critical_path_lengths(
+    execution_plan: "ExecutionPlan", step_durations: Dict[str, float]
+) -> Dict[str, float]:
+    """Returns the length of the longest path from each solid in the plan to the end of the plan,
+    including the duration of the solid itself, keyed by solid handle.
+
+    Solids without a recorded duration are weighted by the average recorded duration, or by 1 if no
+    durations were recorded, so that paths are then measured in steps.
+    """
+    from dagster.core.execution.plan.plan import ExecutionPlan
+    from dagster.core.execution.plan.step import ExecutionStep
+
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.dict_param(step_durations, "step_durations", key_type=str, value_type=float)
+
+    solid_deps: Dict[str, Set[str]] = defaultdict(set)
+    for step in execution_plan.steps:
+        deps = (
+            step.get_execution_dependency_keys()
+            if isinstance(step, ExecutionStep)
+            else step.get_all_dependency_keys()
+        )
+        solid_deps[step.solid_handle.to_string()].update(_solid_handle_str(dep) for dep in deps)
+
+    default_duration = sum(step_durations.values()) / len(step_durations) if step_durations else 1.0
+
+    path_lengths: Dict[str, float] = {}
+    downstream: Dict[str, Set[str]] = defaultdict(set)
+    for solid_handle, deps in solid_deps.items():
+        for dep in deps:
+            downstream[dep].add(solid_handle)
+
+    for solid_handle in reversed(toposort_flatten(solid_deps)):
+        path_lengths[solid_handle] = step_durations.get(solid_handle, default_duration) + max(
+            [path_lengths[child] for child in downstream[solid_handle]], default=0.0
+        )
+
+    return {solid_handle: path_lengths[solid_handle] for solid_handle in solid_deps}
+
+
+def critical_path_sort_key_fn(
+    execution_plan: "ExecutionPlan", step_durations: Dict[str, float]
+) -> Callable[["ExecutionStep"], float]:
+    path_lengths = get_critical_path_lengths(execution_plan, step_durations)
+
+    # scale priorities so that they dominate path lengths
+    priority_scale = max(path_lengths.values(), default=0.0) + 1.0
+
+    def _sort_key(step: "ExecutionStep") -> float:
+        return priority_sort_key(step) * priority_scale - path_lengths.get(
+            step.solid_handle.to_string(), 0.0
+        )
+
+    return _sort_key
@@ -36,6 +36,13 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessTaskDoneEvent(
+    NamedTuple("ChildProcessTaskDoneEvent", [("pid", int), ("recycle", bool)]), ChildProcessEvent
+):
+    """Emitted by a worker process once it has finished executing a task. If recycle is set, the
+    worker exits instead of waiting for another task."""
+
+
 class ChildProcessCommand(ABC):  # pylint: disable=no-init
     """Inherit from this class in order to use this library.
 
@@ -48,6 +55,20 @@ def execute(self):
         Yields a sequence of events to be handled by _execute_command_in_child_process."""
 
 
+class ChildProcessWorkerCommand(ABC):  # pylint: disable=no-init
+    """Inherit from this class to execute a sequence of tasks in a single, long-lived child process.
+
+    The object must be picklable; instantiate it and pass it to a ChildProcessWorker."""
+
+    @abstractmethod
+    def execute(self, tasks):
+        """This method is invoked once in the child process, with an iterator over the tasks sent
+        by the parent process.
+
+        Yields a sequence of events for each task, followed by a ChildProcessTaskDoneEvent once the
+        task has been executed. The worker exits when this method returns."""
+
+
 class ChildProcessCrashException(Exception):
     """Thrown when the child process crashes."""
 
@@ -83,6 +104,34 @@ def _execute_command_in_child_process(event_queue, command):
             )
 
 
+def _execute_worker_command_in_child_process(task_queue, event_queue, command):
+    """Wraps the execution of a ChildProcessWorkerCommand.
+
+    Tasks are read from the task queue until a None sentinel is received. Handles errors and
+    communicates across the event queue with the parent process."""
+
+    check.inst_param(command, "command", ChildProcessWorkerCommand)
+
+    with capture_interrupts():
+        pid = os.getpid()
+        event_queue.put(ChildProcessStartEvent(pid=pid))
+        try:
+            for event in command.execute(iter(task_queue.get, None)):
+                event_queue.put(event)
+            event_queue.put(ChildProcessDoneEvent(pid=pid))
+
+        except (
+            Exception,
+            KeyboardInterrupt,
+            DagsterExecutionInterruptedError,
+        ):
+            event_queue.put(
+                ChildProcessSystemErrorEvent(
+                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                )
+            )
+
+
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
@@ -165,3 +214,92 @@ def execute_child_process_command(multiprocessing_ctx, command):
         process.join()
     finally:
         event_queue.close()
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes the tasks it is sent by a ChildProcessWorkerCommand.
+
+    Tasks are executed one at a time, using execute_task. The worker stops accepting tasks once its
+    command asks for it to be recycled, or once it has exited or crashed.
+
+    Args:
+        multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
+        command (ChildProcessWorkerCommand): The command to execute in the child process.
+    """
+
+    def __init__(self, multiprocessing_ctx, command):
+        check.inst_param(command, "command", ChildProcessWorkerCommand)
+
+        self._task_queue = multiprocessing_ctx.Queue()
+        self._event_queue = multiprocessing_ctx.Queue()
+        self._process = multiprocessing_ctx.Process(
+            target=_execute_worker_command_in_child_process,
+            args=(self._task_queue, self._event_queue, command),
+        )
+        self._process.start()
+        self._accepting_tasks = True
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    @property
+    def is_accepting_tasks(self):
+        return self._accepting_tasks
+
+    def execute_task(self, task):
+        """Sends a task to the child process, and polls the queue for the events yielded by the
+        child process until the task is done.
+
+        Yields the same set of objects as execute_child_process_command, and raises a
+        ChildProcessCrashException if the child process dies before the task is done.
+        """
+        check.invariant(self._accepting_tasks, "Worker is no longer accepting tasks")
+        check.invariant(task is not None, "None is reserved as the worker shutdown sentinel")
+
+        self._task_queue.put(task)
+
+        while True:
+            event = _poll_for_event(self._process, self._event_queue)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                self._accepting_tasks = False
+                raise ChildProcessCrashException(exit_code=self._process.exitcode)
+
+            yield event
+
+            if isinstance(event, ChildProcessTaskDoneEvent):
+                if event.recycle:
+                    self._accepting_tasks = False
+                return
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                self._accepting_tasks = False
+                return
+
+    def shutdown(self):
+        """Asks the child process to exit once it is idle, and waits for it to do so."""
+        self._accepting_tasks = False
+        try:
+            if self._process.is_alive():
+                self._task_queue.put(None)
+
+            # drain the event queue, so that the child process is not blocked on flushing it
+            while _poll_for_event(self._process, self._event_queue) != PROCESS_DEAD_AND_QUEUE_EMPTY:
+                pass
+
+            self._process.join()
+        finally:
+            self._task_queue.close()
+            self._event_queue.close()
+
+    def terminate(self):
+        """Kills the child process without waiting for its current task to finish."""
+        self._accepting_tasks = False
+        try:
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process.join()
+        finally:
+            self._task_queue.close()
+            self._event_queue.close()
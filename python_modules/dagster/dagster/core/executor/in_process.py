@@ -1,11 +1,15 @@
 import os
+from functools import partial
 
 from dagster import check
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.api import ExecuteRunWithPlanIterable
 from dagster.core.execution.context.system import PlanOrchestrationContext
 from dagster.core.execution.context_creation_pipeline import PlanExecutionContextManager
-from dagster.core.execution.plan.execute_plan import inner_plan_execution_iterator
+from dagster.core.execution.plan.execute_plan import (
+    async_plan_execution_iterator,
+    inner_plan_execution_iterator,
+)
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import RetryMode
 from dagster.utils.timing import format_duration, time_execution_scope
@@ -14,9 +18,13 @@
 
 
 class InProcessExecutor(Executor):
-    def __init__(self, retries, marker_to_close):
+    def __init__(self, retries, marker_to_close, release_outputs=False, async_max_concurrent=None):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         self.marker_to_close = check.opt_str_param(marker_to_close, "marker_to_close")
+        self._release_outputs = check.bool_param(release_outputs, "release_outputs")
+        self._async_max_concurrent = check.opt_int_param(
+            async_max_concurrent, "async_max_concurrent"
+        )
 
     @property
     def retries(self):
@@ -34,11 +42,20 @@ def execute(self, plan_context, execution_plan):
             event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
         )
 
+        if self._async_max_concurrent:
+            iterator = partial(
+                async_plan_execution_iterator,
+                max_concurrent=self._async_max_concurrent,
+                release_outputs=self._release_outputs,
+            )
+        else:
+            iterator = partial(inner_plan_execution_iterator, release_outputs=self._release_outputs)
+
         with time_execution_scope() as timer_result:
             yield from iter(
                 ExecuteRunWithPlanIterable(
                     execution_plan=plan_context.execution_plan,
-                    iterator=inner_plan_execution_iterator,
+                    iterator=iterator,
                     execution_context_manager=PlanExecutionContextManager(
                         pipeline=plan_context.pipeline,
                         retry_mode=plan_context.retry_mode,
@@ -1,6 +1,7 @@
 import multiprocessing
 import os
 import sys
+from contextlib import contextmanager
 from typing import List, Optional
 
 from dagster import MetadataEntry, check
@@ -10,13 +11,15 @@
     DagsterUnmetExecutorRequirementsError,
 )
 from dagster.core.events import DagsterEvent, EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.api import create_step_execution_plan, execute_plan_iterator
 from dagster.core.execution.context.system import PlanOrchestrationContext
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import RetryMode
+from dagster.core.execution.step_ordering import PriorityStepOrdering, StepOrdering
 from dagster.core.executor.base import Executor
 from dagster.core.instance import DagsterInstance
+from dagster.seven import IS_WINDOWS
 from dagster.utils import start_termination_thread
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.timing import format_duration, time_execution_scope
@@ -26,6 +29,9 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessTaskDoneEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerCommand,
     execute_child_process_command,
 )
 
@@ -43,6 +49,8 @@ def __init__(
         recon_pipeline,
         retry_mode,
         known_state,
+        execution_plan_snapshot=None,
+        execution_plan_snapshot_id=None,
     ):
         self.run_config = run_config
         self.pipeline_run = pipeline_run
@@ -52,17 +60,20 @@ def __init__(
         self.recon_pipeline = recon_pipeline
         self.retry_mode = retry_mode
         self.known_state = known_state
+        self.execution_plan_snapshot = execution_plan_snapshot
+        self.execution_plan_snapshot_id = execution_plan_snapshot_id
 
     def execute(self):
         pipeline = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             start_termination_thread(self.term_event)
-            execution_plan = create_execution_plan(
-                pipeline=pipeline,
-                run_config=self.run_config,
-                mode=self.pipeline_run.mode,
+            execution_plan = create_step_execution_plan(
+                pipeline,
+                self.pipeline_run,
                 step_keys_to_execute=[self.step_key],
                 known_state=self.known_state,
+                execution_plan_snapshot=self.execution_plan_snapshot,
+                execution_plan_snapshot_id=self.execution_plan_snapshot_id,
             )
 
             yield instance.report_engine_event(
@@ -89,6 +100,146 @@ def execute(self):
             )
 
 
+def get_peak_rss_mb() -> float:
+    """The peak resident set size of the current process, in megabytes"""
+    if IS_WINDOWS:
+        import psutil  # pylint: disable=import-error
+
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+
+    import resource  # pylint: disable=import-error
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS, and in kilobytes elsewhere
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+class MultiprocessExecutorWorkerCommand(ChildProcessWorkerCommand):
+    """Executes steps in a long-lived child process, loading the instance once for all the steps
+    it executes."""
+
+    def __init__(
+        self,
+        run_config,
+        pipeline_run,
+        instance_ref,
+        term_event,
+        recon_pipeline,
+        retry_mode,
+        max_steps_per_process=None,
+        max_process_memory_mb=None,
+        execution_plan_snapshot=None,
+        execution_plan_snapshot_id=None,
+    ):
+        self.run_config = run_config
+        self.pipeline_run = pipeline_run
+        self.instance_ref = instance_ref
+        self.term_event = term_event
+        self.recon_pipeline = recon_pipeline
+        self.retry_mode = retry_mode
+        self.max_steps_per_process = max_steps_per_process
+        self.max_process_memory_mb = max_process_memory_mb
+        self.execution_plan_snapshot = execution_plan_snapshot
+        self.execution_plan_snapshot_id = execution_plan_snapshot_id
+
+    def should_recycle(self, steps_executed):
+        if self.max_steps_per_process and steps_executed >= self.max_steps_per_process:
+            return True
+
+        return bool(self.max_process_memory_mb and get_peak_rss_mb() >= self.max_process_memory_mb)
+
+    def execute(self, tasks):
+        pipeline = self.recon_pipeline
+        with DagsterInstance.from_ref(self.instance_ref) as instance:
+            start_termination_thread(self.term_event)
+
+            steps_executed = 0
+            for step_key, known_state in tasks:
+                execution_plan = create_step_execution_plan(
+                    pipeline,
+                    self.pipeline_run,
+                    step_keys_to_execute=[step_key],
+                    known_state=known_state,
+                    execution_plan_snapshot=self.execution_plan_snapshot,
+                    execution_plan_snapshot_id=self.execution_plan_snapshot_id,
+                )
+
+                yield instance.report_engine_event(
+                    "Executing step {} in subprocess".format(step_key),
+                    self.pipeline_run,
+                    EngineEventData(
+                        [
+                            MetadataEntry("pid", value=str(os.getpid())),
+                            MetadataEntry("step_key", value=step_key),
+                        ],
+                        marker_end=DELEGATE_MARKER,
+                    ),
+                    MultiprocessExecutor,
+                    step_key,
+                )
+
+                yield from execute_plan_iterator(
+                    execution_plan,
+                    pipeline,
+                    self.pipeline_run,
+                    run_config=self.run_config,
+                    retry_mode=self.retry_mode.for_inner_plan(),
+                    instance=instance,
+                )
+
+                steps_executed += 1
+                recycle = self.should_recycle(steps_executed)
+                yield ChildProcessTaskDoneEvent(pid=os.getpid(), recycle=recycle)
+                if recycle:
+                    return
+
+
+class MultiprocessWorkerPool:
+    """The worker processes of a single run, when the MultiprocessExecutor reuses processes.
+
+    Workers are started on demand, and are returned to the pool once a step has been executed,
+    unless they have exited or asked to be recycled.
+    """
+
+    def __init__(self, multiproc_ctx, command_fn):
+        self._multiproc_ctx = multiproc_ctx
+        self._command_fn = check.callable_param(command_fn, "command_fn")
+        self._workers = {}
+        self._idle_workers = []
+
+    def acquire(self):
+        """Returns an idle worker, starting a new one if there are none, along with the event used
+        to interrupt it."""
+        if self._idle_workers:
+            worker = self._idle_workers.pop()
+            return worker, self._workers[worker]
+
+        term_event = self._multiproc_ctx.Event()
+        worker = ChildProcessWorker(self._multiproc_ctx, self._command_fn(term_event))
+        self._workers[worker] = term_event
+        return worker, term_event
+
+    def release(self, worker):
+        if worker not in self._workers:
+            return
+
+        if worker.is_accepting_tasks:
+            self._idle_workers.append(worker)
+        else:
+            del self._workers[worker]
+            worker.shutdown()
+
+    def shutdown(self):
+        for worker in self._workers:
+            if worker in self._idle_workers:
+                worker.shutdown()
+            else:
+                worker.terminate()
+
+        self._workers = {}
+        self._idle_workers = []
+
+
 class MultiprocessExecutor(Executor):
     def __init__(
         self,
@@ -96,6 +247,10 @@ def __init__(
         max_concurrent: int,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[List[str]] = None,
+        reuse_processes: bool = False,
+        max_steps_per_process: Optional[int] = None,
+        max_process_memory_mb: Optional[int] = None,
+        step_ordering: Optional[StepOrdering] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
@@ -113,11 +268,55 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._reuse_processes = check.bool_param(reuse_processes, "reuse_processes")
+        self._max_steps_per_process = check.opt_int_param(
+            max_steps_per_process, "max_steps_per_process"
+        )
+        self._max_process_memory_mb = check.opt_int_param(
+            max_process_memory_mb, "max_process_memory_mb"
+        )
+        self._step_ordering = check.opt_inst_param(
+            step_ordering, "step_ordering", StepOrdering, PriorityStepOrdering()
+        )
 
     @property
     def retries(self):
         return self._retries
 
+    @contextmanager
+    def _worker_pool(
+        self,
+        multiproc_ctx,
+        pipeline,
+        plan_context,
+        execution_plan_snapshot,
+        execution_plan_snapshot_id,
+    ):
+        if not self._reuse_processes:
+            yield None
+            return
+
+        instance_ref = plan_context.instance.get_ref()
+        worker_pool = MultiprocessWorkerPool(
+            multiproc_ctx,
+            lambda term_event: MultiprocessExecutorWorkerCommand(
+                run_config=plan_context.run_config,
+                pipeline_run=plan_context.pipeline_run,
+                instance_ref=instance_ref,
+                term_event=term_event,
+                recon_pipeline=pipeline,
+                retry_mode=self.retries,
+                max_steps_per_process=self._max_steps_per_process,
+                max_process_memory_mb=self._max_process_memory_mb,
+                execution_plan_snapshot=execution_plan_snapshot,
+                execution_plan_snapshot_id=execution_plan_snapshot_id,
+            ),
+        )
+        try:
+            yield worker_pool
+        finally:
+            worker_pool.shutdown()
+
     def execute(self, plan_context, execution_plan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
@@ -147,6 +346,15 @@ def execute(self, plan_context, execution_plan):
 
         limit = self._max_concurrent
 
+        # step processes rebuild their execution plan from the snapshot persisted for the run,
+        # instead of building it from scratch
+        execution_plan_snapshot_id = plan_context.pipeline_run.execution_plan_snapshot_id
+        execution_plan_snapshot = (
+            plan_context.instance.get_execution_plan_snapshot(execution_plan_snapshot_id)
+            if execution_plan_snapshot_id
+            else None
+        )
+
         yield DagsterEvent.engine_event(
             plan_context,
             "Executing steps using multiprocess executor: parent process (pid: {pid})".format(
@@ -161,7 +369,18 @@ def execute(self, plan_context, execution_plan):
         # garbage collect results that are no longer needed by any steps
         # https://github.com/dagster-io/dagster/issues/811
         with time_execution_scope() as timer_result:
-            with execution_plan.start(retry_mode=self.retries) as active_execution:
+            with execution_plan.start(
+                retry_mode=self.retries,
+                sort_key_fn=self._step_ordering.get_sort_key_fn(plan_context, execution_plan),
+            ) as active_execution, (
+                self._worker_pool(
+                    multiproc_ctx,
+                    pipeline,
+                    plan_context,
+                    execution_plan_snapshot,
+                    execution_plan_snapshot_id,
+                )
+            ) as worker_pool:
                 active_iters = {}
                 errors = {}
                 term_events = {}
@@ -191,6 +410,18 @@ def execute(self, plan_context, execution_plan):
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
+                            if worker_pool:
+                                worker, term_events[step.key] = worker_pool.acquire()
+                                active_iters[step.key] = execute_step_in_worker(
+                                    worker_pool,
+                                    worker,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    active_execution.get_known_state(),
+                                )
+                                continue
+
                             term_events[step.key] = multiproc_ctx.Event()
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
@@ -201,6 +432,8 @@ def execute(self, plan_context, execution_plan):
                                 term_events,
                                 self.retries,
                                 active_execution.get_known_state(),
+                                execution_plan_snapshot,
+                                execution_plan_snapshot_id,
                             )
 
                     # process active iterators
@@ -301,6 +534,8 @@ def execute_step_out_of_process(
     term_events,
     retries,
     known_state,
+    execution_plan_snapshot=None,
+    execution_plan_snapshot_id=None,
 ):
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -311,6 +546,8 @@ def execute_step_out_of_process(
         recon_pipeline=pipeline,
         retry_mode=retries,
         known_state=known_state,
+        execution_plan_snapshot=execution_plan_snapshot,
+        execution_plan_snapshot_id=execution_plan_snapshot_id,
     )
 
     yield DagsterEvent.engine_event(
@@ -328,3 +565,38 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         else:
             check.failed("Unexpected return value from child process {}".format(type(ret)))
+
+
+def execute_step_in_worker(
+    worker_pool,
+    worker,
+    step_context,
+    step,
+    errors,
+    known_state,
+):
+    yield DagsterEvent.engine_event(
+        step_context,
+        "Executing {step_key} in worker process (pid: {pid})".format(
+            step_key=step.key, pid=worker.pid
+        ),
+        EngineEventData(marker_start=DELEGATE_MARKER),
+        step_handle=step.handle,
+    )
+
+    completed = False
+    try:
+        for ret in worker.execute_task((step.key, known_state)):
+            if ret is None or isinstance(ret, DagsterEvent):
+                yield ret
+            elif isinstance(ret, ChildProcessEvent):
+                if isinstance(ret, ChildProcessSystemErrorEvent):
+                    errors[ret.pid] = ret.error_info
+            else:
+                check.failed("Unexpected return value from child process {}".format(type(ret)))
+        completed = True
+    finally:
+        if not completed and worker.is_accepting_tasks:
+            # the step was abandoned before it finished executing, so the worker can not be reused
+            worker.terminate()
+        worker_pool.release(worker)
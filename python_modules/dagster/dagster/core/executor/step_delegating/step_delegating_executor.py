@@ -1,8 +1,9 @@
+import sys
+import threading
 import time
+from contextlib import contextmanager
 from typing import Dict, List, Optional, cast
 
-import pendulum
-
 from dagster import check
 from dagster.core.events import (
     DagsterEvent,
@@ -15,8 +16,10 @@
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.plan.step import ExecutionStep
 from dagster.core.execution.retries import RetryMode
+from dagster.core.execution.step_ordering import PriorityStepOrdering, StepOrdering
 from dagster.core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
 from dagster.grpc.types import ExecuteStepArgs
+from dagster.utils.error import serializable_error_info_from_exc_info
 
 from ..base import Executor
 
@@ -28,13 +31,21 @@ def __init__(
         retries: RetryMode,
         sleep_seconds: Optional[float] = None,
         check_step_health_interval_seconds: Optional[int] = None,
+        max_sleep_seconds: Optional[float] = None,
         should_verify_step: bool = False,
+        step_ordering: Optional[StepOrdering] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
         self._sleep_seconds = cast(
             float, check.opt_float_param(sleep_seconds, "sleep_seconds", default=0.1)
         )
+        self._max_sleep_seconds = cast(
+            float,
+            check.opt_float_param(
+                max_sleep_seconds, "max_sleep_seconds", default=max(1.0, self._sleep_seconds)
+            ),
+        )
         self._check_step_health_interval_seconds = cast(
             int,
             check.opt_int_param(
@@ -42,6 +53,9 @@ def __init__(
             ),
         )
         self._should_verify_step = should_verify_step
+        self._step_ordering = check.opt_inst_param(
+            step_ordering, "step_ordering", StepOrdering, PriorityStepOrdering()
+        )
 
     @property
     def retries(self):
@@ -54,6 +68,33 @@ def _pop_events(self, instance, run_id) -> List[DagsterEvent]:
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
         return dagster_events
 
+    @contextmanager
+    def _watch_new_events(self, plan_context: PlanOrchestrationContext):
+        """Subscribes to the events written to the event log for the run, with LISTEN/NOTIFY on
+        Postgres and filesystem notifications on SQLite. Yields a threading.Event that is set
+        whenever new events are written, or None if the event log storage can not be watched, in
+        which case the executor falls back to polling."""
+        new_events = threading.Event()
+
+        def _on_new_event(_event_record):
+            new_events.set()
+
+        instance = plan_context.instance
+        try:
+            instance.watch_event_logs(plan_context.run_id, self._event_cursor, _on_new_event)
+        except Exception:
+            plan_context.log.debug(
+                "Could not watch the event log for new events, polling it instead: "
+                + serializable_error_info_from_exc_info(sys.exc_info()).to_string()
+            )
+            yield None
+            return
+
+        try:
+            yield new_events
+        finally:
+            instance.end_watch_event_logs(plan_context.run_id, _on_new_event)
+
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
@@ -93,7 +134,10 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             EngineEventData(),
         )
 
-        with execution_plan.start(retry_mode=self.retries) as active_execution:
+        with execution_plan.start(
+            retry_mode=self.retries,
+            sort_key_fn=self._step_ordering.get_sort_key_fn(plan_context, execution_plan),
+        ) as active_execution, self._watch_new_events(plan_context) as new_events:
             running_steps: Dict[str, ExecutionStep] = {}
 
             if plan_context.resume_from_failure:
@@ -138,7 +182,12 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                     running_steps[step.key] = step
 
-            last_check_step_health_time = pendulum.now("UTC")
+            # each running step is checked on at most once per interval, starting from when it was
+            # launched
+            last_check_step_health_times = {
+                step_key: time.time() for step_key in running_steps.keys()
+            }
+            sleep_seconds = self._sleep_seconds
 
             # Order of events is important here. During an interation, we call handle_event, then get_steps_to_execute,
             # then is_complete. get_steps_to_execute updates the state of ActiveExecution, and without it
@@ -181,10 +230,11 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                     return
 
-                for dagster_event in self._pop_events(
+                dagster_events = self._pop_events(
                     plan_context.instance,
                     plan_context.run_id,
-                ):  # type: ignore
+                )
+                for dagster_event in dagster_events:
 
                     # STEP_SKIPPED events are only emitted by ActiveExecution, which already handles
                     # and yields them.
@@ -199,30 +249,34 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         if dagster_event.is_step_success or dagster_event.is_step_failure:
                             assert isinstance(dagster_event.step_key, str)
                             del running_steps[dagster_event.step_key]
+                            del last_check_step_health_times[dagster_event.step_key]
                             active_execution.verify_complete(plan_context, dagster_event.step_key)
 
                 # process skips from failures or uncovered inputs
                 for event in active_execution.plan_events_iterator(plan_context):
                     yield event
 
-                curr_time = pendulum.now("UTC")
-                if (
-                    curr_time - last_check_step_health_time
-                ).total_seconds() >= self._check_step_health_interval_seconds:
-                    last_check_step_health_time = curr_time
-                    for _, step in running_steps.items():
-                        self._log_new_events(
-                            self._step_handler.check_step_health(
-                                self._get_step_handler_context(
-                                    plan_context, [step], active_execution
-                                )
-                            ),
-                            plan_context,
-                            running_steps,
-                        )
+                curr_time = time.time()
+                for step_key, step in running_steps.items():
+                    if (
+                        curr_time - last_check_step_health_times[step_key]
+                        < self._check_step_health_interval_seconds
+                    ):
+                        continue
+
+                    last_check_step_health_times[step_key] = curr_time
+                    self._log_new_events(
+                        self._step_handler.check_step_health(
+                            self._get_step_handler_context(plan_context, [step], active_execution)
+                        ),
+                        plan_context,
+                        running_steps,
+                    )
 
-                for step in active_execution.get_steps_to_execute():
+                launched_steps = active_execution.get_steps_to_execute()
+                for step in launched_steps:
                     running_steps[step.key] = step
+                    last_check_step_health_times[step.key] = time.time()
                     self._log_new_events(
                         self._step_handler.launch_step(
                             self._get_step_handler_context(plan_context, [step], active_execution)
@@ -231,4 +285,21 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         running_steps,
                     )
 
-                time.sleep(self._sleep_seconds)
+                # the last step may have just finished, in which case no new events will end the
+                # wait
+                if active_execution.is_complete:
+                    continue
+
+                # wait for new events, backing off while none arrive. When the event log is
+                # watched, new events end the wait early, and the backoff only bounds how long
+                # a missed notification can go unnoticed
+                if dagster_events or launched_steps:
+                    sleep_seconds = self._sleep_seconds
+                else:
+                    sleep_seconds = min(sleep_seconds * 2, self._max_sleep_seconds)
+
+                if new_events:
+                    new_events.wait(sleep_seconds)
+                    new_events.clear()
+                else:
+                    time.sleep(sleep_seconds)
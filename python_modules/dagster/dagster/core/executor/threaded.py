@@ -0,0 +1,92 @@
+import multiprocessing
+import os
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from dagster import check
+from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.api import ExecuteRunWithPlanIterable
+from dagster.core.execution.context.system import PlanOrchestrationContext
+from dagster.core.execution.context_creation_pipeline import PlanExecutionContextManager
+from dagster.core.execution.plan.execute_plan import threaded_plan_execution_iterator
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.retries import RetryMode
+from dagster.core.execution.step_ordering import PriorityStepOrdering, StepOrdering
+from dagster.utils.timing import format_duration, time_execution_scope
+
+from .base import Executor
+
+
+class ThreadedExecutor(Executor):
+    def __init__(
+        self,
+        retries: RetryMode,
+        max_concurrent: int,
+        tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
+        step_ordering: Optional[StepOrdering] = None,
+    ):
+        self._retries = check.inst_param(retries, "retries", RetryMode)
+        max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
+        self._max_concurrent = check.int_param(max_concurrent, "max_concurrent")
+        self._tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, "tag_concurrency_limits", of_type=dict
+        )
+        for tag_limit in self._tag_concurrency_limits:
+            # steps blocked while no other step is running would never be executed
+            check.invariant(
+                tag_limit["limit"] >= 1,
+                f"The tag concurrency limit for the tag key \"{tag_limit['key']}\" must be at least "
+                f"1, got {tag_limit['limit']}",
+            )
+        self._step_ordering = check.opt_inst_param(
+            step_ordering, "step_ordering", StepOrdering, PriorityStepOrdering()
+        )
+
+    @property
+    def retries(self):
+        return self._retries
+
+    def execute(self, plan_context, execution_plan):
+        check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+        step_keys_to_execute = execution_plan.step_keys_to_execute
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Executing steps in threads of process (pid: {pid})".format(pid=os.getpid()),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+        with time_execution_scope() as timer_result:
+            yield from iter(
+                ExecuteRunWithPlanIterable(
+                    execution_plan=plan_context.execution_plan,
+                    iterator=partial(
+                        threaded_plan_execution_iterator,
+                        max_concurrent=self._max_concurrent,
+                        sort_key_fn=self._step_ordering.get_sort_key_fn(
+                            plan_context, execution_plan
+                        ),
+                        tag_concurrency_limits=self._tag_concurrency_limits,
+                    ),
+                    execution_context_manager=PlanExecutionContextManager(
+                        pipeline=plan_context.pipeline,
+                        retry_mode=plan_context.retry_mode,
+                        execution_plan=plan_context.execution_plan,
+                        run_config=plan_context.run_config,
+                        pipeline_run=plan_context.pipeline_run,
+                        instance=plan_context.instance,
+                        raise_on_error=plan_context.raise_on_error,
+                        output_capture=plan_context.output_capture,
+                    ),
+                )
+            )
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Finished steps in threads of process (pid: {pid}) in {duration_ms}".format(
+                pid=os.getpid(), duration_ms=format_duration(timer_result.millis)
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
@@ -27,7 +27,10 @@
 from dagster.core.definitions.mode import DEFAULT_MODE_NAME
 from dagster.core.definitions.node_definition import NodeDefinition
 from dagster.core.definitions.partition import PartitionScheduleDefinition, ScheduleType
-from dagster.core.definitions.schedule_definition import DefaultScheduleStatus
+from dagster.core.definitions.schedule_definition import (
+    DefaultScheduleStatus,
+    ScheduleExecutionData,
+)
 from dagster.core.definitions.sensor_definition import (
     AssetSensorDefinition,
     DefaultSensorStatus,
@@ -298,6 +301,28 @@ def __new__(cls, error: Optional[SerializableErrorInfo]):
         )
 
 
+@whitelist_for_serdes
+class ExternalScheduleBatchExecutionData(
+    NamedTuple(
+        "_ExternalScheduleBatchExecutionData",
+        [("results", List[Union[ScheduleExecutionData, ExternalScheduleExecutionErrorData]])],
+    )
+):
+    """The results of evaluating a schedule at several times, in the order of the times"""
+
+    def __new__(
+        cls, results: List[Union[ScheduleExecutionData, ExternalScheduleExecutionErrorData]]
+    ):
+        return super(ExternalScheduleBatchExecutionData, cls).__new__(
+            cls,
+            results=check.list_param(
+                results,
+                "results",
+                of_type=(ScheduleExecutionData, ExternalScheduleExecutionErrorData),
+            ),
+        )
+
+
 @whitelist_for_serdes
 class ExternalTargetData(
     NamedTuple(
@@ -17,8 +17,13 @@
     sync_get_external_partition_tags_grpc,
 )
 from dagster.api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
-from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
-from dagster.api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
+from dagster.api.snapshot_repository import (
+    sync_get_streaming_external_repositories_data_and_hashes_grpc,
+)
+from dagster.api.snapshot_schedule import (
+    sync_get_external_schedule_batch_execution_data_grpc,
+    sync_get_external_schedule_execution_data_grpc,
+)
 from dagster.api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
 from dagster.core.code_pointer import CodePointer
 from dagster.core.definitions.reconstructable import (
@@ -187,6 +192,22 @@ def get_external_schedule_execution_data(
     ) -> Union["ScheduleExecutionData", "ExternalScheduleExecutionErrorData"]:
         pass
 
+    def get_external_schedule_batch_execution_data(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        schedule_name: str,
+        scheduled_execution_times: List[datetime.datetime],
+    ) -> List[Union["ScheduleExecutionData", "ExternalScheduleExecutionErrorData"]]:
+        """Evaluates a schedule at each of the given times, which share a timezone. Evaluation
+        errors are returned in place of the execution data of the time that failed."""
+        return [
+            self.get_external_schedule_execution_data(
+                instance, repository_handle, schedule_name, scheduled_execution_time
+            )
+            for scheduled_execution_time in scheduled_execution_times
+        ]
+
     @abstractmethod
     def get_external_sensor_execution_data(
         self,
@@ -196,6 +217,7 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        timeout: Optional[float] = None,
     ) -> Union["SensorExecutionData", "ExternalSensorExecutionErrorData"]:
         pass
 
@@ -442,7 +464,9 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        timeout: Optional[float] = None,
     ) -> Union["SensorExecutionData", "ExternalSensorExecutionErrorData"]:
+        # sensors are evaluated in this process, so can not be timed out
         return get_external_sensor_execution(
             self._recon_repo, instance.get_ref(), name, last_completion_time, last_run_key, cursor
         )
@@ -510,19 +534,21 @@ def __init__(
 
         self.server_id = None
         self._external_repositories_data = None
+        self._repository_data_hashes = None
 
         self._executable_path = None
         self._container_image = None
         self._repository_code_pointer_dict = None
         self._entry_point = None
 
+        self.client = DagsterGrpcClient(
+            port=self._port,
+            socket=self._socket,
+            host=self._host,
+            use_ssl=self._use_ssl,
+        )
+
         try:
-            self.client = DagsterGrpcClient(
-                port=self._port,
-                socket=self._socket,
-                host=self._host,
-                use_ssl=self._use_ssl,
-            )
             list_repositories_response = sync_list_repositories_grpc(self.client)
 
             self.server_id = server_id if server_id else sync_get_server_id(self.client)
@@ -552,10 +578,21 @@ def __init__(
 
             self._container_image = self._reload_current_image()
 
-            self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
-                self.client,
-                self,
+            external_repositories_data_and_hashes = (
+                sync_get_streaming_external_repositories_data_and_hashes_grpc(
+                    self.client,
+                    self,
+                    list_repositories_response.repository_data_hashes,
+                )
             )
+            self._external_repositories_data = {
+                repo_name: repo_data
+                for repo_name, (repo_data, _) in external_repositories_data_and_hashes.items()
+            }
+            self._repository_data_hashes = {
+                repo_name: data_hash
+                for repo_name, (_, data_hash) in external_repositories_data_and_hashes.items()
+            }
 
             self.external_repositories = {
                 repo_name: ExternalRepository(
@@ -591,6 +628,12 @@ def executable_path(self) -> Optional[str]:
     def entry_point(self) -> Optional[List[str]]:
         return self._entry_point
 
+    @property
+    def repository_data_hashes(self) -> Dict[str, str]:
+        """The hashes of the serialized data of the loaded repositories, which can be compared to
+        the hashes the server reports when listing repositories."""
+        return cast(Dict[str, str], self._repository_data_hashes)
+
     @property
     def port(self) -> Optional[int]:
         return self._port
@@ -630,6 +673,10 @@ def cleanup(self) -> None:
             self._watch_thread.join()
             self._watch_thread = None
 
+        # calls in flight, e.g. from requests that still hold this location, finish before the
+        # channel is closed
+        self.client.close()
+
     @property
     def is_reload_supported(self) -> bool:
         return True
@@ -743,6 +790,26 @@ def get_external_schedule_execution_data(
             scheduled_execution_time,
         )
 
+    def get_external_schedule_batch_execution_data(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        schedule_name: str,
+        scheduled_execution_times: List[datetime.datetime],
+    ) -> List[Union["ScheduleExecutionData", "ExternalScheduleExecutionErrorData"]]:
+        check.inst_param(instance, "instance", DagsterInstance)
+        check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+        check.str_param(schedule_name, "schedule_name")
+
+        # one request for all of the times, rather than one per time
+        return sync_get_external_schedule_batch_execution_data_grpc(
+            self.client,
+            instance,
+            repository_handle,
+            schedule_name,
+            scheduled_execution_times,
+        )
+
     def get_external_sensor_execution_data(
         self,
         instance: DagsterInstance,
@@ -751,6 +818,7 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        timeout: Optional[float] = None,
     ) -> "SensorExecutionData":
         return sync_get_external_sensor_execution_data_grpc(
             self.client,
@@ -760,6 +828,7 @@ def get_external_sensor_execution_data(
             last_completion_time,
             last_run_key,
             cursor,
+            timeout=timeout,
         )
 
     def get_external_partition_set_execution_param_data(
@@ -63,6 +63,7 @@
 
 from .config import DAGSTER_CONFIG_YAML_FILENAME, is_dagster_home_set
 from .ref import InstanceRef
+from .snapshot_cache import SnapshotCache, SnapshotCacheStats
 
 # 'airflow_execution_date' and 'is_airflow_ingest_pipeline' are hardcoded tags used in the
 # airflow ingestion logic (see: dagster_pipeline_factory.py). 'airflow_execution_date' stores the
@@ -77,6 +78,7 @@
     from dagster.core.debug import DebugRunPayload
     from dagster.core.events import DagsterEvent, DagsterEventType
     from dagster.core.events.log import EventLogEntry
+    from dagster.core.execution.plan.outputs import StepOutputHandle
     from dagster.core.execution.stats import RunStepKeyStatsSnapshot
     from dagster.core.host_representation import HistoricalPipeline
     from dagster.core.launcher import RunLauncher
@@ -87,6 +89,7 @@
     from dagster.core.storage.compute_log_manager import ComputeLogManager
     from dagster.core.storage.event_log import EventLogStorage
     from dagster.core.storage.event_log.base import EventLogRecord, EventRecordsFilter
+    from dagster.core.storage.event_log.buffered_writer import BufferedEventLogWriter
     from dagster.core.storage.root import LocalArtifactStorage
     from dagster.core.storage.runs import RunStorage
     from dagster.core.storage.schedules import ScheduleStorage
@@ -312,6 +315,11 @@ def __init__(
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
+        self._buffered_event_log_writer: Optional["BufferedEventLogWriter"] = None
+
+        # snapshots are immutable, so they can be cached for the lifetime of the instance
+        self._snapshot_cache = SnapshotCache()
+
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         if run_monitoring_enabled and not self.run_launcher.supports_check_run_worker_health:
             run_monitoring_enabled = False
@@ -327,6 +335,12 @@ def __init__(
                 "worker will be marked as failed, but will not be resumed.",
             )
 
+        if self.event_log_retention_enabled:
+            from dagster.core.storage.event_log.retention import EventLogRetentionPolicy
+
+            # surface invalid retention settings when the instance loads, not in the daemon
+            EventLogRetentionPolicy.from_settings(self.event_log_retention_settings)
+
     # ctors
 
     @staticmethod
@@ -624,6 +638,70 @@ def python_log_level(self) -> Optional[str]:
         python_log_settings = self.get_settings("python_logs") or {}
         return python_log_settings.get("python_log_level")
 
+    # buffered event logs
+
+    @property
+    def buffered_event_logs_settings(self) -> Dict:
+        return self.get_settings("buffered_event_logs")
+
+    @property
+    def buffered_event_logs_enabled(self) -> bool:
+        return self.buffered_event_logs_settings.get("enabled", False)
+
+    # sensors
+
+    @property
+    def sensor_settings(self) -> Dict:
+        return self.get_settings("sensors")
+
+    @property
+    def sensor_use_threads(self) -> bool:
+        return self.sensor_settings.get("use_threads", False)
+
+    @property
+    def sensor_num_workers(self) -> Optional[int]:
+        return self.sensor_settings.get("num_workers")
+
+    @property
+    def sensor_max_concurrent_per_location(self) -> Optional[int]:
+        return self.sensor_settings.get("max_concurrent_per_location")
+
+    @property
+    def sensor_timeout_seconds(self) -> Optional[float]:
+        return self.sensor_settings.get("timeout_seconds")
+
+    # schedules
+
+    @property
+    def schedule_settings(self) -> Dict:
+        return self.get_settings("schedules")
+
+    @property
+    def schedule_use_threads(self) -> bool:
+        return self.schedule_settings.get("use_threads", False)
+
+    @property
+    def schedule_num_workers(self) -> Optional[int]:
+        return self.schedule_settings.get("num_workers")
+
+    # event log retention
+
+    @property
+    def event_log_retention_settings(self) -> Dict:
+        return self.get_settings("event_log_retention")
+
+    @property
+    def event_log_retention_enabled(self) -> bool:
+        return self.event_log_retention_settings.get("enabled", False)
+
+    @property
+    def event_log_retention_interval_seconds(self) -> int:
+        from dagster.core.storage.event_log.retention import DEFAULT_RETENTION_INTERVAL_SECONDS
+
+        return self.event_log_retention_settings.get(
+            "interval_seconds", DEFAULT_RETENTION_INTERVAL_SECONDS
+        )
+
     def upgrade(self, print_fn=None):
         from dagster.core.storage.migration.utils import upgrading_instance
 
@@ -656,11 +734,42 @@ def reindex(self, print_fn=lambda _: None):
         self._run_storage.optimize(print_fn)
         print_fn("Done.")
 
+    def compact_event_logs(self, policy=None, print_fn=None):
+        """Purges the event log rows matched by a retention policy, defaulting to the policy in the
+        ``event_log_retention`` settings of the instance.
+
+        Returns:
+            EventLogCompactionResult
+        """
+        from dagster.core.storage.event_log.retention import compact_event_logs
+
+        return compact_event_logs(self, self._event_log_retention_policy(policy), print_fn)
+
+    def compact_event_logs_iterator(self, policy=None):
+        """Purges the event log rows matched by a retention policy, like `compact_event_logs`, and
+        yields an EventLogCompactionResult with the running totals after every batch of purged rows.
+        """
+        from dagster.core.storage.event_log.retention import compact_event_logs_iterator
+
+        return compact_event_logs_iterator(self, self._event_log_retention_policy(policy))
+
+    def _event_log_retention_policy(self, policy):
+        from dagster.core.storage.event_log.retention import EventLogRetentionPolicy
+
+        if policy is None:
+            return EventLogRetentionPolicy.from_settings(self.event_log_retention_settings)
+
+        return check.inst_param(policy, "policy", EventLogRetentionPolicy)
+
     def dispose(self):
+        if self._buffered_event_log_writer:
+            self._buffered_event_log_writer.close()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
         self._run_launcher.dispose()
         self._event_storage.dispose()
+        if self._schedule_storage:
+            self._schedule_storage.dispose()
         self._compute_log_manager.dispose()
 
     # run storage
@@ -670,23 +779,25 @@ def get_run_by_id(self, run_id: str) -> Optional[PipelineRun]:
 
     @traced
     def get_pipeline_snapshot(self, snapshot_id: str) -> "PipelineSnapshot":
-        return self._run_storage.get_pipeline_snapshot(snapshot_id)
+        return self._snapshot_cache.get(
+            snapshot_id, self._run_storage.get_pipeline_snapshot_and_size
+        )
 
     @traced
     def has_pipeline_snapshot(self, snapshot_id: str) -> bool:
-        return self._run_storage.has_pipeline_snapshot(snapshot_id)
+        return self._snapshot_cache.has(snapshot_id, self._run_storage.has_pipeline_snapshot)
 
     @traced
     def has_snapshot(self, snapshot_id: str) -> bool:
-        return self._run_storage.has_snapshot(snapshot_id)
+        return self._snapshot_cache.has(snapshot_id, self._run_storage.has_snapshot)
 
     @traced
     def get_historical_pipeline(self, snapshot_id: str) -> "HistoricalPipeline":
         from dagster.core.host_representation import HistoricalPipeline
 
-        snapshot = self._run_storage.get_pipeline_snapshot(snapshot_id)
+        snapshot = self.get_pipeline_snapshot(snapshot_id)
         parent_snapshot = (
-            self._run_storage.get_pipeline_snapshot(snapshot.lineage_snapshot.parent_snapshot_id)
+            self.get_pipeline_snapshot(snapshot.lineage_snapshot.parent_snapshot_id)
             if snapshot.lineage_snapshot
             else None
         )
@@ -694,11 +805,17 @@ def get_historical_pipeline(self, snapshot_id: str) -> "HistoricalPipeline":
 
     @traced
     def has_historical_pipeline(self, snapshot_id: str) -> bool:
-        return self._run_storage.has_pipeline_snapshot(snapshot_id)
+        return self.has_pipeline_snapshot(snapshot_id)
 
     @traced
     def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapshot":
-        return self._run_storage.get_execution_plan_snapshot(snapshot_id)
+        return self._snapshot_cache.get(
+            snapshot_id, self._run_storage.get_execution_plan_snapshot_and_size
+        )
+
+    @property
+    def snapshot_cache_stats(self) -> SnapshotCacheStats:
+        return self._snapshot_cache.stats
 
     @traced
     def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
@@ -708,6 +825,12 @@ def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
     def get_run_step_stats(self, run_id, step_keys=None) -> List["RunStepKeyStatsSnapshot"]:
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
+    @traced
+    def get_yielded_step_outputs(
+        self, run_id: str, step_keys: Optional[List[str]] = None
+    ) -> Set["StepOutputHandle"]:
+        return self._event_storage.get_yielded_step_outputs(run_id, step_keys)
+
     @traced
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         return self._run_storage.get_run_tags()
@@ -871,7 +994,7 @@ def _ensure_persisted_pipeline_snapshot(self, pipeline_snapshot, parent_pipeline
         check.opt_inst_param(parent_pipeline_snapshot, "parent_pipeline_snapshot", PipelineSnapshot)
 
         if pipeline_snapshot.lineage_snapshot:
-            if not self._run_storage.has_pipeline_snapshot(
+            if not self.has_pipeline_snapshot(
                 pipeline_snapshot.lineage_snapshot.parent_snapshot_id
             ):
                 check.invariant(
@@ -887,13 +1010,15 @@ def _ensure_persisted_pipeline_snapshot(self, pipeline_snapshot, parent_pipeline
                     pipeline_snapshot.lineage_snapshot.parent_snapshot_id
                     == returned_pipeline_snapshot_id
                 )
+                self._snapshot_cache.mark_known(returned_pipeline_snapshot_id)
 
         pipeline_snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
-        if not self._run_storage.has_pipeline_snapshot(pipeline_snapshot_id):
+        if not self.has_pipeline_snapshot(pipeline_snapshot_id):
             returned_pipeline_snapshot_id = self._run_storage.add_pipeline_snapshot(
                 pipeline_snapshot
             )
             check.invariant(pipeline_snapshot_id == returned_pipeline_snapshot_id)
+            self._snapshot_cache.mark_known(pipeline_snapshot_id)
 
         return pipeline_snapshot_id
 
@@ -923,12 +1048,15 @@ def _ensure_persisted_execution_plan_snapshot(
 
         execution_plan_snapshot_id = create_execution_plan_snapshot_id(execution_plan_snapshot)
 
-        if not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
+        if not self._snapshot_cache.has(
+            execution_plan_snapshot_id, self._run_storage.has_execution_plan_snapshot
+        ):
             returned_execution_plan_snapshot_id = self._run_storage.add_execution_plan_snapshot(
                 execution_plan_snapshot
             )
 
             check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
+            self._snapshot_cache.mark_known(execution_plan_snapshot_id)
 
         return execution_plan_snapshot_id
 
@@ -1115,6 +1243,7 @@ def supports_bucket_queries(self):
     def wipe(self):
         self._run_storage.wipe()
         self._event_storage.wipe()
+        self._snapshot_cache.clear()
 
     @traced
     def delete_run(self, run_id: str):
@@ -1293,10 +1422,45 @@ def get_handlers(self):
     def store_event(self, event):
         self._event_storage.store_event(event)
 
+    def store_events(self, events):
+        self._event_storage.store_events(events)
+
+    def _get_buffered_event_log_writer(self) -> "BufferedEventLogWriter":
+        from dagster.core.storage.event_log.buffered_writer import (
+            DEFAULT_FLUSH_INTERVAL_SECONDS,
+            DEFAULT_MAX_BATCH_SIZE,
+            DEFAULT_MAX_QUEUE_SIZE,
+            BufferedEventLogWriter,
+        )
+
+        if not self._buffered_event_log_writer:
+            settings = self.buffered_event_logs_settings
+            self._buffered_event_log_writer = BufferedEventLogWriter(
+                self._event_storage,
+                max_queue_size=settings.get("max_queue_size", DEFAULT_MAX_QUEUE_SIZE),
+                max_batch_size=settings.get("max_batch_size", DEFAULT_MAX_BATCH_SIZE),
+                flush_interval_seconds=settings.get(
+                    "flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS
+                ),
+            )
+        return self._buffered_event_log_writer
+
+    def flush_buffered_events(self):
+        """Block until all buffered user log events have been written to the event log storage."""
+        if self._buffered_event_log_writer:
+            self._buffered_event_log_writer.flush()
+
     def handle_new_event(self, event):
         run_id = event.run_id
 
-        self._event_storage.store_event(event)
+        if self.buffered_event_logs_enabled and not event.is_dagster_event:
+            # User log messages are written in batches from a background thread
+            self._get_buffered_event_log_writer().enqueue(event)
+        else:
+            # Dagster events are the source of truth for the state of the run, so they are stored
+            # synchronously, after any user log messages that were buffered ahead of them
+            self.flush_buffered_events()
+            self._event_storage.store_event(event)
 
         if event.is_dagster_event and event.dagster_event.is_pipeline_event:
             self._run_storage.handle_run_event(run_id, event.dagster_event)
@@ -1304,6 +1468,26 @@ def handle_new_event(self, event):
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def handle_new_events(self, events):
+        """Store and dispatch a batch of events, e.g. events replayed from another instance.
+
+        Equivalent to calling `handle_new_event` for each event in order, but writes the whole
+        batch to the event log storage at once.
+        """
+        events = check.list_param(events, "events")
+        if not events:
+            return
+
+        self.flush_buffered_events()
+        self._event_storage.store_events(events)
+
+        for event in events:
+            if event.is_dagster_event and event.dagster_event.is_pipeline_event:
+                self._run_storage.handle_run_event(event.run_id, event.dagster_event)
+
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
     def add_event_listener(self, run_id, cb):
         self._subscribers[run_id].append(cb)
 
@@ -1845,6 +2029,7 @@ def get_required_daemon_types(self):
         from dagster.core.scheduler import DagsterDaemonScheduler
         from dagster.daemon.daemon import (
             BackfillDaemon,
+            EventLogRetentionDaemon,
             MonitoringDaemon,
             SchedulerDaemon,
             SensorDaemon,
@@ -1863,6 +2048,8 @@ def get_required_daemon_types(self):
             daemons.append(QueuedRunCoordinatorDaemon.daemon_type())
         if self.run_monitoring_enabled:
             daemons.append(MonitoringDaemon.daemon_type())
+        if self.event_log_retention_enabled:
+            daemons.append(EventLogRetentionDaemon.daemon_type())
         return daemons
 
     # backfill
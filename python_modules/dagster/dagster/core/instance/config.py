@@ -127,4 +127,37 @@ def dagster_instance_config_schema():
                 "cancellation_thread_poll_interval_seconds": Field(int, is_required=False),
             },
         ),
+        "buffered_event_logs": Field(
+            {
+                "enabled": Field(Bool, is_required=False),
+                "max_queue_size": Field(int, is_required=False),
+                "max_batch_size": Field(int, is_required=False),
+                "flush_interval_seconds": Field(float, is_required=False),
+            },
+        ),
+        "event_log_retention": Field(
+            {
+                "enabled": Field(Bool, is_required=False),
+                "max_age_days": Field(float, is_required=False),
+                "run_statuses": Field([str], is_required=False),
+                "event_types": Field([str], is_required=False),
+                "batch_size": Field(int, is_required=False),
+                "archive_dir": Field(str, is_required=False),
+                "interval_seconds": Field(int, is_required=False),
+            },
+        ),
+        "sensors": Field(
+            {
+                "use_threads": Field(Bool, is_required=False),
+                "num_workers": Field(int, is_required=False),
+                "max_concurrent_per_location": Field(int, is_required=False),
+                "timeout_seconds": Field(float, is_required=False),
+            },
+        ),
+        "schedules": Field(
+            {
+                "use_threads": Field(Bool, is_required=False),
+                "num_workers": Field(int, is_required=False),
+            },
+        ),
     }
@@ -0,0 +1,132 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+from dagster import check
+from dagster.serdes import serialize_dagster_namedtuple
+
+DEFAULT_SNAPSHOT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_KNOWN_SNAPSHOT_IDS = 10000
+
+
+class SnapshotCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    num_entries: int
+    size_bytes: int
+
+
+class SnapshotCache:
+    """Thread-safe, read-through LRU cache of deserialized pipeline and execution plan snapshots,
+    keyed by snapshot id.
+
+    Snapshots are content-addressed and never change once they have been stored, so entries never
+    need to be invalidated, only evicted. Entries are weighted by the size of their uncompressed
+    serialized representation, as reported by the run storage, and the least recently used entries
+    are evicted once the total exceeds `max_bytes`.
+
+    The cache also remembers (up to `max_known_snapshot_ids`) the ids of snapshots that are known
+    to exist in storage, so that existence checks do not need to hit the database either.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_SNAPSHOT_CACHE_MAX_BYTES,
+        max_known_snapshot_ids: int = DEFAULT_MAX_KNOWN_SNAPSHOT_IDS,
+    ):
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+        self._max_known_snapshot_ids = check.int_param(
+            max_known_snapshot_ids, "max_known_snapshot_ids"
+        )
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._entry_sizes = {}
+        self._size_bytes = 0
+        self._known_snapshot_ids: "OrderedDict[str, bool]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self, snapshot_id: str, load_fn: Callable[[str], Tuple[Optional[Any], Optional[int]]]
+    ) -> Optional[Any]:
+        """Return the snapshot with the given id, calling `load_fn` to fetch it on a miss.
+        `load_fn` returns the snapshot along with the size of its serialized representation, if known.
+        """
+        check.str_param(snapshot_id, "snapshot_id")
+
+        with self._lock:
+            if snapshot_id in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(snapshot_id)
+                return self._entries[snapshot_id]
+            self._misses += 1
+
+        snapshot, size = load_fn(snapshot_id)
+        if snapshot is not None:
+            self._put(snapshot_id, snapshot, size)
+        return snapshot
+
+    def has(self, snapshot_id: str, has_fn: Callable[[str], bool]) -> bool:
+        """Return whether the snapshot with the given id exists, calling `has_fn` to check storage
+        if it is not already known to exist. Negative results are not remembered.
+        """
+        check.str_param(snapshot_id, "snapshot_id")
+
+        with self._lock:
+            if snapshot_id in self._entries or snapshot_id in self._known_snapshot_ids:
+                return True
+
+        if not has_fn(snapshot_id):
+            return False
+
+        self.mark_known(snapshot_id)
+        return True
+
+    def mark_known(self, snapshot_id: str):
+        """Record that the snapshot with the given id exists in storage."""
+        check.str_param(snapshot_id, "snapshot_id")
+
+        with self._lock:
+            self._known_snapshot_ids[snapshot_id] = True
+            self._known_snapshot_ids.move_to_end(snapshot_id)
+            while len(self._known_snapshot_ids) > self._max_known_snapshot_ids:
+                self._known_snapshot_ids.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._entry_sizes.clear()
+            self._size_bytes = 0
+            self._known_snapshot_ids.clear()
+
+    @property
+    def stats(self) -> SnapshotCacheStats:
+        with self._lock:
+            return SnapshotCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                num_entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def _put(self, snapshot_id: str, snapshot: Any, size: Optional[int]):
+        if size is None:
+            # the storage does not keep the snapshot serialized
+            size = len(serialize_dagster_namedtuple(snapshot))
+
+        self.mark_known(snapshot_id)
+        if size > self._max_bytes:
+            # too large to ever fit, don't flush the rest of the cache for it
+            return
+
+        with self._lock:
+            if snapshot_id in self._entries:
+                return
+
+            self._entries[snapshot_id] = snapshot
+            self._entry_sizes[snapshot_id] = size
+            self._size_bytes += size
+
+            while self._size_bytes > self._max_bytes:
+                evicted_id, _ = self._entries.popitem(last=False)
+                self._size_bytes -= self._entry_sizes.pop(evicted_id)
@@ -2,12 +2,10 @@
 import time
 from typing import Any, Dict, List, NamedTuple, Optional
 
-from dagster import DagsterEvent, DagsterEventType, IntSource, String, check
-from dagster.builtins import Bool
+from dagster import DagsterEvent, DagsterEventType, IntSource, check
 from dagster.config import Field
-from dagster.config.config_type import Array, Noneable, ScalarUnion
-from dagster.config.field_utils import Shape
 from dagster.core.events.log import EventLogEntry
+from dagster.core.execution.tag_concurrency_limits import get_tag_concurrency_limits_config_type
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 
@@ -73,23 +71,7 @@ def config_type(cls):
                 description="The maximum number of runs that are allowed to be in progress at once",
             ),
             "tag_concurrency_limits": Field(
-                config=Noneable(
-                    Array(
-                        Shape(
-                            {
-                                "key": String,
-                                "value": Field(
-                                    ScalarUnion(
-                                        scalar_type=String,
-                                        non_scalar_schema=Shape({"applyLimitPerUniqueValue": Bool}),
-                                    ),
-                                    is_required=False,
-                                ),
-                                "limit": Field(int),
-                            }
-                        )
-                    )
-                ),
+                config=get_tag_concurrency_limits_config_type(),
                 is_required=False,
                 description="A set of limits that are applied to runs with particular tags. "
                 "If a value is set, the limit is applied to only that key-value pair. "
@@ -307,6 +307,9 @@ def with_cursor(self, cursor):
     def with_origin_run(self, origin_run_id):
         return self._replace(tick_data=self.tick_data.with_origin_run(origin_run_id))
 
+    def with_lateness(self, lateness_seconds):
+        return self._replace(tick_data=self.tick_data.with_lateness(lateness_seconds))
+
     @property
     def instigator_origin_id(self):
         return self.tick_data.instigator_origin_id
@@ -355,6 +358,10 @@ def origin_run_ids(self):
     def failure_count(self) -> int:
         return self.tick_data.failure_count
 
+    @property
+    def lateness_seconds(self) -> Optional[float]:
+        return self.tick_data.lateness_seconds
+
 
 register_serdes_tuple_fallbacks({"JobTick": InstigatorTick})
 # for internal backcompat
@@ -427,6 +434,7 @@ class TickData(
             ("cursor", Optional[str]),
             ("origin_run_ids", List[str]),
             ("failure_count", int),
+            ("lateness_seconds", Optional[float]),
         ],
     )
 ):
@@ -448,6 +456,8 @@ class TickData(
         origin_run_ids (List[str]): The runs originated from the schedule/sensor.
         failure_count (int): The number of times this tick has failed. If the status is not
             FAILED, this is the number of previous failures before it reached the current state.
+        lateness_seconds (Optional[float]): For schedule ticks, the number of seconds between the
+            scheduled time of the tick and the submission of its first run.
     """
 
     def __new__(
@@ -464,6 +474,7 @@ def __new__(
         cursor: Optional[str] = None,
         origin_run_ids: Optional[List[str]] = None,
         failure_count: Optional[int] = None,
+        lateness_seconds: Optional[float] = None,
     ):
         _validate_tick_args(instigator_type, status, run_ids, error, skip_reason)
         return super(TickData, cls).__new__(
@@ -480,6 +491,7 @@ def __new__(
             cursor=check.opt_str_param(cursor, "cursor"),
             origin_run_ids=check.opt_list_param(origin_run_ids, "origin_run_ids", of_type=str),
             failure_count=check.opt_int_param(failure_count, "failure_count", 0),
+            lateness_seconds=check.opt_float_param(lateness_seconds, "lateness_seconds"),
         )
 
     def with_status(self, status, error=None, timestamp=None, failure_count=None):
@@ -541,6 +553,14 @@ def with_origin_run(self, origin_run_id):
             )
         )
 
+    def with_lateness(self, lateness_seconds):
+        return TickData(
+            **merge_dicts(
+                self._asdict(),
+                {"lateness_seconds": check.float_param(lateness_seconds, "lateness_seconds")},
+            )
+        )
+
 
 register_serdes_tuple_fallbacks({"JobTickData": TickData})
 # for internal backcompat
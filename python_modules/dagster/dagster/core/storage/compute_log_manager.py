@@ -70,6 +70,31 @@ def watch(self, pipeline_run, step_key=None):
             yield
         self.on_watch_finish(pipeline_run, step_key)
 
+    @contextmanager
+    def watch_thread(self, pipeline_run, step_key=None):
+        """
+        Watch the stdout/stderr written by the current thread, and by the coroutines it schedules
+        on an event loop, for a given execution for a given run_id / step_key and persist it, so
+        that steps executing concurrently in the threads of a single process each capture their own
+        logs. Only output written through sys.stdout and sys.stderr while they are routed with
+        route_thread_streams is captured.
+
+        Args:
+            pipeline_run (PipelineRun): The pipeline run config
+            step_key (Optional[String]): The step_key for a compute step
+        """
+        check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+        check.opt_str_param(step_key, "step_key")
+
+        if not self.enabled(pipeline_run, step_key):
+            yield
+            return
+
+        self.on_watch_start(pipeline_run, step_key)
+        with self._watch_thread_logs(pipeline_run, step_key):
+            yield
+        self.on_watch_finish(pipeline_run, step_key)
+
     @contextmanager
     @abstractmethod
     def _watch_logs(self, pipeline_run, step_key=None):
@@ -83,6 +108,18 @@ def _watch_logs(self, pipeline_run, step_key=None):
             step_key (Optional[String]): The step_key for a compute step
         """
 
+    @contextmanager
+    def _watch_thread_logs(self, pipeline_run, step_key=None):
+        """
+        Method to watch the stdout/stderr logs written by the current thread for a given run_id /
+        step_key, see watch_thread. Compute log managers that do not override it capture nothing.
+
+        Args:
+            pipeline_run (PipelineRun): The pipeline run config
+            step_key (Optional[String]): The step_key for a compute step
+        """
+        yield
+
     def get_local_path(self, run_id, key, io_type):
         """Get the local path of the logfile for a given execution step.  This determines the
         location on the local filesystem to which stdout/stderr will be rerouted.
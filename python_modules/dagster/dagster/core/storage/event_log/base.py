@@ -1,3 +1,4 @@
+import logging
 import warnings
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -18,6 +19,7 @@
 from dagster.core.definitions.events import AssetKey
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
+from dagster.core.execution.plan.outputs import StepOutputHandle
 from dagster.core.execution.stats import (
     RunStepKeyStatsSnapshot,
     build_run_stats_from_events,
@@ -157,6 +159,22 @@ def get_step_stats_for_run(self, run_id: str, step_keys=None) -> List[RunStepKey
 
         return build_run_step_stats_from_events(run_id, logs)
 
+    def get_yielded_step_outputs(
+        self, run_id: str, step_keys: Optional[Sequence[str]] = None
+    ) -> Set[StepOutputHandle]:
+        """Get the handles of the outputs yielded by the steps of a run.
+
+        Args:
+            run_id (str): The id of the run for which to fetch the outputs.
+            step_keys (Optional[Sequence[str]]): If set, only the outputs yielded by these steps
+                are returned.
+        """
+        return {
+            event.dagster_event.step_output_data.step_output_handle
+            for event in self.get_logs_for_run(run_id, of_type=DagsterEventType.STEP_OUTPUT)
+            if step_keys is None or event.dagster_event.step_key in step_keys
+        }
+
     @abstractmethod
     def store_event(self, event: EventLogEntry):
         """Store an event corresponding to a pipeline run.
@@ -165,10 +183,63 @@ def store_event(self, event: EventLogEntry):
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence[EventLogEntry]):
+        """Store a batch of events, preserving their order.
+
+        Storages that can write several rows in a single round trip should override this; the
+        default implementation stores the events one at a time.
+
+        Args:
+            events (List[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str):
         """Remove events for a given run id"""
 
+    @property
+    def supports_event_retention(self) -> bool:
+        """bool: Whether the storage implements `purge_events`, so that its events can be compacted
+        by an event log retention policy.
+        """
+        return False
+
+    def purge_events(
+        self,
+        run_ids: Sequence[str],
+        before_timestamp: float,
+        event_types: Optional[Sequence[DagsterEventType]] = None,
+        batch_size: int = 1000,
+        archive=None,
+    ) -> int:
+        """Remove a batch of the events of the given runs that were stored before a timestamp, as
+        part of event log compaction. Asset events and the step and run lifecycle events listed in
+        `RETAINED_EVENT_TYPES` are never purged.
+
+        Each call removes at most `batch_size` events, in a single transaction, so that compaction
+        can heartbeat between batches. Callers purge all matching events by calling this until it
+        returns fewer than `batch_size`.
+
+        Args:
+            run_ids (List[str]): The runs whose events should be purged.
+            before_timestamp (float): Only events stored before this timestamp are purged.
+            event_types (Optional[List[DagsterEventType]]): If set, only events of these types are
+                purged.
+            batch_size (int): The maximum number of events to purge.
+            archive (Optional[EventLogArchive]): If set, purged events are written to the archive
+                before they are deleted.
+
+        Returns:
+            int: The number of events purged.
+        """
+        logging.getLogger("dagster").warning(
+            f"{self.__class__.__name__} does not support event log retention, so no events were "
+            "purged."
+        )
+        return 0
+
     @abstractmethod
     def upgrade(self):
         """This method should perform any schema migrations necessary to bring an
@@ -0,0 +1,168 @@
+import queue
+import sys
+import threading
+import time
+from typing import List, Optional
+
+from dagster import check
+from dagster.core.events.log import EventLogEntry
+from dagster.utils.error import serializable_error_info_from_exc_info
+
+from .base import EventLogStorage
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_MAX_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+
+
+class _FlushRequest:
+    """Marker placed on the queue to ask the writer thread to write out everything ahead of it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class BufferedEventLogWriter:
+    """Writes events to an event log storage from a background thread, in batches.
+
+    Events handed to `enqueue` are placed on a bounded in-process queue. A daemon thread drains the
+    queue and stores up to `max_batch_size` events at a time with
+    :py:meth:`~dagster.core.storage.event_log.EventLogStorage.store_events`, waiting at most
+    `flush_interval_seconds` for a batch to fill up. When the queue is full, `enqueue` blocks until
+    the writer catches up.
+
+    Callers that need queued events to be durable (e.g. before storing an event that determines run
+    state) should call `flush`, which blocks until every event enqueued before it has been written.
+    """
+
+    def __init__(
+        self,
+        event_storage: EventLogStorage,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ):
+        self._event_storage = check.inst_param(event_storage, "event_storage", EventLogStorage)
+        self._max_batch_size = check.int_param(max_batch_size, "max_batch_size")
+        self._flush_interval_seconds = check.numeric_param(
+            flush_interval_seconds, "flush_interval_seconds"
+        )
+        check.invariant(self._max_batch_size > 0, "max_batch_size must be positive")
+
+        self._queue: queue.Queue = queue.Queue(
+            maxsize=check.int_param(max_queue_size, "max_queue_size")
+        )
+        self._lock = threading.Lock()
+        self._pending_count = 0
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = threading.Event()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._shutdown.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="dagster-event-log-writer", daemon=True
+            )
+            self._thread.start()
+
+    def enqueue(self, event: EventLogEntry):
+        check.inst_param(event, "event", EventLogEntry)
+        self._ensure_started()
+        with self._lock:
+            self._pending_count += 1
+        self._queue.put(event)
+
+    @property
+    def has_pending_events(self) -> bool:
+        with self._lock:
+            return self._pending_count > 0
+
+    def flush(self, timeout: Optional[float] = None):
+        """Block until all events enqueued so far have been handed to the event log storage."""
+        if not self.has_pending_events:
+            return
+
+        if not self._thread or not self._thread.is_alive():
+            # the writer thread is gone, so write out whatever it left behind inline
+            self._write(self._drain_nowait())
+            return
+
+        request = _FlushRequest()
+        self._queue.put(request)
+        request.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """Flush any queued events and stop the writer thread."""
+        if not self._thread:
+            return
+
+        self.flush(timeout)
+        self._shutdown.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _drain_nowait(self) -> List[EventLogEntry]:
+        events = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return events
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+            else:
+                events.append(item)
+
+    def _run(self):
+        while not self._shutdown.is_set():
+            try:
+                item = self._queue.get(timeout=self._flush_interval_seconds)
+            except queue.Empty:
+                continue
+
+            batch: List[EventLogEntry] = []
+            flush_requests: List[_FlushRequest] = []
+            deadline = time.time() + self._flush_interval_seconds
+
+            while True:
+                if isinstance(item, _FlushRequest):
+                    # write out everything that was enqueued ahead of the flush request right away
+                    flush_requests.append(item)
+                    break
+
+                batch.append(item)
+                if len(batch) >= self._max_batch_size:
+                    break
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+
+            for request in flush_requests:
+                request.done.set()
+
+    def _write(self, batch: List[EventLogEntry]):
+        if not batch:
+            return
+
+        try:
+            self._event_storage.store_events(batch)
+        except Exception:
+            # Buffered events are user-generated log messages, which are never allowed to fail the
+            # step or run that emitted them
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            sys.stderr.write(
+                f"Exception while writing {len(batch)} buffered logger calls to event log: "
+                f"{error_info.to_string()}\n"
+            )
+        finally:
+            with self._lock:
+                self._pending_count -= len(batch)
@@ -16,6 +16,7 @@
     RunShardedEventsCursor,
     extract_asset_events_cursor,
 )
+from .retention import DEFAULT_PURGE_BATCH_SIZE, RETAINED_EVENT_TYPES
 
 
 class InMemoryEventLogStorage(EventLogStorage, ConfigurableClass):
@@ -112,6 +113,40 @@ def store_event(self, event):
     def delete_events(self, run_id):
         del self._logs[run_id]
 
+    def purge_events(
+        self,
+        run_ids,
+        before_timestamp,
+        event_types=None,
+        batch_size=DEFAULT_PURGE_BATCH_SIZE,
+        archive=None,
+    ):
+        check.list_param(run_ids, "run_ids", of_type=str)
+        check.opt_list_param(event_types, "event_types", of_type=DagsterEventType)
+        check.int_param(batch_size, "batch_size")
+
+        def _should_purge(event):
+            if event.timestamp >= before_timestamp:
+                return False
+            if event.is_dagster_event and event.dagster_event_type in RETAINED_EVENT_TYPES:
+                return False
+            if event_types:
+                return event.is_dagster_event and event.dagster_event_type in event_types
+            return True
+
+        purged = 0
+        for run_id in run_ids:
+            if run_id not in self._logs:
+                continue
+            retained = []
+            for event in self._logs[run_id]:
+                if purged < batch_size and _should_purge(event):
+                    purged += 1
+                else:
+                    retained.append(event)
+            self._logs[run_id] = retained
+        return purged
+
     def upgrade(self):
         pass
 
@@ -135,6 +170,10 @@ def end_watch(self, run_id, handler):
     def is_persistent(self):
         return False
 
+    @property
+    def supports_event_retention(self):
+        return True
+
     def get_event_records(
         self,
         event_records_filter: Optional[EventRecordsFilter] = None,
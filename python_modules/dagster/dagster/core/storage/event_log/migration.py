@@ -3,16 +3,23 @@
 
 from dagster import AssetKey, seven
 from dagster.core.events.log import EventLogEntry
-from dagster.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.serdes import deserialize_dagster_namedtuple, deserialize_json_to_dagster_namedtuple
 from dagster.utils import utc_datetime_from_timestamp
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+RUN_STATS_ROLLUPS = "run_stats_rollups"  # builds the run / step stats rollups from the event log
+# records the storage id and partition of the latest materialization in the asset_keys table
+ASSET_KEY_LATEST_MATERIALIZATION_COLS = "asset_key_latest_materialization_columns"
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
+    RUN_STATS_ROLLUPS: lambda: migrate_run_stats_rollups,
+}
+ASSET_DATA_MIGRATIONS = {
+    ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns,
+    ASSET_KEY_LATEST_MATERIALIZATION_COLS: lambda: migrate_asset_keys_latest_materialization_columns,
 }
-ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
 
 
 def migrate_event_log_data(instance=None):
@@ -72,6 +79,29 @@ def migrate_asset_key_data(event_log_storage, print_fn=None):
                 pass
 
 
+def migrate_run_stats_rollups(event_log_storage, print_fn=None):
+    """
+    Utility method to build the run_event_counts and run_step_stats rollup tables from the data in
+    existing event log records.  Takes in event_log_storage, and a print_fn to keep track of
+    progress.  Events stored while this migration is running are not reflected in the rollups, so
+    it should be run while no runs are in progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run ids.")
+    run_ids = event_log_storage.get_all_run_ids()
+    if print_fn:
+        print_fn(f"Found {len(run_ids)} runs to index.")
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        event_log_storage.rebuild_run_stats(run_id)
+
+
 def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
     from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
     from dagster.serdes import serialize_dagster_namedtuple
@@ -131,7 +161,7 @@ def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
                 )
                 row = conn.execute(materialization_query).fetchone()
                 if row:
-                    event = deserialize_json_to_dagster_namedtuple(row[0])
+                    event = deserialize_dagster_namedtuple(row[0])
 
             if not event:
                 # this must be a wiped asset
@@ -167,6 +197,75 @@ def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
                 )
 
 
+def migrate_asset_keys_latest_materialization_columns(event_log_storage, print_fn=None):
+    """
+    Utility method to record the storage id and partition of the latest materialization of each
+    asset in the asset_keys table, rewriting `last_materialization` to the full event log entry of
+    that materialization.  Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster.core.events import DagsterEventType
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+    from dagster.serdes import serialize_dagster_namedtuple
+
+    from .schema import AssetKeyTable, SqlEventLogStorageTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Querying asset keys.")
+        results = conn.execute(db.select([AssetKeyTable.c.asset_key])).fetchall()
+
+        if print_fn:
+            print_fn(f"Found {len(results)} assets to reindex.")
+            results = tqdm(results)
+
+        for (asset_key_str,) in results:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if not asset_key:
+                continue
+
+            row = conn.execute(
+                db.select(
+                    [
+                        SqlEventLogStorageTable.c.id,
+                        SqlEventLogStorageTable.c.event,
+                        SqlEventLogStorageTable.c.partition,
+                    ]
+                )
+                .where(
+                    db.or_(
+                        SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                        SqlEventLogStorageTable.c.asset_key == asset_key.to_string(legacy=True),
+                    )
+                )
+                .where(
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value
+                )
+                .order_by(SqlEventLogStorageTable.c.id.desc())
+                .limit(1)
+            ).fetchone()
+            if not row:
+                # this asset has only been observed
+                continue
+
+            storage_id, event_str, partition = row
+            event = deserialize_dagster_namedtuple(event_str)
+            conn.execute(
+                AssetKeyTable.update()
+                .values(  # pylint: disable=no-value-for-parameter
+                    last_materialization=serialize_dagster_namedtuple(event),
+                    last_materialization_storage_id=storage_id,
+                    last_materialization_partition=partition,
+                )
+                .where(
+                    AssetKeyTable.c.asset_key == asset_key_str,
+                )
+            )
+
+
 def sql_asset_event_generator(conn, cursor=None, batch_size=1000):
     from .schema import SqlEventLogStorageTable
 
@@ -181,7 +280,7 @@ def sql_asset_event_generator(conn, cursor=None, batch_size=1000):
 
         for (record_id, event_json) in fetched:
             cursor = record_id
-            event_record = deserialize_json_to_dagster_namedtuple(event_json)
+            event_record = deserialize_dagster_namedtuple(event_json)
             if not isinstance(event_record, EventLogEntry):
                 continue
             yield (record_id, event_record)
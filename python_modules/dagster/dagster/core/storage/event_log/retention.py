@@ -0,0 +1,277 @@
+import gzip
+import os
+import time
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import pendulum
+
+from dagster import check, seven
+from dagster.core.events import DagsterEventType
+from dagster.core.storage.pipeline_run import PipelineRunStatus, RunsFilter
+from dagster.utils import mkdir_p
+
+DEFAULT_RETENTION_RUN_STATUSES = [
+    PipelineRunStatus.SUCCESS,
+    PipelineRunStatus.FAILURE,
+    PipelineRunStatus.CANCELED,
+]
+
+# asset events back the asset catalog, and the step and run lifecycle events are read back to
+# re-execute runs and to compute their stats, so they are never purged by a retention policy
+RETAINED_EVENT_TYPES = [
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.ASSET_OBSERVATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_OUTPUT,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.RUN_ENQUEUED,
+    DagsterEventType.RUN_DEQUEUED,
+    DagsterEventType.RUN_STARTING,
+    DagsterEventType.RUN_START,
+    DagsterEventType.RUN_SUCCESS,
+    DagsterEventType.RUN_FAILURE,
+    DagsterEventType.RUN_CANCELING,
+    DagsterEventType.RUN_CANCELED,
+]
+
+# captured compute logs and engine events make up most of the event log, and are purged by default
+DEFAULT_PURGED_EVENT_TYPES = [
+    DagsterEventType.LOGS_CAPTURED,
+    DagsterEventType.ENGINE_EVENT,
+]
+
+DEFAULT_PURGE_BATCH_SIZE = 1000
+DEFAULT_RETENTION_INTERVAL_SECONDS = 3600
+
+# number of runs whose events are purged per call to `purge_events`
+RUN_BATCH_SIZE = 100
+
+
+class EventLogRetentionPolicy(
+    NamedTuple(
+        "_EventLogRetentionPolicy",
+        [
+            ("max_age_seconds", float),
+            ("run_statuses", List[PipelineRunStatus]),
+            ("event_types", List[DagsterEventType]),
+            ("batch_size", int),
+            ("archive_dir", Optional[str]),
+        ],
+    )
+):
+    """Which event log rows are purged by event log compaction.
+
+    Args:
+        max_age_seconds (float): Only events of runs created more than this many seconds ago, that
+            were themselves stored more than this many seconds ago, are purged.
+        run_statuses (Optional[List[PipelineRunStatus]]): Only events of runs in these statuses are
+            purged. Defaults to runs that have succeeded, failed or been canceled.
+        event_types (Optional[List[DagsterEventType]]): Only events of these types are purged.
+            Defaults to captured compute logs and engine events. Asset events and the step and run
+            lifecycle events can not be purged.
+        batch_size (Optional[int]): The number of rows deleted per transaction.
+        archive_dir (Optional[str]): If set, purged rows are written to a gzipped file of JSON
+            lines in this directory before they are deleted.
+    """
+
+    def __new__(
+        cls,
+        max_age_seconds: float,
+        run_statuses: Optional[List[PipelineRunStatus]] = None,
+        event_types: Optional[List[DagsterEventType]] = None,
+        batch_size: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+    ):
+        check.numeric_param(max_age_seconds, "max_age_seconds")
+        check.invariant(max_age_seconds >= 0, "max_age_seconds must not be negative")
+        run_statuses = check.opt_list_param(run_statuses, "run_statuses", of_type=PipelineRunStatus)
+        event_types = check.opt_list_param(event_types, "event_types", of_type=DagsterEventType)
+        for event_type in event_types:
+            check.invariant(
+                event_type not in RETAINED_EVENT_TYPES,
+                f"Events of type {event_type.value} can not be purged, since they back the asset "
+                "catalog or are needed to re-execute runs",
+            )
+        batch_size = check.opt_int_param(batch_size, "batch_size", DEFAULT_PURGE_BATCH_SIZE)
+        check.invariant(batch_size > 0, "batch_size must be a positive integer")
+
+        return super(EventLogRetentionPolicy, cls).__new__(
+            cls,
+            max_age_seconds=max_age_seconds,
+            run_statuses=run_statuses or DEFAULT_RETENTION_RUN_STATUSES,
+            event_types=event_types or DEFAULT_PURGED_EVENT_TYPES,
+            batch_size=batch_size,
+            archive_dir=check.opt_str_param(archive_dir, "archive_dir"),
+        )
+
+    @staticmethod
+    def from_settings(settings: Dict[str, Any]) -> "EventLogRetentionPolicy":
+        """Builds the policy from the ``event_log_retention`` settings of the instance"""
+        check.dict_param(settings, "settings")
+        check.invariant(
+            "max_age_days" in settings,
+            "event_log_retention settings must specify max_age_days",
+        )
+        return EventLogRetentionPolicy(
+            max_age_seconds=settings["max_age_days"] * 24 * 60 * 60,
+            run_statuses=[PipelineRunStatus(status) for status in settings.get("run_statuses", [])]
+            or None,
+            event_types=[
+                DagsterEventType(event_type) for event_type in settings.get("event_types", [])
+            ]
+            or None,
+            batch_size=settings.get("batch_size"),
+            archive_dir=settings.get("archive_dir"),
+        )
+
+
+class EventLogCompactionResult(NamedTuple):
+    rows_purged: int
+    runs_scanned: int
+    elapsed_seconds: float
+    archive_path: Optional[str]
+
+
+class EventLogArchive:
+    """Appends purged event log rows to a gzipped file of JSON lines, created on the first write"""
+
+    def __init__(self, archive_dir: str):
+        self._archive_dir = check.str_param(archive_dir, "archive_dir")
+        self._file = None
+        self._path = None
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    def write_rows(self, rows: Sequence[Dict[str, Any]]):
+        if not rows:
+            return
+
+        if not self._file:
+            mkdir_p(self._archive_dir)
+            self._path = os.path.join(
+                self._archive_dir,
+                "event_logs_{timestamp}.jsonl.gz".format(
+                    timestamp=pendulum.now("UTC").strftime("%Y%m%dT%H%M%S%f")
+                ),
+            )
+            self._file = gzip.open(self._path, "wt", encoding="utf-8")
+
+        for row in rows:
+            self._file.write(seven.json.dumps(_archive_row(row)) + "\n")
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self.close()
+
+
+def _archive_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    archived = {}
+    for key, value in row.items():
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, bytes):
+            # events stored in the binary serialization format
+            value = value.hex()
+        archived[key] = value
+    return archived
+
+
+def compact_event_logs_iterator(instance, policy: EventLogRetentionPolicy):
+    """Purges the event log rows matched by the retention policy, in batches of runs.
+
+    Yields an EventLogCompactionResult with the running totals after every batch of purged rows,
+    so that the daemon can heartbeat during a long compaction.
+    """
+    from dagster.core.instance import DagsterInstance
+
+    check.inst_param(instance, "instance", DagsterInstance)
+    check.inst_param(policy, "policy", EventLogRetentionPolicy)
+
+    start_time = time.time()
+    before_timestamp = start_time - policy.max_age_seconds
+    runs_filter = RunsFilter(
+        statuses=policy.run_statuses,
+        created_before=pendulum.from_timestamp(before_timestamp),
+    )
+
+    rows_purged = 0
+    runs_scanned = 0
+    with ExitStack() as stack:
+        archive = (
+            stack.enter_context(EventLogArchive(policy.archive_dir)) if policy.archive_dir else None
+        )
+
+        def _result():
+            return EventLogCompactionResult(
+                rows_purged=rows_purged,
+                runs_scanned=runs_scanned,
+                elapsed_seconds=time.time() - start_time,
+                archive_path=archive.path if archive else None,
+            )
+
+        if not instance.event_log_storage.supports_event_retention:
+            # storages that do not implement purge_events have nothing to compact
+            yield _result()
+            return
+
+        cursor = None
+        while True:
+            runs = instance.get_runs(filters=runs_filter, cursor=cursor, limit=RUN_BATCH_SIZE)
+            if not runs:
+                break
+
+            run_ids = [run.run_id for run in runs]
+            while True:
+                purged = instance.event_log_storage.purge_events(
+                    run_ids,
+                    before_timestamp,
+                    event_types=policy.event_types,
+                    batch_size=policy.batch_size,
+                    archive=archive,
+                )
+                rows_purged += purged
+                if purged < policy.batch_size:
+                    break
+                yield _result()
+
+            runs_scanned += len(runs)
+            cursor = runs[-1].run_id
+            yield _result()
+
+            if len(runs) < RUN_BATCH_SIZE:
+                break
+
+    yield _result()
+
+
+def compact_event_logs(instance, policy: EventLogRetentionPolicy, print_fn=None):
+    """Purges the event log rows matched by the retention policy, in batches of runs.
+
+    Returns:
+        EventLogCompactionResult
+    """
+    runs_scanned = 0
+    for result in compact_event_logs_iterator(instance, policy):
+        if print_fn and result.runs_scanned > runs_scanned:
+            print_fn(
+                f"Purged {result.rows_purged} event log rows from {result.runs_scanned} runs..."
+            )
+        runs_scanned = result.runs_scanned
+
+    return result  # pylint: disable=undefined-loop-variable
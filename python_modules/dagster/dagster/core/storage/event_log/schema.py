@@ -49,9 +49,36 @@
         "last_materialization_timestamp", db.types.TIMESTAMP
     ),  # guarded by secondary index check
     db.Column("tags", db.TEXT),  # guarded by secondary index check
+    # storage id and partition of the event stored in last_materialization, so that the latest
+    # materializations can be read without deserializing unchanged events
+    db.Column("last_materialization_storage_id", db.Integer),  # guarded by secondary index check
+    db.Column("last_materialization_partition", db.Text),  # guarded by secondary index check
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Rollups of the event log that are maintained as events are stored, so that run and step stats
+# can be read without aggregating over the event_logs table.  Guarded by secondary index check.
+RunEventCountsTable = db.Table(
+    "run_event_counts",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("dagster_event_type", db.String(255), nullable=False),
+    db.Column("event_count", db.Integer, nullable=False),
+    db.Column("last_event_timestamp", db.types.TIMESTAMP),
+    db.UniqueConstraint("run_id", "dagster_event_type"),
+)
+
+RunStepStatsTable = db.Table(
+    "run_step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.String(255), nullable=False),
+    db.Column("stats", db.Text),
+    db.UniqueConstraint("run_id", "step_key"),
+)
+
 db.Index("idx_run_id", SqlEventLogStorageTable.c.run_id)
 db.Index(
     "idx_step_key",
@@ -1,8 +1,10 @@
 import logging
+import threading
 from abc import abstractmethod
 from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, cast
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, cast
 
 import pendulum
 import sqlalchemy as db
@@ -13,8 +15,25 @@
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
-from dagster.core.execution.stats import build_run_step_stats_from_events
-from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.core.execution.stats import (
+    STEP_STATS_EVENT_TYPES,
+    STEP_STATS_RESULT_EVENT_TYPES,
+    apply_event_to_step_stats_state,
+    build_run_step_stats_from_events,
+    collect_step_stats_results,
+    is_step_stats_event,
+    step_stats_from_state,
+    step_stats_result_counts,
+)
+from dagster.serdes import (
+    SerializationFormat,
+    deserialize_dagster_namedtuple,
+    deserialize_json_to_dagster_namedtuple,
+    deserialize_value,
+    serialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_as,
+    serialize_value,
+)
 from dagster.serdes.errors import DeserializationError
 from dagster.utils import datetime_as_float, utc_datetime_from_naive, utc_datetime_from_timestamp
 
@@ -26,11 +45,30 @@
     RunShardedEventsCursor,
     extract_asset_events_cursor,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
-from .schema import AssetKeyTable, SecondaryIndexMigrationTable, SqlEventLogStorageTable
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    ASSET_KEY_LATEST_MATERIALIZATION_COLS,
+    EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_ROLLUPS,
+)
+from .retention import DEFAULT_PURGE_BATCH_SIZE, RETAINED_EVENT_TYPES
+from .schema import (
+    AssetKeyTable,
+    RunEventCountsTable,
+    RunStepStatsTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+)
 
 MIN_ASSET_ROWS = 25
 
+# upper bound on the number of deserialized latest materialization events cached per storage
+MAX_CACHED_LATEST_MATERIALIZATIONS = 50000
+
+# shared across inserts so that engines caching compiled statements only compile it once
+INSERT_EVENT_STATEMENT = SqlEventLogStorageTable.insert()  # pylint: disable=no-value-for-parameter
+
 
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
@@ -39,6 +77,13 @@ class SqlEventLogStorage(EventLogStorage):
     sharding, while maintaining the ability to do cross-run queries
     """
 
+    def __init__(self):
+        # the latest materialization event of each asset key, along with its storage id, so that
+        # `get_latest_materialization_events` only deserializes the events that have changed
+        self._latest_materialization_cache: Dict[AssetKey, Tuple[int, EventLogEntry]] = {}
+        self._latest_materialization_cache_lock = threading.Lock()
+        self._has_asset_key_latest_materialization_cols = False
+
     @abstractmethod
     def run_connection(self, run_id):
         """Context manager yielding a connection to access the event logs for a specific run.
@@ -63,6 +108,15 @@ def upgrade(self):
         out-of-date instance of the storage up to date.
         """
 
+    @property
+    def serialization_format(self) -> SerializationFormat:
+        """The format the `event` column of new event log rows is written in. Rows in either
+        format can always be read, so this can be changed on an existing storage. Binary payloads
+        are stored as bytes, so storages should only override this if their database accepts bytes
+        in the `event` column.
+        """
+        return SerializationFormat.JSON
+
     def prepare_insert_event(self, event):
         """Helper method for preparing the event log SQL insertion statement.  Abstracted away to
         have a single place for the logical table representation of the event, while having a way
@@ -71,6 +125,15 @@ def prepare_insert_event(self, event):
         `store_event`.
         """
 
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self.prepare_insert_event_values(event)
+        )
+
+    def prepare_insert_event_values(self, event):
+        """Column values for the event log row of a single event, shared by the single-row insert
+        statement and the multi-row insert used by `store_events`.
+        """
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -85,10 +148,9 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
-            event=serialize_dagster_namedtuple(event),
+            event=serialize_dagster_namedtuple_as(event, self.serialization_format),
             dagster_event_type=dagster_event_type,
             # Postgres requires a datetime that is in UTC but has no timezone info set
             # in order to be stored correctly
@@ -103,7 +165,26 @@ def has_asset_key_index_cols(self):
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)]
             return "last_materialization_timestamp" in column_names
 
-    def store_asset(self, event):
+    def has_asset_key_latest_materialization_cols(self):
+        # columns are never dropped from a live storage, so only the positive result is cached
+        if not self._has_asset_key_latest_materialization_cols:
+            with self.index_connection() as conn:
+                column_names = [
+                    x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)
+                ]
+            self._has_asset_key_latest_materialization_cols = (
+                "last_materialization_storage_id" in column_names
+            )
+        return self._has_asset_key_latest_materialization_cols
+
+    def store_asset(self, event, storage_id=None):
+        """Updates the asset_keys table for a stored asset event.
+
+        Args:
+            event (EventLogEntry): The asset materialization or observation.
+            storage_id (Optional[int]): The id of the event log row of the event in the index
+                tables, if known. Otherwise it is looked up for materializations.
+        """
         check.inst_param(event, "event", EventLogEntry)
         if not event.is_dagster_event or not event.dagster_event.asset_key:
             return
@@ -120,7 +201,7 @@ def store_asset(self, event):
         if event.dagster_event.is_asset_observation:
             self.store_asset_observation(event)
         elif event.dagster_event.is_step_materialization:
-            self.store_asset_materialization(event)
+            self.store_asset_materialization(event, storage_id)
 
     def store_asset_observation(self, event):
         # last_materialization_timestamp is updated upon observation or materialization
@@ -140,7 +221,36 @@ def store_asset_observation(self, event):
                 except db.exc.IntegrityError:
                     conn.execute(update_statement)
 
-    def store_asset_materialization(self, event):
+    def get_asset_materialization_storage_id(self, conn, event):
+        """The id of the event log row of a stored materialization, for callers that inserted it
+        without getting the id back (e.g. as part of an executemany insert).  The materialization
+        must be the latest of its asset key in its run.
+        """
+        return conn.execute(
+            db.select([db.func.max(SqlEventLogStorageTable.c.id)])
+            .where(SqlEventLogStorageTable.c.run_id == event.run_id)
+            .where(SqlEventLogStorageTable.c.asset_key == event.dagster_event.asset_key.to_string())
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type
+                == DagsterEventType.ASSET_MATERIALIZATION.value
+            )
+        ).scalar()
+
+    def latest_materialization_values(self, event, storage_id=None):
+        """Values of the asset_keys columns that index the latest materialization of an asset."""
+        if not self.has_asset_key_latest_materialization_cols():
+            return {}
+
+        if storage_id is None:
+            with self.index_connection() as conn:
+                storage_id = self.get_asset_materialization_storage_id(conn, event)
+
+        return dict(
+            last_materialization_storage_id=storage_id,
+            last_materialization_partition=event.dagster_event.partition,
+        )
+
+    def store_asset_materialization(self, event, storage_id=None):
         # We switched to storing the entire event record of the last materialization instead of just
         # the AssetMaterialization object, so that we have access to metadata like timestamp,
         # pipeline, run_id, etc.
@@ -157,6 +267,7 @@ def store_asset_materialization(self, event):
         # See store_asset method above for more details
         if self.has_asset_key_index_cols():
             materialization = event.dagster_event.step_materialization_data.materialization
+            latest_materialization_values = self.latest_materialization_values(event, storage_id)
             insert_statement = (
                 AssetKeyTable.insert().values(  # pylint: disable=no-value-for-parameter
                     asset_key=event.dagster_event.asset_key.to_string(),
@@ -164,6 +275,7 @@ def store_asset_materialization(self, event):
                     last_materialization_timestamp=utc_datetime_from_timestamp(event.timestamp),
                     last_run_id=event.run_id,
                     tags=seven.json.dumps(materialization.tags) if materialization.tags else None,
+                    **latest_materialization_values,
                 )
             )
             update_statement = (
@@ -173,6 +285,7 @@ def store_asset_materialization(self, event):
                     last_materialization_timestamp=utc_datetime_from_timestamp(event.timestamp),
                     last_run_id=event.run_id,
                     tags=seven.json.dumps(materialization.tags) if materialization.tags else None,
+                    **latest_materialization_values,
                 )
                 .where(
                     AssetKeyTable.c.asset_key == event.dagster_event.asset_key.to_string(),
@@ -214,7 +327,10 @@ def store_event(self, event):
         run_id = event.run_id
 
         with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+            with self.event_write_transaction(conn) as conn:
+                result = conn.execute(insert_event_statement)
+                storage_id = result.inserted_primary_key[0]
+                self.update_run_stats(conn, run_id, [event])
 
         if (
             event.is_dagster_event
@@ -224,7 +340,230 @@ def store_event(self, event):
             )
             and event.dagster_event.asset_key
         ):
-            self.store_asset(event)
+            self.store_asset(event, storage_id)
+
+    def store_events(self, events):
+        """Store a batch of events corresponding to one or more pipeline runs.
+
+        The events of each run are written with one executemany insert, in the same transaction
+        as the update of the run stats rollups, after which the asset index is updated for the
+        batch.
+
+        Args:
+            events (List[EventLogEntry]): The events to store, in order.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in group_events_by_run_id(events).items():
+            with self.run_connection(run_id) as conn:
+                with self.event_write_transaction(conn) as conn:
+                    self.insert_events(conn, run_events)
+                    self.update_run_stats(conn, run_id, run_events)
+
+        for event in without_superseded_materializations(events):
+            if event.is_dagster_event and event.dagster_event.asset_key:
+                self.store_asset(event)
+
+    @contextmanager
+    def event_write_transaction(self, conn):
+        """Context manager for the transaction in which new event log rows are inserted along with
+        the run stats rollups they affect, so that the rollups can not drift from the event log if
+        a write fails part way. Yields the connection to write with.
+        """
+        with conn.begin():
+            yield conn
+
+    def insert_events(self, conn, events):
+        """Helper method for inserting a batch of event log rows using an executemany insert.
+        Expects to be called within an event_write_transaction.
+        """
+        if not events:
+            return
+
+        conn.execute(
+            INSERT_EVENT_STATEMENT,
+            [self.prepare_insert_event_values(event) for event in events],
+        )
+
+    def has_run_stats_rollups(self):
+        return self.has_secondary_index(RUN_STATS_ROLLUPS)
+
+    def update_run_stats(self, conn, run_id, events):
+        """Folds newly stored events of a single run into the run_event_counts and run_step_stats
+        rollup tables, so that run and step stats can be read without aggregating over the event
+        log. Expects `conn` to be a run connection for `run_id`, within the
+        event_write_transaction that inserts the events.
+        """
+        if not events or not self.has_run_stats_rollups():
+            return
+
+        counts = OrderedDict()
+        step_events = OrderedDict()
+        for event in events:
+            if not event.is_dagster_event:
+                continue
+
+            event_timestamp = datetime.utcfromtimestamp(event.timestamp)
+            event_type_value = event.dagster_event.event_type_value
+            count, last_timestamp = counts.get(event_type_value, (0, None))
+            counts[event_type_value] = (
+                count + 1,
+                max(last_timestamp, event_timestamp) if last_timestamp else event_timestamp,
+            )
+
+            if is_step_stats_event(event):
+                step_events.setdefault(event.step_key, []).append(event)
+
+        # rows are updated in a consistent order, so that concurrent writers for the same run do
+        # not deadlock on each other's row locks
+        for event_type_value, (count, last_timestamp) in sorted(counts.items()):
+            self._increment_run_event_count(conn, run_id, event_type_value, count, last_timestamp)
+
+        for step_key, events_for_step in sorted(step_events.items()):
+            self._update_step_stats(conn, run_id, step_key, events_for_step)
+
+    def _increment_run_event_count(self, conn, run_id, event_type_value, count, last_timestamp):
+        # increment in place, so that concurrent writers for the same run do not lose updates
+        update_statement = (
+            RunEventCountsTable.update()  # pylint: disable=no-value-for-parameter
+            .where(
+                db.and_(
+                    RunEventCountsTable.c.run_id == run_id,
+                    RunEventCountsTable.c.dagster_event_type == event_type_value,
+                )
+            )
+            .values(
+                event_count=RunEventCountsTable.c.event_count + count,
+                last_event_timestamp=db.case(
+                    [
+                        (
+                            db.or_(
+                                RunEventCountsTable.c.last_event_timestamp == None,
+                                RunEventCountsTable.c.last_event_timestamp < last_timestamp,
+                            ),
+                            last_timestamp,
+                        )
+                    ],
+                    else_=RunEventCountsTable.c.last_event_timestamp,
+                ),
+            )
+        )
+        if conn.execute(update_statement).rowcount:
+            return
+
+        try:
+            # in a savepoint, so that a conflicting insert does not abort the whole transaction
+            with conn.begin_nested():
+                conn.execute(
+                    RunEventCountsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        run_id=run_id,
+                        dagster_event_type=event_type_value,
+                        event_count=count,
+                        last_event_timestamp=last_timestamp,
+                    )
+                )
+        except db.exc.IntegrityError:
+            # another writer inserted the row first
+            conn.execute(update_statement)
+
+    def _update_step_stats(self, conn, run_id, step_key, events):
+        # the stats are only written if they have not changed since they were read, and are read
+        # again and retried otherwise, so that concurrent writers for the same step do not lose
+        # updates
+        step_filter = db.and_(
+            RunStepStatsTable.c.run_id == run_id,
+            RunStepStatsTable.c.step_key == step_key,
+        )
+        while True:
+            row = conn.execute(db.select([RunStepStatsTable.c.stats]).where(step_filter)).fetchone()
+
+            state = deserialize_value(row[0]) if row and row[0] else {}
+            for event in events:
+                apply_event_to_step_stats_state(state, event)
+
+            if not row:
+                try:
+                    with conn.begin_nested():
+                        conn.execute(
+                            RunStepStatsTable.insert(),  # pylint: disable=no-value-for-parameter
+                            dict(run_id=run_id, step_key=step_key, stats=serialize_value(state)),
+                        )
+                    return
+                except db.exc.IntegrityError:
+                    # another writer inserted the row first
+                    continue
+
+            update_statement = (
+                RunStepStatsTable.update()  # pylint: disable=no-value-for-parameter
+                .where(db.and_(step_filter, RunStepStatsTable.c.stats == row[0]))
+                .values(stats=serialize_value(state))
+            )
+            if conn.execute(update_statement).rowcount:
+                return
+
+    def rebuild_run_stats(self, run_id):
+        """Rebuilds the run stats rollups for a run from its event log rows. Used to backfill the
+        rollup tables for runs that were stored before they existed.
+        """
+        check.str_param(run_id, "run_id")
+
+        with self.run_connection(run_id) as conn:
+            counts = conn.execute(self._run_event_counts_query(run_id)).fetchall()
+            step_event_rows = conn.execute(self._step_stats_events_query(run_id)).fetchall()
+
+            step_states = OrderedDict()
+            for (json_str,) in step_event_rows:
+                event = deserialize_dagster_namedtuple(json_str)
+                if not isinstance(event, EventLogEntry) or not is_step_stats_event(event):
+                    continue
+                apply_event_to_step_stats_state(step_states.setdefault(event.step_key, {}), event)
+
+            with conn.begin():
+                self._delete_run_stats_for_run(conn, run_id)
+                if counts:
+                    conn.execute(
+                        RunEventCountsTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [
+                            dict(
+                                run_id=run_id,
+                                dagster_event_type=dagster_event_type,
+                                event_count=event_count,
+                                last_event_timestamp=last_event_timestamp,
+                            )
+                            for dagster_event_type, event_count, last_event_timestamp in counts
+                        ],
+                    )
+                if step_states:
+                    conn.execute(
+                        RunStepStatsTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [
+                            dict(run_id=run_id, step_key=step_key, stats=serialize_value(state))
+                            for step_key, state in step_states.items()
+                        ],
+                    )
+
+    def _delete_run_stats_for_run(self, conn, run_id):
+        conn.execute(
+            RunEventCountsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                RunEventCountsTable.c.run_id == run_id
+            )
+        )
+        conn.execute(
+            RunStepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                RunStepStatsTable.c.run_id == run_id
+            )
+        )
+
+    def get_all_run_ids(self):
+        """Returns the ids of all runs that have events in the event log."""
+        with self.index_connection() as conn:
+            return [
+                row[0]
+                for row in conn.execute(
+                    db.select([SqlEventLogStorageTable.c.run_id]).distinct()
+                ).fetchall()
+                if row[0]
+            ]
 
     def get_logs_for_run_by_log_id(
         self,
@@ -276,7 +615,7 @@ def get_logs_for_run_by_log_id(
                 json_str,
             ) in results:
                 events[record_id] = check.inst_param(
-                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                    deserialize_dagster_namedtuple(json_str), "event", EventLogEntry
                 )
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
@@ -315,10 +654,8 @@ def get_logs_for_run(
         events_by_id = self.get_logs_for_run_by_log_id(run_id, cursor, of_type, limit)
         return [event for id, event in sorted(events_by_id.items(), key=lambda x: x[0])]
 
-    def get_stats_for_run(self, run_id):
-        check.str_param(run_id, "run_id")
-
-        query = (
+    def _run_event_counts_query(self, run_id):
+        return (
             db.select(
                 [
                     SqlEventLogStorageTable.c.dagster_event_type,
@@ -335,6 +672,20 @@ def get_stats_for_run(self, run_id):
             .group_by("dagster_event_type")
         )
 
+    def get_stats_for_run(self, run_id):
+        check.str_param(run_id, "run_id")
+
+        if self.has_run_stats_rollups():
+            query = db.select(
+                [
+                    RunEventCountsTable.c.dagster_event_type,
+                    RunEventCountsTable.c.event_count,
+                    RunEventCountsTable.c.last_event_timestamp,
+                ]
+            ).where(RunEventCountsTable.c.run_id == run_id)
+        else:
+            query = self._run_event_counts_query(run_id)
+
         with self.run_connection(run_id) as conn:
             results = conn.execute(query).fetchall()
 
@@ -376,6 +727,9 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self.has_run_stats_rollups():
+            return self._get_step_stats_from_rollups(run_id, step_keys)
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -388,46 +742,128 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         # being able to share code with the in-memory event log storage implementation.  We may
         # choose to revisit this in the future, especially if we are able to do JSON-column queries
         # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
+        #
+        # Storages that have the run stats rollups enabled skip this entirely, and instead read the
+        # per-step stats state that is kept up to date as events are stored.
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(self._step_stats_events_query(run_id, step_keys)).fetchall()
+
+        try:
+            records = [
+                check.inst_param(deserialize_dagster_namedtuple(json_str), "event", EventLogEntry)
+                for (json_str,) in results
+            ]
+            return build_run_step_stats_from_events(run_id, records)
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def get_yielded_step_outputs(self, run_id, step_keys=None):
+        check.str_param(run_id, "run_id")
+        check.opt_list_param(step_keys, "step_keys", of_type=str)
+
+        # the filters are on indexed columns, so only the output events of the requested steps are
+        # read and deserialized, rather than every event of the run
+        query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type == DagsterEventType.STEP_OUTPUT.value
+            )
+        )
+        if step_keys is not None:
+            query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        try:
+            return {
+                check.inst_param(
+                    deserialize_dagster_namedtuple(json_str), "event", EventLogEntry
+                ).dagster_event.step_output_data.step_output_handle
+                for (json_str,) in results
+            }
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def _step_stats_events_query(self, run_id, step_keys=None):
+        query = (
             db.select([SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .where(SqlEventLogStorageTable.c.step_key != None)
             .where(
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                        DagsterEventType.ENGINE_EVENT.value,
-                    ]
+                    [event_type.value for event_type in STEP_STATS_EVENT_TYPES]
                 )
             )
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
         if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
-            )
+            query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+        return query
+
+    def _get_step_stats_from_rollups(self, run_id, step_keys=None):
+        query = (
+            db.select([RunStepStatsTable.c.step_key, RunStepStatsTable.c.stats])
+            .where(RunStepStatsTable.c.run_id == run_id)
+            .order_by(RunStepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            query = query.where(RunStepStatsTable.c.step_key.in_(step_keys))
 
         with self.run_connection(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
+            results = conn.execute(query).fetchall()
 
-        try:
-            records = [
-                check.inst_param(
-                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+            try:
+                states = [
+                    (step_key, deserialize_value(stats)) for step_key, stats in results if stats
+                ]
+
+                # the states only count the materializations and expectation results of the steps,
+                # which are read from the event log for the steps that have any
+                result_step_keys = [
+                    step_key for step_key, state in states if step_stats_result_counts(state)
+                ]
+                result_records = (
+                    [
+                        check.inst_param(
+                            deserialize_dagster_namedtuple(event_str), "event", EventLogEntry
+                        )
+                        for (event_str,) in conn.execute(
+                            self._step_stats_results_query(run_id, result_step_keys)
+                        ).fetchall()
+                    ]
+                    if result_step_keys
+                    else []
                 )
-                for (json_str,) in results
-            ]
-            return build_run_step_stats_from_events(run_id, records)
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        materialization_events, expectation_results = collect_step_stats_results(result_records)
+        step_stats = [
+            step_stats_from_state(
+                run_id,
+                step_key,
+                state,
+                materialization_events=materialization_events.get(step_key),
+                expectation_results=expectation_results.get(step_key),
+            )
+            for step_key, state in states
+        ]
+        return [stats for stats in step_stats if stats]
+
+    def _step_stats_results_query(self, run_id, step_keys):
+        return (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [event_type.value for event_type in STEP_STATS_RESULT_EVENT_TYPES]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
 
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
@@ -461,11 +897,17 @@ def wipe(self):
         with self.run_connection(run_id=None) as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if self.has_run_stats_rollups():
+                conn.execute(RunEventCountsTable.delete())  # pylint: disable=no-value-for-parameter
+                conn.execute(RunStepStatsTable.delete())  # pylint: disable=no-value-for-parameter
 
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
 
+        # storage ids may be reused once the tables have been cleared
+        self.clear_latest_materialization_cache()
+
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
@@ -490,6 +932,8 @@ def delete_events_for_run(self, conn, run_id):
             for row in conn.execute(removed_asset_key_query).fetchall()
         ]
         conn.execute(delete_statement)
+        if self.has_run_stats_rollups():
+            self._delete_run_stats_for_run(conn, run_id)
         if len(removed_asset_keys) > 0:
             keys_to_check = []
             keys_to_check.extend([key.to_string() for key in removed_asset_keys])
@@ -513,10 +957,92 @@ def delete_events_for_run(self, conn, run_id):
                     )
                 )
 
+    def purge_events(
+        self,
+        run_ids,
+        before_timestamp,
+        event_types=None,
+        batch_size=DEFAULT_PURGE_BATCH_SIZE,
+        archive=None,
+    ):
+        check.list_param(run_ids, "run_ids", of_type=str)
+        if not run_ids:
+            return 0
+
+        with self.index_connection() as conn:
+            return self.purge_events_for_runs(
+                conn, run_ids, before_timestamp, event_types, batch_size, archive
+            )
+
+    def purge_events_for_runs(
+        self,
+        conn,
+        run_ids,
+        before_timestamp,
+        event_types=None,
+        batch_size=DEFAULT_PURGE_BATCH_SIZE,
+        archive=None,
+    ):
+        """Helper method for deleting a batch of at most `batch_size` of the events matched by a
+        retention policy in a single transaction, so that compaction never holds long locks on the
+        event log.
+        """
+        check.list_param(run_ids, "run_ids", of_type=str)
+        check.float_param(float(before_timestamp), "before_timestamp")
+        event_types = check.opt_list_param(event_types, "event_types", of_type=DagsterEventType)
+        check.int_param(batch_size, "batch_size")
+
+        columns = [SqlEventLogStorageTable] if archive else [SqlEventLogStorageTable.c.id]
+        query = (
+            db.select(columns)
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .where(
+                SqlEventLogStorageTable.c.timestamp < datetime.utcfromtimestamp(before_timestamp)
+            )
+            # asset events, which back the asset catalog, and the step and run lifecycle events,
+            # which re-execution reads back, are never purged
+            .where(SqlEventLogStorageTable.c.asset_key == None)
+            .where(
+                db.or_(
+                    SqlEventLogStorageTable.c.dagster_event_type == None,
+                    SqlEventLogStorageTable.c.dagster_event_type.notin_(
+                        [event_type.value for event_type in RETAINED_EVENT_TYPES]
+                    ),
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .limit(batch_size)
+        )
+        if event_types:
+            query = query.where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [event_type.value for event_type in event_types]
+                )
+            )
+
+        rows = conn.execute(query).fetchall()
+        if not rows:
+            return 0
+
+        if archive:
+            archive.write_rows([dict(row) for row in rows])
+
+        with conn.begin():
+            conn.execute(
+                SqlEventLogStorageTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    SqlEventLogStorageTable.c.id.in_([row.id for row in rows])
+                )
+            )
+        return len(rows)
+
     @property
     def is_persistent(self):
         return True
 
+    @property
+    def supports_event_retention(self):
+        return True
+
     def update_event_log_record(self, record_id, event):
         """Utility method for migration scripts to update SQL representation of event records."""
         check.int_param(record_id, "record_id")
@@ -534,7 +1060,7 @@ def update_event_log_record(self, record_id, event):
                 SqlEventLogStorageTable.update()  # pylint: disable=no-value-for-parameter
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_dagster_namedtuple(event),
+                    event=serialize_dagster_namedtuple_as(event, self.serialization_format),
                     dagster_event_type=dagster_event_type,
                     timestamp=datetime.utcfromtimestamp(event.timestamp),
                     step_key=event.step_key,
@@ -700,7 +1226,7 @@ def get_event_records(
         event_records = []
         for row_id, json_str in results:
             try:
-                event_record = deserialize_json_to_dagster_namedtuple(json_str)
+                event_record = deserialize_dagster_namedtuple(json_str)
                 if not isinstance(event_record, EventLogEntry):
                     logging.warning(
                         "Could not resolve event record as EventLogEntry for id `{}`.".format(
@@ -741,6 +1267,11 @@ def get_latest_materialization_events(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, Optional[EventLogEntry]]:
         check.list_param(asset_keys, "asset_keys", AssetKey)
+        if self.has_secondary_index(ASSET_KEY_INDEX_COLS) and self.has_secondary_index(
+            ASSET_KEY_LATEST_MATERIALIZATION_COLS
+        ):
+            return self._get_indexed_latest_materialization_events(asset_keys)
+
         rows = self._fetch_asset_rows(asset_keys=asset_keys)
         to_backcompat_fetch = set()
         results: Dict[AssetKey, Optional[EventLogEntry]] = {}
@@ -757,48 +1288,142 @@ def get_latest_materialization_events(
                 to_backcompat_fetch.add(asset_key)
 
         if to_backcompat_fetch:
-            latest_event_subquery = (
-                db.select(
-                    [
-                        SqlEventLogStorageTable.c.asset_key,
-                        db.func.max(SqlEventLogStorageTable.c.timestamp).label("timestamp"),
-                    ]
-                )
-                .where(
-                    db.and_(
-                        SqlEventLogStorageTable.c.asset_key.in_(
-                            [asset_key.to_string() for asset_key in to_backcompat_fetch]
-                        ),
-                        SqlEventLogStorageTable.c.dagster_event_type
-                        == DagsterEventType.ASSET_MATERIALIZATION.value,
-                    )
-                )
-                .group_by(SqlEventLogStorageTable.c.asset_key)
-                .alias("latest_materializations")
+            results.update(
+                self._fetch_backcompat_latest_materialization_events(to_backcompat_fetch)
+            )
+
+        return results
+
+    def _fetch_backcompat_latest_materialization_events(self, asset_keys):
+        # fetches the latest materialization events for asset keys whose asset_keys row predates
+        # storing the full event record.  Uses the (slower) raw event log table.
+        results = {}
+        latest_event_subquery = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    db.func.max(SqlEventLogStorageTable.c.timestamp).label("timestamp"),
+                ]
             )
-            backcompat_query = db.select(
-                [SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.event]
-            ).select_from(
-                latest_event_subquery.join(
-                    SqlEventLogStorageTable,
-                    db.and_(
-                        SqlEventLogStorageTable.c.asset_key == latest_event_subquery.c.asset_key,
-                        SqlEventLogStorageTable.c.timestamp == latest_event_subquery.c.timestamp,
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in asset_keys]
                     ),
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
                 )
             )
-            with self.index_connection() as conn:
-                event_rows = conn.execute(backcompat_query).fetchall()
+            .group_by(SqlEventLogStorageTable.c.asset_key)
+            .alias("latest_materializations")
+        )
+        backcompat_query = db.select(
+            [SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.event]
+        ).select_from(
+            latest_event_subquery.join(
+                SqlEventLogStorageTable,
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key == latest_event_subquery.c.asset_key,
+                    SqlEventLogStorageTable.c.timestamp == latest_event_subquery.c.timestamp,
+                ),
+            )
+        )
+        with self.index_connection() as conn:
+            event_rows = conn.execute(backcompat_query).fetchall()
 
-            for row in event_rows:
-                asset_key = AssetKey.from_db_string(row[0])
-                if asset_key:
-                    results[asset_key] = cast(
-                        EventLogEntry, deserialize_json_to_dagster_namedtuple(row[1])
-                    )
+        for row in event_rows:
+            asset_key = AssetKey.from_db_string(row[0])
+            if asset_key:
+                # the event column holds either format, depending on the serialization format of
+                # the storage that wrote the event
+                results[asset_key] = cast(EventLogEntry, deserialize_dagster_namedtuple(row[1]))
 
         return results
 
+    def _get_indexed_latest_materialization_events(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Optional[EventLogEntry]]:
+        # Reads the storage ids of the latest materializations from the asset_keys table, and then
+        # only fetches and deserializes the events that have changed since they were last cached.
+        if not asset_keys:
+            return {}
+
+        storage_id_query = (
+            db.select([AssetKeyTable.c.asset_key, AssetKeyTable.c.last_materialization_storage_id])
+            .where(
+                AssetKeyTable.c.asset_key.in_([asset_key.to_string() for asset_key in asset_keys])
+            )
+            .where(AssetKeyTable.c.last_materialization_storage_id != None)
+            .where(
+                db.or_(
+                    AssetKeyTable.c.wipe_timestamp == None,
+                    AssetKeyTable.c.last_materialization_timestamp > AssetKeyTable.c.wipe_timestamp,
+                )
+            )
+        )
+
+        results: Dict[AssetKey, Optional[EventLogEntry]] = {}
+        to_fetch = []
+        with self.index_connection() as conn:
+            rows = conn.execute(storage_id_query).fetchall()
+            with self._latest_materialization_cache_lock:
+                for asset_key_str, storage_id in rows:
+                    asset_key = AssetKey.from_db_string(asset_key_str)
+                    if not asset_key:
+                        continue
+                    cached = self._latest_materialization_cache.get(asset_key)
+                    if cached and cached[0] == storage_id:
+                        results[asset_key] = cached[1]
+                    else:
+                        to_fetch.append(asset_key_str)
+
+            if not to_fetch:
+                return results
+
+            event_rows = conn.execute(
+                db.select(
+                    [
+                        AssetKeyTable.c.asset_key,
+                        AssetKeyTable.c.last_materialization_storage_id,
+                        AssetKeyTable.c.last_materialization,
+                    ]
+                ).where(AssetKeyTable.c.asset_key.in_(to_fetch))
+            ).fetchall()
+
+        fetched = {}
+        to_backcompat_fetch = set()
+        for asset_key_str, storage_id, event_str in event_rows:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if not asset_key:
+                continue
+            event = deserialize_json_to_dagster_namedtuple(event_str) if event_str else None
+            if isinstance(event, EventLogEntry):
+                results[asset_key] = event
+                fetched[asset_key] = (storage_id, event)
+            else:
+                to_backcompat_fetch.add(asset_key)
+
+        if to_backcompat_fetch:
+            results.update(
+                self._fetch_backcompat_latest_materialization_events(to_backcompat_fetch)
+            )
+
+        with self._latest_materialization_cache_lock:
+            for asset_key, entry in fetched.items():
+                # reinsert, so that entries are ordered by when they were last fetched
+                self._latest_materialization_cache.pop(asset_key, None)
+                self._latest_materialization_cache[asset_key] = entry
+            while len(self._latest_materialization_cache) > MAX_CACHED_LATEST_MATERIALIZATIONS:
+                del self._latest_materialization_cache[
+                    next(iter(self._latest_materialization_cache))
+                ]
+
+        return results
+
+    def clear_latest_materialization_cache(self):
+        with self._latest_materialization_cache_lock:
+            self._latest_materialization_cache.clear()
+
     def _fetch_asset_rows(self, asset_keys=None, prefix=None, limit=None, cursor=None):
         # fetches rows containing asset_key, last_materialization, and asset_details from the DB,
         # applying the filters specified in the arguments.
@@ -1104,7 +1729,7 @@ def _asset_materialization_from_json_column(self, json_str):
         #
         # https://github.com/dagster-io/dagster/issues/3945
 
-        event_or_materialization = deserialize_json_to_dagster_namedtuple(json_str)
+        event_or_materialization = deserialize_dagster_namedtuple(json_str)
         if isinstance(event_or_materialization, AssetMaterialization):
             return event_or_materialization
 
@@ -1203,6 +1828,35 @@ def get_materialization_count_by_partition(
         return materialization_count_by_partition
 
 
+def without_superseded_materializations(events):
+    """Drops the materializations in a batch of events that are followed by a later materialization
+    of the same asset key in the same run.  The asset index only records the latest materialization
+    of each asset, and the storage id of a materialization inserted as part of a batch can then be
+    looked up as the latest of its asset key in its run.
+    """
+    latest_materialization_index = {}
+    for i, event in enumerate(events):
+        if event.is_dagster_event and event.dagster_event.is_step_materialization:
+            key = (event.run_id, event.dagster_event.asset_key)
+            latest_materialization_index[key] = i
+
+    return [
+        event
+        for i, event in enumerate(events)
+        if not (event.is_dagster_event and event.dagster_event.is_step_materialization)
+        or latest_materialization_index[(event.run_id, event.dagster_event.asset_key)] == i
+    ]
+
+
+def group_events_by_run_id(events):
+    """Groups a sequence of events by run id, preserving the order of the events within each run as
+    well as the order in which the runs first appear."""
+    events_by_run_id: Dict[str, List[EventLogEntry]] = OrderedDict()
+    for event in events:
+        events_by_run_id.setdefault(event.run_id, []).append(event)
+    return events_by_run_id
+
+
 def _get_from_row(row, column):
     """utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3"""
@@ -0,0 +1,25 @@
+"""add run stats rollup tables
+
+Revision ID: 155a8a4089c5
+Revises: 05844c702676
+Create Date: 2022-02-14 10:12:47.381104
+
+"""
+from dagster.core.storage.migration.utils import (
+    create_run_stats_rollup_tables,
+    drop_run_stats_rollup_tables,
+)
+
+# revision identifiers, used by Alembic.
+revision = "155a8a4089c5"
+down_revision = "05844c702676"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_stats_rollup_tables()
+
+
+def downgrade():
+    drop_run_stats_rollup_tables()
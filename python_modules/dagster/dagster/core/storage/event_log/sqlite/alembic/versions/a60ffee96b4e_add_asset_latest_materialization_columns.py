@@ -0,0 +1,25 @@
+"""add asset latest materialization columns
+
+Revision ID: a60ffee96b4e
+Revises: 155a8a4089c5
+Create Date: 2022-02-16 09:41:12.530217
+
+"""
+from dagster.core.storage.migration.utils import (
+    add_asset_latest_materialization_columns,
+    drop_asset_latest_materialization_columns,
+)
+
+# revision identifiers, used by Alembic.
+revision = "a60ffee96b4e"
+down_revision = "155a8a4089c5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_asset_latest_materialization_columns()
+
+
+def downgrade():
+    drop_asset_latest_materialization_columns()
@@ -145,33 +145,43 @@ def watch(self, run_id, start_cursor, callback):
         self._watchers[run_id][callback] = cursor
 
     def on_modified(self):
-        keys = [
-            (run_id, callback)
-            for run_id, callback_dict in self._watchers.items()
-            for callback, _ in callback_dict.items()
-        ]
-        for run_id, callback in keys:
-            cursor = self._watchers[run_id][callback]
+        # fetch the new events for each watched run once, from the earliest cursor of any of its
+        # callbacks, and fan them out to every callback of the run
+        cursors_by_run_id = {
+            run_id: dict(callback_dict)
+            for run_id, callback_dict in list(self._watchers.items())
+            if callback_dict
+        }
+        for run_id, callback_cursors in cursors_by_run_id.items():
+            min_cursor = min(callback_cursors.values())
 
             # fetch events
-            events = self.get_logs_for_run(run_id, cursor)
-
-            # update cursor
-            self._watchers[run_id][callback] = cursor + len(events)
-
-            for event in events:
-                status = None
-                try:
-                    status = callback(event)
-                except Exception:
-                    logging.exception("Exception in callback for event watch on run %s.", run_id)
-
-                if (
-                    status == PipelineRunStatus.SUCCESS
-                    or status == PipelineRunStatus.FAILURE
-                    or status == PipelineRunStatus.CANCELED
-                ):
-                    self.end_watch(run_id, callback)
+            events = self.get_logs_for_run(run_id, min_cursor)
+
+            for callback, cursor in callback_cursors.items():
+                if callback not in self._watchers[run_id]:
+                    # the watch was ended while the events were being fetched
+                    continue
+
+                # update cursor
+                new_events = events[cursor - min_cursor :]
+                self._watchers[run_id][callback] = cursor + len(new_events)
+
+                for event in new_events:
+                    status = None
+                    try:
+                        status = callback(event)
+                    except Exception:
+                        logging.exception(
+                            "Exception in callback for event watch on run %s.", run_id
+                        )
+
+                    if (
+                        status == PipelineRunStatus.SUCCESS
+                        or status == PipelineRunStatus.FAILURE
+                        or status == PipelineRunStatus.CANCELED
+                    ):
+                        self.end_watch(run_id, callback)
 
     def end_watch(self, run_id, handler):
         if run_id in self._watchers and handler in self._watchers[run_id]:
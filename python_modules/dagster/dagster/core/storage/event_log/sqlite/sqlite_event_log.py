@@ -5,9 +5,8 @@
 import threading
 import time
 import warnings
-from collections import defaultdict
 from contextlib import contextmanager
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
@@ -15,8 +14,8 @@
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
-from dagster import check, seven
-from dagster.config.source import StringSource
+from dagster import Field, check, seven
+from dagster.config.source import IntSource, StringSource
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
 from dagster.core.storage.event_log.base import EventLogRecord, EventRecordsFilter
@@ -29,16 +28,31 @@
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster.core.storage.sqlite import create_db_conn_string
+from dagster.core.storage.sqlite import (
+    connection_pool_from_config,
+    create_db_conn_string,
+    serialization_format_from_config,
+)
 from dagster.serdes import (
     ConfigurableClass,
     ConfigurableClassData,
-    deserialize_json_to_dagster_namedtuple,
+    SerializationFormat,
+    deserialize_dagster_namedtuple,
 )
+from dagster.serdes.serdes import check_serialization_format_available
 from dagster.utils import mkdir_p
 
+from ..migration import EVENT_LOG_DATA_MIGRATIONS, RUN_STATS_ROLLUPS
+from ..polling_event_watcher import CallbackAfterCursor
+from ..retention import DEFAULT_PURGE_BATCH_SIZE
 from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..sql_event_log import (
+    INSERT_EVENT_STATEMENT,
+    RunShardedEventsCursor,
+    SqlEventLogStorage,
+    group_events_by_run_id,
+    without_superseded_materializations,
+)
 
 INDEX_SHARD_NAME = "index"
 
@@ -66,31 +80,66 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     The ``base_dir`` param tells the event log storage where on disk to store the databases. To
     improve concurrent performance, event logs are stored in a separate SQLite database for each
     run.
+
+    The optional ``serialization_format`` param (``json`` or ``binary``, defaults to ``json``)
+    selects how new events are encoded. The ``binary`` format produces smaller rows that are
+    cheaper to encode and decode, and requires the ``msgpack`` package. Events stored in either
+    format can always be read.
+
+    By default, a new connection is opened for every operation. Setting the optional
+    ``pool_size`` param instead keeps a pool of that many WAL-mode connections open per database,
+    reusing connections and compiled statements across writes. Databases that have not been
+    touched for ``pool_idle_timeout`` seconds (defaults to 60) have their connections closed.
     """
 
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(
+        self,
+        base_dir,
+        inst_data=None,
+        serialization_format=SerializationFormat.JSON,
+        pool_size=None,
+        pool_idle_timeout=None,
+    ):
         """Note that idempotent initialization of the SQLite database is done on a per-run_id
         basis in the body of connect, since each run is stored in a separate database."""
         self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
         mkdir_p(self._base_dir)
 
+        self._serialization_format = check.inst_param(
+            serialization_format, "serialization_format", SerializationFormat
+        )
+        check_serialization_format_available(self._serialization_format)
+        self._connection_pool = connection_pool_from_config(pool_size, pool_idle_timeout)
+
         self._obs = None
 
-        self._watchers = defaultdict(dict)
+        self._watchers = {}
+        self._watchers_lock = threading.Lock()
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
         # Used to ensure that each run ID attempts to initialize its DB the first time it connects,
         # ensuring that the database will be created if it doesn't exist
         self._initialized_dbs = set()
 
-        # Ensure that multiple threads (like the event log watcher) interact safely with each other
-        self._db_lock = threading.Lock()
+        # Ensure that multiple threads (like the event log watcher) interact safely with each other.
+        # Reentrant, since maintaining the run stats rollups may consult the index shard while a
+        # run shard connection is open
+        self._db_lock = threading.RLock()
+
+        self._secondary_index_cache = {}
 
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
             conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
             engine = create_engine(conn_string, poolclass=NullPool)
             self._initdb(engine)
-            self.reindex_events()
+            if self.get_all_run_ids():
+                # run shards that predate the index shard may need to be migrated before the run
+                # stats rollups can be built from them, so leave that to `dagster instance reindex`
+                for migration_name, migration_fn in EVENT_LOG_DATA_MIGRATIONS.items():
+                    if migration_name != RUN_STATS_ROLLUPS:
+                        self._apply_migration(migration_name, migration_fn, None, False)
+            else:
+                self.reindex_events()
             self.reindex_assets()
 
         super().__init__()
@@ -118,11 +167,23 @@ def inst_data(self):
 
     @classmethod
     def config_type(cls):
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "serialization_format": Field(StringSource, is_required=False),
+            "pool_size": Field(IntSource, is_required=False),
+            "pool_idle_timeout": Field(IntSource, is_required=False),
+        }
 
     @staticmethod
     def from_config_value(inst_data, config_value):
-        return SqliteEventLogStorage(inst_data=inst_data, **config_value)
+        return SqliteEventLogStorage(
+            inst_data=inst_data,
+            **serialization_format_from_config(config_value),
+        )
+
+    @property
+    def serialization_format(self):
+        return self._serialization_format
 
     def get_all_run_ids(self):
         all_filenames = glob.glob(os.path.join(self._base_dir, "*.db"))
@@ -135,6 +196,14 @@ def get_all_run_ids(self):
     def path_for_shard(self, run_id):
         return os.path.join(self._base_dir, "{run_id}.db".format(run_id=run_id))
 
+    def watch_paths_for_shard(self, run_id):
+        paths = [self.path_for_shard(run_id)]
+        if self._connection_pool:
+            # pooled connections stay open, so new events sit in the write-ahead log until the
+            # next checkpoint rather than being flushed to the database file when a connection closes
+            paths.append(paths[0] + "-wal")
+        return paths
+
     def conn_string_for_shard(self, shard_name):
         check.str_param(shard_name, "shard_name")
         return create_db_conn_string(self._base_dir, shard_name)
@@ -191,7 +260,10 @@ def _connect(self, shard):
             check.str_param(shard, "shard")
 
             conn_string = self.conn_string_for_shard(shard)
-            engine = create_engine(conn_string, poolclass=NullPool)
+            if self._connection_pool:
+                engine = self._connection_pool.get_engine(conn_string)
+            else:
+                engine = create_engine(conn_string, poolclass=NullPool)
 
             if not shard in self._initialized_dbs:
                 self._initdb(engine)
@@ -208,7 +280,8 @@ def _connect(self, shard):
                     yield conn
             finally:
                 conn.close()
-            engine.dispose()
+            if not self._connection_pool:
+                engine.dispose()
 
     def run_connection(self, run_id=None):
         return self._connect(run_id)
@@ -225,11 +298,15 @@ def store_event(self, event):
             event (EventLogEntry): The event to store.
         """
         check.inst_param(event, "event", EventLogEntry)
-        insert_event_statement = self.prepare_insert_event(event)
+        # bind the values to the shared insert statement, rather than baking them into a new
+        # statement per event, so that pooled engines can reuse its compiled form
+        insert_event_values = self.prepare_insert_event_values(event)
         run_id = event.run_id
 
         with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+            with self.event_write_transaction(conn) as conn:
+                conn.execute(INSERT_EVENT_STATEMENT, insert_event_values)
+                self.update_run_stats(conn, run_id, [event])
 
         if event.is_dagster_event and event.dagster_event.asset_key:
             check.invariant(
@@ -239,13 +316,51 @@ def store_event(self, event):
             )
             # mirror the event in the cross-run index database
             with self.index_connection() as conn:
-                conn.execute(insert_event_statement)
+                result = conn.execute(INSERT_EVENT_STATEMENT, insert_event_values)
+                storage_id = result.inserted_primary_key[0]
 
             if (
                 event.dagster_event.is_step_materialization
                 or event.dagster_event.is_asset_observation
             ):
-                self.store_asset(event)
+                self.store_asset(event, storage_id)
+
+    def store_events(self, events):
+        """
+        Overridden method to write a batch of events with one transaction per run shard, mirroring
+        any asset events in the batch into the central assets.db sqlite shard.
+
+        Args:
+            events (List[EventLogEntry]): The events to store, in order.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in group_events_by_run_id(events).items():
+            with self.run_connection(run_id) as conn:
+                with self.event_write_transaction(conn) as conn:
+                    self.insert_events(conn, run_events)
+                    self.update_run_stats(conn, run_id, run_events)
+
+        asset_events = [
+            event for event in events if event.is_dagster_event and event.dagster_event.asset_key
+        ]
+        if not asset_events:
+            return
+
+        for event in asset_events:
+            check.invariant(
+                event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
+                or event.dagster_event_type == DagsterEventType.ASSET_OBSERVATION,
+                "Can only store asset materializations and observations in index database",
+            )
+
+        # mirror the events in the cross-run index database
+        with self.index_connection() as conn:
+            with self.event_write_transaction(conn) as conn:
+                self.insert_events(conn, asset_events)
+
+        for event in without_superseded_materializations(asset_events):
+            self.store_asset(event)
 
     def get_event_records(
         self,
@@ -327,7 +442,7 @@ def get_event_records(
 
             for row_id, json_str in results:
                 try:
-                    event_record = deserialize_json_to_dagster_namedtuple(json_str)
+                    event_record = deserialize_dagster_namedtuple(json_str)
                     if not isinstance(event_record, EventLogEntry):
                         logging.warning(
                             "Could not resolve event record as EventLogEntry for id `{}`.".format(
@@ -349,6 +464,18 @@ def get_event_records(
 
         return event_records[:limit]
 
+    def has_secondary_index(self, name):
+        if name not in self._secondary_index_cache:
+            self._secondary_index_cache[name] = super(
+                SqliteEventLogStorage, self
+            ).has_secondary_index(name)
+        return self._secondary_index_cache[name]
+
+    def enable_secondary_index(self, name):
+        super(SqliteEventLogStorage, self).enable_secondary_index(name)
+        if name in self._secondary_index_cache:
+            del self._secondary_index_cache[name]
+
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
@@ -357,7 +484,36 @@ def delete_events(self, run_id):
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
 
+    def purge_events(
+        self,
+        run_ids,
+        before_timestamp,
+        event_types=None,
+        batch_size=DEFAULT_PURGE_BATCH_SIZE,
+        archive=None,
+    ):
+        check.list_param(run_ids, "run_ids", of_type=str)
+
+        # asset events, the only events mirrored in the index shard, are never purged, so only the
+        # run shards need to be compacted
+        purged = 0
+        for run_id in run_ids:
+            if purged >= batch_size:
+                break
+            if not os.path.exists(self.path_for_shard(run_id)):
+                continue
+
+            with self.run_connection(run_id) as conn:
+                purged += self.purge_events_for_runs(
+                    conn, [run_id], before_timestamp, event_types, batch_size - purged, archive
+                )
+        return purged
+
     def wipe(self):
+        # close any pooled connections before the databases are removed from under them
+        if self._connection_pool:
+            self._connection_pool.dispose()
+
         # should delete all the run-sharded dbs as well as the index db
         for filename in (
             glob.glob(os.path.join(self._base_dir, "*.db"))
@@ -367,6 +523,8 @@ def wipe(self):
             os.unlink(filename)
 
         self._initialized_dbs = set()
+        self._secondary_index_cache = {}
+        self.clear_latest_materialization_cache()
 
     def _delete_mirrored_events_for_asset_key(self, asset_key):
         with self.index_connection() as conn:
@@ -391,52 +549,174 @@ def watch(self, run_id, start_cursor, callback):
             self._obs = Observer()
             self._obs.start()
 
-        watchdog = SqliteEventLogStorageWatchdog(self, run_id, callback, start_cursor)
-        self._watchers[run_id][callback] = (
-            watchdog,
-            self._obs.schedule(watchdog, self._base_dir, True),
-        )
+        # All subscribers of a run share a single handler, so that each write to the run shard
+        # results in a single cursor query, fanned out to every callback.  Observer methods are
+        # never called while holding the watchers lock, since the observer thread holds its own
+        # lock while dispatching to callbacks that may end their watch.
+        while True:
+            with self._watchers_lock:
+                watchdog = self._watchers.get(run_id)
+                created = watchdog is None or watchdog.is_closed
+                if created:
+                    watchdog = SqliteEventLogStorageWatchdog(self, run_id, start_cursor)
+                    self._watchers[run_id] = watchdog
+
+            if created:
+                watch = self._obs.schedule(watchdog, self._base_dir, True)
+                if not watchdog.attach_watch(watch):
+                    self._obs.remove_handler_for_watch(watchdog, watch)
+
+            if watchdog.add_callback(start_cursor, callback):
+                return
 
     def end_watch(self, run_id, handler):
-        if handler in self._watchers[run_id]:
-            event_handler, watch = self._watchers[run_id][handler]
-            self._obs.remove_handler_for_watch(event_handler, watch)
-            del self._watchers[run_id][handler]
+        with self._watchers_lock:
+            watchdog = self._watchers.get(run_id)
+        if not watchdog or not watchdog.remove_callback(handler):
+            return
+
+        # the last callback was removed, tear down the handler for the run
+        with self._watchers_lock:
+            if self._watchers.get(run_id) is watchdog:
+                del self._watchers[run_id]
+
+        watch = watchdog.detach_watch()
+        if watch:
+            self._obs.remove_handler_for_watch(watchdog, watch)
 
     def dispose(self):
         if self._obs:
             self._obs.stop()
             self._obs.join(timeout=15)
+        if self._connection_pool:
+            self._connection_pool.dispose()
 
 
 class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
-    def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
+    """Watches the shard for a single run, fetching new events once per modification and
+    dispatching them to every callback registered for the run.
+    """
+
+    def __init__(self, event_log_storage, run_id, start_cursor, **kwargs):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", SqliteEventLogStorage
         )
         self._run_id = check.str_param(run_id, "run_id")
-        self._cb = check.callable_param(callback, "callback")
-        self._log_path = event_log_storage.path_for_shard(run_id)
+        self._watch_paths = event_log_storage.watch_paths_for_shard(run_id)
         self._cursor = start_cursor if start_cursor is not None else -1
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
+        self._callbacks: List[CallbackAfterCursor] = []
+        self._watch = None
+        self._closed = False
+        # reentrant, since callbacks may end their own watch while events are being dispatched
+        self._lock = threading.RLock()
+        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=self._watch_paths, **kwargs)
+
+    @property
+    def is_closed(self):
+        return self._closed
+
+    def attach_watch(self, watch):
+        """Returns False if the handler was closed before it was scheduled."""
+        with self._lock:
+            if self._closed:
+                return False
+            self._watch = watch
+            return True
+
+    def detach_watch(self):
+        with self._lock:
+            watch, self._watch = self._watch, None
+            return watch
+
+    def add_callback(self, start_cursor, callback):
+        """Returns False if the handler has already been closed, in which case the callback should
+        be registered with a new handler."""
+        check.callable_param(callback, "callback")
+        start_cursor = start_cursor if start_cursor is not None else -1
+        with self._lock:
+            if self._closed:
+                return False
+
+            callback_with_cursor = CallbackAfterCursor(start_cursor, callback)
+            self._callbacks.append(callback_with_cursor)
+            finished = []
+            if start_cursor < self._cursor:
+                # the subscriber is behind the shared cursor, catch it up on the events that have
+                # already been dispatched to the other callbacks
+                events = self._event_log_storage.get_logs_for_run(
+                    self._run_id, start_cursor, limit=self._cursor - start_cursor
+                )
+                finished = self._dispatch(start_cursor, events, [callback_with_cursor])
+
+        self._end_finished_watches(finished)
+        return True
+
+    def remove_callback(self, callback):
+        """Returns True if the handler has no callbacks left and was closed by this call."""
+        with self._lock:
+            self._callbacks = [
+                callback_with_cursor
+                for callback_with_cursor in self._callbacks
+                if callback_with_cursor.callback != callback
+            ]
+            if self._callbacks or self._closed:
+                return False
+
+            self._closed = True
+            return True
+
+    def _dispatch(self, cursor, events, callbacks):
+        """Must be called while holding the lock.  Returns the callbacks that have finished
+        watching the run, which have been removed from the handler."""
+        finished = []
+        for index, event in enumerate(events, start=cursor + 1):
+            for callback_with_cursor in callbacks:
+                if (
+                    callback_with_cursor.start_cursor >= index
+                    or callback_with_cursor in finished
+                    or callback_with_cursor not in self._callbacks
+                ):
+                    continue
+
+                status = None
+                try:
+                    status = callback_with_cursor.callback(event)
+                except Exception:
+                    logging.exception(
+                        "Exception in callback for event watch on run %s.", self._run_id
+                    )
+
+                if (
+                    status == PipelineRunStatus.SUCCESS
+                    or status == PipelineRunStatus.FAILURE
+                    or status == PipelineRunStatus.CANCELED
+                ):
+                    finished.append(callback_with_cursor)
+
+        if finished:
+            self._callbacks = [
+                callback_with_cursor
+                for callback_with_cursor in self._callbacks
+                if callback_with_cursor not in finished
+            ]
+        return finished
+
+    def _end_finished_watches(self, finished):
+        for callback_with_cursor in finished:
+            self._event_log_storage.end_watch(self._run_id, callback_with_cursor.callback)
 
     def _process_log(self):
-        events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
-        self._cursor += len(events)
-        for event in events:
-            status = None
-            try:
-                status = self._cb(event)
-            except Exception:
-                logging.exception("Exception in callback for event watch on run %s.", self._run_id)
+        with self._lock:
+            if self._closed:
+                return
 
-            if (
-                status == PipelineRunStatus.SUCCESS
-                or status == PipelineRunStatus.FAILURE
-                or status == PipelineRunStatus.CANCELED
-            ):
-                self._event_log_storage.end_watch(self._run_id, self._cb)
+            events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
+            cursor = self._cursor
+            self._cursor += len(events)
+            finished = self._dispatch(cursor, events, list(self._callbacks))
+
+        self._end_finished_watches(finished)
 
     def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
+        check.invariant(event.src_path in self._watch_paths)
         self._process_log()
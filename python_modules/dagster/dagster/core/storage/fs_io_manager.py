@@ -153,6 +153,20 @@ def load_input(self, context):
         with open(filepath, self.read_mode) as read_obj:
             return pickle.load(read_obj)
 
+    def release_output(self, context):
+        """Delete the file of an output that is no longer needed by this run. Versioned outputs
+        are kept, since they are shared with later runs.
+        """
+        check.inst_param(context, "context", OutputContext)
+
+        if context.version is not None:
+            return
+
+        filepath = self._get_path(context)
+        if os.path.exists(filepath):
+            context.log.debug(f"Deleting file at: {filepath}")
+            os.remove(filepath)
+
 
 class CustomPathPickledObjectFilesystemIOManager(IOManager):
     """Built-in filesystem IO managerthat stores and retrieves values using pickling and
@@ -35,6 +35,7 @@ def __init__(
         version=None,
         input_config_schema=None,
         output_config_schema=None,
+        cleans_up_runs=False,
     ):
         self._input_config_schema = convert_user_facing_definition_config_schema(
             input_config_schema
@@ -49,6 +50,7 @@ def __init__(
             if output_config_schema is not None
             else None
         )
+        self._cleans_up_runs = check.bool_param(cleans_up_runs, "cleans_up_runs")
         super(IOManagerDefinition, self).__init__(
             resource_fn=resource_fn,
             config_schema=config_schema,
@@ -65,6 +67,10 @@ def input_config_schema(self):
     def output_config_schema(self):
         return self._output_config_schema
 
+    @property
+    def cleans_up_runs(self):
+        return self._cleans_up_runs
+
     def copy_for_configured(self, description, config_schema, _):
         return IOManagerDefinition(
             config_schema=config_schema,
@@ -73,6 +79,7 @@ def copy_for_configured(self, description, config_schema, _):
             required_resource_keys=self.required_resource_keys,
             input_config_schema=self.input_config_schema,
             output_config_schema=self.output_config_schema,
+            cleans_up_runs=self.cleans_up_runs,
         )
 
     @staticmethod
@@ -121,6 +128,28 @@ def handle_output(self, context, obj):
             obj (Any): The object, returned by the op, to be stored.
         """
 
+    def release_output(self, _context) -> None:
+        """User-defined method that releases or deletes a stored output of an op, once every
+        downstream op that loads it has succeeded.
+
+        It is only called by executors that are configured to release outputs, like the
+        in_process_executor with ``release_outputs`` enabled. By default, outputs are kept.
+
+        Args:
+            context (OutputContext): The context of the step output that produced the object.
+        """
+
+    def cleanup_run(self, _run_id: str) -> None:
+        """User-defined method that removes the outputs a run stored, once the run has succeeded.
+
+        It is only called for IO managers whose definition sets ``cleans_up_runs``, which the
+        orchestration process initializes once the run has succeeded. The outputs of failed runs
+        are never cleaned up, so that they can be re-executed. By default, outputs are kept.
+
+        Args:
+            run_id (str): The id of the run that succeeded.
+        """
+
     def get_output_asset_key(self, _context) -> Optional[AssetKey]:
         """User-defined method that associates outputs handled by this IOManager with a particular
         AssetKey.
@@ -167,6 +196,7 @@ def io_manager(
     input_config_schema=None,
     required_resource_keys=None,
     version=None,
+    cleans_up_runs=False,
 ):
     """
     Define an IO manager.
@@ -190,6 +220,9 @@ def io_manager(
         version (Optional[str]): (Experimental) The version of a resource function. Two wrapped
             resource functions should only have the same version if they produce the same resource
             definition when provided with the same inputs.
+        cleans_up_runs (bool): Whether the orchestration process should initialize the IO manager
+            once a run has succeeded, and call its ``cleanup_run`` method to remove the outputs the
+            run stored. Defaults to False.
 
     **Examples:**
 
@@ -226,6 +259,7 @@ def _wrap(resource_fn):
             version=version,
             output_config_schema=output_config_schema,
             input_config_schema=input_config_schema,
+            cleans_up_runs=cleans_up_runs,
         )(resource_fn)
 
     return _wrap
@@ -240,6 +274,7 @@ def __init__(
         version=None,
         output_config_schema=None,
         input_config_schema=None,
+        cleans_up_runs=False,
     ):
         # type validation happens in IOManagerDefinition
         self.config_schema = config_schema
@@ -248,6 +283,7 @@ def __init__(
         self.version = version
         self.output_config_schema = output_config_schema
         self.input_config_schema = input_config_schema
+        self.cleans_up_runs = cleans_up_runs
 
     def __call__(self, fn):
         check.callable_param(fn, "fn")
@@ -260,6 +296,7 @@ def __call__(self, fn):
             version=self.version,
             output_config_schema=self.output_config_schema,
             input_config_schema=self.input_config_schema,
+            cleans_up_runs=self.cleans_up_runs,
         )
 
         update_wrapper(io_manager_def, wrapped=fn)
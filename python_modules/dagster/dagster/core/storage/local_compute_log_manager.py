@@ -8,7 +8,10 @@
 from watchdog.observers.polling import PollingObserver
 
 from dagster import Field, Float, StringSource, check
-from dagster.core.execution.compute_logs import mirror_stream_to_file
+from dagster.core.execution.compute_logs import (
+    mirror_stream_to_file,
+    mirror_thread_streams_to_files,
+)
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import ensure_dir, touch_file
@@ -51,6 +54,17 @@ def _watch_logs(self, pipeline_run, step_key=None):
             with mirror_stream_to_file(sys.stderr, errpath):
                 yield
 
+    @contextmanager
+    def _watch_thread_logs(self, pipeline_run, step_key=None):
+        check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+        check.opt_str_param(step_key, "step_key")
+
+        key = self.get_key(pipeline_run, step_key)
+        outpath = self.get_local_path(pipeline_run.run_id, key, ComputeIOType.STDOUT)
+        errpath = self.get_local_path(pipeline_run.run_id, key, ComputeIOType.STDERR)
+        with mirror_thread_streams_to_files(outpath, errpath):
+            yield
+
     @property
     def inst_data(self):
         return self._inst_data
@@ -13,6 +13,10 @@ def load_input(self, context):
         keys = tuple(context.upstream_output.get_output_identifier())
         return self.values[keys]
 
+    def release_output(self, context):
+        keys = tuple(context.get_output_identifier())
+        self.values.pop(keys, None)
+
 
 @io_manager
 def mem_io_manager(_):
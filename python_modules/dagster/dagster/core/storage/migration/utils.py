@@ -195,6 +195,28 @@ def extract_asset_keys_idx_columns():
     op.add_column("asset_keys", db.Column("tags", db.TEXT))
 
 
+def add_asset_latest_materialization_columns():
+    if not has_table("asset_keys"):
+        return
+
+    if has_column("asset_keys", "last_materialization_storage_id"):
+        return
+
+    op.add_column("asset_keys", db.Column("last_materialization_storage_id", db.Integer))
+    op.add_column("asset_keys", db.Column("last_materialization_partition", db.Text))
+
+
+def drop_asset_latest_materialization_columns():
+    if not has_table("asset_keys"):
+        return
+
+    if not has_column("asset_keys", "last_materialization_storage_id"):
+        return
+
+    op.drop_column("asset_keys", "last_materialization_storage_id")
+    op.drop_column("asset_keys", "last_materialization_partition")
+
+
 def create_event_log_event_idx():
     if not has_table("event_logs"):
         return
@@ -245,3 +267,37 @@ def drop_run_record_start_end_timestamps():
 
     op.drop_column("runs", "start_time")
     op.drop_column("runs", "end_time")
+
+
+def create_run_stats_rollup_tables():
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("run_event_counts"):
+        op.create_table(
+            "run_event_counts",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("dagster_event_type", db.String(255), nullable=False),
+            db.Column("event_count", db.Integer, nullable=False),
+            db.Column("last_event_timestamp", db.types.TIMESTAMP),
+            db.UniqueConstraint("run_id", "dagster_event_type"),
+        )
+
+    if not has_table("run_step_stats"):
+        op.create_table(
+            "run_step_stats",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.String(255), nullable=False),
+            db.Column("stats", db.Text),
+            db.UniqueConstraint("run_id", "step_key"),
+        )
+
+
+def drop_run_stats_rollup_tables():
+    if has_table("run_event_counts"):
+        op.drop_table("run_event_counts")
+
+    if has_table("run_step_stats"):
+        op.drop_table("run_step_stats")
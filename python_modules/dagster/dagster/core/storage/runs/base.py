@@ -266,6 +266,20 @@ def get_pipeline_snapshot(self, pipeline_snapshot_id: str) -> PipelineSnapshot:
             PipelineSnapshot
         """
 
+    def get_pipeline_snapshot_and_size(
+        self, pipeline_snapshot_id: str
+    ) -> Tuple[Optional[PipelineSnapshot], Optional[int]]:
+        """Fetch a snapshot by ID, along with the size in bytes of its uncompressed serialized
+        representation, or None if the storage does not keep a serialized representation.
+
+        Args:
+            pipeline_snapshot_id (str)
+
+        Returns:
+            Tuple[Optional[PipelineSnapshot], Optional[int]]
+        """
+        return self.get_pipeline_snapshot(pipeline_snapshot_id), None
+
     @abstractmethod
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         """Check to see if storage contains an execution plan snapshot.
@@ -310,6 +324,20 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
             ExecutionPlanSnapshot
         """
 
+    def get_execution_plan_snapshot_and_size(
+        self, execution_plan_snapshot_id: str
+    ) -> Tuple[Optional[ExecutionPlanSnapshot], Optional[int]]:
+        """Fetch a snapshot by ID, along with the size in bytes of its uncompressed serialized
+        representation, or None if the storage does not keep a serialized representation.
+
+        Args:
+            execution_plan_snapshot_id (str)
+
+        Returns:
+            Tuple[Optional[ExecutionPlanSnapshot], Optional[int]]
+        """
+        return self.get_execution_plan_snapshot(execution_plan_snapshot_id), None
+
     @abstractmethod
     def wipe(self):
         """Clears the run storage."""
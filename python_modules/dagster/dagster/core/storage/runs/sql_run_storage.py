@@ -722,6 +722,12 @@ def get_pipeline_snapshot(self, pipeline_snapshot_id: str) -> PipelineSnapshot:
         check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
         return self._get_snapshot(pipeline_snapshot_id)
 
+    def get_pipeline_snapshot_and_size(
+        self, pipeline_snapshot_id: str
+    ) -> Tuple[Optional[PipelineSnapshot], Optional[int]]:
+        check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
+        return self._get_snapshot_and_size(pipeline_snapshot_id)
+
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return bool(self.get_execution_plan_snapshot(execution_plan_snapshot_id))
@@ -745,6 +751,12 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._get_snapshot(execution_plan_snapshot_id)
 
+    def get_execution_plan_snapshot_and_size(
+        self, execution_plan_snapshot_id: str
+    ) -> Tuple[Optional[ExecutionPlanSnapshot], Optional[int]]:
+        check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
+        return self._get_snapshot_and_size(execution_plan_snapshot_id)
+
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
         check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
@@ -784,13 +796,19 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str):
+        snapshot, _ = self._get_snapshot_and_size(snapshot_id)
+        return snapshot
+
+    def _get_snapshot_and_size(self, snapshot_id: str):
         query = db.select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
+        if not row:
+            return None, None
 
-        return defensively_unpack_pipeline_snapshot_query(logging, row) if row else None
+        return defensively_unpack_pipeline_snapshot_query_and_size(logging, row)
 
     def _get_partition_runs(
         self, partition_set_name: str, partition_name: str
@@ -983,6 +1001,13 @@ def update_backfill(self, partition_backfill: PartitionBackfill):
 
 
 def defensively_unpack_pipeline_snapshot_query(logger, row):
+    snapshot, _ = defensively_unpack_pipeline_snapshot_query_and_size(logger, row)
+    return snapshot
+
+
+def defensively_unpack_pipeline_snapshot_query_and_size(logger, row):
+    """Unpacks the snapshot stored in the row, along with the size of its decompressed body, or
+    None for both if the row can not be unpacked."""
     # no checking here because sqlalchemy returns a special
     # row proxy and don't want to instance check on an internal
     # implementation detail
@@ -992,22 +1017,24 @@ def _warn(msg):
 
     if not isinstance(row[0], bytes):
         _warn("First entry in row is not a binary type.")
-        return None
+        return None, None
 
     try:
         uncompressed_bytes = zlib.decompress(row[0])
     except zlib.error:
         _warn("Could not decompress bytes stored in snapshot table.")
-        return None
+        return None, None
+
+    snapshot_size = len(uncompressed_bytes)
 
     try:
         decoded_str = uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
         _warn("Could not unicode decode decompressed bytes stored in snapshot table.")
-        return None
+        return None, None
 
     try:
-        return deserialize_json_to_dagster_namedtuple(decoded_str)
+        return deserialize_json_to_dagster_namedtuple(decoded_str), snapshot_size
     except JSONDecodeError:
         _warn("Could not parse json in snapshot table.")
-        return None
+        return None, None
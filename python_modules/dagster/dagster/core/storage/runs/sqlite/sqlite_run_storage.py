@@ -5,7 +5,7 @@
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
 
-from dagster import StringSource, check
+from dagster import Field, IntSource, StringSource, check
 from dagster.core.storage.sql import (
     check_alembic_revision,
     create_engine,
@@ -15,7 +15,11 @@
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster.core.storage.sqlite import create_db_conn_string, get_sqlite_version
+from dagster.core.storage.sqlite import (
+    connection_pool_from_config,
+    create_db_conn_string,
+    get_sqlite_version,
+)
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import mkdir_p
 
@@ -46,12 +50,23 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
             base_dir: /path/to/dir
 
     The ``base_dir`` param tells the run storage where on disk to store the database.
+
+    Setting the optional ``pool_size`` param keeps a pool of that many WAL-mode connections open to
+    the database, instead of opening a new connection for every operation. Pooled connections are
+    closed after the database has been idle for ``pool_idle_timeout`` seconds (defaults to 60).
     """
 
-    def __init__(self, conn_string, inst_data=None):
+    def __init__(
+        self,
+        conn_string,
+        inst_data=None,
+        pool_size=None,
+        pool_idle_timeout=None,
+    ):
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._connection_pool = connection_pool_from_config(pool_size, pool_idle_timeout)
         super().__init__()
 
     @property
@@ -60,14 +75,24 @@ def inst_data(self):
 
     @classmethod
     def config_type(cls):
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "pool_size": Field(IntSource, is_required=False),
+            "pool_idle_timeout": Field(IntSource, is_required=False),
+        }
 
     @staticmethod
     def from_config_value(inst_data, config_value):
         return SqliteRunStorage.from_local(inst_data=inst_data, **config_value)
 
     @classmethod
-    def from_local(cls, base_dir, inst_data=None):
+    def from_local(
+        cls,
+        base_dir,
+        inst_data=None,
+        pool_size=None,
+        pool_idle_timeout=None,
+    ):
         check.str_param(base_dir, "base_dir")
         mkdir_p(base_dir)
         conn_string = create_db_conn_string(base_dir, "runs")
@@ -87,7 +112,12 @@ def from_local(cls, base_dir, inst_data=None):
             if "instance_info" not in table_names:
                 InstanceInfo.create(engine)
 
-        run_storage = cls(conn_string, inst_data)
+        run_storage = cls(
+            conn_string,
+            inst_data,
+            pool_size=pool_size,
+            pool_idle_timeout=pool_idle_timeout,
+        )
 
         if should_mark_indexes:
             run_storage.migrate()
@@ -97,7 +127,10 @@ def from_local(cls, base_dir, inst_data=None):
 
     @contextmanager
     def connect(self):
-        engine = create_engine(self._conn_string, poolclass=NullPool)
+        if self._connection_pool:
+            engine = self._connection_pool.get_engine(self._conn_string)
+        else:
+            engine = create_engine(self._conn_string, poolclass=NullPool)
         conn = engine.connect()
         try:
             with handle_schema_errors(
@@ -109,6 +142,10 @@ def connect(self):
         finally:
             conn.close()
 
+    def dispose(self):
+        if self._connection_pool:
+            self._connection_pool.dispose()
+
     def _alembic_upgrade(self, rev="head"):
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
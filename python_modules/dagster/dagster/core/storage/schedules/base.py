@@ -125,3 +125,6 @@ def upgrade(self):
 
     def optimize_for_dagit(self, statement_timeout: int):
         """Allows for optimizing database connection / use in the context of a long lived dagit process"""
+
+    def dispose(self):
+        """Explicit lifecycle management."""
@@ -2,7 +2,7 @@
 
 from sqlalchemy.pool import NullPool
 
-from dagster import StringSource, check
+from dagster import Field, IntSource, StringSource, check
 from dagster.core.storage.sql import (
     check_alembic_revision,
     create_engine,
@@ -11,7 +11,11 @@
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster.core.storage.sqlite import create_db_conn_string, get_sqlite_version
+from dagster.core.storage.sqlite import (
+    connection_pool_from_config,
+    create_db_conn_string,
+    get_sqlite_version,
+)
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import mkdir_p
 
@@ -22,12 +26,17 @@
 
 
 class SqliteScheduleStorage(SqlScheduleStorage, ConfigurableClass):
-    """Local SQLite backed schedule storage"""
+    """Local SQLite backed schedule storage
+
+    Setting the optional ``pool_size`` config param keeps a pool of that many WAL-mode connections
+    open to the database, instead of opening a new connection for every operation.
+    """
 
-    def __init__(self, conn_string, inst_data=None):
+    def __init__(self, conn_string, inst_data=None, pool_size=None, pool_idle_timeout=None):
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._connection_pool = connection_pool_from_config(pool_size, pool_idle_timeout)
 
         super().__init__()
 
@@ -37,14 +46,18 @@ def inst_data(self):
 
     @classmethod
     def config_type(cls):
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "pool_size": Field(IntSource, is_required=False),
+            "pool_idle_timeout": Field(IntSource, is_required=False),
+        }
 
     @staticmethod
     def from_config_value(inst_data, config_value):
         return SqliteScheduleStorage.from_local(inst_data=inst_data, **config_value)
 
     @staticmethod
-    def from_local(base_dir, inst_data=None):
+    def from_local(base_dir, inst_data=None, pool_size=None, pool_idle_timeout=None):
         check.str_param(base_dir, "base_dir")
         mkdir_p(base_dir)
         conn_string = create_db_conn_string(base_dir, "schedules")
@@ -58,11 +71,14 @@ def from_local(base_dir, inst_data=None):
                 engine.execute("PRAGMA journal_mode=WAL;")
                 stamp_alembic_rev(alembic_config, connection)
 
-        return SqliteScheduleStorage(conn_string, inst_data)
+        return SqliteScheduleStorage(conn_string, inst_data, pool_size, pool_idle_timeout)
 
     @contextmanager
     def connect(self):
-        engine = create_engine(self._conn_string, poolclass=NullPool)
+        if self._connection_pool:
+            engine = self._connection_pool.get_engine(self._conn_string)
+        else:
+            engine = create_engine(self._conn_string, poolclass=NullPool)
         conn = engine.connect()
         try:
             with handle_schema_errors(
@@ -74,6 +90,10 @@ def connect(self):
         finally:
             conn.close()
 
+    def dispose(self):
+        if self._connection_pool:
+            self._connection_pool.dispose()
+
     @property
     def supports_batch_queries(self):
         return get_sqlite_version() > MINIMUM_SQLITE_BATCH_VERSION
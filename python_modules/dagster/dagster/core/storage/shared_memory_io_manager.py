@@ -0,0 +1,163 @@
+import mmap
+import os
+import pickle
+import shutil
+import tempfile
+
+from dagster import check
+from dagster.config import Field
+from dagster.config.source import StringSource
+from dagster.core.execution.context.input import InputContext
+from dagster.core.execution.context.output import OutputContext
+from dagster.core.storage.io_manager import IOManager, io_manager
+from dagster.utils import PICKLE_PROTOCOL, mkdir_p
+from dagster.utils.backcompat import experimental
+
+# pickle protocol 5 lets objects like numpy arrays and arrow buffers hand their data to pickle as
+# separate out-of-band buffers, which can then be written and mapped without copying through the
+# pickle stream
+OUT_OF_BAND_PICKLE_PROTOCOL = 5
+
+SHARED_MEMORY_DIR = "/dev/shm"
+
+
+def _default_base_dir():
+    # files in /dev/shm live in memory, so mapping them does not go through the disk
+    root_dir = SHARED_MEMORY_DIR if os.path.isdir(SHARED_MEMORY_DIR) else tempfile.gettempdir()
+    return os.path.join(root_dir, "dagster")
+
+
+@io_manager(config_schema={"base_dir": Field(StringSource, is_required=False)}, cleans_up_runs=True)
+@experimental
+def shared_memory_io_manager(init_context):
+    """Built-in IO manager that passes step outputs between the processes of a run on the same
+    host through shared memory.
+
+    Outputs are pickled with protocol 5, and the out-of-band buffers of objects that support it,
+    like numpy arrays, pandas DataFrames and arrow tables, are stored as separate files. Downstream
+    steps memory-map those files instead of reading and unpickling a copy of the data, so large
+    arrays are loaded without being copied. The mapping is copy-on-write, so a step may modify the
+    objects it loads without affecting other steps. On Python versions before 3.8, outputs are
+    pickled in-band.
+
+    By default, outputs are stored under ``/dev/shm/dagster`` where it exists, which is held in
+    memory, and under the temporary directory otherwise. Every run stores its outputs in its own
+    directory, which is removed when the run succeeds. The outputs of failed runs are kept, so that
+    they can be re-executed. Since shared memory does not survive a restart of the host, this IO
+    manager is best suited to jobs executed by the multiprocess_executor on a single host.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from dagster import job, op, shared_memory_io_manager
+
+        @op
+        def op_a():
+            # create array ...
+            return array
+
+        @op
+        def op_b(array):
+            return array.mean()
+
+        @job(resource_defs={"io_manager": shared_memory_io_manager})
+        def job():
+            op_b(op_a())
+
+    """
+    base_dir = init_context.resource_config.get("base_dir", _default_base_dir())
+    return SharedMemoryIOManager(base_dir=base_dir)
+
+
+class SharedMemoryIOManager(IOManager):
+    """Built-in IO manager that stores values in memory-mapped files, using pickle protocol 5
+    out-of-band buffers to load them without copying.
+
+    Args:
+        base_dir (str): base directory where all the step outputs which use this object manager
+            will be stored in. Each run stores its outputs in a subdirectory named after its run id.
+    """
+
+    def __init__(self, base_dir):
+        self.base_dir = check.str_param(base_dir, "base_dir")
+
+    def _get_path(self, context):
+        return os.path.join(self.base_dir, *context.get_output_identifier())
+
+    def handle_output(self, context, obj):
+        """Pickle the object, and write its pickle stream and out-of-band buffers to files."""
+        check.inst_param(context, "context", OutputContext)
+
+        path = self._get_path(context)
+        context.log.debug(f"Writing shared memory output at: {path}")
+
+        # a retried step overwrites the output of its previous attempt
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        mkdir_p(path)
+
+        buffers = []
+        if pickle.HIGHEST_PROTOCOL >= OUT_OF_BAND_PICKLE_PROTOCOL:
+            data = pickle.dumps(
+                obj, protocol=OUT_OF_BAND_PICKLE_PROTOCOL, buffer_callback=buffers.append
+            )
+        else:
+            data = pickle.dumps(obj, protocol=PICKLE_PROTOCOL)
+
+        for i, buffer in enumerate(buffers):
+            with open(os.path.join(path, f"buffer_{i}"), "wb") as write_obj:
+                with buffer.raw() as view:
+                    write_obj.write(view)
+
+        # the pickle stream is written last, so that an output is only loaded once it is complete
+        with open(os.path.join(path, "object"), "wb") as write_obj:
+            write_obj.write(data)
+
+    def load_input(self, context):
+        """Unpickle the object, mapping its out-of-band buffers from their files."""
+        check.inst_param(context, "context", InputContext)
+
+        path = self._get_path(context.upstream_output)
+        context.log.debug(f"Loading shared memory output from: {path}")
+
+        with open(os.path.join(path, "object"), "rb") as read_obj:
+            data = read_obj.read()
+
+        buffers = []
+        while os.path.exists(os.path.join(path, f"buffer_{len(buffers)}")):
+            buffers.append(_map_buffer(os.path.join(path, f"buffer_{len(buffers)}")))
+
+        if buffers:
+            return pickle.loads(data, buffers=buffers)
+
+        return pickle.loads(data)
+
+    def release_output(self, context):
+        """Remove the files of an output that is no longer needed by this run. Objects that were
+        already loaded keep their mapping of the removed files.
+        """
+        check.inst_param(context, "context", OutputContext)
+
+        path = self._get_path(context)
+        if os.path.exists(path):
+            context.log.debug(f"Removing shared memory output at: {path}")
+            shutil.rmtree(path, ignore_errors=True)
+
+    def cleanup_run(self, run_id):
+        """Remove the directory holding the outputs of a run that succeeded. The outputs of the
+        runs it re-executes are kept, since other re-executions may still load them.
+        """
+        check.str_param(run_id, "run_id")
+
+        shutil.rmtree(os.path.join(self.base_dir, run_id), ignore_errors=True)
+
+
+def _map_buffer(filepath):
+    with open(filepath, "rb") as read_obj:
+        size = os.fstat(read_obj.fileno()).st_size
+        # empty files cannot be mapped
+        if size == 0:
+            return b""
+
+        return mmap.mmap(read_obj.fileno(), size, access=mmap.ACCESS_COPY)
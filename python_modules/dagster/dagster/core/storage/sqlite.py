@@ -1,9 +1,16 @@
 import os
 import sqlite3
+import threading
+import time
 from functools import update_wrapper
 
+import sqlalchemy as db
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.util import LRUCache
+
 from dagster import check
 
+from .sql import create_engine
 from .sql import run_migrations_offline as run_migrations_offline_
 from .sql import run_migrations_online as run_migrations_online_
 
@@ -44,3 +51,125 @@ def create_db_conn_string(base_dir, db_name):
 
 def get_sqlite_version():
     return str(sqlite3.sqlite_version)
+
+
+def serialization_format_from_config(config_value):
+    """Returns the storage config value with its `serialization_format` string, if any, converted
+    to a SerializationFormat."""
+    from dagster.serdes import SerializationFormat
+
+    config_value = dict(config_value)
+    if "serialization_format" in config_value:
+        format_str = config_value["serialization_format"]
+        valid_formats = [serialization_format.value for serialization_format in SerializationFormat]
+        check.invariant(
+            format_str in valid_formats,
+            f'Invalid serialization_format "{format_str}", expected one of {valid_formats}',
+        )
+        config_value["serialization_format"] = SerializationFormat(format_str)
+    return config_value
+
+
+DEFAULT_POOL_IDLE_TIMEOUT = 60  # seconds
+COMPILED_STATEMENT_CACHE_SIZE = 100
+
+
+def _set_wal_journal_mode(dbapi_connection, _connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL;")
+    finally:
+        cursor.close()
+
+
+class SqliteConnectionPool:
+    """Keeps a long-lived engine, with a pool of WAL-mode connections, for each SQLite database
+    touched by a storage, instead of opening a fresh engine and connection per operation.
+
+    Each engine also caches compiled statements, so that statements reused across operations (like
+    the event log insert) are only compiled once per database.  Engines that have not been used for
+    ``idle_timeout`` seconds are disposed, which keeps the number of open files bounded for storages
+    that shard their databases per run.
+
+    Args:
+        pool_size (int): The number of connections to keep open per database. Connections checked
+            out beyond this are closed when returned.
+        idle_timeout (Optional[int]): Seconds after which an unused engine is disposed.
+    """
+
+    def __init__(self, pool_size, idle_timeout=None):
+        self._pool_size = check.int_param(pool_size, "pool_size")
+        check.invariant(pool_size > 0, "pool_size must be a positive integer")
+        self._idle_timeout = check.opt_int_param(
+            idle_timeout, "idle_timeout", DEFAULT_POOL_IDLE_TIMEOUT
+        )
+        self._engines = {}
+        self._last_used = {}
+        self._last_eviction = time.time()
+        self._lock = threading.Lock()
+
+    @property
+    def pool_size(self):
+        return self._pool_size
+
+    @property
+    def idle_timeout(self):
+        return self._idle_timeout
+
+    def get_engine(self, conn_string):
+        check.str_param(conn_string, "conn_string")
+        now = time.time()
+        with self._lock:
+            evicted = self._evict_idle_engines(now)
+            engine = self._engines.get(conn_string)
+            if engine is None:
+                engine = create_engine(
+                    conn_string,
+                    poolclass=QueuePool,
+                    pool_size=self._pool_size,
+                    # nested checkouts (e.g. initializing a shard while connecting to it) never
+                    # block; overflow connections are closed as soon as they are returned
+                    max_overflow=-1,
+                    # connections are checked out by whichever thread is using the storage
+                    connect_args={"check_same_thread": False},
+                    execution_options={"compiled_cache": LRUCache(COMPILED_STATEMENT_CACHE_SIZE)},
+                )
+                db.event.listen(engine, "connect", _set_wal_journal_mode)
+                self._engines[conn_string] = engine
+            self._last_used[conn_string] = now
+
+        for idle_engine in evicted:
+            idle_engine.dispose()
+
+        return engine
+
+    def _evict_idle_engines(self, now):
+        if now - self._last_eviction < self._idle_timeout:
+            return []
+
+        self._last_eviction = now
+        idle = [
+            conn_string
+            for conn_string, last_used in self._last_used.items()
+            if now - last_used >= self._idle_timeout
+        ]
+        for conn_string in idle:
+            del self._last_used[conn_string]
+        return [self._engines.pop(conn_string) for conn_string in idle]
+
+    def dispose(self):
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines = {}
+            self._last_used = {}
+        for engine in engines:
+            engine.dispose()
+
+
+def connection_pool_from_config(pool_size=None, pool_idle_timeout=None):
+    """Returns a SqliteConnectionPool if pooling was opted into via the storage config, otherwise
+    None, in which case a new engine and connection are created for each operation."""
+    if pool_size is None:
+        check.invariant(pool_idle_timeout is None, "pool_idle_timeout requires pool_size to be set")
+        return None
+    return SqliteConnectionPool(pool_size, pool_idle_timeout)
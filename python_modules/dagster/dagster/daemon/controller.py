@@ -14,6 +14,7 @@
 from dagster.daemon.daemon import (
     BackfillDaemon,
     DagsterDaemon,
+    EventLogRetentionDaemon,
     MonitoringDaemon,
     SchedulerDaemon,
     SensorDaemon,
@@ -302,6 +303,10 @@ def create_daemon_of_type(daemon_type, instance):
         return BackfillDaemon(interval_seconds=DEFAULT_DAEMON_INTERVAL_SECONDS)
     elif daemon_type == MonitoringDaemon.daemon_type():
         return MonitoringDaemon(interval_seconds=instance.run_monitoring_poll_interval_seconds)
+    elif daemon_type == EventLogRetentionDaemon.daemon_type():
+        return EventLogRetentionDaemon(
+            interval_seconds=instance.event_log_retention_interval_seconds
+        )
     else:
         raise Exception(f"Unexpected daemon type {daemon_type}")
 
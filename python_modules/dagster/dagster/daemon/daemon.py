@@ -12,6 +12,7 @@
 from dagster.core.telemetry import DAEMON_ALIVE, log_action
 from dagster.core.workspace import IWorkspace
 from dagster.daemon.backfill import execute_backfill_iteration
+from dagster.daemon.event_log_retention import execute_event_log_retention_iteration
 from dagster.daemon.monitoring import execute_monitoring_iteration
 from dagster.daemon.sensor import execute_sensor_iteration_loop
 from dagster.daemon.types import DaemonHeartbeat
@@ -249,3 +250,12 @@ def daemon_type(cls):
 
     def run_iteration(self, instance, workspace):
         yield from execute_monitoring_iteration(instance, workspace, self._logger)
+
+
+class EventLogRetentionDaemon(IntervalDaemon):
+    @classmethod
+    def daemon_type(cls):
+        return "EVENT_LOG_RETENTION"
+
+    def run_iteration(self, instance, workspace):
+        yield from execute_event_log_retention_iteration(instance, self._logger)
@@ -0,0 +1,26 @@
+from dagster import DagsterInstance, check
+
+
+def execute_event_log_retention_iteration(instance, logger):
+    check.inst_param(instance, "instance", DagsterInstance)
+
+    if not instance.event_log_storage.supports_event_retention:
+        logger.warning(
+            "Not compacting the event log, since the event log storage of the instance does not "
+            "support event log retention"
+        )
+        return
+
+    result = None
+    for result in instance.compact_event_logs_iterator():
+        # heartbeat between batches, since purging a large backlog can outlast the heartbeat
+        # tolerance of the daemon
+        yield
+
+    message = (
+        f"Purged {result.rows_purged} event log rows from {result.runs_scanned} runs in "
+        f"{result.elapsed_seconds:.2f} seconds"
+    )
+    if result.archive_path:
+        message += f", archived to {result.archive_path}"
+    logger.info(message)
@@ -1,15 +1,13 @@
 import logging
 import sys
 import time
-from collections import defaultdict
-from typing import Dict
 
 from dagster import DagsterEvent, DagsterEventType, check
 from dagster.core.events.log import EventLogEntry
+from dagster.core.execution.tag_concurrency_limits import TagConcurrencyLimitsCounter
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.pipeline_run import (
     IN_PROGRESS_RUN_STATUSES,
-    PipelineRun,
     PipelineRunStatus,
     RunsFilter,
 )
@@ -19,78 +17,6 @@
 from dagster.utils.error import serializable_error_info_from_exc_info
 
 
-class _TagConcurrencyLimitsCounter:
-    """
-    Helper object that keeps track of when the tag concurrency limits are met
-    """
-
-    def __init__(self, tag_concurrency_limits, in_progress_runs):
-        check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
-        check.list_param(in_progress_runs, "in_progress_runs", of_type=PipelineRun)
-
-        self._key_limits: Dict[str, int] = {}
-        self._key_value_limits: Dict[(str, str), int] = {}
-        self._unique_value_limits: Dict[str, int] = {}
-
-        for tag_limit in tag_concurrency_limits:
-            key = tag_limit["key"]
-            value = tag_limit.get("value")
-            limit = tag_limit["limit"]
-
-            if isinstance(value, str):
-                self._key_value_limits[(key, value)] = limit
-            elif not value or not value["applyLimitPerUniqueValue"]:
-                self._key_limits[key] = limit
-            else:
-                self._unique_value_limits[key] = limit
-
-        self._key_counts: Dict[str, int] = defaultdict(lambda: 0)
-        self._key_value_counts: Dict[(str, str), int] = defaultdict(lambda: 0)
-        self._unique_value_counts: Dict[(str, str), int] = defaultdict(lambda: 0)
-
-        # initialize counters based on current in progress runs
-        for run in in_progress_runs:
-            self.update_counters_with_launched_run(run)
-
-    def is_run_blocked(self, run):
-        """
-        True if there are in progress runs which are blocking this run based on tag limits
-        """
-        for key, value in run.tags.items():
-            if key in self._key_limits and self._key_counts[key] >= self._key_limits[key]:
-                return True
-
-            tag_tuple = (key, value)
-            if (
-                tag_tuple in self._key_value_limits
-                and self._key_value_counts[tag_tuple] >= self._key_value_limits[tag_tuple]
-            ):
-                return True
-
-            if (
-                key in self._unique_value_limits
-                and self._unique_value_counts[tag_tuple] >= self._unique_value_limits[key]
-            ):
-                return True
-
-        return False
-
-    def update_counters_with_launched_run(self, run):
-        """
-        Add a new in progress run to the counters
-        """
-        for key, value in run.tags.items():
-            if key in self._key_limits:
-                self._key_counts[key] += 1
-
-            tag_tuple = (key, value)
-            if tag_tuple in self._key_value_limits:
-                self._key_value_counts[tag_tuple] += 1
-
-            if key in self._unique_value_limits:
-                self._unique_value_counts[tag_tuple] += 1
-
-
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """
     Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
@@ -134,7 +60,7 @@ def run_iteration(self, instance, workspace):
 
         # launch until blocked by limit rules
         num_dequeued_runs = 0
-        tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
             tag_concurrency_limits, in_progress_runs
         )
 
@@ -142,7 +68,7 @@ def run_iteration(self, instance, workspace):
             if num_dequeued_runs >= max_runs_to_launch:
                 break
 
-            if tag_concurrency_limits_counter.is_run_blocked(run):
+            if tag_concurrency_limits_counter.is_blocked(run):
                 continue
 
             error_info = None
@@ -165,7 +91,7 @@ def run_iteration(self, instance, workspace):
                 error_info = error_info._replace(message=f"{message}: {error_info.message}")
 
             else:
-                tag_concurrency_limits_counter.update_counters_with_launched_run(run)
+                tag_concurrency_limits_counter.update_counters_with_launched_item(run)
                 num_dequeued_runs += 1
 
             yield error_info
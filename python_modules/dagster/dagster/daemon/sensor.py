@@ -1,7 +1,10 @@
 import os
 import sys
 import time
-from typing import Dict, NamedTuple, Optional
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from typing import Dict, List, NamedTuple, Optional
 
 import pendulum
 
@@ -23,7 +26,7 @@
 from dagster.core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster.core.workspace import IWorkspace
 from dagster.utils import merge_dicts
-from dagster.utils.error import serializable_error_info_from_exc_info
+from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 MIN_INTERVAL_LOOP_TIME = 5
 
@@ -174,33 +177,84 @@ def execute_sensor_iteration_loop(instance, workspace, logger, until=None):
 
     workspace_iteration = 0
     start_time = pendulum.now("UTC").timestamp()
-    while True:
-        start_time = pendulum.now("UTC").timestamp()
-        if until and start_time >= until:
-            # provide a way of organically ending the loop to support test environment
-            break
-
-        if start_time - workspace_loaded_time > RELOAD_WORKSPACE:
-            workspace.cleanup()
-            workspace_loaded_time = pendulum.now("UTC").timestamp()
-            workspace_iteration = 0
-
-        yield from execute_sensor_iteration(
-            instance, logger, workspace, log_verbose_checks=(workspace_iteration == 0)
-        )
 
-        loop_duration = pendulum.now("UTC").timestamp() - start_time
-        sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
-        time.sleep(sleep_time)
+    with ExitStack() as stack:
+        threadpool_executor = None
+        sensor_tick_futures: Dict[str, Future] = {}
+        if instance.sensor_use_threads:
+            threadpool_executor = stack.enter_context(
+                ThreadPoolExecutor(
+                    max_workers=instance.sensor_num_workers,
+                    thread_name_prefix="sensor_daemon_worker",
+                )
+            )
+
+        while True:
+            start_time = pendulum.now("UTC").timestamp()
+            if until and start_time >= until:
+                # provide a way of organically ending the loop to support test environment
+                break
+
+            if start_time - workspace_loaded_time > RELOAD_WORKSPACE:
+                # the worker threads use the locations that are cleaned up
+                yield from _wait_for_sensor_tick_futures(sensor_tick_futures)
+                workspace.cleanup()
+                workspace_loaded_time = pendulum.now("UTC").timestamp()
+                workspace_iteration = 0
+
+            yield from execute_sensor_iteration(
+                instance,
+                logger,
+                workspace,
+                log_verbose_checks=(workspace_iteration == 0),
+                threadpool_executor=threadpool_executor,
+                sensor_tick_futures=sensor_tick_futures,
+            )
+
+            loop_duration = pendulum.now("UTC").timestamp() - start_time
+            sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
+            time.sleep(sleep_time)
+            yield
+            workspace_iteration += 1
+
+
+def _wait_for_sensor_tick_futures(sensor_tick_futures: Dict[str, Future]):
+    while sensor_tick_futures:
+        wait(list(sensor_tick_futures.values()), timeout=MIN_INTERVAL_LOOP_TIME)
+        for origin_id, future in list(sensor_tick_futures.items()):
+            if future.done():
+                del sensor_tick_futures[origin_id]
+                yield from future.result()
         yield
-        workspace_iteration += 1
 
 
 def execute_sensor_iteration(
-    instance, logger, workspace, log_verbose_checks=True, debug_crash_flags=None
+    instance,
+    logger,
+    workspace,
+    log_verbose_checks=True,
+    debug_crash_flags=None,
+    threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    sensor_tick_futures: Optional[Dict[str, Future]] = None,
 ):
+    """
+    Evaluates the running sensors that are due, the most overdue sensor first. Without a
+    threadpool_executor, the sensors are evaluated one after another. With one, each evaluation is
+    submitted to the pool and tracked in sensor_tick_futures, keyed by sensor origin id, across
+    iterations, so that a slow sensor does not hold up the others.
+    """
     check.inst_param(workspace, "workspace", IWorkspace)
     check.inst_param(instance, "instance", DagsterInstance)
+    check.opt_inst_param(threadpool_executor, "threadpool_executor", ThreadPoolExecutor)
+
+    if threadpool_executor:
+        sensor_tick_futures = check.dict_param(sensor_tick_futures, "sensor_tick_futures")
+
+        # report the errors of the evaluations that finished since the last iteration
+        for origin_id, future in list(sensor_tick_futures.items()):
+            if future.done():
+                del sensor_tick_futures[origin_id]
+                yield from future.result()
 
     workspace_snapshot = {
         location_entry.origin: location_entry
@@ -276,57 +330,144 @@ def execute_sensor_iteration(
 
     now = pendulum.now("UTC")
 
-    for external_sensor in sensors.values():
-        sensor_name = external_sensor.name
-        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
-        error_info = None
-        try:
-            sensor_state = all_sensor_states.get(external_sensor.get_external_origin().get_id())
-            if not sensor_state:
-                assert external_sensor.default_status == DefaultSensorStatus.RUNNING
-                sensor_state = InstigatorState(
-                    external_sensor.get_external_origin(),
-                    InstigatorType.SENSOR,
-                    InstigatorStatus.AUTOMATICALLY_RUNNING,
-                    SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
-                )
-                instance.add_instigator_state(sensor_state)
-            elif _is_under_min_interval(sensor_state, external_sensor, now):
-                continue
-
-            tick = instance.create_tick(
-                TickData(
-                    instigator_origin_id=sensor_state.instigator_origin_id,
-                    instigator_name=sensor_state.instigator_name,
-                    instigator_type=InstigatorType.SENSOR,
-                    status=TickStatus.STARTED,
-                    timestamp=now.timestamp(),
-                )
+    max_concurrent_per_location = instance.sensor_max_concurrent_per_location
+    in_flight_counts_by_location: Dict[str, int] = defaultdict(int)
+    if threadpool_executor:
+        for origin_id in sensor_tick_futures:
+            if origin_id in sensors:
+                in_flight_counts_by_location[sensors[origin_id].handle.location_name] += 1
+
+    sensors_by_seconds_overdue = sorted(
+        sensors.items(),
+        key=lambda item: _seconds_overdue(all_sensor_states.get(item[0]), item[1], now),
+        reverse=True,
+    )
+
+    for origin_id, external_sensor in sensors_by_seconds_overdue:
+        sensor_state = all_sensor_states.get(origin_id)
+        if sensor_state and _is_under_min_interval(sensor_state, external_sensor, now):
+            continue
+
+        sensor_debug_crash_flags = (
+            debug_crash_flags.get(external_sensor.name) if debug_crash_flags else None
+        )
+
+        if not threadpool_executor:
+            yield from _process_tick_generator(
+                instance,
+                logger,
+                workspace,
+                external_sensor,
+                sensor_state,
+                now,
+                sensor_debug_crash_flags,
             )
+            continue
 
-            _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
-
-            with SensorLaunchContext(
-                external_sensor, sensor_state, tick, instance, logger
-            ) as tick_context:
-                _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
-                yield from _evaluate_sensor(
-                    tick_context,
-                    instance,
-                    workspace,
-                    external_sensor,
-                    sensor_state,
-                    sensor_debug_crash_flags,
-                )
-        except Exception:
-            error_info = serializable_error_info_from_exc_info(sys.exc_info())
-            logger.error(
-                "Sensor daemon caught an error for sensor {sensor_name} : {error_info}".format(
-                    sensor_name=external_sensor.name,
-                    error_info=error_info.to_string(),
-                )
+        # only evaluate one tick of each sensor at a time
+        if origin_id in sensor_tick_futures:
+            continue
+
+        location_name = external_sensor.handle.location_name
+        if (
+            max_concurrent_per_location
+            and in_flight_counts_by_location[location_name] >= max_concurrent_per_location
+        ):
+            continue
+
+        in_flight_counts_by_location[location_name] += 1
+        sensor_tick_futures[origin_id] = threadpool_executor.submit(
+            _process_tick,
+            instance,
+            logger,
+            workspace,
+            external_sensor,
+            sensor_state,
+            now,
+            sensor_debug_crash_flags,
+        )
+        yield
+
+
+def _process_tick(
+    instance,
+    logger,
+    workspace,
+    external_sensor,
+    sensor_state,
+    now,
+    sensor_debug_crash_flags,
+) -> List[SerializableErrorInfo]:
+    """Evaluates a sensor in a worker thread, returning the errors of the evaluation"""
+    return [
+        error_info
+        for error_info in _process_tick_generator(
+            instance,
+            logger,
+            workspace,
+            external_sensor,
+            sensor_state,
+            now,
+            sensor_debug_crash_flags,
+        )
+        if error_info
+    ]
+
+
+def _process_tick_generator(
+    instance,
+    logger,
+    workspace,
+    external_sensor,
+    sensor_state,
+    now,
+    sensor_debug_crash_flags,
+):
+    error_info = None
+    try:
+        if not sensor_state:
+            assert external_sensor.default_status == DefaultSensorStatus.RUNNING
+            sensor_state = InstigatorState(
+                external_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.AUTOMATICALLY_RUNNING,
+                SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
             )
-        yield error_info
+            instance.add_instigator_state(sensor_state)
+
+        tick = instance.create_tick(
+            TickData(
+                instigator_origin_id=sensor_state.instigator_origin_id,
+                instigator_name=sensor_state.instigator_name,
+                instigator_type=InstigatorType.SENSOR,
+                status=TickStatus.STARTED,
+                timestamp=now.timestamp(),
+            )
+        )
+
+        _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
+
+        with SensorLaunchContext(
+            external_sensor, sensor_state, tick, instance, logger
+        ) as tick_context:
+            _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
+            yield from _evaluate_sensor(
+                tick_context,
+                instance,
+                workspace,
+                external_sensor,
+                sensor_state,
+                sensor_debug_crash_flags,
+            )
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        logger.error(
+            "Sensor daemon caught an error for sensor {sensor_name} : {error_info}".format(
+                sensor_name=external_sensor.name,
+                error_info=error_info.to_string(),
+            )
+        )
+    yield error_info
 
 
 def _evaluate_sensor(
@@ -352,6 +493,7 @@ def _evaluate_sensor(
         state.instigator_data.last_tick_timestamp if state.instigator_data else None,
         state.instigator_data.last_run_key if state.instigator_data else None,
         state.instigator_data.cursor if state.instigator_data else None,
+        timeout=instance.sensor_timeout_seconds,
     )
 
     yield
@@ -502,6 +644,16 @@ def _is_under_min_interval(state, external_sensor, now):
     return elapsed < external_sensor.min_interval_seconds
 
 
+def _seconds_overdue(state, external_sensor, now):
+    """How long ago the sensor was due to be evaluated. Sensors that have never been evaluated are
+    the most overdue."""
+    if not state or not state.instigator_data or not state.instigator_data.last_tick_timestamp:
+        return float("inf")
+
+    elapsed = now.timestamp() - state.instigator_data.last_tick_timestamp
+    return elapsed - (external_sensor.min_interval_seconds or 0)
+
+
 def _fetch_existing_runs(instance, external_sensor, run_requests):
     run_keys = [run_request.run_key for run_request in run_requests if run_request.run_key]
 
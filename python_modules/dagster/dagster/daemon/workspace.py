@@ -1,9 +1,12 @@
 import sys
+import threading
 import time
 from abc import abstractmethod
 from typing import Dict
 
 from dagster import check
+from dagster.api.get_server_id import sync_get_server_id
+from dagster.api.list_repositories import sync_list_repositories_grpc
 from dagster.core.errors import DagsterRepositoryLocationLoadError
 from dagster.core.host_representation.grpc_server_registry import GrpcServerRegistry
 from dagster.core.host_representation.origin import RepositoryLocationOrigin
@@ -25,34 +28,51 @@ class BaseDaemonWorkspace(IWorkspace):
     Both the list of locations and the RepositoryLocation objects are cached until the daemon
     code calls cleanup() on the DaemonWorkspace - daemons are responsible for doing this
     periodically whenever they might want to check for code updates and workspace.yaml updates.
+    When the workspace is next loaded, locations whose code has not changed since may be reused
+    rather than reloaded.
+
+    Daemons that evaluate in worker threads share their workspace with those threads, so loading
+    and cleaning up the locations is serialized. Daemons must wait for their worker threads to
+    finish before calling cleanup(), since it cleans up the locations that the threads use.
     """
 
     def __init__(self):
         self._location_entries = None
+        self._previous_location_entries: Dict[str, WorkspaceLocationEntry] = {}
+        self._lock = threading.RLock()
 
     def __enter__(self):
         return self
 
     def get_workspace_snapshot(self) -> Dict[str, WorkspaceLocationEntry]:
-        if self._location_entries == None:
-            self._location_entries = self._load_workspace()
-        return self._location_entries
+        return self._get_location_entries()
+
+    def _get_location_entries(self) -> Dict[str, WorkspaceLocationEntry]:
+        with self._lock:
+            if self._location_entries == None:
+                self._location_entries = self._load_workspace()
+
+                # the previous locations that were not reused are no longer needed
+                self._cleanup_location_entries(self._previous_location_entries)
+                self._previous_location_entries = {}
+
+            return self._location_entries
 
     @abstractmethod
     def _load_workspace(self) -> Dict[str, WorkspaceLocationEntry]:
-        pass
+        """Loads the locations in the workspace. Entries of the previous load that can still be
+        used may be taken from self._previous_location_entries."""
 
     def get_location(self, location_name: str) -> RepositoryLocation:
-        if self._location_entries == None:
-            self._location_entries = self._load_workspace()
+        location_entries = self._get_location_entries()
 
-        if location_name not in self._location_entries:
+        if location_name not in location_entries:
             raise DagsterRepositoryLocationLoadError(
                 f"Location {location_name} does not exist in workspace",
                 load_error_infos=[],
             )
 
-        location_entry = self._location_entries[location_name]
+        location_entry = location_entries[location_name]
 
         if location_entry.load_error:
             raise DagsterRepositoryLocationLoadError(
@@ -69,14 +89,22 @@ def get_location(self, location_name: str) -> RepositoryLocation:
         return location_entry.repository_location
 
     def cleanup(self) -> None:
-        if self._location_entries != None:
-            for location_entry in self._location_entries.values():
-                if location_entry.repository_location:
-                    location_entry.repository_location.cleanup()
-            self._location_entries = None
+        with self._lock:
+            if self._location_entries != None:
+                self._cleanup_location_entries(self._previous_location_entries)
+                self._previous_location_entries = self._location_entries
+                self._location_entries = None
+
+    def _cleanup_location_entries(self, location_entries: Dict[str, WorkspaceLocationEntry]):
+        for location_entry in location_entries.values():
+            if location_entry.repository_location:
+                location_entry.repository_location.cleanup()
 
     def __exit__(self, exception_type, exception_value, traceback):
-        self.cleanup()
+        with self._lock:
+            self.cleanup()
+            self._cleanup_location_entries(self._previous_location_entries)
+            self._previous_location_entries = {}
 
 
 class DaemonWorkspace(BaseDaemonWorkspace):
@@ -97,9 +125,54 @@ def _load_workspace(self) -> Dict[str, WorkspaceLocationEntry]:
         entries = {}
         origins = self._workspace_load_target.create_origins()
         for origin in origins:
-            entries[origin.location_name] = self._load_location(origin)
+            previous_entry = self._previous_location_entries.get(origin.location_name)
+            if previous_entry and self._is_location_unchanged(origin, previous_entry):
+                entries[origin.location_name] = self._previous_location_entries.pop(
+                    origin.location_name
+                )
+            else:
+                entries[origin.location_name] = self._load_location(origin)
         return entries
 
+    def _is_location_unchanged(self, origin, location_entry: WorkspaceLocationEntry) -> bool:
+        """Whether the location in the entry still serves the current code of the origin, in
+        which case it can be reused rather than fetching all of its repository data again. gRPC
+        servers get a new server id whenever they are restarted or reloaded with new code, but a
+        custom RepositoryData may return new definitions on every call to a running server. The
+        server only reports a hash for the data of repositories whose definitions can not change
+        while it runs, so the location is only reused if every one of its repositories has a
+        reported hash that matches the data it loaded."""
+        location = location_entry.repository_location
+        if (
+            not isinstance(location, GrpcServerRepositoryLocation)
+            or location_entry.origin != origin
+        ):
+            return False
+
+        try:
+            if self._grpc_server_registry.supports_origin(origin):
+                server_id = self._grpc_server_registry.get_grpc_endpoint(origin).server_id
+            else:
+                server_id = sync_get_server_id(location.client)
+
+            if server_id != location.server_id:
+                return False
+
+            list_repositories_response = sync_list_repositories_grpc(location.client)
+        except Exception:
+            return False
+
+        repository_names = set(
+            symbol.repository_name for symbol in list_repositories_response.repository_symbols
+        )
+        if repository_names != location.repository_names:
+            return False
+
+        return all(
+            list_repositories_response.repository_data_hashes.get(repository_name) == data_hash
+            for repository_name, data_hash in location.repository_data_hashes.items()
+        )
+
     def _load_location(self, origin) -> WorkspaceLocationEntry:
         location = None
         error = None
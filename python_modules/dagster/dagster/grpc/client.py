@@ -1,6 +1,7 @@
 import os
 import subprocess
 import sys
+import threading
 import warnings
 from contextlib import contextmanager
 from typing import Iterator, Optional
@@ -25,6 +26,7 @@
     CancelExecutionRequest,
     ExecuteExternalPipelineArgs,
     ExecutionPlanSnapshotArgs,
+    ExternalScheduleBatchExecutionArgs,
     ExternalScheduleExecutionArgs,
     PartitionArgs,
     PartitionNamesArgs,
@@ -38,6 +40,11 @@
 
 DEFAULT_GRPC_TIMEOUT = 60
 
+# Keepalive pings detect broken connections during long calls. gRPC servers reject pings that
+# are more frequent than every five minutes by default.
+GRPC_KEEPALIVE_TIME_MS = 300000
+GRPC_KEEPALIVE_TIMEOUT_MS = 20000
+
 
 def client_heartbeat_thread(client, shutdown_event):
     while True:
@@ -78,54 +85,159 @@ def __init__(self, port=None, socket=None, host="localhost", use_ssl=False):
         else:
             self._server_address = "unix:" + os.path.abspath(socket)
 
-    @contextmanager
-    def _channel(self):
+        # A single channel is shared by all calls and threads, so that calls reuse its connection.
+        # A channel that is replaced or closed is only closed once the calls in flight on it have
+        # finished, since closing a channel cancels its calls
+        self._grpc_channel = None
+        self._grpc_channel_pid = None
+        self._grpc_channel_calls = {}
+        self._grpc_channel_lock = threading.Lock()
+        self._closed = False
+
+    def _create_channel(self):
         options = [
             ("grpc.max_receive_message_length", max_rx_bytes()),
             ("grpc.max_send_message_length", max_send_bytes()),
+            ("grpc.keepalive_time_ms", GRPC_KEEPALIVE_TIME_MS),
+            ("grpc.keepalive_timeout_ms", GRPC_KEEPALIVE_TIMEOUT_MS),
         ]
-        with (
-            grpc.secure_channel(
-                self._server_address,
-                self._ssl_creds,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
+        return (
+            grpc.secure_channel(self._server_address, self._ssl_creds, options=options)
             if self._use_ssl
-            else grpc.insecure_channel(
-                self._server_address,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
-        ) as channel:
-            yield channel
+            else grpc.insecure_channel(self._server_address, options=options)
+        )
 
-    def _query(self, method, request_type, timeout=DEFAULT_GRPC_TIMEOUT, **kwargs):
+    def _acquire_channel(self):
+        with self._grpc_channel_lock:
+            if self._grpc_channel_pid != os.getpid():
+                # Channels can not be used across a fork, so a child process drops the channels of
+                # its parent without closing them, and opens its own
+                self._grpc_channel = None
+                self._grpc_channel_calls = {}
+                self._grpc_channel_pid = os.getpid()
+
+            if self._closed:
+                # a closed client opens a channel for each call, which is closed when the call ends
+                channel = self._create_channel()
+                self._grpc_channel_calls[channel] = 1
+                return channel
+
+            if self._grpc_channel is None:
+                self._grpc_channel = self._create_channel()
+                self._grpc_channel_calls[self._grpc_channel] = 0
+
+            self._grpc_channel_calls[self._grpc_channel] += 1
+            return self._grpc_channel
+
+    def _release_channel(self, channel):
+        with self._grpc_channel_lock:
+            if channel not in self._grpc_channel_calls:
+                # opened by the parent of a forked process
+                return
+
+            self._grpc_channel_calls[channel] -= 1
+            should_close = self._pop_if_unused(channel)
+
+        if should_close:
+            channel.close()
+
+    def _retire_channel(self, channel):
+        # Once the server is unavailable the channel backs off before connecting again, so it is
+        # replaced rather than waiting for a restarted server to be noticed
+        with self._grpc_channel_lock:
+            if self._grpc_channel is channel:
+                self._grpc_channel = None
+            should_close = self._pop_if_unused(channel)
+
+        if should_close:
+            channel.close()
+
+    def _pop_if_unused(self, channel):
+        # must be called while holding the channel lock
+        if channel is self._grpc_channel or self._grpc_channel_calls.get(channel) != 0:
+            return False
+
+        del self._grpc_channel_calls[channel]
+        return True
+
+    def close(self):
+        """Releases the channel shared by the calls of the client. Calls in flight finish first.
+
+        The client can still be used once it is closed, but each later call opens a channel of its
+        own that is closed when the call ends, rather than sharing a long-lived channel.
+        """
+        with self._grpc_channel_lock:
+            self._closed = True
+            channel = self._grpc_channel if self._grpc_channel_pid == os.getpid() else None
+
+        if channel is not None:
+            self._retire_channel(channel)
+
+    @contextmanager
+    def _channel(self):
+        channel = self._acquire_channel()
+        try:
+            yield channel
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNAVAILABLE:  # pylint: disable=no-member
+                self._retire_channel(channel)
+            raise
+        finally:
+            self._release_channel(channel)
+
+    def _query(
+        self,
+        method,
+        request_type,
+        timeout=DEFAULT_GRPC_TIMEOUT,
+        compression=grpc.Compression.Gzip,
+        **kwargs,
+    ):
         try:
             with self._channel() as channel:
                 stub = DagsterApiStub(channel)
-                response = getattr(stub, method)(request_type(**kwargs), timeout=timeout)
+                response = getattr(stub, method)(
+                    request_type(**kwargs), timeout=timeout, compression=compression
+                )
             return response
         except Exception as e:
             raise DagsterUserCodeUnreachableError("Could not reach user code server") from e
 
-    def _streaming_query(self, method, request_type, timeout=DEFAULT_GRPC_TIMEOUT, **kwargs):
+    def _streaming_query(
+        self,
+        method,
+        request_type,
+        timeout=DEFAULT_GRPC_TIMEOUT,
+        compression=grpc.Compression.Gzip,
+        **kwargs,
+    ):
         try:
             with self._channel() as channel:
                 stub = DagsterApiStub(channel)
-                response_stream = getattr(stub, method)(request_type(**kwargs), timeout=timeout)
-                yield from response_stream
+                response_stream = getattr(stub, method)(
+                    request_type(**kwargs), timeout=timeout, compression=compression
+                )
+                try:
+                    yield from response_stream
+                finally:
+                    # the channel outlives the call, so a stream that is not read to the end has
+                    # to be cancelled explicitly
+                    response_stream.cancel()
         except Exception as e:
             raise DagsterUserCodeUnreachableError("Could not reach user code server") from e
 
     def ping(self, echo):
         check.str_param(echo, "echo")
-        res = self._query("Ping", api_pb2.PingRequest, echo=echo)
+        res = self._query(
+            "Ping", api_pb2.PingRequest, compression=grpc.Compression.NoCompression, echo=echo
+        )
         return res.echo
 
     def heartbeat(self, echo=""):
         check.str_param(echo, "echo")
-        res = self._query("Heartbeat", api_pb2.PingRequest, echo=echo)
+        res = self._query(
+            "Heartbeat", api_pb2.PingRequest, compression=grpc.Compression.NoCompression, echo=echo
+        )
         return res.echo
 
     def streaming_ping(self, sequence_length, echo):
@@ -135,6 +247,7 @@ def streaming_ping(self, sequence_length, echo):
         for res in self._streaming_query(
             "StreamingPing",
             api_pb2.StreamingPingRequest,
+            compression=grpc.Compression.NoCompression,
             sequence_length=sequence_length,
             echo=echo,
         ):
@@ -144,7 +257,12 @@ def streaming_ping(self, sequence_length, echo):
             }
 
     def get_server_id(self, timeout=None):
-        res = self._query("GetServerId", api_pb2.Empty, timeout=timeout)
+        res = self._query(
+            "GetServerId",
+            api_pb2.Empty,
+            timeout=timeout,
+            compression=grpc.Compression.NoCompression,
+        )
         return res.server_id
 
     def execution_plan_snapshot(self, execution_plan_snapshot_args):
@@ -284,6 +402,25 @@ def external_schedule_execution(self, external_schedule_execution_args):
 
         return "".join([chunk.serialized_chunk for chunk in chunks])
 
+    def external_schedule_batch_execution(self, external_schedule_batch_execution_args):
+        check.inst_param(
+            external_schedule_batch_execution_args,
+            "external_schedule_batch_execution_args",
+            ExternalScheduleBatchExecutionArgs,
+        )
+
+        chunks = list(
+            self._streaming_query(
+                "ExternalScheduleExecution",
+                api_pb2.ExternalScheduleExecutionRequest,
+                serialized_external_schedule_execution_args=serialize_dagster_namedtuple(
+                    external_schedule_batch_execution_args
+                ),
+            )
+        )
+
+        return "".join([chunk.serialized_chunk for chunk in chunks])
+
     def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_TIMEOUT):
         check.inst_param(
             sensor_execution_args,
@@ -383,7 +520,8 @@ def health_check_query(self):
         try:
             with self._channel() as channel:
                 response = HealthStub(channel).Check(
-                    health_pb2.HealthCheckRequest(service="DagsterApi")
+                    health_pb2.HealthCheckRequest(service="DagsterApi"),
+                    compression=grpc.Compression.NoCompression,
                 )
         except grpc.RpcError as e:
             print(e)  # pylint: disable=print-call
@@ -418,6 +556,7 @@ def __enter__(self):
 
     def __exit__(self, _exception_type, _exception_value, _traceback):
         self.cleanup_server()
+        self.close()
 
     def __del__(self):
         if self._server_process:
@@ -33,6 +33,7 @@
     ExternalPartitionSetExecutionParamData,
     ExternalPartitionTagsData,
     ExternalPipelineSubsetResult,
+    ExternalScheduleBatchExecutionData,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
 )
@@ -260,6 +261,27 @@ def get_external_schedule_execution(
             )
 
 
+def get_external_schedule_batch_execution(
+    recon_repo,
+    instance_ref,
+    schedule_name,
+    scheduled_execution_timestamps,
+    scheduled_execution_timezone,
+):
+    return ExternalScheduleBatchExecutionData(
+        [
+            get_external_schedule_execution(
+                recon_repo,
+                instance_ref,
+                schedule_name,
+                scheduled_execution_timestamp,
+                scheduled_execution_timezone,
+            )
+            for scheduled_execution_timestamp in scheduled_execution_timestamps
+        ]
+    )
+
+
 def get_external_sensor_execution(
     recon_repo, instance_ref, sensor_name, last_completion_timestamp, last_run_key, cursor
 ):
@@ -17,6 +17,7 @@
 from dagster import check, seven
 from dagster.core.code_pointer import CodePointer
 from dagster.core.definitions.reconstructable import ReconstructableRepository
+from dagster.core.definitions.repository_definition import CachingRepositoryData
 from dagster.core.errors import DagsterUserCodeUnreachableError
 from dagster.core.host_representation.external_data import external_repository_data_from_def
 from dagster.core.host_representation.origin import ExternalPipelineOrigin, ExternalRepositoryOrigin
@@ -29,6 +30,7 @@
     whitelist_for_serdes,
 )
 from dagster.serdes.ipc import IPCErrorMessage, ipc_write_stream, open_ipc_subprocess
+from dagster.serdes.utils import hash_str
 from dagster.utils import find_free_port, frozenlist, safe_tempfile_path_unmanaged
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
@@ -39,6 +41,7 @@
     StartRunInSubprocessSuccessful,
     get_external_execution_plan_snapshot,
     get_external_pipeline_subset_result,
+    get_external_schedule_batch_execution,
     get_external_schedule_execution,
     get_external_sensor_execution,
     get_notebook_data,
@@ -55,6 +58,7 @@
     CancelExecutionResult,
     ExecuteExternalPipelineArgs,
     ExecutionPlanSnapshotArgs,
+    ExternalScheduleBatchExecutionArgs,
     ExternalScheduleExecutionArgs,
     GetCurrentImageResult,
     ListRepositoriesResponse,
@@ -199,6 +203,14 @@ def __init__(
 
         self._serializable_load_error = None
 
+        # Dict[str, (str, str)] of serialized external repository data and its hash, by repository
+        # name. The repository definitions are loaded once, so the data is computed at most once.
+        # Each repository has its own lock, so that computing the data of a large repository
+        # does not hold up requests for the other repositories.
+        self._serialized_external_repository_data = {}
+        self._serialized_external_repository_data_locks = {}
+        self._serialized_external_repository_data_locks_lock = threading.Lock()
+
         self._entry_point = (
             frozenlist(check.list_param(entry_point, "entry_point", of_type=str))
             if entry_point != None
@@ -215,6 +227,15 @@ def __init__(
             self._loaded_repositories = None
             self._serializable_load_error = serializable_error_info_from_exc_info(sys.exc_info())
 
+        if self._loaded_repositories and not lazy_load_user_code:
+            self.__repository_data_thread = threading.Thread(
+                target=self._repository_data_thread,
+                args=(),
+                name="grpc-server-repository-data",
+            )
+            self.__repository_data_thread.daemon = True
+            self.__repository_data_thread.start()
+
         self.__last_heartbeat_time = time.time()
         if heartbeat:
             self.__heartbeat_thread = threading.Thread(
@@ -248,6 +269,17 @@ def _heartbeat_thread(self, heartbeat_timeout):
             if self.__last_heartbeat_time < time.time() - heartbeat_timeout:
                 self._shutdown_once_executions_finish_event.set()
 
+    def _repository_data_thread(self):
+        # Serializes the repository data before the first client asks for it. Errors are raised
+        # again when a client requests the data.
+        for symbol in self._loaded_repositories.loadable_repository_symbols:
+            if self._server_termination_event.is_set():
+                break
+            try:
+                self._get_cached_serialized_external_repository_data(symbol.repository_name)
+            except Exception:  # pylint: disable=broad-except
+                pass
+
     def _cleanup_thread(self):
         while True:
             self._server_termination_event.wait(CLEANUP_TICK)
@@ -305,22 +337,27 @@ def _recon_pipeline_from_origin(self, external_pipeline_origin: ExternalPipeline
         )
         return recon_repo.get_reconstructable_pipeline(external_pipeline_origin.pipeline_name)
 
-    def Ping(self, request, _context):
+    def Ping(self, request, context):
+        # pings are too small to benefit from the server's default gzip compression
+        context.set_compression(grpc.Compression.NoCompression)
         echo = request.echo
         return api_pb2.PingReply(echo=echo)
 
-    def StreamingPing(self, request, _context):
+    def StreamingPing(self, request, context):
+        context.set_compression(grpc.Compression.NoCompression)
         sequence_length = request.sequence_length
         echo = request.echo
         for sequence_number in range(sequence_length):
             yield api_pb2.StreamingPingEvent(sequence_number=sequence_number, echo=echo)
 
-    def Heartbeat(self, request, _context):
+    def Heartbeat(self, request, context):
+        context.set_compression(grpc.Compression.NoCompression)
         self.__last_heartbeat_time = time.time()
         echo = request.echo
         return api_pb2.PingReply(echo=echo)
 
-    def GetServerId(self, _request, _context):
+    def GetServerId(self, _request, context):
+        context.set_compression(grpc.Compression.NoCompression)
         return api_pb2.GetServerIdReply(server_id=self._server_id)
 
     def ExecutionPlanSnapshot(self, request, _context):
@@ -354,6 +391,13 @@ def ListRepositories(self, request, _context):
             else None,
             repository_code_pointer_dict=self._loaded_repositories.code_pointers_by_repo_name,
             entry_point=self._entry_point,
+            # only repositories whose data has already been computed, so listing stays fast
+            repository_data_hashes={
+                repository_name: data_and_hash[1]
+                for repository_name, data_and_hash in list(
+                    self._serialized_external_repository_data.items()
+                )
+            },
         )
 
         return api_pb2.ListRepositoriesReply(
@@ -453,16 +497,45 @@ def ExternalPipelineSubsetSnapshot(self, request, _context):
             )
         )
 
+    def _get_cached_serialized_external_repository_data(self, repository_name):
+        with self._serialized_external_repository_data_locks_lock:
+            repository_lock = self._serialized_external_repository_data_locks.setdefault(
+                repository_name, threading.Lock()
+            )
+
+        with repository_lock:
+            if repository_name in self._serialized_external_repository_data:
+                return self._serialized_external_repository_data[repository_name]
+
+            repository_def = self._loaded_repositories.get_recon_repo(
+                repository_name
+            ).get_definition()
+            serialized_external_repository_data = serialize_dagster_namedtuple(
+                external_repository_data_from_def(repository_def)
+            )
+            data_and_hash = (
+                serialized_external_repository_data,
+                hash_str(serialized_external_repository_data),
+            )
+
+            # Custom RepositoryData implementations may return different definitions each time
+            # they are called, so only the built-in definitions are computed once
+            if isinstance(repository_def.repository_data, CachingRepositoryData):
+                self._serialized_external_repository_data[repository_name] = data_and_hash
+
+            return data_and_hash
+
     def _get_serialized_external_repository_data(self, request):
         repository_origin = deserialize_json_to_dagster_namedtuple(
             request.serialized_repository_python_origin
         )
 
         check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
-        recon_repo = self._recon_repository_from_origin(repository_origin)
-        return serialize_dagster_namedtuple(
-            external_repository_data_from_def(recon_repo.get_definition())
-        )
+        (
+            serialized_external_repository_data,
+            _,
+        ) = self._get_cached_serialized_external_repository_data(repository_origin.repository_name)
+        return serialized_external_repository_data
 
     def ExternalRepository(self, request, _context):
         serialized_external_repository_data = self._get_serialized_external_repository_data(request)
@@ -513,19 +586,30 @@ def ExternalScheduleExecution(self, request, _context):
         check.inst_param(
             args,
             "args",
-            ExternalScheduleExecutionArgs,
+            (ExternalScheduleExecutionArgs, ExternalScheduleBatchExecutionArgs),
         )
 
         recon_repo = self._recon_repository_from_origin(args.repository_origin)
-        serialized_schedule_data = serialize_dagster_namedtuple(
-            get_external_schedule_execution(
-                recon_repo,
-                args.instance_ref,
-                args.schedule_name,
-                args.scheduled_execution_timestamp,
-                args.scheduled_execution_timezone,
+        if isinstance(args, ExternalScheduleBatchExecutionArgs):
+            serialized_schedule_data = serialize_dagster_namedtuple(
+                get_external_schedule_batch_execution(
+                    recon_repo,
+                    args.instance_ref,
+                    args.schedule_name,
+                    args.scheduled_execution_timestamps,
+                    args.scheduled_execution_timezone,
+                )
+            )
+        else:
+            serialized_schedule_data = serialize_dagster_namedtuple(
+                get_external_schedule_execution(
+                    recon_repo,
+                    args.instance_ref,
+                    args.schedule_name,
+                    args.scheduled_execution_timestamp,
+                    args.scheduled_execution_timezone,
+                )
             )
-        )
 
         yield from self._split_serialized_data_into_chunk_events(serialized_schedule_data)
 
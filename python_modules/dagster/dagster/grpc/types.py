@@ -256,6 +256,7 @@ class ListRepositoriesResponse(
             ("executable_path", Optional[str]),
             ("repository_code_pointer_dict", Dict[str, CodePointer]),
             ("entry_point", Optional[List[str]]),
+            ("repository_data_hashes", Dict[str, str]),
         ],
     )
 ):
@@ -265,6 +266,7 @@ def __new__(
         executable_path=None,
         repository_code_pointer_dict=None,
         entry_point=None,
+        repository_data_hashes=None,
     ):
         return super(ListRepositoriesResponse, cls).__new__(
             cls,
@@ -283,6 +285,9 @@ def __new__(
                 if entry_point != None
                 else None
             ),
+            repository_data_hashes=check.opt_dict_param(
+                repository_data_hashes, "repository_data_hashes", key_type=str, value_type=str
+            ),
         )
 
 
@@ -463,6 +468,44 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class ExternalScheduleBatchExecutionArgs(
+    NamedTuple(
+        "_ExternalScheduleBatchExecutionArgs",
+        [
+            ("repository_origin", ExternalRepositoryOrigin),
+            ("instance_ref", Optional[InstanceRef]),
+            ("schedule_name", str),
+            ("scheduled_execution_timestamps", List[float]),
+            ("scheduled_execution_timezone", Optional[str]),
+        ],
+    )
+):
+    def __new__(
+        cls,
+        repository_origin: ExternalRepositoryOrigin,
+        instance_ref: Optional[InstanceRef],
+        schedule_name: str,
+        scheduled_execution_timestamps: List[float],
+        scheduled_execution_timezone: Optional[str] = None,
+    ):
+        return super(ExternalScheduleBatchExecutionArgs, cls).__new__(
+            cls,
+            repository_origin=check.inst_param(
+                repository_origin, "repository_origin", ExternalRepositoryOrigin
+            ),
+            instance_ref=check.opt_inst_param(instance_ref, "instance_ref", InstanceRef),
+            schedule_name=check.str_param(schedule_name, "schedule_name"),
+            scheduled_execution_timestamps=check.list_param(
+                scheduled_execution_timestamps, "scheduled_execution_timestamps", of_type=float
+            ),
+            scheduled_execution_timezone=check.opt_str_param(
+                scheduled_execution_timezone,
+                "scheduled_execution_timezone",
+            ),
+        )
+
+
 @whitelist_for_serdes
 class SensorExecutionArgs(
     NamedTuple(
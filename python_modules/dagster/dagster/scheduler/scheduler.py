@@ -2,14 +2,17 @@
 import os
 import sys
 import time
-from typing import cast
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from typing import Dict, List, Optional, cast
 
 import pendulum
 
 from dagster import check
 from dagster.core.definitions.schedule_definition import DefaultScheduleStatus
-from dagster.core.errors import DagsterUserCodeUnreachableError
+from dagster.core.errors import DagsterUserCodeProcessError, DagsterUserCodeUnreachableError
 from dagster.core.host_representation import ExternalSchedule, PipelineSelector
+from dagster.core.host_representation.external_data import ExternalScheduleExecutionErrorData
 from dagster.core.instance import DagsterInstance
 from dagster.core.scheduler.instigation import (
     InstigatorState,
@@ -26,7 +29,7 @@
 from dagster.core.workspace import IWorkspace
 from dagster.seven.compat.pendulum import to_timezone
 from dagster.utils import merge_dicts
-from dagster.utils.error import serializable_error_info_from_exc_info
+from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster.utils.log import default_date_format_string
 
 
@@ -53,6 +56,11 @@ def update_state(self, status, error=None, **kwargs):
     def add_run_info(self, run_id=None, run_key=None):
         self._tick = self._tick.with_run_info(run_id, run_key)
 
+    def record_lateness(self, lateness_seconds):
+        # a tick that is resumed or retried keeps the lateness of its first submitted run
+        if self._tick.lateness_seconds is None:
+            self._tick = self._tick.with_lateness(lateness_seconds)
+
     def _write(self):
         self._instance.update_tick(self._tick)
 
@@ -74,28 +82,54 @@ def execute_scheduler_iteration_loop(
 
     workspace_iteration = 0
     start_time = pendulum.now("UTC").timestamp()
-    while True:
-        start_time = pendulum.now("UTC").timestamp()
-        if start_time - workspace_loaded_time > RELOAD_WORKSPACE:
-            workspace.cleanup()
-            workspace_loaded_time = pendulum.now("UTC").timestamp()
-            workspace_iteration = 0
-
-        end_datetime_utc = pendulum.now("UTC")
-        yield from launch_scheduled_runs(
-            instance,
-            workspace,
-            logger,
-            end_datetime_utc=end_datetime_utc,
-            max_catchup_runs=max_catchup_runs,
-            max_tick_retries=max_tick_retries,
-            log_verbose_checks=(workspace_iteration == 0),
-        )
-        loop_duration = pendulum.now("UTC").timestamp() - start_time
-        sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
-        time.sleep(sleep_time)
+
+    with ExitStack() as stack:
+        threadpool_executor = None
+        schedule_tick_futures: Dict[str, Future] = {}
+        if instance.schedule_use_threads:
+            threadpool_executor = stack.enter_context(
+                ThreadPoolExecutor(
+                    max_workers=instance.schedule_num_workers,
+                    thread_name_prefix="schedule_daemon_worker",
+                )
+            )
+
+        while True:
+            start_time = pendulum.now("UTC").timestamp()
+            if start_time - workspace_loaded_time > RELOAD_WORKSPACE:
+                # the worker threads use the locations that are cleaned up
+                yield from _wait_for_schedule_tick_futures(schedule_tick_futures)
+                workspace.cleanup()
+                workspace_loaded_time = pendulum.now("UTC").timestamp()
+                workspace_iteration = 0
+
+            end_datetime_utc = pendulum.now("UTC")
+            yield from launch_scheduled_runs(
+                instance,
+                workspace,
+                logger,
+                end_datetime_utc=end_datetime_utc,
+                max_catchup_runs=max_catchup_runs,
+                max_tick_retries=max_tick_retries,
+                log_verbose_checks=(workspace_iteration == 0),
+                threadpool_executor=threadpool_executor,
+                schedule_tick_futures=schedule_tick_futures,
+            )
+            loop_duration = pendulum.now("UTC").timestamp() - start_time
+            sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
+            time.sleep(sleep_time)
+            yield
+            workspace_iteration += 1
+
+
+def _wait_for_schedule_tick_futures(schedule_tick_futures: Dict[str, Future]):
+    while schedule_tick_futures:
+        wait(list(schedule_tick_futures.values()), timeout=MIN_INTERVAL_LOOP_TIME)
+        for origin_id, future in list(schedule_tick_futures.items()):
+            if future.done():
+                del schedule_tick_futures[origin_id]
+                yield from future.result()
         yield
-        workspace_iteration += 1
 
 
 def launch_scheduled_runs(
@@ -107,9 +141,27 @@ def launch_scheduled_runs(
     max_tick_retries=0,
     debug_crash_flags=None,
     log_verbose_checks=True,
+    threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    schedule_tick_futures: Optional[Dict[str, Future]] = None,
 ):
+    """
+    Launches the runs of the ticks of each running schedule up to end_datetime_utc. Without a
+    threadpool_executor, the schedules are processed one after another. With one, each schedule
+    is submitted to the pool and tracked in schedule_tick_futures, keyed by schedule origin id,
+    across iterations, so that schedules that fire at the same time are evaluated concurrently.
+    """
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(workspace, "workspace", IWorkspace)
+    check.opt_inst_param(threadpool_executor, "threadpool_executor", ThreadPoolExecutor)
+
+    if threadpool_executor:
+        schedule_tick_futures = check.dict_param(schedule_tick_futures, "schedule_tick_futures")
+
+        # report the errors of the schedules that finished since the last iteration
+        for origin_id, future in list(schedule_tick_futures.items()):
+            if future.done():
+                del schedule_tick_futures[origin_id]
+                yield from future.result()
 
     workspace_snapshot = {
         location_entry.origin: location_entry
@@ -198,47 +250,123 @@ def launch_scheduled_runs(
         schedule_names = ", ".join([schedule.name for schedule in schedules.values()])
         logger.info(f"Checking for new runs for the following schedules: {schedule_names}")
 
-    for external_schedule in schedules.values():
-        error_info = None
-        try:
-            schedule_state = all_schedule_states.get(
-                external_schedule.get_external_origin().get_id()
-            )
-            if not schedule_state:
-                assert external_schedule.default_status == DefaultScheduleStatus.RUNNING
-                schedule_state = InstigatorState(
-                    external_schedule.get_external_origin(),
-                    InstigatorType.SCHEDULE,
-                    InstigatorStatus.AUTOMATICALLY_RUNNING,
-                    ScheduleInstigatorData(
-                        external_schedule.cron_schedule,
-                        end_datetime_utc.timestamp(),
-                    ),
-                )
-                instance.add_instigator_state(schedule_state)
+    for origin_id, external_schedule in schedules.items():
+        schedule_state = all_schedule_states.get(origin_id)
+        schedule_debug_crash_flags = (
+            debug_crash_flags.get(external_schedule.name) if debug_crash_flags else None
+        )
 
-            yield from launch_scheduled_runs_for_schedule(
+        if not threadpool_executor:
+            yield from _process_schedule_generator(
                 instance,
                 logger,
+                workspace,
                 external_schedule,
                 schedule_state,
-                workspace,
                 end_datetime_utc,
                 max_catchup_runs,
                 max_tick_retries,
-                (
-                    debug_crash_flags.get(schedule_state.instigator_name)
-                    if debug_crash_flags
-                    else None
-                ),
-                log_verbose_checks=log_verbose_checks,
+                schedule_debug_crash_flags,
+                log_verbose_checks,
             )
-        except Exception:
-            error_info = serializable_error_info_from_exc_info(sys.exc_info())
-            logger.error(
-                f"Scheduler caught an error for schedule {external_schedule.name} : {error_info.to_string()}"
+            continue
+
+        # only process one iteration of each schedule at a time
+        if origin_id in schedule_tick_futures:
+            continue
+
+        schedule_tick_futures[origin_id] = threadpool_executor.submit(
+            _process_schedule,
+            instance,
+            logger,
+            workspace,
+            external_schedule,
+            schedule_state,
+            end_datetime_utc,
+            max_catchup_runs,
+            max_tick_retries,
+            schedule_debug_crash_flags,
+            log_verbose_checks,
+        )
+        yield
+
+
+def _process_schedule(
+    instance,
+    logger,
+    workspace,
+    external_schedule,
+    schedule_state,
+    end_datetime_utc,
+    max_catchup_runs,
+    max_tick_retries,
+    debug_crash_flags,
+    log_verbose_checks,
+) -> List[SerializableErrorInfo]:
+    """Processes a schedule in a worker thread, returning the errors of its ticks"""
+    return [
+        error_info
+        for error_info in _process_schedule_generator(
+            instance,
+            logger,
+            workspace,
+            external_schedule,
+            schedule_state,
+            end_datetime_utc,
+            max_catchup_runs,
+            max_tick_retries,
+            debug_crash_flags,
+            log_verbose_checks,
+        )
+        if error_info
+    ]
+
+
+def _process_schedule_generator(
+    instance,
+    logger,
+    workspace,
+    external_schedule,
+    schedule_state,
+    end_datetime_utc,
+    max_catchup_runs,
+    max_tick_retries,
+    debug_crash_flags,
+    log_verbose_checks,
+):
+    error_info = None
+    try:
+        if not schedule_state:
+            assert external_schedule.default_status == DefaultScheduleStatus.RUNNING
+            schedule_state = InstigatorState(
+                external_schedule.get_external_origin(),
+                InstigatorType.SCHEDULE,
+                InstigatorStatus.AUTOMATICALLY_RUNNING,
+                ScheduleInstigatorData(
+                    external_schedule.cron_schedule,
+                    end_datetime_utc.timestamp(),
+                ),
             )
-        yield error_info
+            instance.add_instigator_state(schedule_state)
+
+        yield from launch_scheduled_runs_for_schedule(
+            instance,
+            logger,
+            external_schedule,
+            schedule_state,
+            workspace,
+            end_datetime_utc,
+            max_catchup_runs,
+            max_tick_retries,
+            debug_crash_flags,
+            log_verbose_checks=log_verbose_checks,
+        )
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        logger.error(
+            f"Scheduler caught an error for schedule {external_schedule.name} : {error_info.to_string()}"
+        )
+    yield error_info
 
 
 def launch_scheduled_runs_for_schedule(
@@ -321,9 +449,14 @@ def launch_scheduled_runs_for_schedule(
         times = ", ".join([time.strftime(default_date_format_string()) for time in tick_times])
         logger.info(f"Evaluating schedule `{schedule_name}` at the following times: {times}")
 
+    schedule_execution_data_by_timestamp = _get_schedule_execution_data_for_catchup(
+        instance, logger, workspace, external_schedule, tick_times
+    )
+
     for schedule_time in tick_times:
         schedule_timestamp = schedule_time.timestamp()
         schedule_time_str = schedule_time.strftime(default_date_format_string())
+
         if latest_tick and latest_tick.timestamp == schedule_timestamp:
             tick = latest_tick
             if latest_tick.status == TickStatus.FAILURE:
@@ -357,6 +490,7 @@ def launch_scheduled_runs_for_schedule(
                     schedule_time,
                     tick_context,
                     debug_crash_flags,
+                    schedule_execution_data_by_timestamp.get(schedule_timestamp),
                 )
             except Exception as e:
                 if isinstance(e, DagsterUserCodeUnreachableError):
@@ -386,6 +520,40 @@ def launch_scheduled_runs_for_schedule(
                     raise
 
 
+def _get_schedule_execution_data_for_catchup(
+    instance, logger, workspace, external_schedule, tick_times
+):
+    """
+    Evaluates the schedule at each of the catch-up tick times in a single request to the
+    repository location, returning the results keyed by tick timestamp. If the batch can not be
+    evaluated, for instance because the location runs an older version of dagster, the ticks are
+    evaluated one at a time instead.
+    """
+    if len(tick_times) < 2:
+        return {}
+
+    schedule_origin = external_schedule.get_external_origin()
+    try:
+        repo_location = workspace.get_location(
+            schedule_origin.external_repository_origin.repository_location_origin.location_name
+        )
+        results = repo_location.get_external_schedule_batch_execution_data(
+            instance=instance,
+            repository_handle=external_schedule.handle.repository_handle,
+            schedule_name=external_schedule.name,
+            scheduled_execution_times=tick_times,
+        )
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        logger.warning(
+            f"Could not evaluate the ticks of schedule {external_schedule.name} in one request, "
+            f"evaluating them one at a time instead: {error_info.to_string()}"
+        )
+        return {}
+
+    return {schedule_time.timestamp(): result for schedule_time, result in zip(tick_times, results)}
+
+
 def _check_for_debug_crash(debug_crash_flags, key):
     if not debug_crash_flags:
         return
@@ -407,6 +575,7 @@ def _schedule_runs_at_time(
     schedule_time,
     tick_context,
     debug_crash_flags,
+    schedule_execution_data=None,
 ):
     schedule_name = external_schedule.name
 
@@ -426,12 +595,16 @@ def _schedule_runs_at_time(
 
     external_pipeline = repo_location.get_external_pipeline(pipeline_selector)
 
-    schedule_execution_data = repo_location.get_external_schedule_execution_data(
-        instance=instance,
-        repository_handle=repository_handle,
-        schedule_name=external_schedule.name,
-        scheduled_execution_time=schedule_time,
-    )
+    if schedule_execution_data is None:
+        schedule_execution_data = repo_location.get_external_schedule_execution_data(
+            instance=instance,
+            repository_handle=repository_handle,
+            schedule_name=external_schedule.name,
+            scheduled_execution_time=schedule_time,
+        )
+    elif isinstance(schedule_execution_data, ExternalScheduleExecutionErrorData):
+        # evaluated in a batch with other ticks, fail this tick just like a single evaluation would
+        raise DagsterUserCodeProcessError.from_error_info(schedule_execution_data.error)
     yield
 
     if not schedule_execution_data.run_requests:
@@ -481,7 +654,12 @@ def _schedule_runs_at_time(
         if run.status != PipelineRunStatus.FAILURE:
             try:
                 instance.submit_run(run.run_id, workspace)
-                logger.info(f"Completed scheduled launch of run {run.run_id} for {schedule_name}")
+                lateness_seconds = pendulum.now("UTC").timestamp() - schedule_time.timestamp()
+                tick_context.record_lateness(lateness_seconds)
+                logger.info(
+                    f"Completed scheduled launch of run {run.run_id} for {schedule_name}, "
+                    f"{lateness_seconds:.2f} seconds after its scheduled time"
+                )
             except Exception:
                 error_info = serializable_error_info_from_exc_info(sys.exc_info())
                 logger.error(
@@ -1,14 +1,19 @@
 from .config_class import ConfigurableClass, ConfigurableClassData, class_from_code_pointer
 from .serdes import (
     DefaultNamedTupleSerializer,
+    SerializationFormat,
     deserialize_as,
+    deserialize_dagster_namedtuple,
     deserialize_json_to_dagster_namedtuple,
+    deserialize_payload,
     deserialize_value,
     pack_inner_value,
     pack_value,
     register_serdes_tuple_fallbacks,
     serialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_as,
     serialize_value,
+    serialize_value_to_bytes,
     unpack_inner_value,
     unpack_value,
     whitelist_for_serdes,
@@ -21,6 +21,7 @@
     Any,
     Callable,
     Dict,
+    FrozenSet,
     List,
     Mapping,
     NamedTuple,
@@ -48,11 +49,29 @@
 EnumEntry = Tuple[Type[Enum], Type["EnumSerializer"]]
 
 
+class CompiledTupleEntry(NamedTuple):
+    """
+    Per-class layout precomputed when a namedtuple is whitelisted, so that the fast serdes paths
+    don't need to look up the serializer, storage name and empty-skipping rules on every value.
+    """
+
+    klass: Optional[Type[NamedTuple]]
+    serializer: Type["NamedTupleSerializer"]
+    args_for_class: Mapping[str, Parameter]
+    fields: Tuple[str, ...]
+    skip_when_empty: FrozenSet[str]
+    storage_name: str
+    # whether the serializer uses the default field-by-field packing / unpacking
+    default_pack: bool
+    default_unpack: bool
+
+
 class WhitelistMap(NamedTuple):
     tuples: Dict[str, TupleEntry]
     enums: Dict[str, EnumEntry]
     serialized_names: Dict[str, str]
     deserialized_names: Dict[str, str]
+    compiled_tuples: Dict[str, CompiledTupleEntry]
 
     def register_tuple(
         self,
@@ -70,6 +89,27 @@ def register_tuple(
             args_for_class: the inspect.signature paramaters for __new__
         """
         self.tuples[name] = (nt, serializer or DefaultNamedTupleSerializer, args_for_class)
+        self._compile_tuple(name)
+
+    def _compile_tuple(self, name: str):
+        nt, serializer, args_for_class = self.tuples[name]
+        is_default = issubclass(serializer, DefaultNamedTupleSerializer)
+        self.compiled_tuples[name] = CompiledTupleEntry(
+            klass=nt,
+            serializer=serializer,
+            args_for_class=args_for_class,
+            fields=tuple(nt._fields) if nt is not None else (),
+            skip_when_empty=(
+                frozenset(cast(DefaultNamedTupleSerializer, serializer).skip_when_empty())
+                if is_default
+                else frozenset()
+            ),
+            storage_name=self.serialized_names.get(name, name),
+            default_pack=is_default
+            and _is_inherited(serializer, DefaultNamedTupleSerializer, "value_to_storage_dict"),
+            default_unpack=is_default
+            and _is_inherited(serializer, DefaultNamedTupleSerializer, "value_from_storage_dict"),
+        )
 
     def has_tuple_entry(self, name: str) -> bool:
         return name in self.tuples
@@ -93,6 +133,8 @@ def get_enum_entry(self, name: str) -> EnumEntry:
 
     def register_serialized_name(self, name: str, serialized_name: str):
         self.serialized_names[name] = serialized_name
+        if self.has_tuple_entry(name):
+            self._compile_tuple(name)
 
     def has_serialized_name(self, name: str) -> bool:
         return name in self.serialized_names
@@ -111,11 +153,25 @@ def get_deserialized_name(self, name: str) -> str:
 
     @staticmethod
     def create():
-        return WhitelistMap(tuples={}, enums={}, serialized_names={}, deserialized_names={})
+        return WhitelistMap(
+            tuples={}, enums={}, serialized_names={}, deserialized_names={}, compiled_tuples={}
+        )
 
 
 _WHITELIST_MAP = WhitelistMap.create()
 
+# When enabled, pack_inner_value / unpack_inner_value use the precomputed per-class layouts in
+# WhitelistMap.compiled_tuples and skip building descent paths, only falling back to the path
+# tracking implementation to produce error messages. Output is identical in both modes.
+_COMPILED_SERDES_ENABLED = True
+
+# Exact types that are returned as-is by both packing and unpacking
+_PASSTHROUGH_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def _is_inherited(klass: Type, base: Type, method_name: str) -> bool:
+    return getattr(klass, method_name).__func__ is getattr(base, method_name).__func__
+
 
 @overload
 def whitelist_for_serdes(__cls: Type) -> Type:
@@ -365,9 +421,76 @@ def pack_value(val: Any) -> Any:
 
 
 def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    if _COMPILED_SERDES_ENABLED:
+        try:
+            return _pack_compiled(val, whitelist_map, descent_path)
+        except SerializationError:
+            # rerun with descent path tracking to produce the full error message
+            pass
+
+    return _pack_with_path(val, whitelist_map, descent_path)
+
+
+def _pack_compiled(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    klass = val.__class__
+    if klass in _PASSTHROUGH_TYPES:
+        return val
+    if isinstance(val, list):
+        return [_pack_compiled(item, whitelist_map, descent_path) for item in val]
+    if isinstance(val, tuple):
+        compiled = whitelist_map.compiled_tuples.get(klass.__name__)
+        if compiled is None:
+            raise SerializationError(f"Can only serialize whitelisted namedtuples, received {val}.")
+        if not compiled.default_pack:
+            return compiled.serializer.value_to_storage_dict(
+                cast(NamedTuple, val), whitelist_map, descent_path
+            )
+
+        skip_when_empty_fields = compiled.skip_when_empty
+        base_dict = {}
+        for key, inner_value in zip(
+            compiled.fields if klass is compiled.klass else val._fields, val  # type: ignore
+        ):
+            if (
+                skip_when_empty_fields
+                and key in skip_when_empty_fields
+                and inner_value in EMPTY_VALUES_TO_SKIP
+            ):
+                continue
+            base_dict[key] = _pack_compiled(inner_value, whitelist_map, descent_path)
+        base_dict["__class__"] = compiled.storage_name
+        return base_dict
+    if isinstance(val, Enum):
+        enum_entry = whitelist_map.enums.get(klass.__name__)
+        if enum_entry is None:
+            raise SerializationError(f"Can only serialize whitelisted Enums, received {klass}.")
+        return {"__enum__": enum_entry[1].value_to_storage_str(val, whitelist_map, descent_path)}
+    if isinstance(val, set):
+        return {
+            "__set__": [
+                _pack_compiled(item, whitelist_map, descent_path)
+                for item in sorted(list(val), key=str)
+            ]
+        }
+    if isinstance(val, frozenset):
+        return {
+            "__frozenset__": [
+                _pack_compiled(item, whitelist_map, descent_path)
+                for item in sorted(list(val), key=str)
+            ]
+        }
+    if isinstance(val, dict):
+        return {
+            key: _pack_compiled(value, whitelist_map, descent_path) for key, value in val.items()
+        }
+
+    return val
+
+
+def _pack_with_path(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
-            pack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _pack_with_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, tuple):
@@ -391,7 +514,7 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         set_path = descent_path + "{}"
         return {
             "__set__": [
-                pack_inner_value(item, whitelist_map, set_path)
+                _pack_with_path(item, whitelist_map, set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
@@ -399,13 +522,13 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         frz_set_path = descent_path + "{}"
         return {
             "__frozenset__": [
-                pack_inner_value(item, whitelist_map, frz_set_path)
+                _pack_with_path(item, whitelist_map, frz_set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
     if isinstance(val, dict):
         return {
-            key: pack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _pack_with_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
@@ -483,13 +606,86 @@ def unpack_value(val: Any) -> Any:
 
 
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    if _COMPILED_SERDES_ENABLED:
+        try:
+            return _unpack_compiled(val, whitelist_map, descent_path)
+        except DeserializationError:
+            # rerun with descent path tracking to produce the full error message. Neither
+            # implementation mutates the input, so the packed value is still intact.
+            pass
+
+    return _unpack_with_path(val, whitelist_map, descent_path)
+
+
+def _unpack_compiled(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    if val.__class__ in _PASSTHROUGH_TYPES:
+        return val
+    if isinstance(val, list):
+        return [_unpack_compiled(item, whitelist_map, descent_path) for item in val]
+    if isinstance(val, dict):
+        klass_name = val.get("__class__")
+        if klass_name:
+            lookup_name = whitelist_map.deserialized_names.get(klass_name, klass_name)
+            compiled = whitelist_map.compiled_tuples.get(lookup_name)
+            if compiled is None:
+                raise DeserializationError(
+                    f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.'
+                )
+            if compiled.klass is None:
+                return None
+            if not compiled.default_unpack:
+                return compiled.serializer.value_from_storage_dict(
+                    _without_class_key(val),
+                    compiled.klass,
+                    compiled.args_for_class,
+                    whitelist_map,
+                    descent_path,
+                )
+
+            args_for_class = compiled.args_for_class
+            return cast(Type[DefaultNamedTupleSerializer], compiled.serializer).value_from_unpacked(
+                {
+                    key: _unpack_compiled(value, whitelist_map, descent_path)
+                    for key, value in val.items()
+                    if key in args_for_class
+                },
+                compiled.klass,
+            )
+        if val.get("__enum__"):
+            name, member = val["__enum__"].split(".")
+            enum_entry = whitelist_map.enums.get(name)
+            if enum_entry is None:
+                raise DeserializationError(
+                    f"Attempted to deserialize enum {name} which was not in the whitelist."
+                )
+            enum_class, enum_serializer = enum_entry
+            return enum_serializer.value_from_storage_str(member, enum_class)
+        if val.get("__set__") is not None:
+            return set(
+                [_unpack_compiled(item, whitelist_map, descent_path) for item in val["__set__"]]
+            )
+        if val.get("__frozenset__") is not None:
+            return frozenset(
+                [
+                    _unpack_compiled(item, whitelist_map, descent_path)
+                    for item in val["__frozenset__"]
+                ]
+            )
+        return {
+            key: _unpack_compiled(value, whitelist_map, descent_path) for key, value in val.items()
+        }
+
+    return val
+
+
+def _unpack_with_path(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
-            unpack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _unpack_with_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, dict) and val.get("__class__"):
-        klass_name = cast(str, val.pop("__class__"))
+        klass_name = cast(str, val["__class__"])
         lookup_name = (
             whitelist_map.get_deserialized_name(klass_name)
             if whitelist_map.has_deserialized_name(klass_name)
@@ -514,7 +710,7 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
             return None
 
         return serializer.value_from_storage_dict(
-            val, klass, args_for_class, whitelist_map, descent_path
+            _without_class_key(val), klass, args_for_class, whitelist_map, descent_path
         )
     if isinstance(val, dict) and val.get("__enum__"):
         name, member = val["__enum__"].split(".")
@@ -528,21 +724,131 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
         return enum_serializer.value_from_storage_str(member, enum_class)
     if isinstance(val, dict) and val.get("__set__") is not None:
         set_path = descent_path + "{}"
-        return set([unpack_inner_value(item, whitelist_map, set_path) for item in val["__set__"]])
+        return set([_unpack_with_path(item, whitelist_map, set_path) for item in val["__set__"]])
     if isinstance(val, dict) and val.get("__frozenset__") is not None:
         frz_set_path = descent_path + "{}"
         return frozenset(
-            [unpack_inner_value(item, whitelist_map, frz_set_path) for item in val["__frozenset__"]]
+            [_unpack_with_path(item, whitelist_map, frz_set_path) for item in val["__frozenset__"]]
         )
     if isinstance(val, dict):
         return {
-            key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _unpack_with_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
     return val
 
 
+def _without_class_key(storage_dict: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in storage_dict.items() if key != "__class__"}
+
+
+###################################################################################################
+# Binary format
+###################################################################################################
+
+
+class SerializationFormat(Enum):
+    """The encoding used for serialized payloads. JSON is the default everywhere. BINARY is a
+    compact msgpack based encoding of the same packed values, which requires the optional
+    ``msgpack`` dependency (``pip install dagster[msgpack]``).
+    """
+
+    JSON = "json"
+    BINARY = "binary"
+
+
+# Prefix of every binary payload, followed by the format version byte. 0xff never occurs in
+# UTF-8 encoded text, so binary payloads can always be told apart from UTF-8 encoded json.
+BINARY_SERDES_MAGIC = b"\xffdgs"
+BINARY_SERDES_VERSION = 1
+_BINARY_SERDES_HEADER = BINARY_SERDES_MAGIC + bytes([BINARY_SERDES_VERSION])
+
+
+def _import_msgpack():
+    try:
+        import msgpack  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise SerdesUsageError(
+            "The binary serialization format requires the msgpack package. Install it with "
+            "`pip install dagster[msgpack]`."
+        ) from e
+    return msgpack
+
+
+def check_serialization_format_available(serialization_format: SerializationFormat) -> None:
+    """Raises a SerdesUsageError if the dependencies of the given format are not installed"""
+    check.inst_param(serialization_format, "serialization_format", SerializationFormat)
+    if serialization_format == SerializationFormat.BINARY:
+        _import_msgpack()
+
+
+def is_binary_serdes_payload(payload: Union[str, bytes]) -> bool:
+    return isinstance(payload, bytes) and payload.startswith(BINARY_SERDES_MAGIC)
+
+
+def serialize_value_to_bytes(val: Any, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> bytes:
+    """Serialize a value using the binary format. Values that the binary encoding can not
+    represent (integers wider than 64 bits) are written as UTF-8 encoded json instead, which
+    deserialize_payload reads just the same."""
+    msgpack = _import_msgpack()
+    packed = pack_inner_value(val, whitelist_map=whitelist_map, descent_path=_root(val))
+    try:
+        return _BINARY_SERDES_HEADER + msgpack.packb(packed, use_bin_type=True)
+    except OverflowError:
+        return seven.json.dumps(packed).encode("utf-8")
+
+
+def serialize_dagster_namedtuple_as(
+    nt: tuple, serialization_format: SerializationFormat
+) -> Union[str, bytes]:
+    """Serialize a whitelisted named tuple to a json encoded string or to binary payload bytes"""
+    check.tuple_param(nt, "nt")
+    if serialization_format == SerializationFormat.BINARY:
+        return serialize_value_to_bytes(nt)
+    return serialize_dagster_namedtuple(nt)
+
+
+def deserialize_payload(payload: Union[str, bytes], whitelist_map: WhitelistMap = _WHITELIST_MAP):
+    """Deserialize a json encoded string, UTF-8 encoded json bytes, or binary payload bytes in to
+    its original value, detecting the format from the payload."""
+    if isinstance(payload, str):
+        return _deserialize_json(payload, whitelist_map)
+
+    check.inst_param(payload, "payload", bytes)
+    if not payload.startswith(BINARY_SERDES_MAGIC):
+        return _deserialize_json(payload.decode("utf-8"), whitelist_map)
+
+    version = payload[len(BINARY_SERDES_MAGIC)] if len(payload) > len(BINARY_SERDES_MAGIC) else None
+    if version != BINARY_SERDES_VERSION:
+        raise DeserializationError(
+            f"Unsupported binary serialization format version {version}. This error can occur due "
+            "to version skew, verify processes are running expected versions."
+        )
+
+    msgpack = _import_msgpack()
+    try:
+        value = msgpack.unpackb(
+            payload[len(_BINARY_SERDES_HEADER) :], raw=False, strict_map_key=False
+        )
+    except ValueError as e:
+        # all msgpack unpacking errors are ValueErrors
+        raise DeserializationError(f"Could not unpack binary serialized payload: {e}") from e
+
+    return unpack_inner_value(value, whitelist_map=whitelist_map, descent_path=_root(value))
+
+
+def deserialize_dagster_namedtuple(payload: Union[str, bytes]) -> tuple:
+    """Deserialize a json encoded string or binary payload in to a whitelisted named tuple"""
+    dagster_namedtuple = deserialize_payload(payload)
+    if not isinstance(dagster_namedtuple, tuple):
+        raise DeserializationError(
+            f"Output of deserialized payload was not expected type of tuple. Received type {type(dagster_namedtuple)}."
+        )
+
+    return dagster_namedtuple
+
+
 ###################################################################################################
 # Back compat
 ###################################################################################################
@@ -1,15 +1,20 @@
 import sys
 from contextlib import contextmanager
 
+import mock
 import pytest
 
 from dagster import lambda_solid, pipeline, repository
+from dagster.api import snapshot_repository
+from dagster.api.list_repositories import sync_list_repositories_grpc
 from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
 from dagster.core.host_representation import (
     ExternalRepositoryData,
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.serdes import serialize_dagster_namedtuple
+from dagster.serdes.utils import hash_str
 
 from .utils import get_bar_repo_repository_location
 
@@ -28,6 +33,68 @@ def test_streaming_external_repositories_api_grpc():
         assert external_repository_data.name == "bar_repo"
 
 
+def test_external_repository_data_hashes_grpc():
+    with get_bar_repo_repository_location() as repository_location:
+        # the location already fetched the repository data, so the server reports its hash
+        data_hashes = sync_list_repositories_grpc(repository_location.client).repository_data_hashes
+        assert set(data_hashes.keys()) == {"bar_repo"}
+
+        external_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location, data_hashes
+        )
+        assert data_hashes["bar_repo"] == hash_str(
+            serialize_dagster_namedtuple(external_repo_datas["bar_repo"])
+        )
+
+        # data that was downloaded with the same hash is not downloaded again
+        with mock.patch.object(
+            repository_location.client, "streaming_external_repository"
+        ) as streaming_mock:
+            cached_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+                repository_location.client, repository_location, data_hashes
+            )
+            assert not streaming_mock.called
+            assert cached_repo_datas["bar_repo"] is external_repo_datas["bar_repo"]
+
+
+def test_external_repository_data_cache_bounds():
+    data_a, data_b, data_c = object(), object(), object()
+    with mock.patch.object(snapshot_repository, "MAX_CACHED_EXTERNAL_REPOSITORY_DATA_BYTES", 10):
+        snapshot_repository._cache_external_repository_data(  # pylint: disable=protected-access
+            "location", "repo_a", "hash_a", data_a, 4
+        )
+        assert _get_cached_data("location", "repo_a", "hash_a") is data_a
+        # cached per location
+        assert _get_cached_data("other_location", "repo_a", "hash_a") is None
+
+        # only the latest data of each repository is kept
+        snapshot_repository._cache_external_repository_data(  # pylint: disable=protected-access
+            "location", "repo_a", "new_hash_a", data_b, 4
+        )
+        assert _get_cached_data("location", "repo_a", "hash_a") is None
+        assert _get_cached_data("location", "repo_a", "new_hash_a") is data_b
+
+        # the least recently used data is evicted once the cache holds too many bytes
+        snapshot_repository._cache_external_repository_data(  # pylint: disable=protected-access
+            "location", "repo_c", "hash_c", data_c, 8
+        )
+        assert _get_cached_data("location", "repo_a", "new_hash_a") is None
+        assert _get_cached_data("location", "repo_c", "hash_c") is data_c
+
+        # data that is too large on its own is not cached
+        snapshot_repository._cache_external_repository_data(  # pylint: disable=protected-access
+            "location", "repo_c", "new_hash_c", data_c, 11
+        )
+        assert _get_cached_data("location", "repo_c", "new_hash_c") is None
+
+
+def _get_cached_data(location_name, repository_name, data_hash):
+    # pylint: disable=protected-access
+    return snapshot_repository._get_cached_external_repository_data(
+        location_name, repository_name, data_hash
+    )
+
+
 @lambda_solid
 def do_something():
     return 1
@@ -3,7 +3,7 @@
 from dagster.core.test_utils import instance_for_test
 from dagster.seven import get_current_datetime_in_utc
 
-from .utils import get_bar_repo_handle
+from .utils import get_bar_repo_handle, get_bar_repo_repository_location
 
 
 def test_external_schedule_execution_data_api_grpc():
@@ -51,3 +51,26 @@ def test_include_execution_time_grpc():
             to_launch = execution_data.run_requests[0]
             assert to_launch.run_config == {"passed_in_time": execution_time.isoformat()}
             assert to_launch.tags == {"dagster/schedule_name": "foo_schedule_echo_time"}
+
+
+def test_external_schedule_batch_execution_data_grpc():
+    with instance_for_test() as instance:
+        with get_bar_repo_repository_location() as repository_location:
+            repository_handle = repository_location.get_repository("bar_repo").handle
+            execution_times = [
+                get_current_datetime_in_utc().subtract(minutes=1),
+                get_current_datetime_in_utc(),
+            ]
+            results = repository_location.get_external_schedule_batch_execution_data(
+                instance,
+                repository_handle,
+                "foo_schedule_echo_time",
+                execution_times,
+            )
+
+            assert len(results) == 2
+            for execution_time, execution_data in zip(execution_times, results):
+                assert isinstance(execution_data, ScheduleExecutionData)
+                assert execution_data.run_requests[0].run_config == {
+                    "passed_in_time": execution_time.isoformat()
+                }
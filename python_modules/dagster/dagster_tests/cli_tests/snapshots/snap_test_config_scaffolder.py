@@ -10,7 +10,11 @@
     'execution': {
         'in_process': {
             'config': {
+                'asyncio': {
+                    'max_concurrent': 0
+                },
                 'marker_to_close': '',
+                'release_outputs': True,
                 'retries': {
                     'disabled': {
                     },
@@ -28,6 +32,14 @@
                     'enabled': {
                     }
                 },
+                'reuse_processes': {
+                    'disabled': {
+                    },
+                    'enabled': {
+                        'max_process_memory_mb': 0,
+                        'max_steps_per_process': 0
+                    }
+                },
                 'start_method': {
                     'forkserver': {
                         'preload_modules': [
@@ -35,6 +47,13 @@
                     },
                     'spawn': {
                     }
+                },
+                'step_ordering': {
+                    'critical_path': {
+                        'history_run_limit': 0
+                    },
+                    'priority': {
+                    }
                 }
             }
         }
@@ -68,7 +87,11 @@
     'execution': {
         'in_process': {
             'config': {
+                'asyncio': {
+                    'max_concurrent': 0
+                },
                 'marker_to_close': '',
+                'release_outputs': True,
                 'retries': {
                     'disabled': {
                     },
@@ -86,6 +109,14 @@
                     'enabled': {
                     }
                 },
+                'reuse_processes': {
+                    'disabled': {
+                    },
+                    'enabled': {
+                        'max_process_memory_mb': 0,
+                        'max_steps_per_process': 0
+                    }
+                },
                 'start_method': {
                     'forkserver': {
                         'preload_modules': [
@@ -93,6 +124,13 @@
                     },
                     'spawn': {
                     }
+                },
+                'step_ordering': {
+                    'critical_path': {
+                        'history_run_limit': 0
+                    },
+                    'priority': {
+                    }
                 }
             }
         }
@@ -126,7 +164,11 @@
     'execution': {
         'in_process': {
             'config': {
+                'asyncio': {
+                    'max_concurrent': 0
+                },
                 'marker_to_close': '',
+                'release_outputs': True,
                 'retries': {
                     'disabled': {
                     },
@@ -144,6 +186,14 @@
                     'enabled': {
                     }
                 },
+                'reuse_processes': {
+                    'disabled': {
+                    },
+                    'enabled': {
+                        'max_process_memory_mb': 0,
+                        'max_steps_per_process': 0
+                    }
+                },
                 'start_method': {
                     'forkserver': {
                         'preload_modules': [
@@ -151,6 +201,13 @@
                     },
                     'spawn': {
                     }
+                },
+                'step_ordering': {
+                    'critical_path': {
+                        'history_run_limit': 0
+                    },
+                    'priority': {
+                    }
                 }
             }
         }
@@ -0,0 +1,99 @@
+"""
+Benchmarks scheduling steps through ActiveExecution for plans of 10k, 50k and 100k steps, in the
+same way the multiprocess executor does: requesting the steps to execute on every tick, with a
+bounded number of steps in flight.
+
+cd python_modules/dagster && python -m dagster_tests.core_tests.execution_plan_tests.active_execution_benchmarks
+"""
+
+import time
+
+from dagster import DynamicOut, DynamicOutput, job, op
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.outputs import StepOutputHandle
+from dagster.core.execution.plan.state import KnownExecutionState
+from dagster.core.execution.retries import RetryMode
+
+PLAN_SIZES = [10_000, 50_000, 100_000]
+
+
+@op(out=DynamicOut())
+def emit():
+    yield DynamicOutput(0, mapping_key="0")
+
+
+@op
+def double(num):
+    return num * 2
+
+
+@op
+def add_one(num):
+    return num + 1
+
+
+@op
+def total(nums):
+    return sum(nums)
+
+
+@job
+def fan_out_job():
+    total(emit().map(lambda num: add_one(double(num))).collect())
+
+
+def build_plan(num_steps: int):
+    # every mapping key adds a double and an add_one step
+    mapping_keys = [str(i) for i in range((num_steps - 2) // 2)]
+    known_state = KnownExecutionState(
+        previous_retry_attempts={}, dynamic_mappings={"emit": {"result": mapping_keys}}
+    )
+    return create_execution_plan(fan_out_job, known_state=known_state), mapping_keys
+
+
+def schedule_plan(execution_plan, mapping_keys, max_concurrent: int) -> int:
+    """Returns the number of ticks taken to execute the plan, one per completed step"""
+    ticks = 0
+    with execution_plan.start(retry_mode=RetryMode.DISABLED) as active_execution:
+        in_flight = []
+        while not active_execution.is_complete:
+            ticks += 1
+            in_flight.extend(
+                active_execution.get_steps_to_execute(limit=max_concurrent - len(in_flight))
+            )
+
+            # complete the step that has been in flight the longest
+            step = in_flight.pop(0)
+            for step_output in step.step_outputs:
+                for mapping_key in mapping_keys if step_output.is_dynamic else [None]:
+                    active_execution.mark_step_produced_output(
+                        StepOutputHandle(step.key, step_output.name, mapping_key)
+                    )
+            active_execution.mark_success(step.key)
+
+            list(active_execution.get_steps_to_skip())
+            list(active_execution.get_steps_to_abandon())
+
+    return ticks
+
+
+def run_active_execution_benchmarks(max_concurrent: int = 8):
+    header = f"{'steps':>8} {'plan (s)':>9} {'schedule (s)':>13} {'us/tick':>8}"
+    print(header)  # pylint: disable=print-call
+    for num_steps in PLAN_SIZES:
+        start = time.perf_counter()
+        execution_plan, mapping_keys = build_plan(num_steps)
+        plan_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ticks = schedule_plan(execution_plan, mapping_keys, max_concurrent)
+        schedule_seconds = time.perf_counter() - start
+
+        print(  # pylint: disable=print-call
+            f"{ticks:>8} {plan_seconds:>9.2f} "
+            f"{schedule_seconds:>13.2f} {schedule_seconds / ticks * 1_000_000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run_active_execution_benchmarks()
@@ -0,0 +1,154 @@
+"""
+Simulates the makespan of plans executed with a bounded number of concurrent steps, when ready
+steps are started in priority order and in critical path order.
+
+Each plan is modelled on the shape of a job seen in practice, and every step takes the duration
+recorded for its op. The simulation drives ActiveExecution in the same way an executor does.
+
+cd python_modules/dagster && python -m dagster_tests.core_tests.execution_plan_tests.step_ordering_benchmarks
+"""
+
+import heapq
+import itertools
+import random
+
+from dagster import (
+    DependencyDefinition,
+    GraphDefinition,
+    In,
+    MultiDependencyDefinition,
+    Nothing,
+    check,
+    op,
+)
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.outputs import StepOutputHandle
+from dagster.core.execution.retries import RetryMode
+from dagster.core.execution.step_ordering import (
+    critical_path_sort_key_fn,
+    get_critical_path_lengths,
+    priority_sort_key,
+)
+
+MAX_CONCURRENT = 8
+
+
+def _noop_op(name):
+    @op(name=name, ins={"after": In(Nothing)})
+    def _op():
+        pass
+
+    return _op
+
+
+def build_job(name, upstream_ops):
+    """Builds a job from a dict of op name to the names of the ops it depends on"""
+    return GraphDefinition(
+        name=name,
+        node_defs=[_noop_op(op_name) for op_name in upstream_ops],
+        dependencies={
+            op_name: {
+                "after": MultiDependencyDefinition(
+                    [DependencyDefinition(upstream) for upstream in upstreams]
+                )
+            }
+            for op_name, upstreams in upstream_ops.items()
+            if upstreams
+        },
+    ).to_job()
+
+
+def wide_etl_plan():
+    """Many short ingestion ops next to a few long chains of transformations, all loaded into a
+    single report at the end. Ingestion ops are named so that they sort before the chains.
+    """
+    upstream_ops = {}
+    durations = {}
+    for i in range(200):
+        upstream_ops[f"a_ingest_{i}"] = []
+        durations[f"a_ingest_{i}"] = 1.0
+
+    for chain in range(4):
+        for i in range(10):
+            name = f"transform_{chain}_{i}"
+            upstream_ops[name] = [f"transform_{chain}_{i - 1}"] if i else []
+            durations[name] = 10.0
+
+    upstream_ops["report"] = list(upstream_ops.keys())
+    durations["report"] = 5.0
+    return build_job("wide_etl", upstream_ops), durations
+
+
+def layered_plan(num_layers=20, layer_width=50, seed=0):
+    """Layers of ops that each depend on a few ops of the previous layer, with long-tailed
+    durations.
+    """
+    rng = random.Random(seed)
+    upstream_ops = {}
+    durations = {}
+    for layer in range(num_layers):
+        for i in range(layer_width):
+            name = f"op_{layer}_{i}"
+            upstream_ops[name] = (
+                [f"op_{layer - 1}_{j}" for j in rng.sample(range(layer_width), 3)] if layer else []
+            )
+            durations[name] = rng.lognormvariate(0, 1.5)
+
+    return build_job("layered", upstream_ops), durations
+
+
+def simulate_makespan(execution_plan, durations, sort_key_fn, max_concurrent):
+    clock = 0.0
+    sequence = itertools.count()
+    running = []
+    with execution_plan.start(
+        retry_mode=RetryMode.DISABLED, sort_key_fn=sort_key_fn
+    ) as active_execution:
+        while not active_execution.is_complete:
+            if len(running) < max_concurrent:
+                for step in active_execution.get_steps_to_execute(
+                    limit=max_concurrent - len(running)
+                ):
+                    finish_time = clock + durations[step.solid_handle.to_string()]
+                    heapq.heappush(running, (finish_time, next(sequence), step))
+
+            check.invariant(running, "Simulation stalled with no steps running")
+            clock, _, step = heapq.heappop(running)
+            for step_output in step.step_outputs:
+                active_execution.mark_step_produced_output(
+                    StepOutputHandle(step.key, step_output.name)
+                )
+            active_execution.mark_success(step.key)
+
+    return clock
+
+
+def run_step_ordering_benchmarks(max_concurrent=MAX_CONCURRENT):
+    print(  # pylint: disable=print-call
+        f"{'plan':>10} {'steps':>6} {'lower bound':>12} {'priority':>9} {'critical path':>14}"
+    )
+    for plan_fn in [wide_etl_plan, layered_plan]:
+        job_def, durations = plan_fn()
+        execution_plan = create_execution_plan(job_def)
+
+        lower_bound = max(
+            max(get_critical_path_lengths(execution_plan, durations).values()),
+            sum(durations.values()) / max_concurrent,
+        )
+        priority_makespan = simulate_makespan(
+            execution_plan, durations, priority_sort_key, max_concurrent
+        )
+        critical_path_makespan = simulate_makespan(
+            execution_plan,
+            durations,
+            critical_path_sort_key_fn(execution_plan, durations),
+            max_concurrent,
+        )
+        print(  # pylint: disable=print-call
+            f"{job_def.name:>10} {len(durations):>6} {lower_bound:>12.1f} "
+            f"{priority_makespan:>9.1f} {critical_path_makespan:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run_step_ordering_benchmarks()
@@ -1,14 +1,27 @@
+import random
+import time
+
 import pytest
 
 from dagster import (
     DagsterInstance,
+    DependencyDefinition,
+    DynamicOut,
+    DynamicOutput,
+    InputDefinition,
     Int,
+    MultiDependencyDefinition,
+    Nothing,
     Output,
     OutputDefinition,
+    PipelineDefinition,
+    SolidDefinition,
     check,
     composite_solid,
     execute_pipeline,
+    job,
     lambda_solid,
+    op,
     pipeline,
     solid,
 )
@@ -18,8 +31,9 @@
     DagsterInvariantViolationError,
     DagsterUnknownStepStateError,
 )
+from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.execution.api import create_execution_plan, execute_plan
-from dagster.core.execution.plan.outputs import StepOutputHandle
+from dagster.core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster.core.execution.plan.plan import should_skip_step
 from dagster.core.execution.retries import RetryMode
 from dagster.core.storage.pipeline_run import PipelineRun
@@ -122,6 +136,160 @@ def test_active_execution_plan():
         assert active_execution.is_complete
 
 
+def _execute_step(active_execution, step_key):
+    active_execution.mark_step_produced_output(StepOutputHandle(step_key, "result"))
+    active_execution.mark_success(step_key)
+
+
+def test_active_execution_release_outputs():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    with plan.start(retry_mode=RetryMode.DISABLED, release_outputs=True) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["return_two"]
+        _execute_step(active_execution, "return_two")
+        assert active_execution.get_outputs_to_release() == []
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["add_three", "mult_three"]
+        _execute_step(active_execution, "add_three")
+        assert active_execution.get_outputs_to_release() == []
+
+        _execute_step(active_execution, "mult_three")
+        assert active_execution.get_outputs_to_release() == [StepOutputHandle("return_two")]
+
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["adder"]
+        _execute_step(active_execution, "adder")
+
+        # the outputs of the last step are kept
+        assert set(active_execution.get_outputs_to_release()) == {
+            StepOutputHandle("add_three"),
+            StepOutputHandle("mult_three"),
+        }
+        assert active_execution.is_complete
+
+    with plan.start(retry_mode=RetryMode.DISABLED) as active_execution:
+        while not active_execution.is_complete:
+            for step in active_execution.get_steps_to_execute():
+                _execute_step(active_execution, step.key)
+            assert active_execution.get_outputs_to_release() == []
+
+
+def test_active_execution_release_outputs_step_subset():
+    pipeline_def = define_diamond_pipeline()
+
+    plan = create_execution_plan(pipeline_def, step_keys_to_execute=["return_two", "add_three"])
+    with plan.start(retry_mode=RetryMode.DISABLED, release_outputs=True) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["return_two"]
+        _execute_step(active_execution, "return_two")
+
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["add_three"]
+        _execute_step(active_execution, "add_three")
+
+        # mult_three also consumes the output of return_two, and may be executed from this run
+        assert active_execution.get_outputs_to_release() == []
+        assert active_execution.is_complete
+
+    plan = create_execution_plan(
+        pipeline_def, step_keys_to_execute=["return_two", "add_three", "mult_three"]
+    )
+    with plan.start(retry_mode=RetryMode.DISABLED, release_outputs=True) as active_execution:
+        active_execution.get_steps_to_execute()
+        _execute_step(active_execution, "return_two")
+
+        active_execution.get_steps_to_execute()
+        _execute_step(active_execution, "add_three")
+        _execute_step(active_execution, "mult_three")
+
+        # only the outputs that no unselected step consumes are released
+        assert active_execution.get_outputs_to_release() == [StepOutputHandle("return_two")]
+        assert active_execution.is_complete
+
+
+def test_active_execution_release_outputs_failure():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    with plan.start(retry_mode=RetryMode.DISABLED, release_outputs=True) as active_execution:
+        active_execution.get_steps_to_execute()
+        _execute_step(active_execution, "return_two")
+
+        active_execution.get_steps_to_execute()
+        _execute_step(active_execution, "add_three")
+        active_execution.mark_failed("mult_three")
+
+        # the inputs of failed steps are kept, so that the run can be re-executed from failure
+        assert active_execution.get_outputs_to_release() == []
+
+        for step in active_execution.get_steps_to_abandon():
+            active_execution.mark_abandoned(step.key)
+
+        assert active_execution.get_outputs_to_release() == []
+        assert active_execution.is_complete
+
+
+def test_active_execution_release_dynamic_outputs():
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(2):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def one():
+        return 1
+
+    @op
+    def double(num):
+        return num * 2
+
+    @op
+    def total(nums):
+        return sum(nums)
+
+    @op
+    def add(num, total_num):
+        return num + total_num
+
+    @job
+    def dynamic_job():
+        num = one()
+        add(num, total(emit().map(lambda mapped: double(add(num, mapped))).collect()))
+
+    plan = create_execution_plan(dynamic_job)
+
+    with plan.start(retry_mode=RetryMode.DISABLED, release_outputs=True) as active_execution:
+        released = []
+        while not active_execution.is_complete:
+            for step in active_execution.get_steps_to_execute():
+                for mapping_key in ["0", "1"] if step.key == "emit" else [None]:
+                    active_execution.handle_event(
+                        DagsterEvent(
+                            DagsterEventType.STEP_OUTPUT.value,
+                            "dynamic_job",
+                            step_handle=step.handle,
+                            event_specific_data=StepOutputData(
+                                StepOutputHandle(step.key, "result", mapping_key)
+                            ),
+                        )
+                    )
+                active_execution.mark_success(step.key)
+                # resolves the steps mapped from emit's output, like the executors do
+                assert active_execution.get_steps_to_skip() == []
+                released.append((step.key, active_execution.get_outputs_to_release()))
+
+        released_handles = [handle for _, handles in released for handle in handles]
+        assert set(released_handles) == {
+            StepOutputHandle("emit", "result", "0"),
+            StepOutputHandle("emit", "result", "1"),
+            StepOutputHandle("add[0]"),
+            StepOutputHandle("add[1]"),
+            StepOutputHandle("double[0]"),
+            StepOutputHandle("double[1]"),
+            StepOutputHandle("one"),
+            StepOutputHandle("total"),
+        }
+        # the output of one is held until the steps mapped from emit's output that load it succeed
+        assert StepOutputHandle("one") in dict(released)["add_2"]
+
+
 def test_failing_execution_plan():
     pipeline_def = define_diamond_pipeline()
     plan = create_execution_plan(pipeline_def)
@@ -342,6 +510,267 @@ def priorities():
         _ = [active_execution.mark_skipped(step.key) for step in steps]
 
 
+def test_active_execution_skip_propagation():
+    @solid(output_defs=[OutputDefinition(is_required=False)])
+    def maybe(_):
+        if False:  # pylint: disable=using-constant-test
+            yield Output(1)
+
+    @solid
+    def first(_, num):
+        return num
+
+    @solid
+    def second(_, num):
+        return num
+
+    @solid
+    def other(_):
+        return 1
+
+    @solid
+    def combine(_, left, right):
+        return left + right
+
+    @pipeline
+    def skip_pipeline():
+        combine(left=second(first(maybe())), right=other())
+
+    plan = create_execution_plan(skip_pipeline)
+
+    with plan.start(retry_mode=RetryMode.DISABLED) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert {step.key for step in steps} == {"maybe", "other"}
+
+        # maybe yields no output, so everything downstream of it is skipped one step at a time
+        active_execution.mark_success("maybe")
+        _execute_step(active_execution, "other")
+
+        assert active_execution.get_steps_to_execute() == []
+        for step_key in ["first", "second", "combine"]:
+            assert [step.key for step in active_execution.get_steps_to_skip()] == [step_key]
+            assert active_execution.get_steps_to_execute() == []
+            active_execution.mark_skipped(step_key)
+
+        assert active_execution.get_steps_to_skip() == []
+        assert active_execution.is_complete
+
+
+def test_active_execution_abandon_propagation():
+    @solid
+    def fails(_):
+        return 1
+
+    @solid
+    def downstream_one(_, num):
+        return num
+
+    @solid
+    def downstream_two(_, num):
+        return num
+
+    @solid
+    def independent(_):
+        return 1
+
+    @solid
+    def after_independent(_, num):
+        return num
+
+    @pipeline
+    def abandon_pipeline():
+        downstream_two(downstream_one(fails()))
+        after_independent(independent())
+
+    plan = create_execution_plan(abandon_pipeline)
+
+    with plan.start(retry_mode=RetryMode.DISABLED) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert {step.key for step in steps} == {"fails", "independent"}
+
+        active_execution.mark_failed("fails")
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["downstream_one"]
+        active_execution.mark_abandoned("downstream_one")
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["downstream_two"]
+        active_execution.mark_abandoned("downstream_two")
+        assert active_execution.get_steps_to_abandon() == []
+
+        # the failure does not hold up steps that do not depend on it
+        assert not active_execution.is_complete
+        _execute_step(active_execution, "independent")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "after_independent"
+        ]
+        _execute_step(active_execution, "after_independent")
+
+        assert active_execution.is_complete
+
+
+def test_retries_active_execution_downstream_waits():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    with plan.start(retry_mode=RetryMode.ENABLED) as active_execution:
+        active_execution.get_steps_to_execute()
+        _execute_step(active_execution, "return_two")
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["add_three", "mult_three"]
+
+        active_execution.mark_up_for_retry("add_three")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["add_three"]
+
+        # adder waits on the retried step, even once its other upstream step succeeded
+        _execute_step(active_execution, "mult_three")
+        assert active_execution.get_steps_to_execute() == []
+
+        # retries with a wait are executable again once the wait is over
+        active_execution.mark_up_for_retry("add_three", at_time=time.time())
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["add_three"]
+        assert active_execution.get_steps_to_execute() == []
+
+        _execute_step(active_execution, "add_three")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["adder"]
+        _execute_step(active_execution, "adder")
+
+        assert active_execution.retry_state.get_attempt_count("add_three") == 2
+        assert active_execution.is_complete
+
+
+def test_active_execution_dynamic_mapping():
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(2):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def echo(num):
+        return num
+
+    @op
+    def double(num):
+        return num * 2
+
+    @op
+    def total(nums):
+        return sum(nums)
+
+    @job
+    def dynamic_job():
+        total(emit().map(lambda num: double(echo(num))).collect())
+
+    plan = create_execution_plan(dynamic_job)
+
+    with plan.start(retry_mode=RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["emit"]
+        for mapping_key in ["0", "1"]:
+            active_execution.handle_event(
+                DagsterEvent(
+                    DagsterEventType.STEP_OUTPUT.value,
+                    "dynamic_job",
+                    step_handle=plan.get_step_by_key("emit").handle,
+                    event_specific_data=StepOutputData(
+                        StepOutputHandle("emit", "result", mapping_key)
+                    ),
+                )
+            )
+        active_execution.mark_success("emit")
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["echo[0]", "echo[1]"]
+
+        # each mapped step only waits on the step mapped from the same output
+        _execute_step(active_execution, "echo[0]")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["double[0]"]
+
+        active_execution.mark_failed("echo[1]")
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["double[1]"]
+        active_execution.mark_abandoned("double[1]")
+
+        # the collecting step is abandoned without waiting on the mapped steps still in flight
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["total"]
+        active_execution.mark_abandoned("total")
+        assert not active_execution.is_complete
+
+        _execute_step(active_execution, "double[0]")
+        assert active_execution.get_steps_to_execute() == []
+
+        assert active_execution.is_complete
+
+
+def _define_layered_pipeline(num_layers, width, seed):
+    rng = random.Random(seed)
+
+    solid_defs = []
+    dependencies = {}
+    for layer in range(num_layers):
+        for i in range(width):
+            name = "solid_{layer}_{i}".format(layer=layer, i=i)
+            solid_defs.append(
+                SolidDefinition(
+                    name=name,
+                    input_defs=[InputDefinition("after", Nothing)],
+                    output_defs=[OutputDefinition(Nothing)],
+                    compute_fn=lambda *_args: None,
+                    tags={"priority": str(rng.randint(-2, 2))},
+                )
+            )
+            if layer:
+                upstream = rng.sample(range(width), rng.randint(1, 3))
+                dependencies[name] = {
+                    "after": MultiDependencyDefinition(
+                        [
+                            DependencyDefinition("solid_{layer}_{j}".format(layer=layer - 1, j=j))
+                            for j in upstream
+                        ]
+                    )
+                }
+
+    return PipelineDefinition(
+        name="layered_pipeline", solid_defs=solid_defs, dependencies=dependencies
+    )
+
+
+def _expected_execution_order(plan, sort_key_fn, limit):
+    """The steps vended by each call to get_steps_to_execute when every vended step succeeds
+    before the next call, as ActiveExecution ordered them when it rechecked every pending step
+    on each call"""
+    pending = plan.get_executable_step_deps()
+    executable = []
+    succeeded = set()
+    order = []
+    while pending or executable:
+        for step_key, deps in list(pending.items()):
+            if deps.issubset(succeeded):
+                executable.append(step_key)
+                del pending[step_key]
+
+        batch = sorted(executable, key=lambda key: sort_key_fn(plan.get_step_by_key(key)))
+        batch = batch[:limit] if limit else batch
+        for step_key in batch:
+            executable.remove(step_key)
+        succeeded.update(batch)
+        order.append(batch)
+
+    return order
+
+
+@pytest.mark.parametrize("limit", [None, 1, 3])
+def test_active_execution_ordering(limit):
+    sort_key_fn = lambda step: int(step.tags.get("priority", 0)) * -1
+
+    plan = create_execution_plan(_define_layered_pipeline(num_layers=5, width=8, seed=limit))
+
+    order = []
+    with plan.start(RetryMode.DISABLED, sort_key_fn) as active_execution:
+        while not active_execution.is_complete:
+            steps = active_execution.get_steps_to_execute(limit=limit)
+            for step in steps:
+                _execute_step(active_execution, step.key)
+            order.append([step.key for step in steps])
+
+    assert order == _expected_execution_order(plan, sort_key_fn, limit)
+
+
 def test_executor_not_created_for_execute_plan():
     instance = DagsterInstance.ephemeral()
     pipe = define_diamond_pipeline()
@@ -1,15 +1,26 @@
+import mock
+
 from dagster import (
     DependencyDefinition,
+    DynamicOutput,
+    DynamicOutputDefinition,
     InputDefinition,
     Int,
     Output,
     OutputDefinition,
     PipelineDefinition,
     lambda_solid,
+    pipeline,
     solid,
 )
 from dagster.core.definitions.pipeline_base import InMemoryPipeline
-from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.api import (
+    create_execution_plan,
+    create_step_execution_plan,
+    execute_plan,
+)
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.instance import DagsterInstance
 
 
@@ -114,3 +125,94 @@ def has_tag(context):
         find_events(step_events, event_type="STEP_OUTPUT")[0].logging_tags["pipeline_tags"]
         == "{'foo': 'bar'}"
     )
+
+
+@solid(output_defs=[DynamicOutputDefinition()])
+def emit(_):
+    for i in range(3):
+        yield DynamicOutput(value=i, mapping_key=str(i))
+
+
+@solid
+def double(_, num):
+    return num * 2
+
+
+@solid
+def total(_, nums):
+    return sum(nums)
+
+
+@pipeline
+def dynamic_pipeline():
+    total(emit().map(double).collect())
+
+
+def test_create_step_execution_plan_from_snapshot():
+    instance = DagsterInstance.ephemeral()
+    execution_plan = create_execution_plan(dynamic_pipeline)
+    pipeline_run = instance.create_run_for_pipeline(
+        pipeline_def=dynamic_pipeline, execution_plan=execution_plan
+    )
+    snapshot_id = pipeline_run.execution_plan_snapshot_id
+    snapshot = instance.get_execution_plan_snapshot(snapshot_id)
+    known_state = KnownExecutionState(
+        previous_retry_attempts={}, dynamic_mappings={"emit": {"result": ["0", "1", "2"]}}
+    )
+
+    for step_keys in [["emit"], ["double[1]"], ["total"]]:
+        rebuilt_plan = create_step_execution_plan(
+            InMemoryPipeline(dynamic_pipeline),
+            pipeline_run,
+            step_keys_to_execute=step_keys,
+            known_state=known_state,
+            execution_plan_snapshot=snapshot,
+            execution_plan_snapshot_id=snapshot_id,
+        )
+        built_plan = create_execution_plan(
+            dynamic_pipeline, step_keys_to_execute=step_keys, known_state=known_state
+        )
+
+        assert rebuilt_plan.step_keys_to_execute == built_plan.step_keys_to_execute == step_keys
+        assert rebuilt_plan.known_state == known_state
+        assert dict(rebuilt_plan.get_all_step_deps()) == dict(built_plan.get_all_step_deps())
+        assert [
+            step_input.source
+            for step_input in rebuilt_plan.get_step_by_key(step_keys[0]).step_inputs
+        ] == [
+            step_input.source for step_input in built_plan.get_step_by_key(step_keys[0]).step_inputs
+        ]
+
+
+def test_create_step_execution_plan_snapshot_id():
+    instance = DagsterInstance.ephemeral()
+    pipeline_def = define_two_int_pipeline()
+    execution_plan = create_execution_plan(pipeline_def)
+    pipeline_run = instance.create_run_for_pipeline(
+        pipeline_def=pipeline_def, execution_plan=execution_plan
+    )
+    snapshot = instance.get_execution_plan_snapshot(pipeline_run.execution_plan_snapshot_id)
+
+    with mock.patch.object(
+        ExecutionPlan, "rebuild_from_snapshot", wraps=ExecutionPlan.rebuild_from_snapshot
+    ) as rebuild_from_snapshot:
+        step_plan = create_step_execution_plan(
+            InMemoryPipeline(pipeline_def),
+            pipeline_run,
+            step_keys_to_execute=["add_one"],
+            execution_plan_snapshot=snapshot,
+            execution_plan_snapshot_id=pipeline_run.execution_plan_snapshot_id,
+        )
+        assert step_plan.step_keys_to_execute == ["add_one"]
+        assert rebuild_from_snapshot.call_count == 1
+
+        # not the snapshot persisted for the run, so the plan is built from the definition
+        step_plan = create_step_execution_plan(
+            InMemoryPipeline(pipeline_def),
+            pipeline_run,
+            step_keys_to_execute=["add_one"],
+            execution_plan_snapshot=snapshot,
+            execution_plan_snapshot_id="not_the_run_snapshot_id",
+        )
+        assert step_plan.step_keys_to_execute == ["add_one"]
+        assert rebuild_from_snapshot.call_count == 1
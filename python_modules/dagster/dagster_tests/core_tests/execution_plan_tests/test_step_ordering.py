@@ -0,0 +1,191 @@
+import pytest
+
+from dagster import DynamicOut, DynamicOutput, job, op
+from dagster.check import CheckError
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.outputs import StepOutputHandle
+from dagster.core.execution.plan.state import KnownExecutionState
+from dagster.core.execution.retries import RetryMode
+from dagster.core.execution.step_ordering import (
+    CriticalPathStepOrdering,
+    PriorityStepOrdering,
+    StepOrdering,
+    critical_path_sort_key_fn,
+    get_critical_path_lengths,
+    get_historical_step_durations,
+)
+from dagster.core.test_utils import instance_for_test
+
+
+@op
+def chain_start():
+    return 1
+
+
+@op
+def chain_middle(num):
+    return num
+
+
+@op
+def chain_end(num):
+    return num
+
+
+@op
+def leaf():
+    return 1
+
+
+@op(tags={"dagster/priority": "1"})
+def urgent_leaf():
+    return 1
+
+
+@job
+def wide_job():
+    chain_end(chain_middle(chain_start()))
+    leaf()
+    urgent_leaf()
+
+
+@op(out=DynamicOut())
+def emit():
+    for i in range(3):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op
+def double(num):
+    return num * 2
+
+
+@op
+def total(nums):
+    return sum(nums)
+
+
+@job
+def dynamic_job():
+    total(emit().map(double).collect())
+
+
+def test_critical_path_lengths():
+    plan = create_execution_plan(wide_job)
+
+    assert get_critical_path_lengths(plan, {}) == {
+        "chain_start": 3.0,
+        "chain_middle": 2.0,
+        "chain_end": 1.0,
+        "leaf": 1.0,
+        "urgent_leaf": 1.0,
+    }
+
+    # steps without a recorded duration are weighted by the average recorded duration
+    assert get_critical_path_lengths(plan, {"chain_start": 1.0, "leaf": 5.0}) == {
+        "chain_start": 7.0,
+        "chain_middle": 6.0,
+        "chain_end": 3.0,
+        "leaf": 5.0,
+        "urgent_leaf": 3.0,
+    }
+
+
+def test_critical_path_lengths_dynamic():
+    plan = create_execution_plan(dynamic_job)
+    durations = {"emit": 1.0, "double": 10.0, "total": 2.0}
+    assert get_critical_path_lengths(plan, durations) == {
+        "emit": 13.0,
+        "double": 12.0,
+        "total": 2.0,
+    }
+
+    resolved_plan = create_execution_plan(
+        dynamic_job,
+        known_state=KnownExecutionState(
+            previous_retry_attempts={}, dynamic_mappings={"emit": {"result": ["0", "1"]}}
+        ),
+    )
+    # steps resolved from dynamic outputs are weighted by the duration of their op
+    assert get_critical_path_lengths(resolved_plan, durations) == {
+        "emit": 13.0,
+        "double": 12.0,
+        "total": 2.0,
+    }
+
+
+CHAIN_DURATIONS = {"chain_start": 1.0, "chain_middle": 1.0, "chain_end": 1.0, "urgent_leaf": 1.0}
+
+
+def _ready_step_keys(plan, sort_key_fn):
+    return [step.key for step in sorted(plan.get_steps_to_execute_by_level()[0], key=sort_key_fn)]
+
+
+def test_critical_path_ordering():
+    plan = create_execution_plan(wide_job)
+
+    assert _ready_step_keys(plan, PriorityStepOrdering().get_sort_key_fn(None, plan)) == [
+        "urgent_leaf",
+        "chain_start",
+        "leaf",
+    ]
+
+    # the priority tag takes precedence over the length of the critical path
+    assert _ready_step_keys(
+        plan, critical_path_sort_key_fn(plan, {**CHAIN_DURATIONS, "leaf": 2.0})
+    ) == [
+        "urgent_leaf",
+        "chain_start",
+        "leaf",
+    ]
+    assert _ready_step_keys(
+        plan, critical_path_sort_key_fn(plan, {**CHAIN_DURATIONS, "leaf": 10.0})
+    ) == [
+        "urgent_leaf",
+        "leaf",
+        "chain_start",
+    ]
+
+
+def test_critical_path_active_execution():
+    plan = create_execution_plan(wide_job)
+
+    with plan.start(
+        retry_mode=RetryMode.DISABLED,
+        sort_key_fn=critical_path_sort_key_fn(plan, {**CHAIN_DURATIONS, "leaf": 0.5}),
+    ) as active_execution:
+        step_keys = []
+        while not active_execution.is_complete:
+            step = active_execution.get_steps_to_execute(limit=1)[0]
+            step_keys.append(step.key)
+            active_execution.mark_step_produced_output(StepOutputHandle(step.key, "result"))
+            active_execution.mark_success(step.key)
+
+    assert step_keys == ["urgent_leaf", "chain_start", "chain_middle", "chain_end", "leaf"]
+
+
+def test_historical_step_durations():
+    with instance_for_test() as instance:
+        assert get_historical_step_durations(instance, "dynamic_job", 5) == {}
+
+        result = dynamic_job.execute_in_process(instance=instance)
+        durations = get_historical_step_durations(instance, "dynamic_job", 5)
+        assert set(durations.keys()) == {"emit", "double", "total"}
+        assert all(duration >= 0 for duration in durations.values())
+
+        assert (
+            get_historical_step_durations(instance, "dynamic_job", 5, exclude_run_id=result.run_id)
+            == {}
+        )
+
+
+def test_step_ordering_from_config():
+    assert isinstance(StepOrdering.from_config(None), PriorityStepOrdering)
+    assert isinstance(StepOrdering.from_config({"priority": {}}), PriorityStepOrdering)
+    assert isinstance(
+        StepOrdering.from_config({"critical_path": {"history_run_limit": 2}}),
+        CriticalPathStepOrdering,
+    )
+
+    with pytest.raises(CheckError):
+        StepOrdering.from_config({"random": {}})
@@ -0,0 +1,243 @@
+import gzip
+import os
+import tempfile
+
+import mock
+import pytest
+from click.testing import CliRunner
+
+from dagster import AssetKey, AssetMaterialization, Output, job, op
+from dagster.check import CheckError
+from dagster.cli.instance import compact_command
+from dagster.core.events import DagsterEventType
+from dagster.core.storage.event_log.retention import (
+    DEFAULT_PURGED_EVENT_TYPES,
+    EventLogRetentionPolicy,
+)
+from dagster.core.storage.pipeline_run import PipelineRunStatus
+from dagster.core.test_utils import create_run_for_test, instance_for_test
+from dagster.daemon.event_log_retention import execute_event_log_retention_iteration
+from dagster.seven import json
+
+
+@op
+def materialize_asset(context):
+    context.log.info("materializing")
+    yield AssetMaterialization(asset_key=AssetKey("retained_asset"))
+    yield Output(1)
+
+
+@job
+def asset_job():
+    materialize_asset()
+
+
+def _event_types(instance, run_id):
+    return [event.dagster_event_type for event in instance.all_logs(run_id)]
+
+
+def _purgeable_event_count(instance, run_id):
+    return len(
+        [
+            event_type
+            for event_type in _event_types(instance, run_id)
+            if event_type in DEFAULT_PURGED_EVENT_TYPES
+        ]
+    )
+
+
+def test_retention_policy_from_settings():
+    policy = EventLogRetentionPolicy.from_settings(
+        {
+            "max_age_days": 7,
+            "run_statuses": ["FAILURE"],
+            "event_types": ["LOGS_CAPTURED", "ENGINE_EVENT"],
+            "batch_size": 10,
+        }
+    )
+    assert policy.max_age_seconds == 7 * 24 * 60 * 60
+    assert policy.run_statuses == [PipelineRunStatus.FAILURE]
+    assert policy.event_types == [DagsterEventType.LOGS_CAPTURED, DagsterEventType.ENGINE_EVENT]
+    assert policy.batch_size == 10
+    assert policy.archive_dir is None
+
+    with pytest.raises(CheckError):
+        EventLogRetentionPolicy.from_settings({"run_statuses": ["FAILURE"]})
+
+    with pytest.raises(CheckError, match="back the asset catalog"):
+        EventLogRetentionPolicy.from_settings(
+            {"max_age_days": 7, "event_types": ["ASSET_MATERIALIZATION"]}
+        )
+
+    with pytest.raises(CheckError, match="needed to re-execute runs"):
+        EventLogRetentionPolicy.from_settings({"max_age_days": 7, "event_types": ["STEP_OUTPUT"]})
+
+    # only captured compute logs and engine events are purged by default
+    assert EventLogRetentionPolicy.from_settings({"max_age_days": 7}).event_types == [
+        DagsterEventType.LOGS_CAPTURED,
+        DagsterEventType.ENGINE_EVENT,
+    ]
+
+
+def test_compact_event_logs():
+    with instance_for_test() as instance:
+        result = asset_job.execute_in_process(instance=instance)
+        in_progress_run = create_run_for_test(instance, status=PipelineRunStatus.STARTED)
+        instance.report_engine_event("in progress", in_progress_run)
+
+        purgeable_event_count = _purgeable_event_count(instance, result.run_id)
+        assert purgeable_event_count > 0
+
+        # runs created after the cutoff are retained
+        compaction = instance.compact_event_logs(EventLogRetentionPolicy(max_age_seconds=3600))
+        assert compaction.rows_purged == 0
+        assert compaction.runs_scanned == 0
+
+        compaction = instance.compact_event_logs(
+            EventLogRetentionPolicy(
+                max_age_seconds=0, event_types=[DagsterEventType.HANDLED_OUTPUT]
+            )
+        )
+        assert compaction.rows_purged == 1
+        assert compaction.runs_scanned == 1
+        assert DagsterEventType.HANDLED_OUTPUT not in _event_types(instance, result.run_id)
+
+        compaction = instance.compact_event_logs(EventLogRetentionPolicy(max_age_seconds=0))
+        assert compaction.rows_purged == purgeable_event_count
+        assert _purgeable_event_count(instance, result.run_id) == 0
+        assert instance.get_latest_materialization_events([AssetKey("retained_asset")])[
+            AssetKey("retained_asset")
+        ]
+
+        # the events that re-execution reads back are retained
+        assert instance.get_yielded_step_outputs(result.run_id)
+        assert instance.get_run_stats(result.run_id).steps_succeeded == 1
+        assert DagsterEventType.STEP_SUCCESS in _event_types(instance, result.run_id)
+
+        # events of runs that have not finished are retained
+        assert len(instance.all_logs(in_progress_run.run_id)) == 1
+
+
+def test_compact_event_logs_iterator():
+    with instance_for_test() as instance:
+        result = asset_job.execute_in_process(instance=instance)
+        purgeable_event_count = _purgeable_event_count(instance, result.run_id)
+
+        compactions = list(
+            instance.compact_event_logs_iterator(
+                EventLogRetentionPolicy(max_age_seconds=0, batch_size=2)
+            )
+        )
+
+        # a result is yielded after every full batch, so that the daemon can heartbeat between them
+        assert len(compactions) > purgeable_event_count // 2
+        assert [compaction.rows_purged for compaction in compactions] == sorted(
+            compaction.rows_purged for compaction in compactions
+        )
+        assert compactions[-1].rows_purged == purgeable_event_count
+        assert compactions[-1].runs_scanned == 1
+
+
+def test_compact_event_logs_archive():
+    with tempfile.TemporaryDirectory() as archive_dir:
+        with instance_for_test() as instance:
+            result = asset_job.execute_in_process(instance=instance)
+
+            compaction = instance.compact_event_logs(
+                EventLogRetentionPolicy(
+                    max_age_seconds=0, batch_size=2, archive_dir=os.path.join(archive_dir, "logs")
+                )
+            )
+            assert compaction.rows_purged > 0
+            assert os.path.dirname(compaction.archive_path) == os.path.join(archive_dir, "logs")
+
+            with gzip.open(compaction.archive_path, "rt") as f:
+                rows = [json.loads(line) for line in f]
+
+            assert len(rows) == compaction.rows_purged
+            assert {row["run_id"] for row in rows} == {result.run_id}
+            assert {row["dagster_event_type"] for row in rows} <= {
+                event_type.value for event_type in DEFAULT_PURGED_EVENT_TYPES
+            }
+            assert all(json.loads(row["event"])["dagster_event"] for row in rows)
+
+
+def test_compact_event_logs_from_settings():
+    with instance_for_test(
+        overrides={
+            "event_log_retention": {
+                "enabled": True,
+                "max_age_days": 0,
+                "event_types": ["HANDLED_OUTPUT"],
+            }
+        }
+    ) as instance:
+        result = asset_job.execute_in_process(instance=instance)
+        assert instance.compact_event_logs().rows_purged == 1
+        assert DagsterEventType.HANDLED_OUTPUT not in _event_types(instance, result.run_id)
+
+
+def test_compact_command():
+    with instance_for_test() as instance, mock.patch(
+        "dagster.core.instance.DagsterInstance.get", return_value=instance
+    ):
+        result = asset_job.execute_in_process(instance=instance)
+
+        runner = CliRunner()
+        cli_result = runner.invoke(compact_command, [])
+        assert cli_result.exit_code == 2
+        assert "--max-age-days must be set" in cli_result.output
+
+        cli_result = runner.invoke(
+            compact_command, ["--max-age-days", "0", "--event-type", "HANDLED_OUTPUT"]
+        )
+        assert cli_result.exit_code == 0, cli_result.output
+        assert "Purged 1 event log rows from 1 runs" in cli_result.output
+        assert DagsterEventType.HANDLED_OUTPUT not in _event_types(instance, result.run_id)
+
+
+def test_event_log_retention_daemon_iteration():
+    with instance_for_test(
+        overrides={"event_log_retention": {"enabled": True, "max_age_days": 0, "batch_size": 2}}
+    ) as instance:
+        result = asset_job.execute_in_process(instance=instance)
+        purgeable_event_count = _purgeable_event_count(instance, result.run_id)
+
+        logger = mock.MagicMock()
+        heartbeats = list(execute_event_log_retention_iteration(instance, logger))
+
+        # the daemon heartbeats between batches
+        assert len(heartbeats) > purgeable_event_count // 2
+        assert heartbeats == [None] * len(heartbeats)
+        assert (
+            f"Purged {purgeable_event_count} event log rows from 1 runs"
+            in logger.info.call_args[0][0]
+        )
+
+
+def test_compact_event_logs_unsupported_storage():
+    with instance_for_test(
+        overrides={"event_log_retention": {"enabled": True, "max_age_days": 0}}
+    ) as instance, mock.patch(
+        "dagster.core.instance.DagsterInstance.get", return_value=instance
+    ), mock.patch.object(
+        type(instance.event_log_storage),
+        "supports_event_retention",
+        new_callable=mock.PropertyMock,
+        return_value=False,
+    ):
+        result = asset_job.execute_in_process(instance=instance)
+        event_count = len(instance.all_logs(result.run_id))
+
+        # storages that do not implement purge_events are skipped, rather than failing
+        assert instance.compact_event_logs().rows_purged == 0
+
+        logger = mock.MagicMock()
+        assert list(execute_event_log_retention_iteration(instance, logger)) == []
+        assert "does not support event log retention" in logger.warning.call_args[0][0]
+
+        cli_result = CliRunner().invoke(compact_command, [])
+        assert cli_result.exit_code == 0, cli_result.output
+        assert "does not support event log retention" in cli_result.output
+
+        assert len(instance.all_logs(result.run_id)) == event_count
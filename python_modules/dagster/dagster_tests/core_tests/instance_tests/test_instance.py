@@ -1,5 +1,6 @@
 import re
 
+import mock
 import pytest
 import yaml
 from dagster_tests.api_tests.utils import get_bar_workspace
@@ -12,8 +13,10 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster.core.events import DagsterEventType
 from dagster.core.execution.api import create_execution_plan
 from dagster.core.instance import DagsterInstance, InstanceRef
+from dagster.core.instance.snapshot_cache import SnapshotCache
 from dagster.core.launcher import LaunchRunContext, RunLauncher
 from dagster.core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
 from dagster.core.snap import (
@@ -22,7 +25,7 @@
     snapshot_from_execution_plan,
 )
 from dagster.core.test_utils import create_run_for_test, environ, instance_for_test
-from dagster.serdes import ConfigurableClass
+from dagster.serdes import ConfigurableClass, serialize_dagster_namedtuple
 from dagster.serdes.config_class import ConfigurableClassData
 
 
@@ -105,6 +108,121 @@ def noop_pipeline():
         assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
 
 
+def test_snapshot_cache():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    with instance_for_test() as instance:
+        run = instance.create_run_for_pipeline(noop_pipeline)
+
+        assert instance.snapshot_cache_stats.hits == 0
+        assert instance.snapshot_cache_stats.misses == 0
+
+        # snapshots persisted by create_run are known to exist without a lookup
+        with mock.patch.object(
+            instance.run_storage, "has_pipeline_snapshot", side_effect=Exception("uncached")
+        ):
+            assert instance.has_pipeline_snapshot(run.pipeline_snapshot_id)
+
+        snapshot = instance.get_historical_pipeline(run.pipeline_snapshot_id).pipeline_snapshot
+        assert instance.snapshot_cache_stats.misses == 1
+        assert instance.snapshot_cache_stats.num_entries == 1
+
+        with mock.patch.object(
+            instance.run_storage,
+            "get_pipeline_snapshot_and_size",
+            side_effect=Exception("uncached"),
+        ), mock.patch.object(
+            instance.run_storage, "has_pipeline_snapshot", side_effect=Exception("uncached")
+        ):
+            assert instance.get_pipeline_snapshot(run.pipeline_snapshot_id) == snapshot
+            assert instance.has_pipeline_snapshot(run.pipeline_snapshot_id)
+
+        assert instance.snapshot_cache_stats.hits == 1
+
+        instance.get_execution_plan_snapshot(run.execution_plan_snapshot_id)
+        instance.get_execution_plan_snapshot(run.execution_plan_snapshot_id)
+        assert instance.snapshot_cache_stats.hits == 2
+        assert instance.snapshot_cache_stats.misses == 2
+
+        assert instance.get_pipeline_snapshot("not_a_snapshot_id") is None
+        assert not instance.has_pipeline_snapshot("not_a_snapshot_id")
+        assert instance.snapshot_cache_stats.num_entries == 2
+
+        instance.wipe()
+        assert instance.snapshot_cache_stats.num_entries == 0
+        assert not instance.has_pipeline_snapshot(run.pipeline_snapshot_id)
+
+
+def test_snapshot_cache_eviction():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    snapshot = noop_pipeline.get_pipeline_snapshot()
+    snapshot_size = 100
+
+    cache = SnapshotCache(max_bytes=snapshot_size * 2, max_known_snapshot_ids=2)
+    for snapshot_id in ["a", "b", "c"]:
+        assert cache.get(snapshot_id, lambda _: (snapshot, snapshot_size)) == snapshot
+
+    assert cache.stats.num_entries == 2
+    assert cache.stats.size_bytes == snapshot_size * 2
+
+    # "a" was evicted, so it is loaded again
+    assert cache.get("a", lambda _: (None, None)) is None
+    assert cache.get("c", lambda _: (None, None)) == snapshot
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 4
+
+    too_small = SnapshotCache(max_bytes=snapshot_size - 1)
+    assert too_small.get("a", lambda _: (snapshot, snapshot_size)) == snapshot
+    assert too_small.stats.num_entries == 0
+    assert too_small.has("a", lambda _: False)
+
+    # snapshots from storages that do not keep them serialized are weighed by serializing them
+    unsized = SnapshotCache()
+    assert unsized.get("a", lambda _: (snapshot, None)) == snapshot
+    assert unsized.stats.size_bytes == len(serialize_dagster_namedtuple(snapshot))
+
+
+def test_snapshot_cache_weighs_stored_snapshots():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    with instance_for_test() as instance:
+        run = instance.create_run_for_pipeline(noop_pipeline)
+
+        snapshot, stored_size = instance.run_storage.get_pipeline_snapshot_and_size(
+            run.pipeline_snapshot_id
+        )
+        # the decompressed size, in the same units as snapshots that are serialized by the cache
+        assert stored_size == len(serialize_dagster_namedtuple(snapshot))
+
+        # the size of the decompressed blob is used, rather than serializing the snapshot again
+        with mock.patch(
+            "dagster.core.instance.snapshot_cache.serialize_dagster_namedtuple",
+            side_effect=Exception("serialized"),
+        ):
+            instance.get_pipeline_snapshot(run.pipeline_snapshot_id)
+
+        assert instance.snapshot_cache_stats.size_bytes == stored_size
+
+
 def test_submit_run():
     with instance_for_test(
         overrides={
@@ -138,6 +256,7 @@ def test_submit_run():
 def test_get_required_daemon_types():
     from dagster.daemon.daemon import (
         BackfillDaemon,
+        EventLogRetentionDaemon,
         MonitoringDaemon,
         SchedulerDaemon,
         SensorDaemon,
@@ -166,6 +285,16 @@ def test_get_required_daemon_types():
             MonitoringDaemon.daemon_type(),
         ]
 
+    with instance_for_test(
+        overrides={"event_log_retention": {"enabled": True, "max_age_days": 30}}
+    ) as instance:
+        assert instance.get_required_daemon_types() == [
+            SensorDaemon.daemon_type(),
+            BackfillDaemon.daemon_type(),
+            SchedulerDaemon.daemon_type(),
+            EventLogRetentionDaemon.daemon_type(),
+        ]
+
 
 class TestNonResumeRunLauncher(RunLauncher, ConfigurableClass):
     def __init__(self, inst_data=None):
@@ -263,6 +392,46 @@ def test_cancellation_thread():
         assert instance.cancellation_thread_poll_interval_seconds == 10
 
 
+def test_buffered_event_logs():
+    @solid
+    def chatty(context):
+        for i in range(100):
+            context.log.info(f"chatty message {i}")
+
+    @pipeline
+    def chatty_pipeline():
+        chatty()
+
+    with instance_for_test(
+        overrides={"buffered_event_logs": {"enabled": True, "max_batch_size": 7}}
+    ) as instance:
+        assert instance.buffered_event_logs_enabled
+        result = execute_pipeline(chatty_pipeline, instance=instance)
+        assert result.success
+
+        logs = instance.all_logs(result.run_id)
+        user_messages = [
+            event.user_message
+            for event in logs
+            if not event.is_dagster_event and "chatty message" in event.user_message
+        ]
+        assert len(user_messages) == 100
+        assert all(
+            message.endswith(f"chatty message {i}") for i, message in enumerate(user_messages)
+        )
+
+        # user logs are flushed ahead of the system events that follow them
+        last_user_message_index = max(
+            i for i, event in enumerate(logs) if not event.is_dagster_event
+        )
+        step_success_index = next(
+            i
+            for i, event in enumerate(logs)
+            if event.is_dagster_event and event.dagster_event_type == DagsterEventType.STEP_SUCCESS
+        )
+        assert last_user_message_index < step_success_index
+
+
 def test_dagster_home_not_set():
     with environ({"DAGSTER_HOME": ""}):
         with pytest.raises(
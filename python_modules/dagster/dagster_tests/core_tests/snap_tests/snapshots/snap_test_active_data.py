@@ -254,6 +254,70 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Selector.549444e882e4b5e88867b7882131572348a62113": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
+              "description": null,
+              "is_required": false,
+              "name": "disabled",
+              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
+              "description": null,
+              "is_required": false,
+              "name": "enabled",
+              "type_key": "Shape.afa4c3c953fa7f1331596ca8c5650312fb47ea37"
+            }
+          ],
+          "given_name": null,
+          "key": "Selector.549444e882e4b5e88867b7882131572348a62113",
+          "kind": {
+            "__enum__": "ConfigTypeKind.SELECTOR"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Selector.7a5e9b68f20832c2307e33fbbea93f8bde717c54": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
+              "description": null,
+              "is_required": false,
+              "name": "in_process",
+              "type_key": "Shape.c5f18e3692785eaeb35a23ab75a22edf62048bd7"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}, \\"step_ordering\\": {\\"priority\\": {}}}}",
+              "description": null,
+              "is_required": false,
+              "name": "multiprocess",
+              "type_key": "Shape.96127f4ce14ff4b1e8bdaf95f98c0ec5135172fd"
+            }
+          ],
+          "given_name": null,
+          "key": "Selector.7a5e9b68f20832c2307e33fbbea93f8bde717c54",
+          "kind": {
+            "__enum__": "ConfigTypeKind.SELECTOR"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -377,6 +441,38 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Selector.d689e3f8bb4ce1812142124e78b1bf88feb44d48": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"history_run_limit\\": 5}",
+              "description": null,
+              "is_required": false,
+              "name": "critical_path",
+              "type_key": "Shape.f16c23a16b4037028a58c36a54672d4e595000d4"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
+              "description": null,
+              "is_required": false,
+              "name": "priority",
+              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            }
+          ],
+          "given_name": null,
+          "key": "Selector.d689e3f8bb4ce1812142124e78b1bf88feb44d48",
+          "kind": {
+            "__enum__": "ConfigTypeKind.SELECTOR"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -491,115 +587,110 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+        "Shape.01d25630fb500be58057f2d68b1b1dc8740216e6": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
+          "field_aliases": {
+            "solids": "ops"
+          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+              "default_value_as_json_str": "{\\"in_process\\": {}}",
               "description": null,
               "is_required": false,
-              "name": "in_process",
-              "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+              "name": "execution",
+              "type_key": "Selector.7a5e9b68f20832c2307e33fbbea93f8bde717c54"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+              "default_value_as_json_str": "{}",
               "description": null,
               "is_required": false,
-              "name": "multiprocess",
-              "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-            }
-          ],
-          "given_name": null,
-          "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-          "kind": {
-            "__enum__": "ConfigTypeKind.SELECTOR"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
+              "name": "loggers",
+              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+            },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
+              "default_value_as_json_str": "{\\"io_manager\\": {}}",
               "description": null,
               "is_required": false,
-              "name": "io_manager",
-              "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+              "name": "resources",
+              "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"a_solid\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "solids",
+              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
             }
           ],
           "given_name": null,
-          "key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19",
+          "key": "Shape.01d25630fb500be58057f2d68b1b1dc8740216e6",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.1b89f17c57460ee6db612e2a543579b48100564d": {
+        "Shape.04df9dd73d21027a27ee49d60384d92da2b5e15f": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
-          "field_aliases": {
-            "solids": "ops"
-          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"in_process\\": {}}",
-              "description": null,
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Execute the steps of solids with async compute functions concurrently, on a single event loop.",
               "is_required": false,
-              "name": "execution",
-              "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+              "name": "asyncio",
+              "type_key": "Shape.ad30d7535d92f51976021810b8258902a29bb0bd"
             },
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{}",
+              "default_provided": false,
+              "default_value_as_json_str": null,
               "description": null,
               "is_required": false,
-              "name": "loggers",
-              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+              "name": "marker_to_close",
+              "type_key": "String"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"io_manager\\": {}}",
-              "description": null,
+              "default_value_as_json_str": "false",
+              "description": "Whether the IO managers release each step output once every step that loads it has succeeded, to bound the memory and disk used by long runs. Outputs of steps that failed are kept, so the run can be re-executed from failure.",
               "is_required": false,
-              "name": "resources",
-              "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+              "name": "release_outputs",
+              "type_key": "Bool"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"a_solid\\": {}}",
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
               "description": null,
               "is_required": false,
-              "name": "solids",
-              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
             }
           ],
           "given_name": null,
-          "key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d",
+          "key": "Shape.04df9dd73d21027a27ee49d60384d92da2b5e15f",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+        "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -607,15 +698,15 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+              "default_value_as_json_str": "{}",
               "description": null,
               "is_required": false,
-              "name": "config",
-              "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+              "name": "io_manager",
+              "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
             }
           ],
           "given_name": null,
-          "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+          "key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -804,101 +895,111 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+        "Shape.96127f4ce14ff4b1e8bdaf95f98c0ec5135172fd": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": null,
-              "is_required": false,
-              "name": "marker_to_close",
-              "type_key": "String"
-            },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}, \\"step_ordering\\": {\\"priority\\": {}}}",
               "description": null,
               "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+              "name": "config",
+              "type_key": "Shape.c0b54805f02b95bbc867f5d176ef8660c5e8dc9d"
             }
           ],
           "given_name": null,
-          "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+          "key": "Shape.96127f4ce14ff4b1e8bdaf95f98c0ec5135172fd",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b": {
+        "Shape.ad30d7535d92f51976021810b8258902a29bb0bd": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
-          "field_aliases": {
-            "solids": "ops"
-          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": null,
+              "default_value_as_json_str": "100",
+              "description": "The maximum number of steps with async compute functions that are executed concurrently.",
               "is_required": false,
-              "name": "a_solid",
-              "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+              "name": "max_concurrent",
+              "type_key": "Int"
             }
           ],
           "given_name": null,
-          "key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b",
+          "key": "Shape.ad30d7535d92f51976021810b8258902a29bb0bd",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+        "Shape.afa4c3c953fa7f1331596ca8c5650312fb47ea37": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-              "description": null,
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Replace a worker process once its peak resident set size exceeds this many megabytes.",
               "is_required": false,
-              "name": "config",
-              "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+              "name": "max_process_memory_mb",
+              "type_key": "Int"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Replace a worker process after it has executed this many steps.",
+              "is_required": false,
+              "name": "max_steps_per_process",
+              "type_key": "Int"
             }
           ],
           "given_name": null,
-          "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+          "key": "Shape.afa4c3c953fa7f1331596ca8c5650312fb47ea37",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+        "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
-          "fields": [],
+          "field_aliases": {
+            "solids": "ops"
+          },
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
+              "description": null,
+              "is_required": false,
+              "name": "a_solid",
+              "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+            }
+          ],
           "given_name": null,
-          "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+          "key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+        "Shape.c0b54805f02b95bbc867f5d176ef8660c5e8dc9d": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -921,6 +1022,15 @@
               "name": "retries",
               "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
             },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Whether steps are executed by a pool of long-lived worker processes, which load the job and the instance once per run, instead of in a new process per step. Defaults to disabled.",
+              "is_required": false,
+              "name": "reuse_processes",
+              "type_key": "Selector.549444e882e4b5e88867b7882131572348a62113"
+            },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": false,
@@ -929,10 +1039,55 @@
               "is_required": false,
               "name": "start_method",
               "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"priority\\": {}}",
+              "description": "The order in which steps that are ready to execute are started. With priority, steps are ordered by their dagster/priority tag. With critical_path, steps with the same priority are then ordered by the longest path from the step to the end of the plan, weighted by the durations of the steps in previous runs of the job.",
+              "is_required": false,
+              "name": "step_ordering",
+              "type_key": "Selector.d689e3f8bb4ce1812142124e78b1bf88feb44d48"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.c0b54805f02b95bbc867f5d176ef8660c5e8dc9d",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.c5f18e3692785eaeb35a23ab75a22edf62048bd7": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
+              "description": null,
+              "is_required": false,
+              "name": "config",
+              "type_key": "Shape.04df9dd73d21027a27ee49d60384d92da2b5e15f"
             }
           ],
           "given_name": null,
-          "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+          "key": "Shape.c5f18e3692785eaeb35a23ab75a22edf62048bd7",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [],
+          "given_name": null,
+          "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -962,6 +1117,29 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.f16c23a16b4037028a58c36a54672d4e595000d4": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "5",
+              "description": "The number of most recent successful runs of the job whose step durations are used to weight the paths through the plan.",
+              "is_required": false,
+              "name": "history_run_limit",
+              "type_key": "Int"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.f16c23a16b4037028a58c36a54672d4e595000d4",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "String": {
           "__class__": "ConfigTypeSnap",
           "description": "",
@@ -1121,7 +1299,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+        "root_config_key": "Shape.01d25630fb500be58057f2d68b1b1dc8740216e6"
       },
       {
         "__class__": "ModeDefSnap",
@@ -1159,7 +1337,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+        "root_config_key": "Shape.01d25630fb500be58057f2d68b1b1dc8740216e6"
       }
     ],
     "name": "a_pipeline",
@@ -1408,8 +1586,40 @@
                   "default_value_as_json_str": "{}",
                   "description": null,
                   "is_required": false,
-                  "name": "forkserver",
-                  "type_key": "Shape.45a8f1f21db73ecbfa5b4e07b9aedc1835cef1ef"
+                  "name": "forkserver",
+                  "type_key": "Shape.45a8f1f21db73ecbfa5b4e07b9aedc1835cef1ef"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "spawn",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                }
+              ],
+              "given_name": null,
+              "key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47",
+              "kind": {
+                "__enum__": "ConfigTypeKind.SELECTOR"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "disabled",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
@@ -1417,19 +1627,19 @@
                   "default_value_as_json_str": "{}",
                   "description": null,
                   "is_required": false,
-                  "name": "spawn",
+                  "name": "enabled",
                   "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
                 }
               ],
               "given_name": null,
-              "key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47",
+              "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+            "Selector.549444e882e4b5e88867b7882131572348a62113": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1450,11 +1660,43 @@
                   "description": null,
                   "is_required": false,
                   "name": "enabled",
-                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                  "type_key": "Shape.afa4c3c953fa7f1331596ca8c5650312fb47ea37"
                 }
               ],
               "given_name": null,
-              "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+              "key": "Selector.549444e882e4b5e88867b7882131572348a62113",
+              "kind": {
+                "__enum__": "ConfigTypeKind.SELECTOR"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Selector.7a5e9b68f20832c2307e33fbbea93f8bde717c54": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "in_process",
+                  "type_key": "Shape.c5f18e3692785eaeb35a23ab75a22edf62048bd7"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}, \\"step_ordering\\": {\\"priority\\": {}}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "multiprocess",
+                  "type_key": "Shape.96127f4ce14ff4b1e8bdaf95f98c0ec5135172fd"
+                }
+              ],
+              "given_name": null,
+              "key": "Selector.7a5e9b68f20832c2307e33fbbea93f8bde717c54",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
@@ -1584,6 +1826,38 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Selector.d689e3f8bb4ce1812142124e78b1bf88feb44d48": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"history_run_limit\\": 5}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "critical_path",
+                  "type_key": "Shape.f16c23a16b4037028a58c36a54672d4e595000d4"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "priority",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                }
+              ],
+              "given_name": null,
+              "key": "Selector.d689e3f8bb4ce1812142124e78b1bf88feb44d48",
+              "kind": {
+                "__enum__": "ConfigTypeKind.SELECTOR"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1698,115 +1972,110 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+            "Shape.01d25630fb500be58057f2d68b1b1dc8740216e6": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
+              "field_aliases": {
+                "solids": "ops"
+              },
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+                  "default_value_as_json_str": "{\\"in_process\\": {}}",
                   "description": null,
                   "is_required": false,
-                  "name": "in_process",
-                  "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+                  "name": "execution",
+                  "type_key": "Selector.7a5e9b68f20832c2307e33fbbea93f8bde717c54"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+                  "default_value_as_json_str": "{}",
                   "description": null,
                   "is_required": false,
-                  "name": "multiprocess",
-                  "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-                }
-              ],
-              "given_name": null,
-              "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-              "kind": {
-                "__enum__": "ConfigTypeKind.SELECTOR"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
+                  "name": "loggers",
+                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+                },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
+                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
                   "description": null,
                   "is_required": false,
-                  "name": "io_manager",
-                  "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+                  "name": "resources",
+                  "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "solids",
+                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
                 }
               ],
               "given_name": null,
-              "key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19",
+              "key": "Shape.01d25630fb500be58057f2d68b1b1dc8740216e6",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.1b89f17c57460ee6db612e2a543579b48100564d": {
+            "Shape.04df9dd73d21027a27ee49d60384d92da2b5e15f": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "field_aliases": {
-                "solids": "ops"
-              },
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"in_process\\": {}}",
-                  "description": null,
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Execute the steps of solids with async compute functions concurrently, on a single event loop.",
                   "is_required": false,
-                  "name": "execution",
-                  "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+                  "name": "asyncio",
+                  "type_key": "Shape.ad30d7535d92f51976021810b8258902a29bb0bd"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{}",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "loggers",
-                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+                  "name": "marker_to_close",
+                  "type_key": "String"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
-                  "description": null,
+                  "default_value_as_json_str": "false",
+                  "description": "Whether the IO managers release each step output once every step that loads it has succeeded, to bound the memory and disk used by long runs. Outputs of steps that failed are kept, so the run can be re-executed from failure.",
                   "is_required": false,
-                  "name": "resources",
-                  "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+                  "name": "release_outputs",
+                  "type_key": "Bool"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
                   "description": null,
                   "is_required": false,
-                  "name": "solids",
-                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
                 }
               ],
               "given_name": null,
-              "key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d",
+              "key": "Shape.04df9dd73d21027a27ee49d60384d92da2b5e15f",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+            "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1814,15 +2083,15 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+                  "default_value_as_json_str": "{}",
                   "description": null,
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+                  "name": "io_manager",
+                  "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
                 }
               ],
               "given_name": null,
-              "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+              "key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2011,101 +2280,111 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+            "Shape.96127f4ce14ff4b1e8bdaf95f98c0ec5135172fd": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
-                  "description": null,
-                  "is_required": false,
-                  "name": "marker_to_close",
-                  "type_key": "String"
-                },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}, \\"step_ordering\\": {\\"priority\\": {}}}",
                   "description": null,
                   "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                  "name": "config",
+                  "type_key": "Shape.c0b54805f02b95bbc867f5d176ef8660c5e8dc9d"
                 }
               ],
               "given_name": null,
-              "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+              "key": "Shape.96127f4ce14ff4b1e8bdaf95f98c0ec5135172fd",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b": {
+            "Shape.ad30d7535d92f51976021810b8258902a29bb0bd": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "field_aliases": {
-                "solids": "ops"
-              },
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": null,
+                  "default_value_as_json_str": "100",
+                  "description": "The maximum number of steps with async compute functions that are executed concurrently.",
                   "is_required": false,
-                  "name": "a_solid",
-                  "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+                  "name": "max_concurrent",
+                  "type_key": "Int"
                 }
               ],
               "given_name": null,
-              "key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b",
+              "key": "Shape.ad30d7535d92f51976021810b8258902a29bb0bd",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+            "Shape.afa4c3c953fa7f1331596ca8c5650312fb47ea37": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-                  "description": null,
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Replace a worker process once its peak resident set size exceeds this many megabytes.",
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+                  "name": "max_process_memory_mb",
+                  "type_key": "Int"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Replace a worker process after it has executed this many steps.",
+                  "is_required": false,
+                  "name": "max_steps_per_process",
+                  "type_key": "Int"
                 }
               ],
               "given_name": null,
-              "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+              "key": "Shape.afa4c3c953fa7f1331596ca8c5650312fb47ea37",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+            "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "fields": [],
+              "field_aliases": {
+                "solids": "ops"
+              },
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "a_solid",
+                  "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+                }
+              ],
               "given_name": null,
-              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+              "key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+            "Shape.c0b54805f02b95bbc867f5d176ef8660c5e8dc9d": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -2128,6 +2407,15 @@
                   "name": "retries",
                   "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
                 },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Whether steps are executed by a pool of long-lived worker processes, which load the job and the instance once per run, instead of in a new process per step. Defaults to disabled.",
+                  "is_required": false,
+                  "name": "reuse_processes",
+                  "type_key": "Selector.549444e882e4b5e88867b7882131572348a62113"
+                },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": false,
@@ -2136,10 +2424,55 @@
                   "is_required": false,
                   "name": "start_method",
                   "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"priority\\": {}}",
+                  "description": "The order in which steps that are ready to execute are started. With priority, steps are ordered by their dagster/priority tag. With critical_path, steps with the same priority are then ordered by the longest path from the step to the end of the plan, weighted by the durations of the steps in previous runs of the job.",
+                  "is_required": false,
+                  "name": "step_ordering",
+                  "type_key": "Selector.d689e3f8bb4ce1812142124e78b1bf88feb44d48"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.c0b54805f02b95bbc867f5d176ef8660c5e8dc9d",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.c5f18e3692785eaeb35a23ab75a22edf62048bd7": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "config",
+                  "type_key": "Shape.04df9dd73d21027a27ee49d60384d92da2b5e15f"
                 }
               ],
               "given_name": null,
-              "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+              "key": "Shape.c5f18e3692785eaeb35a23ab75a22edf62048bd7",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [],
+              "given_name": null,
+              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2169,6 +2502,29 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.f16c23a16b4037028a58c36a54672d4e595000d4": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "5",
+                  "description": "The number of most recent successful runs of the job whose step durations are used to weight the paths through the plan.",
+                  "is_required": false,
+                  "name": "history_run_limit",
+                  "type_key": "Int"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.f16c23a16b4037028a58c36a54672d4e595000d4",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "String": {
               "__class__": "ConfigTypeSnap",
               "description": "",
@@ -2328,7 +2684,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+            "root_config_key": "Shape.01d25630fb500be58057f2d68b1b1dc8740216e6"
           },
           {
             "__class__": "ModeDefSnap",
@@ -2366,7 +2722,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+            "root_config_key": "Shape.01d25630fb500be58057f2d68b1b1dc8740216e6"
           }
         ],
         "name": "a_pipeline",
@@ -11,7 +11,7 @@
   "artifacts_persisted": true,
   "executor_name": "in_process",
   "initial_known_state": null,
-  "pipeline_snapshot_id": "330e31c23c3edacaa7a9224039b53a703f011788",
+  "pipeline_snapshot_id": "551162fd76daf216aa714641b79857a7769c1dba",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "solid_one",
@@ -134,7 +134,7 @@
   "artifacts_persisted": true,
   "executor_name": "in_process",
   "initial_known_state": null,
-  "pipeline_snapshot_id": "7ffd65ba8633d4c172a7b15dfee5927bed301724",
+  "pipeline_snapshot_id": "be4b92bd5b948081ea5a42e6ab7493f42577aa21",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -187,7 +187,7 @@
   "artifacts_persisted": true,
   "executor_name": "in_process",
   "initial_known_state": null,
-  "pipeline_snapshot_id": "b96bfd4d61336a6ed2016679d1467c3e1daa3285",
+  "pipeline_snapshot_id": "0da82a1f33c345989d63e26594f45b1714628901",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -254,7 +254,7 @@
   "artifacts_persisted": true,
   "executor_name": "in_process",
   "initial_known_state": null,
-  "pipeline_snapshot_id": "7bb46b4373672e250386288663f7eca81f0a0a02",
+  "pipeline_snapshot_id": "89920df254a34128c3c8cc02afc57c7f31db165b",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
@@ -0,0 +1,68 @@
+"""
+Compares the throughput of handing large outputs from one step to another through the
+fs_io_manager and through the shared_memory_io_manager.
+
+Outputs are frames whose data is pickled out-of-band with protocol 5, as numpy arrays, pandas
+DataFrames and arrow tables are. Loading includes reading every page of the data, since the
+shared_memory_io_manager maps the data lazily.
+
+cd python_modules/dagster && python -m dagster_tests.core_tests.storage_tests.shared_memory_io_manager_benchmarks
+"""
+
+import mmap
+import os
+import pickle
+import tempfile
+import time
+
+from dagster import build_input_context, build_output_context
+from dagster.core.storage.fs_io_manager import PickledObjectFilesystemIOManager
+from dagster.core.storage.shared_memory_io_manager import SHARED_MEMORY_DIR, SharedMemoryIOManager
+
+OUTPUT_SIZES_MB = [16, 256, 1024]
+
+
+class Frame:
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return Frame, (pickle.PickleBuffer(self.data),)
+        return Frame, (bytes(self.data),)
+
+
+def handoff_seconds(manager, frame):
+    """Returns the seconds taken to store a frame and load it back, reading every page"""
+    output_context = build_output_context(step_key="producer", name="result", run_id="benchmark")
+    input_context = build_input_context(upstream_output=output_context)
+
+    start = time.perf_counter()
+    manager.handle_output(output_context, frame)
+    loaded = manager.load_input(input_context)
+    memoryview(loaded.data)[:: mmap.PAGESIZE].tobytes()
+    return time.perf_counter() - start
+
+
+def run_shared_memory_io_manager_benchmarks():
+    print(  # pylint: disable=print-call
+        f"{'size (MB)':>10} {'fs (MB/s)':>10} {'shared memory (MB/s)':>21}"
+    )
+    with tempfile.TemporaryDirectory() as fs_dir, tempfile.TemporaryDirectory(
+        dir=SHARED_MEMORY_DIR if os.path.isdir(SHARED_MEMORY_DIR) else None
+    ) as shared_memory_dir:
+        fs_manager = PickledObjectFilesystemIOManager(base_dir=fs_dir)
+        shared_memory_manager = SharedMemoryIOManager(base_dir=shared_memory_dir)
+
+        for size_mb in OUTPUT_SIZES_MB:
+            frame = Frame(bytearray(size_mb * 1024 * 1024))
+            fs_seconds = handoff_seconds(fs_manager, frame)
+            shared_memory_seconds = handoff_seconds(shared_memory_manager, frame)
+            print(  # pylint: disable=print-call
+                f"{size_mb:>10} {size_mb / fs_seconds:>10.0f} "
+                f"{size_mb / shared_memory_seconds:>21.0f}"
+            )
+
+
+if __name__ == "__main__":
+    run_shared_memory_io_manager_benchmarks()
@@ -0,0 +1,51 @@
+"""
+Benchmarks the throughput of `store_event` on the SQLite event log storage, opening a connection
+per operation (the default) versus keeping a pool of connections per shard.
+
+cd python_modules/dagster && python -m dagster_tests.core_tests.storage_tests.sqlite_storage_benchmarks
+"""
+
+import tempfile
+import time
+
+from dagster.core.storage.event_log import SqliteEventLogStorage
+
+from .utils.event_log_storage import create_test_event_log_record
+
+STORAGE_CONFIGS = [
+    ("connection per operation", {}),
+    ("pooled (pool_size=1)", {"pool_size": 1}),
+    ("pooled (pool_size=4)", {"pool_size": 4}),
+]
+
+
+def events_per_second(storage_kwargs, num_runs: int, events_per_run: int) -> float:
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, **storage_kwargs)
+        try:
+            events = [
+                create_test_event_log_record(str(i), run_id=f"run_{run_index}")
+                for run_index in range(num_runs)
+                for i in range(events_per_run)
+            ]
+            start = time.perf_counter()
+            for event in events:
+                storage.store_event(event)
+            elapsed = time.perf_counter() - start
+        finally:
+            storage.dispose()
+
+    return len(events) / elapsed
+
+
+def run_store_event_benchmarks(num_runs: int = 5, events_per_run: int = 200):
+    print(f"{'storage':<30} {'events/s':>10} {'speedup':>8}")  # pylint: disable=print-call
+    baseline = None
+    for name, storage_kwargs in STORAGE_CONFIGS:
+        rate = events_per_second(storage_kwargs, num_runs, events_per_run)
+        baseline = baseline or rate
+        print(f"{name:<30} {rate:>10.0f} {rate / baseline:>7.2f}x")  # pylint: disable=print-call
+
+
+if __name__ == "__main__":
+    run_store_event_benchmarks()
@@ -2,11 +2,15 @@
 import os
 import sys
 import tempfile
+import time
 import traceback
 
+import mock
 import pytest
 import sqlalchemy
 
+from dagster import AssetKey, AssetMaterialization, Output, op
+from dagster.check import CheckError
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
@@ -15,9 +19,16 @@
     SqlEventLogStorageTable,
     SqliteEventLogStorage,
 )
+from dagster.core.storage.event_log.schema import AssetKeyTable
 from dagster.core.storage.sql import create_engine
+from dagster.serdes import SerializationFormat
 
-from .utils.event_log_storage import TestEventLogStorage
+from .utils.event_log_storage import (
+    DEFAULT_RUN_ID,
+    TestEventLogStorage,
+    _synthesize_events,
+    create_test_event_log_record,
+)
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -46,6 +57,42 @@ def event_log_storage(self):  # pylint: disable=arguments-differ
             finally:
                 storage.dispose()
 
+    def test_watch_shares_handler_per_run(self, storage):
+        watched = {"one": [], "two": []}
+        watcher_one = lambda x: watched["one"].append(x)  # pylint: disable=unnecessary-lambda
+        watcher_two = lambda x: watched["two"].append(x)  # pylint: disable=unnecessary-lambda
+
+        storage.store_event(create_test_event_log_record(str(1)))
+        storage.watch(DEFAULT_RUN_ID, 0, watcher_one)
+        storage.store_event(create_test_event_log_record(str(2)))
+
+        attempts = 10
+        while not watched["one"] and attempts > 0:
+            time.sleep(0.5)
+            attempts -= 1
+
+        # a subscriber joining behind the shared cursor is caught up on the events it missed
+        storage.watch(DEFAULT_RUN_ID, -1, watcher_two)
+        assert len(storage._watchers) == 1  # pylint: disable=protected-access
+        assert [int(evt.user_message) for evt in watched["two"]] == [1, 2]
+
+        storage.end_watch(DEFAULT_RUN_ID, watcher_one)
+        assert len(storage._watchers) == 1  # pylint: disable=protected-access
+        storage.end_watch(DEFAULT_RUN_ID, watcher_two)
+        assert not storage._watchers  # pylint: disable=protected-access
+
+        # watching again after the shared handler was torn down schedules a new one
+        storage.watch(DEFAULT_RUN_ID, 1, watcher_one)
+        storage.store_event(create_test_event_log_record(str(3)))
+
+        attempts = 10
+        while len(watched["one"]) < 2 and attempts > 0:
+            time.sleep(0.5)
+            attempts -= 1
+
+        storage.end_watch(DEFAULT_RUN_ID, watcher_one)
+        assert [int(evt.user_message) for evt in watched["one"]] == [2, 3]
+
     def test_filesystem_event_log_storage_run_corrupted(self, storage):
         # URL begins sqlite:///
         # pylint: disable=protected-access
@@ -111,6 +158,113 @@ def test_concurrent_sqlite_event_log_connections(self, storage):
         assert not excs, excs
 
 
+class TestBinarySerdesSqliteEventLogStorage(TestEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(scope="function", name="storage")
+    def event_log_storage(self):  # pylint: disable=arguments-differ
+        with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
+            storage = SqliteEventLogStorage(
+                tmpdir_path, serialization_format=SerializationFormat.BINARY
+            )
+            try:
+                yield storage
+            finally:
+                storage.dispose()
+
+    def test_reads_events_across_serialization_formats(self, storage):
+        run_id = "serialization_formats"
+        json_storage = SqliteEventLogStorage(storage._base_dir)  # pylint: disable=protected-access
+        json_storage.store_event(create_test_event_log_record("json", run_id=run_id))
+        storage.store_event(create_test_event_log_record("binary", run_id=run_id))
+
+        rows = [storage.get_event_log_table_data(run_id, record_id) for record_id in [1, 2]]
+        assert isinstance(rows[0].event, str)
+        assert isinstance(rows[1].event, bytes)
+
+        for event_log_storage in [storage, json_storage]:
+            assert [event.user_message for event in event_log_storage.get_logs_for_run(run_id)] == [
+                "json",
+                "binary",
+            ]
+
+    def test_backcompat_latest_materialization_events(self, storage):
+        @op
+        def materialize():
+            yield AssetMaterialization(asset_key=AssetKey("asset"))
+            yield Output(1)
+
+        events, _ = _synthesize_events(lambda: materialize())
+        for event in events:
+            storage.store_event(event)
+
+        # an asset row written before the latest materialization was stored in the asset_keys
+        # table, whose latest materialization is read from the binary events instead
+        with storage.index_connection() as conn:
+            conn.execute(AssetKeyTable.update().values(last_materialization=None))
+
+        with mock.patch.object(SqliteEventLogStorage, "has_secondary_index", return_value=False):
+            events_by_key = storage.get_latest_materialization_events([AssetKey("asset")])
+
+        assert events_by_key[AssetKey("asset")].dagster_event.asset_key == AssetKey("asset")
+
+
+class TestPooledSqliteEventLogStorage(TestEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(scope="function", name="storage")
+    def event_log_storage(self):  # pylint: disable=arguments-differ
+        with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
+            storage = SqliteEventLogStorage(tmpdir_path, pool_size=2)
+            try:
+                yield storage
+            finally:
+                storage.dispose()
+
+    def test_pooled_connections_are_reused(self, storage):
+        storage.store_event(create_test_event_log_record("first"))
+
+        pool = storage._connection_pool  # pylint: disable=protected-access
+        engine = pool.get_engine(storage.conn_string_for_shard(DEFAULT_RUN_ID))
+        connects = []
+        sqlalchemy.event.listen(engine, "connect", lambda *_args: connects.append(1))
+
+        for i in range(5):
+            storage.store_event(create_test_event_log_record(str(i)))
+
+        assert not connects
+        assert engine.pool.checkedout() == 0
+        assert len(storage.get_logs_for_run(DEFAULT_RUN_ID)) == 6
+
+        with engine.connect() as conn:
+            assert conn.execute("PRAGMA journal_mode;").scalar() == "wal"
+
+    def test_idle_engines_are_evicted(self, storage):
+        storage.store_event(create_test_event_log_record("before"))
+        pool = storage._connection_pool  # pylint: disable=protected-access
+        conn_string = storage.conn_string_for_shard(DEFAULT_RUN_ID)
+        engine = pool.get_engine(conn_string)
+
+        with mock.patch(
+            "dagster.core.storage.sqlite.time.time", return_value=time.time() + pool.idle_timeout
+        ):
+            assert pool.get_engine(storage.conn_string_for_shard("other")) is not engine
+            assert pool.get_engine(conn_string) is not engine
+
+        storage.store_event(create_test_event_log_record("after"))
+        assert [event.user_message for event in storage.get_logs_for_run(DEFAULT_RUN_ID)] == [
+            "before",
+            "after",
+        ]
+
+    def test_pool_config(self):
+        with pytest.raises(CheckError):
+            SqliteEventLogStorage(os.getcwd(), pool_idle_timeout=30)
+
+        with pytest.raises(CheckError):
+            SqliteEventLogStorage(os.getcwd(), pool_size=0)
+
+
 class TestConsolidatedSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
 
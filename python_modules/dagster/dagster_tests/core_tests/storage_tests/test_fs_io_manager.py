@@ -71,6 +71,50 @@ def test_fs_io_manager_base_dir():
             assert pickle.load(read_obj) == [1, 2, 3]
 
 
+def test_fs_io_manager_release_outputs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = fs_io_manager.configured({"base_dir": tmpdir_path})
+        pipeline_def = define_pipeline(io_manager)
+
+        result = execute_pipeline(
+            pipeline_def,
+            run_config={"execution": {"in_process": {"config": {"release_outputs": True}}}},
+        )
+        assert result.success
+
+        # the output of solid_a is deleted once solid_b has loaded it
+        assert not os.path.exists(os.path.join(tmpdir_path, result.run_id, "solid_a", "result"))
+        assert os.path.isfile(os.path.join(tmpdir_path, result.run_id, "solid_b", "result"))
+
+
+def test_fs_io_manager_release_outputs_failure():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+
+        @op
+        def op_a():
+            return 1
+
+        @op
+        def op_b(_num):
+            raise Exception("oops")
+
+        @graph
+        def failing_graph():
+            op_b(op_a())
+
+        result = execute_pipeline(
+            failing_graph.to_job(
+                resource_defs={"io_manager": fs_io_manager.configured({"base_dir": tmpdir_path})}
+            ),
+            run_config={"execution": {"config": {"in_process": {"release_outputs": True}}}},
+            raise_on_error=False,
+        )
+        assert not result.success
+
+        # the inputs of failed steps are kept, so that the run can be re-executed from failure
+        assert os.path.isfile(os.path.join(tmpdir_path, result.run_id, "op_a", "result"))
+
+
 def test_fs_io_manager_memoization():
     recorder = []
 
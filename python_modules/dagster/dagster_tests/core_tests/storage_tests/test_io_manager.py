@@ -491,6 +491,7 @@ def test_configured():
         input_config_schema={"format": str},
         required_resource_keys={"r1", "r2"},
         version="123",
+        cleans_up_runs=True,
     )
     def an_io_manager(_):
         pass
@@ -503,6 +504,46 @@ def an_io_manager(_):
     assert configured_io_manager.input_config_schema == an_io_manager.input_config_schema
     assert configured_io_manager.required_resource_keys == an_io_manager.required_resource_keys
     assert configured_io_manager.version is None
+    assert configured_io_manager.cleans_up_runs
+
+
+def test_cleanup_run():
+    inits = []
+    cleaned_up_run_ids = []
+
+    class CleanupIOManager(InMemoryIOManager):
+        def cleanup_run(self, run_id):
+            cleaned_up_run_ids.append(run_id)
+
+    @io_manager(cleans_up_runs=True)
+    def cleanup_io_manager(_):
+        inits.append("cleanup_io_manager")
+        return CleanupIOManager()
+
+    @io_manager
+    def other_io_manager(_):
+        inits.append("other_io_manager")
+        return CleanupIOManager()
+
+    @op(out=Out(io_manager_key="other_io_manager"))
+    def op_a():
+        return 1
+
+    @op
+    def op_b(value):
+        return value
+
+    @job(resource_defs={"io_manager": cleanup_io_manager, "other_io_manager": other_io_manager})
+    def cleanup_job():
+        op_b(op_a())
+
+    result = cleanup_job.execute_in_process()
+    assert result.success
+
+    # only the IO manager that opts in is initialized again to clean up the run
+    assert cleaned_up_run_ids == [result.run_id]
+    assert inits.count("cleanup_io_manager") == 2
+    assert inits.count("other_io_manager") == 1
 
 
 def test_mem_io_manager_execution():
@@ -512,6 +553,9 @@ def test_mem_io_manager_execution():
     input_context = build_input_context(upstream_output=output_context)
     assert mem_io_manager_instance.load_input(input_context) == 1
 
+    mem_io_manager_instance.release_output(output_context)
+    assert mem_io_manager_instance.values == {}
+
 
 def test_io_manager_resources_on_context():
     @resource
@@ -14,6 +14,16 @@ def create_sqlite_run_storage():
         yield SqliteRunStorage.from_local(tempdir)
 
 
+@contextmanager
+def create_pooled_sqlite_run_storage():
+    with tempfile.TemporaryDirectory() as tempdir:
+        storage = SqliteRunStorage.from_local(tempdir, pool_size=2)
+        try:
+            yield storage
+        finally:
+            storage.dispose()
+
+
 @contextmanager
 def create_non_bucket_sqlite_run_storage():
     with tempfile.TemporaryDirectory() as tempdir:
@@ -38,7 +48,13 @@ def create_in_memory_storage():
 class TestSqliteImplementation(TestRunStorage):
     __test__ = True
 
-    @pytest.fixture(name="storage", params=[create_sqlite_run_storage])
+    @pytest.fixture(
+        name="storage",
+        params=[
+            create_sqlite_run_storage,
+            create_pooled_sqlite_run_storage,
+        ],
+    )
     def run_storage(self, request):
         with request.param() as s:
             yield s
@@ -13,10 +13,23 @@ def create_sqlite_schedule_storage():
         yield SqliteScheduleStorage.from_local(tempdir)
 
 
+@contextmanager
+def create_pooled_sqlite_schedule_storage():
+    with tempfile.TemporaryDirectory() as tempdir:
+        storage = SqliteScheduleStorage.from_local(tempdir, pool_size=2)
+        try:
+            yield storage
+        finally:
+            storage.dispose()
+
+
 class TestSqliteScheduleStorage(TestScheduleStorage):
     __test__ = True
 
-    @pytest.fixture(name="storage", params=[create_sqlite_schedule_storage])
+    @pytest.fixture(
+        name="storage",
+        params=[create_sqlite_schedule_storage, create_pooled_sqlite_schedule_storage],
+    )
     def schedule_storage(self, request):
         with request.param() as s:
             yield s
@@ -0,0 +1,184 @@
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+
+import pytest
+
+from dagster import (
+    DynamicOut,
+    DynamicOutput,
+    build_input_context,
+    build_output_context,
+    execute_pipeline,
+    job,
+    op,
+    reconstructable,
+    reexecute_pipeline,
+)
+from dagster.core.storage.shared_memory_io_manager import (
+    SharedMemoryIOManager,
+    shared_memory_io_manager,
+)
+from dagster.core.test_utils import instance_for_test
+
+requires_out_of_band_pickle = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="Out-of-band pickle buffers require Python 3.8"
+)
+
+
+class Frame:
+    """Hands its data to pickle as an out-of-band buffer, like numpy arrays do"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return Frame, (pickle.PickleBuffer(self.data),)
+        return Frame, (bytes(self.data),)
+
+
+@op
+def make_frame():
+    return Frame(bytearray(b"abc" * 1000))
+
+
+@op
+def frame_size(frame):
+    if sys.version_info >= (3, 8):
+        # the data is mapped from shared memory, rather than unpickled into a copy
+        assert isinstance(frame.data, mmap.mmap)
+    return len(frame.data)
+
+
+@op(out=DynamicOut())
+def emit():
+    for i in range(3):
+        yield DynamicOutput(Frame(bytearray(b"x" * (i + 1))), mapping_key=str(i))
+
+
+@op
+def total(sizes):
+    # the outputs of a successful run are removed, so their values are checked during the run
+    assert sorted(sizes) == [1, 2, 3]
+    return sum(sizes)
+
+
+@job(resource_defs={"io_manager": shared_memory_io_manager})
+def frame_job():
+    frame_size(make_frame())
+    total(emit().map(frame_size).collect())
+
+
+def _run_config(base_dir, executor="multiprocess"):
+    return {
+        "execution": {"config": {executor: {}}},
+        "resources": {"io_manager": {"config": {"base_dir": base_dir}}},
+    }
+
+
+def test_shared_memory_io_manager():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        with instance_for_test() as instance:
+            result = execute_pipeline(
+                reconstructable(frame_job), run_config=_run_config(tmpdir_path), instance=instance
+            )
+            assert result.success
+
+        # the outputs of a successful run are removed
+        assert not os.path.exists(os.path.join(tmpdir_path, result.run_id))
+
+
+@op(config_schema={"fail": bool})
+def check_frame(context, frame):
+    if context.op_config["fail"]:
+        raise Exception("failed")
+    assert len(frame.data) == 3000
+
+
+@job(resource_defs={"io_manager": shared_memory_io_manager})
+def failing_frame_job():
+    check_frame(make_frame())
+
+
+def test_shared_memory_io_manager_keeps_failed_run_outputs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        with instance_for_test() as instance:
+            run_config = _run_config(tmpdir_path)
+            result = execute_pipeline(
+                reconstructable(failing_frame_job),
+                run_config={**run_config, "ops": {"check_frame": {"config": {"fail": True}}}},
+                instance=instance,
+                raise_on_error=False,
+            )
+            assert not result.success
+
+            # the outputs of a failed run are kept, so that it can be re-executed
+            output_path = os.path.join(tmpdir_path, result.run_id, "make_frame", "result")
+            assert os.path.isfile(os.path.join(output_path, "object"))
+            if sys.version_info >= (3, 8):
+                with open(os.path.join(output_path, "buffer_0"), "rb") as read_obj:
+                    assert read_obj.read() == b"abc" * 1000
+
+            reexecution_result = reexecute_pipeline(
+                reconstructable(failing_frame_job),
+                parent_run_id=result.run_id,
+                run_config={**run_config, "ops": {"check_frame": {"config": {"fail": False}}}},
+                step_selection=["check_frame"],
+                instance=instance,
+            )
+            assert reexecution_result.success
+
+            # once the re-execution succeeds, only its own outputs are removed, so that the failed
+            # run can still be re-executed again
+            assert os.path.isfile(os.path.join(output_path, "object"))
+            assert not os.path.exists(os.path.join(tmpdir_path, reexecution_result.run_id))
+
+
+@requires_out_of_band_pickle
+def test_shared_memory_io_manager_copy_on_write():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        manager = SharedMemoryIOManager(base_dir=tmpdir_path)
+        output_context = build_output_context(step_key="step", name="result", run_id="run")
+        manager.handle_output(output_context, Frame(bytearray(b"abc")))
+
+        loaded = manager.load_input(build_input_context(upstream_output=output_context))
+        loaded.data[0:3] = b"xyz"
+        assert bytes(loaded.data) == b"xyz"
+
+        reloaded = manager.load_input(build_input_context(upstream_output=output_context))
+        assert bytes(reloaded.data) == b"abc"
+
+        # empty buffers can not be mapped, and are loaded as empty bytes
+        manager.handle_output(output_context, Frame(bytearray()))
+        assert (
+            bytes(manager.load_input(build_input_context(upstream_output=output_context)).data)
+            == b""
+        )
+
+
+def test_shared_memory_io_manager_release_output():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        manager = SharedMemoryIOManager(base_dir=tmpdir_path)
+        output_context = build_output_context(step_key="step", name="result", run_id="run")
+        manager.handle_output(output_context, [1, 2, 3])
+        loaded = manager.load_input(build_input_context(upstream_output=output_context))
+        assert loaded == [1, 2, 3]
+
+        manager.release_output(output_context)
+        assert not os.path.exists(os.path.join(tmpdir_path, "run", "step", "result"))
+
+
+def test_shared_memory_io_manager_cleanup_run():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        manager = SharedMemoryIOManager(base_dir=tmpdir_path)
+        for run_id in ["run", "other_run"]:
+            manager.handle_output(
+                build_output_context(step_key="step", name="result", run_id=run_id), [1, 2, 3]
+            )
+
+        manager.cleanup_run("run")
+        assert not os.path.exists(os.path.join(tmpdir_path, "run"))
+        assert os.path.exists(os.path.join(tmpdir_path, "other_run", "step", "result"))
@@ -7,6 +7,7 @@
 import mock
 import pendulum
 import pytest
+import sqlalchemy as db
 
 from dagster import (
     AssetKey,
@@ -40,8 +41,17 @@
 from dagster.core.execution.api import execute_run
 from dagster.core.execution.plan.handle import StepHandle
 from dagster.core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster.core.execution.stats import StepEventStatus
-from dagster.core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
+from dagster.core.execution.plan.outputs import StepOutputHandle
+from dagster.core.execution.stats import (
+    StepEventStatus,
+    build_run_stats_from_events,
+    build_run_step_stats_from_events,
+)
+from dagster.core.storage.event_log import (
+    InMemoryEventLogStorage,
+    SqlEventLogStorage,
+    sql_event_log,
+)
 from dagster.core.storage.event_log.base import (
     EventLogRecord,
     EventRecordsFilter,
@@ -50,12 +60,15 @@
 from dagster.core.storage.event_log.migration import (
     EVENT_LOG_DATA_MIGRATIONS,
     migrate_asset_key_data,
+    migrate_asset_keys_latest_materialization_columns,
 )
+from dagster.core.storage.event_log.retention import RETAINED_EVENT_TYPES
+from dagster.core.storage.event_log.schema import AssetKeyTable, RunStepStatsTable
 from dagster.core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster.core.test_utils import instance_for_test
 from dagster.core.utils import make_new_run_id
 from dagster.loggers import colored_console_logger
-from dagster.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.serdes import deserialize_dagster_namedtuple
 from dagster.utils import datetime_as_float
 
 DEFAULT_RUN_ID = "foo"
@@ -359,6 +372,30 @@ def test_event_log_storage_store_with_multiple_runs(self, storage):
             for run_id in runs:
                 assert len(storage.get_logs_for_run(run_id)) == 0
 
+    def test_event_log_storage_store_events_batch(self, storage):
+        @solid
+        def materialize_one(_):
+            yield AssetMaterialization(asset_key=AssetKey("batch_asset"))
+            yield Output(1)
+
+        def _solids():
+            materialize_one()
+
+        events_one, result_one = _synthesize_events(_solids)
+        events_two, result_two = _synthesize_events(_solids)
+
+        # interleave the two runs so that batches switch between runs
+        batch = []
+        for i in range(max(len(events_one), len(events_two))):
+            batch.extend(events_one[i : i + 1])
+            batch.extend(events_two[i : i + 1])
+
+        storage.store_events(batch)
+
+        assert _event_types(storage.get_logs_for_run(result_one.run_id)) == _event_types(events_one)
+        assert _event_types(storage.get_logs_for_run(result_two.run_id)) == _event_types(events_two)
+        assert storage.has_asset_key(AssetKey("batch_asset"))
+
     def test_event_log_storage_watch(self, storage):
         if not self.can_watch():
             pytest.skip("storage cannot watch runs")
@@ -400,6 +437,137 @@ def test_event_log_storage_watch(self, storage):
 
         assert [int(evt.user_message) for evt in watched] == [2, 3, 4]
 
+    def test_event_log_storage_watch_batch(self, storage):
+        if not self.can_watch():
+            pytest.skip("storage cannot watch runs")
+
+        watched = []
+        watcher = lambda x: watched.append(x)  # pylint: disable=unnecessary-lambda
+
+        storage.store_event(create_test_event_log_record(str(1)))
+        storage.watch(DEFAULT_RUN_ID, 0, watcher)
+
+        storage.store_events([create_test_event_log_record(str(i)) for i in range(2, 12)])
+
+        attempts = 10
+        while len(watched) < 10 and attempts > 0:
+            time.sleep(0.5)
+            attempts -= 1
+
+        storage.end_watch(DEFAULT_RUN_ID, watcher)
+
+        assert len(storage.get_logs_for_run(DEFAULT_RUN_ID)) == 11
+        assert [int(evt.user_message) for evt in watched] == list(range(2, 12))
+
+    def test_event_log_storage_watch_multiple_subscribers(self, storage):
+        if not self.can_watch():
+            pytest.skip("storage cannot watch runs")
+
+        watched_one = []
+        watched_two = []
+        watcher_one = lambda x: watched_one.append(x)  # pylint: disable=unnecessary-lambda
+        watcher_two = lambda x: watched_two.append(x)  # pylint: disable=unnecessary-lambda
+
+        storage.store_event(create_test_event_log_record(str(1)))
+        storage.store_event(create_test_event_log_record(str(2)))
+
+        storage.watch(DEFAULT_RUN_ID, 1, watcher_one)
+        storage.watch(DEFAULT_RUN_ID, 1, watcher_two)
+
+        storage.store_events([create_test_event_log_record(str(i)) for i in range(3, 6)])
+
+        attempts = 10
+        while (len(watched_one) < 3 or len(watched_two) < 3) and attempts > 0:
+            time.sleep(0.5)
+            attempts -= 1
+
+        storage.end_watch(DEFAULT_RUN_ID, watcher_one)
+        time.sleep(0.3)
+        storage.store_event(create_test_event_log_record(str(6)))
+
+        attempts = 10
+        while len(watched_two) < 4 and attempts > 0:
+            time.sleep(0.5)
+            attempts -= 1
+
+        storage.end_watch(DEFAULT_RUN_ID, watcher_two)
+
+        assert [int(evt.user_message) for evt in watched_one] == [3, 4, 5]
+        assert [int(evt.user_message) for evt in watched_two] == [3, 4, 5, 6]
+
+    def test_purge_events(self, storage):
+        events, result = _synthesize_events(two_solids)
+        for event in events:
+            storage.store_event(event)
+
+        run_id = result.run_id
+        handled_output_count = len(
+            [
+                event
+                for event in events
+                if event.dagster_event_type == DagsterEventType.HANDLED_OUTPUT
+            ]
+        )
+        materialization_count = len(
+            [
+                event
+                for event in events
+                if event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
+            ]
+        )
+        assert handled_output_count == 2
+        assert materialization_count == 3
+
+        # none of the events are older than the earliest event
+        earliest_timestamp = min(event.timestamp for event in events)
+        assert storage.purge_events([run_id], earliest_timestamp) == 0
+
+        # each call purges a single batch
+        for _ in range(handled_output_count):
+            assert (
+                storage.purge_events(
+                    [run_id],
+                    time.time() + 1,
+                    event_types=[DagsterEventType.HANDLED_OUTPUT],
+                    batch_size=1,
+                )
+                == 1
+            )
+        assert (
+            storage.purge_events(
+                [run_id],
+                time.time() + 1,
+                event_types=[DagsterEventType.HANDLED_OUTPUT],
+                batch_size=1,
+            )
+            == 0
+        )
+        remaining = storage.get_logs_for_run(run_id)
+        assert len(remaining) == len(events) - handled_output_count
+        assert DagsterEventType.HANDLED_OUTPUT not in _event_types(remaining)
+
+        # asset events and the step and run lifecycle events are retained
+        retained_count = len(
+            [event for event in remaining if event.dagster_event_type in RETAINED_EVENT_TYPES]
+        )
+        assert retained_count >= materialization_count
+        assert (
+            storage.purge_events([make_new_run_id(), run_id], time.time() + 1, batch_size=1000)
+            == len(remaining) - retained_count
+        )
+        assert _event_types(storage.get_logs_for_run(run_id)) == [
+            event.dagster_event_type
+            for event in remaining
+            if event.dagster_event_type in RETAINED_EVENT_TYPES
+        ]
+        assert (
+            storage.purge_events(
+                [run_id], time.time() + 1, event_types=[DagsterEventType.STEP_OUTPUT]
+            )
+            == 0
+        )
+        assert storage.get_latest_materialization_events([AssetKey("asset_1")])[AssetKey("asset_1")]
+
     def test_event_log_storage_pagination(self, storage):
         # interleave two runs events to ensure pagination is not affected by other runs
         storage.store_event(create_test_event_log_record("A"))
@@ -552,7 +720,7 @@ def _solids():
 
         rows = _fetch_all_events(storage, run_id=DEFAULT_RUN_ID)
 
-        out_events = list(map(lambda r: deserialize_json_to_dagster_namedtuple(r[0]), rows))
+        out_events = list(map(lambda r: deserialize_dagster_namedtuple(r[0]), rows))
 
         # messages can come out of order
         event_type_counts = Counter(_event_types(out_events))
@@ -965,14 +1133,14 @@ def _solids():
                 # for generic sql-based event log storage
                 stack.enter_context(
                     mock.patch(
-                        "dagster.core.storage.event_log.sql_event_log.deserialize_json_to_dagster_namedtuple",
+                        "dagster.core.storage.event_log.sql_event_log.deserialize_dagster_namedtuple",
                         return_value="not_an_event_record",
                     )
                 )
                 # for sqlite event log storage, which overrides the record fetching implementation
                 stack.enter_context(
                     mock.patch(
-                        "dagster.core.storage.event_log.sqlite.sqlite_event_log.deserialize_json_to_dagster_namedtuple",
+                        "dagster.core.storage.event_log.sqlite.sqlite_event_log.deserialize_dagster_namedtuple",
                         return_value="not_an_event_record",
                     )
                 )
@@ -995,14 +1163,14 @@ def _solids():
                 # for generic sql-based event log storage
                 stack.enter_context(
                     mock.patch(
-                        "dagster.core.storage.event_log.sql_event_log.deserialize_json_to_dagster_namedtuple",
+                        "dagster.core.storage.event_log.sql_event_log.deserialize_dagster_namedtuple",
                         side_effect=seven.JSONDecodeError("error", "", 0),
                     )
                 )
                 # for sqlite event log storage, which overrides the record fetching implementation
                 stack.enter_context(
                     mock.patch(
-                        "dagster.core.storage.event_log.sqlite.sqlite_event_log.deserialize_json_to_dagster_namedtuple",
+                        "dagster.core.storage.event_log.sqlite.sqlite_event_log.deserialize_dagster_namedtuple",
                         side_effect=seven.JSONDecodeError("error", "", 0),
                     )
                 )
@@ -1097,6 +1265,34 @@ def _one():
         assert step_stats[0].attempts == 4
         assert len(step_stats[0].attempts_list) == 4
 
+    def test_get_yielded_step_outputs(self, storage):
+        @solid(
+            output_defs=[
+                OutputDefinition(name="yielded", is_required=False),
+                OutputDefinition(name="not_yielded", is_required=False),
+            ]
+        )
+        def optional_outputs(_):
+            yield Output(1, "yielded")
+
+        def _two():
+            optional_outputs()
+            should_succeed()
+
+        events, result = _synthesize_events(_two)
+        for event in events:
+            storage.store_event(event)
+
+        assert storage.get_yielded_step_outputs(result.run_id) == {
+            StepOutputHandle("optional_outputs", "yielded"),
+            StepOutputHandle("should_succeed", "result"),
+        }
+        assert storage.get_yielded_step_outputs(result.run_id, step_keys=["optional_outputs"]) == {
+            StepOutputHandle("optional_outputs", "yielded")
+        }
+        assert storage.get_yielded_step_outputs(result.run_id, step_keys=[]) == set()
+        assert storage.get_yielded_step_outputs(make_new_run_id()) == set()
+
     # After adding the IN_PROGRESS field to the StepEventStatus enum, tests in internal fail
     # Temporarily skipping this test
     @pytest.mark.skip
@@ -1165,6 +1361,165 @@ def _pipeline():
         assert len(step_stats[0].markers) == 1
         assert step_stats[0].markers[0].end_time >= step_stats[0].markers[0].start_time + 0.1
 
+    def test_run_stats_rollups(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("storage does not maintain run stats rollups")
+
+        @solid
+        def materialize_and_check(_):
+            yield AssetMaterialization(asset_key="rollup_asset")
+            yield ExpectationResult(success=True, label="rollup_expectation")
+            yield Output(1)
+
+        @solid(input_defs=[InputDefinition("_input", int)])
+        def should_retry(_context, _input):
+            raise RetryRequested(max_retries=2)
+
+        def _pipeline():
+            should_retry(materialize_and_check())
+
+        events, result = _synthesize_events(_pipeline, check_success=False)
+        storage.store_events(events[:5])
+        for event in events[5:]:
+            storage.store_event(event)
+
+        def _by_step_key(step_stats):
+            return {stats.step_key: stats for stats in step_stats}
+
+        def _assert_run_stats_match(run_stats, expected):
+            # the storage keeps event timestamps at microsecond precision
+            for field in ("enqueued_time", "launch_time", "start_time", "end_time"):
+                assert getattr(run_stats, field) == pytest.approx(getattr(expected, field))
+            assert run_stats._replace(
+                enqueued_time=None, launch_time=None, start_time=None, end_time=None
+            ) == expected._replace(
+                enqueued_time=None, launch_time=None, start_time=None, end_time=None
+            )
+
+        expected_run_stats = build_run_stats_from_events(result.run_id, events)
+        expected_step_stats = _by_step_key(build_run_step_stats_from_events(result.run_id, events))
+        assert expected_step_stats["should_retry"].attempts == 3
+        assert len(expected_step_stats["materialize_and_check"].materialization_events) == 1
+        assert len(expected_step_stats["materialize_and_check"].expectation_results) == 1
+
+        _assert_run_stats_match(storage.get_stats_for_run(result.run_id), expected_run_stats)
+        assert _by_step_key(storage.get_step_stats_for_run(result.run_id)) == expected_step_stats
+
+        # backfilling the rollups from the event log yields the same stats
+        storage.rebuild_run_stats(result.run_id)
+        _assert_run_stats_match(storage.get_stats_for_run(result.run_id), expected_run_stats)
+        assert _by_step_key(storage.get_step_stats_for_run(result.run_id)) == expected_step_stats
+
+        filtered = storage.get_step_stats_for_run(result.run_id, step_keys=["should_retry"])
+        assert [stats.step_key for stats in filtered] == ["should_retry"]
+
+        storage.delete_events(result.run_id)
+        assert storage.get_step_stats_for_run(result.run_id) == []
+        assert storage.get_stats_for_run(result.run_id).steps_failed == 0
+
+    def test_step_stats_rollup_concurrent_writers(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("storage does not maintain run stats rollups")
+
+        @solid
+        def materialize(_):
+            yield AssetMaterialization(asset_key="concurrent_asset")
+            yield Output(1)
+
+        def _pipeline():
+            materialize()
+
+        events, result = _synthesize_events(_pipeline)
+        with storage.run_connection(result.run_id) as conn:
+            if conn.dialect.name == "sqlite":
+                pytest.skip("sqlite serializes write transactions, so writers can not interleave")
+
+        materialization = next(
+            event
+            for event in events
+            if event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
+        )
+        step_success = next(
+            event for event in events if event.dagster_event_type == DagsterEventType.STEP_SUCCESS
+        )
+        for event in events:
+            if event not in (materialization, step_success):
+                storage.store_event(event)
+
+        apply_event = sql_event_log.apply_event_to_step_stats_state
+        concurrent_writes = []
+
+        def _apply_with_concurrent_write(state, event):
+            # another writer stores an event for the same step after the stats have been read
+            if not concurrent_writes:
+                concurrent_writes.append(materialization)
+                storage.store_event(materialization)
+            apply_event(state, event)
+
+        with mock.patch.object(
+            sql_event_log, "apply_event_to_step_stats_state", _apply_with_concurrent_write
+        ):
+            storage.store_event(step_success)
+
+        step_stats = storage.get_step_stats_for_run(result.run_id)
+        assert len(step_stats) == 1
+        assert step_stats[0].status == StepEventStatus.SUCCESS
+        assert step_stats[0].materialization_events == [materialization]
+
+        # the stored state only counts the materializations of the step
+        with storage.run_connection(result.run_id) as conn:
+            (stats,) = conn.execute(
+                db.select([RunStepStatsTable.c.stats]).where(
+                    RunStepStatsTable.c.run_id == result.run_id
+                )
+            ).fetchone()
+        assert "EventLogEntry" not in stats
+
+    def test_run_stats_rollup_written_with_event(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("storage does not maintain run stats rollups")
+
+        @solid
+        def return_one(_):
+            return 1
+
+        def _pipeline():
+            return_one()
+
+        events, result = _synthesize_events(_pipeline)
+        step_success_index = next(
+            i
+            for i, event in enumerate(events)
+            if event.dagster_event_type == DagsterEventType.STEP_SUCCESS
+        )
+        for event in events[:step_success_index]:
+            storage.store_event(event)
+
+        stats_before = storage.get_stats_for_run(result.run_id)
+        step_stats_before = storage.get_step_stats_for_run(result.run_id)
+
+        # a failure while updating the rollups also rolls back the event insert
+        for store_fn in (
+            lambda: storage.store_event(events[step_success_index]),
+            lambda: storage.store_events([events[step_success_index]]),
+        ):
+            with mock.patch.object(
+                sql_event_log,
+                "apply_event_to_step_stats_state",
+                side_effect=Exception("failed to update step stats"),
+            ):
+                with pytest.raises(Exception, match="failed to update step stats"):
+                    store_fn()
+
+            assert len(storage.get_logs_for_run(result.run_id)) == step_success_index
+            assert storage.get_stats_for_run(result.run_id) == stats_before
+            assert storage.get_step_stats_for_run(result.run_id) == step_stats_before
+
+        storage.store_event(events[step_success_index])
+        step_stats = storage.get_step_stats_for_run(result.run_id)
+        assert len(step_stats) == 1
+        assert step_stats[0].status == StepEventStatus.SUCCESS
+
     @pytest.mark.parametrize(
         "cursor_dt", cursor_datetime_args()
     )  # test both tz-aware and naive datetimes
@@ -1553,6 +1908,98 @@ def _fetch_events(storage):
             assert _event_tags(events_by_key[AssetKey("c")])["num"] == "2"
             assert _event_tags(events_by_key[AssetKey("d")])["num"] == "1"
 
+    def test_latest_materialization_index(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip(
+                "storage does not index the latest materializations in the asset_keys table"
+            )
+
+        @op
+        def materialize_twice(_):
+            yield AssetMaterialization(AssetKey("a"), partition="1")
+            yield AssetMaterialization(AssetKey("a"), partition="2")
+            yield AssetMaterialization(AssetKey("b"))
+            yield Output(1)
+
+        @op
+        def materialize_b(_):
+            yield AssetMaterialization(AssetKey("b"), partition="3")
+            yield Output(1)
+
+        def _indexed_columns():
+            with storage.index_connection() as conn:
+                rows = conn.execute(
+                    db.select(
+                        [
+                            AssetKeyTable.c.asset_key,
+                            AssetKeyTable.c.last_materialization_storage_id,
+                            AssetKeyTable.c.last_materialization_partition,
+                        ]
+                    )
+                ).fetchall()
+            return {AssetKey.from_db_string(row[0]): (row[1], row[2]) for row in rows}
+
+        def _latest_record(asset_key):
+            return storage.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+                ),
+                limit=1,
+            )[0]
+
+        def _fetch_counting_deserializations():
+            with mock.patch(
+                "dagster.core.storage.event_log.sql_event_log.deserialize_json_to_dagster_namedtuple",
+                side_effect=deserialize_dagster_namedtuple,
+            ) as deserialize_mock:
+                events_by_key = storage.get_latest_materialization_events(
+                    [AssetKey("a"), AssetKey("b"), AssetKey("c")]
+                )
+            return events_by_key, deserialize_mock.call_count
+
+        events, _ = _synthesize_events(lambda: materialize_twice())
+        # batched inserts do not return the ids of the inserted rows
+        storage.store_events(events)
+
+        latest_a, latest_b = _latest_record(AssetKey("a")), _latest_record(AssetKey("b"))
+        assert _indexed_columns() == {
+            AssetKey("a"): (latest_a.storage_id, "2"),
+            AssetKey("b"): (latest_b.storage_id, None),
+        }
+
+        events_by_key, num_deserialized = _fetch_counting_deserializations()
+        assert set(events_by_key.keys()) == {AssetKey("a"), AssetKey("b")}
+        assert events_by_key[AssetKey("a")].dagster_event.partition == "2"
+        assert num_deserialized == 2
+
+        # unchanged events are not deserialized again
+        events_by_key, num_deserialized = _fetch_counting_deserializations()
+        assert set(events_by_key.keys()) == {AssetKey("a"), AssetKey("b")}
+        assert num_deserialized == 0
+
+        events, _ = _synthesize_events(lambda: materialize_b())
+        for event in events:
+            storage.store_event(event)
+
+        latest_b = _latest_record(AssetKey("b"))
+        assert _indexed_columns()[AssetKey("b")] == (latest_b.storage_id, "3")
+        events_by_key, num_deserialized = _fetch_counting_deserializations()
+        assert events_by_key[AssetKey("b")].dagster_event.partition == "3"
+        assert num_deserialized == 1
+
+        # the columns can be rebuilt from the event log
+        with storage.index_connection() as conn:
+            conn.execute(
+                AssetKeyTable.update().values(  # pylint: disable=no-value-for-parameter
+                    last_materialization_storage_id=None, last_materialization_partition=None
+                )
+            )
+        migrate_asset_keys_latest_materialization_columns(storage)
+        assert _indexed_columns() == {
+            AssetKey("a"): (latest_a.storage_id, "2"),
+            AssetKey("b"): (latest_b.storage_id, "3"),
+        }
+
     def test_asset_keys(self, storage):
         with instance_for_test() as instance:
             if not storage._instance:  # pylint: disable=protected-access
@@ -741,6 +741,8 @@ def test_add_get_snapshot(self, storage):
         fetched_pipeline_snapshot = storage.get_pipeline_snapshot(pipeline_snapshot_id)
         assert fetched_pipeline_snapshot
         assert serialize_pp(fetched_pipeline_snapshot) == serialize_pp(pipeline_snapshot)
+        sized_pipeline_snapshot, _ = storage.get_pipeline_snapshot_and_size(pipeline_snapshot_id)
+        assert serialize_pp(sized_pipeline_snapshot) == serialize_pp(pipeline_snapshot)
         assert storage.has_pipeline_snapshot(pipeline_snapshot_id)
         assert not storage.has_pipeline_snapshot("nope")
 
@@ -809,6 +811,8 @@ def test_add_get_execution_snapshot(self, storage):
         fetched_ep_snapshot = storage.get_execution_plan_snapshot(snapshot_id)
         assert fetched_ep_snapshot
         assert serialize_pp(fetched_ep_snapshot) == serialize_pp(ep_snapshot)
+        sized_ep_snapshot, _ = storage.get_execution_plan_snapshot_and_size(snapshot_id)
+        assert serialize_pp(sized_ep_snapshot) == serialize_pp(ep_snapshot)
         assert storage.has_execution_plan_snapshot(snapshot_id)
         assert not storage.has_execution_plan_snapshot("nope")
 
@@ -0,0 +1,143 @@
+import sys
+from contextlib import contextmanager
+
+from dagster import pipeline, repository, solid
+from dagster.core.definitions.repository_definition import RepositoryData
+from dagster.core.test_utils import create_test_daemon_workspace
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.core.workspace.load_target import GrpcServerTarget, PythonFileTarget
+from dagster.grpc.client import EphemeralDagsterGrpcClient
+from dagster.grpc.server import open_server_process
+from dagster.seven import wait_for_process
+from dagster.utils import find_free_port
+
+
+@solid
+def the_solid(_):
+    return 1
+
+
+@pipeline
+def the_pipeline():
+    the_solid()
+
+
+@repository
+def the_repo():
+    return [the_pipeline]
+
+
+class DynamicRepositoryData(RepositoryData):
+    def __init__(self):
+        self._num_calls = 0
+
+    # returns a new pipeline each time the definitions are requested
+    def get_all_pipelines(self):
+        self._num_calls += 1
+
+        @pipeline(name=f"the_pipeline_{self._num_calls}")
+        def _dynamic_pipeline():
+            the_solid()
+
+        return [_dynamic_pipeline]
+
+
+@repository
+def dynamic_repo():
+    return DynamicRepositoryData()
+
+
+@contextmanager
+def _grpc_server(port):
+    server_process = open_server_process(
+        port=port,
+        socket=None,
+        loadable_target_origin=LoadableTargetOrigin(
+            executable_path=sys.executable, python_file=__file__, attribute="the_repo"
+        ),
+    )
+    try:
+        # shuts down server when it leaves this contextmanager
+        with EphemeralDagsterGrpcClient(port=port, socket=None, server_process=server_process):
+            yield
+    finally:
+        if server_process.poll() is None:
+            wait_for_process(server_process, timeout=30)
+
+
+def test_reload_reuses_unchanged_managed_location():
+    with create_test_daemon_workspace(
+        PythonFileTarget(
+            python_file=__file__,
+            attribute="the_repo",
+            working_directory=None,
+            location_name="test_location",
+        )
+    ) as workspace:
+        location = workspace.get_location("test_location")
+        external_repo = location.get_repository("the_repo")
+
+        workspace.cleanup()
+
+        # the server process did not change, so its repository data is not fetched again
+        assert workspace.get_location("test_location") is location
+        assert location.get_repository("the_repo") is external_repo
+
+
+def test_reload_refetches_dynamic_repository():
+    with create_test_daemon_workspace(
+        PythonFileTarget(
+            python_file=__file__,
+            attribute="dynamic_repo",
+            working_directory=None,
+            location_name="test_location",
+        )
+    ) as workspace:
+        location = workspace.get_location("test_location")
+        pipeline_names = {
+            external_pipeline.name
+            for external_pipeline in location.get_repository(
+                "dynamic_repo"
+            ).get_all_external_pipelines()
+        }
+
+        workspace.cleanup()
+
+        # the server has not changed, but its definitions may have, so they are fetched again
+        reloaded_location = workspace.get_location("test_location")
+        assert reloaded_location is not location
+        assert reloaded_location.server_id == location.server_id
+        assert {
+            external_pipeline.name
+            for external_pipeline in reloaded_location.get_repository(
+                "dynamic_repo"
+            ).get_all_external_pipelines()
+        } != pipeline_names
+
+
+def test_reload_refetches_changed_server():
+    port = find_free_port()
+    with create_test_daemon_workspace(
+        GrpcServerTarget(host="localhost", port=port, socket=None, location_name="test_location")
+    ) as workspace:
+        with _grpc_server(port):
+            location = workspace.get_location("test_location")
+
+            workspace.cleanup()
+            assert workspace.get_location("test_location") is location
+
+        # a restarted server has a new server id, so the location is loaded again
+        with _grpc_server(port):
+            workspace.cleanup()
+            reloaded_location = workspace.get_location("test_location")
+            assert reloaded_location is not location
+            assert reloaded_location.server_id != location.server_id
+            assert reloaded_location.get_repository("the_repo").has_external_pipeline(
+                "the_pipeline"
+            )
+
+        # an unreachable server can not be reused, and fails to load
+        workspace.cleanup()
+        entry = workspace.get_workspace_snapshot()["test_location"]
+        assert entry.repository_location is None
+        assert entry.load_error
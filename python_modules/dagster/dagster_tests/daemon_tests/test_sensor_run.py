@@ -3,8 +3,10 @@
 import string
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
+import mock
 import pendulum
 import pytest
 
@@ -156,6 +158,12 @@ def error_sensor(context):
     raise Exception("womp womp")
 
 
+@sensor(pipeline_name="the_pipeline")
+def slow_sensor(_context):
+    time.sleep(2)
+    return RunRequest(run_key=None, run_config={}, tags={})
+
+
 @sensor(pipeline_name="the_pipeline")
 def wrong_config_sensor(_context):
     return RunRequest(run_key="bad_config_key", run_config={"bad_key": "bad_val"}, tags={})
@@ -306,6 +314,7 @@ def the_repo():
         bad_request_untargeted,
         bad_request_mismatch,
         bad_request_unspecified,
+        slow_sensor,
     ]
 
 
@@ -368,14 +377,24 @@ def workspace_load_target(attribute="the_repo"):
     )
 
 
-def evaluate_sensors(instance, workspace):
+def evaluate_sensors(instance, workspace, threadpool_executor=None):
+    sensor_tick_futures = {}
     list(
         execute_sensor_iteration(
             instance,
             get_default_daemon_logger("SensorDaemon"),
             workspace,
+            threadpool_executor=threadpool_executor,
+            sensor_tick_futures=sensor_tick_futures,
         )
     )
+    wait_for_futures(sensor_tick_futures)
+    return sensor_tick_futures
+
+
+def wait_for_futures(futures, timeout=10):
+    for future in futures.values():
+        future.result(timeout=timeout)
 
 
 def validate_tick(
@@ -2114,3 +2133,167 @@ def test_status_in_code_sensor():
                 )
 
                 assert len(instance.get_ticks(never_running_origin.get_id())) == 0
+
+
+def test_sensor_threads():
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with instance_with_sensors(overrides={"sensors": {"use_threads": True, "num_workers": 4}}) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        with pendulum.test(freeze_datetime), ThreadPoolExecutor(
+            max_workers=4
+        ) as threadpool_executor:
+            slow = external_repo.get_external_sensor("slow_sensor")
+            always_on = external_repo.get_external_sensor("always_on_sensor")
+            instance.start_sensor(slow)
+            instance.start_sensor(always_on)
+
+            sensor_tick_futures = {}
+            list(
+                execute_sensor_iteration(
+                    instance,
+                    get_default_daemon_logger("SensorDaemon"),
+                    workspace,
+                    threadpool_executor=threadpool_executor,
+                    sensor_tick_futures=sensor_tick_futures,
+                )
+            )
+            assert set(sensor_tick_futures.keys()) == {
+                slow.get_external_origin_id(),
+                always_on.get_external_origin_id(),
+            }
+
+            # the slow sensor does not hold up the others
+            sensor_tick_futures[always_on.get_external_origin_id()].result(timeout=10)
+            assert not sensor_tick_futures[slow.get_external_origin_id()].done()
+            validate_tick(
+                instance.get_ticks(always_on.get_external_origin_id())[0],
+                always_on,
+                freeze_datetime,
+                TickStatus.SUCCESS,
+            )
+
+            # a sensor is not evaluated again while its previous tick is in flight
+            list(
+                execute_sensor_iteration(
+                    instance,
+                    get_default_daemon_logger("SensorDaemon"),
+                    workspace,
+                    threadpool_executor=threadpool_executor,
+                    sensor_tick_futures=sensor_tick_futures,
+                )
+            )
+            wait_for_futures(sensor_tick_futures)
+            assert len(instance.get_ticks(slow.get_external_origin_id())) == 1
+
+            wait_for_all_runs_to_start(instance)
+            assert instance.get_runs_count() == 2
+            validate_tick(
+                instance.get_ticks(slow.get_external_origin_id())[0],
+                slow,
+                freeze_datetime,
+                TickStatus.SUCCESS,
+            )
+
+
+def test_sensor_threads_max_concurrent_per_location():
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with instance_with_sensors(
+        overrides={"sensors": {"use_threads": True, "max_concurrent_per_location": 1}}
+    ) as (instance, workspace, external_repo):
+        with pendulum.test(freeze_datetime), ThreadPoolExecutor(
+            max_workers=4
+        ) as threadpool_executor:
+            always_on = external_repo.get_external_sensor("always_on_sensor")
+            run_key = external_repo.get_external_sensor("run_key_sensor")
+            instance.start_sensor(always_on)
+
+            evaluate_sensors(instance, workspace, threadpool_executor)
+            assert len(instance.get_ticks(always_on.get_external_origin_id())) == 1
+
+        freeze_datetime = freeze_datetime.add(seconds=60)
+        with pendulum.test(freeze_datetime), ThreadPoolExecutor(
+            max_workers=4
+        ) as threadpool_executor:
+            instance.start_sensor(run_key)
+
+            # the sensor that has never been evaluated is the most overdue, and takes the only slot
+            sensor_tick_futures = evaluate_sensors(instance, workspace, threadpool_executor)
+            assert list(sensor_tick_futures.keys()) == [run_key.get_external_origin_id()]
+            assert len(instance.get_ticks(always_on.get_external_origin_id())) == 1
+            assert len(instance.get_ticks(run_key.get_external_origin_id())) == 1
+
+
+def test_sensor_threads_workspace_cleanup():
+    with instance_with_sensors(overrides={"sensors": {"use_threads": True, "num_workers": 4}}) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        slow = external_repo.get_external_sensor("slow_sensor")
+        instance.start_sensor(slow)
+
+        original_cleanup = workspace.cleanup
+        cleanup_tick_statuses = []
+
+        def _cleanup():
+            cleanup_tick_statuses.append(
+                [tick.status for tick in instance.get_ticks(slow.get_external_origin_id())]
+            )
+            original_cleanup()
+
+        # reload the workspace on every iteration, while the slow sensor is still running
+        with mock.patch("dagster.daemon.sensor.RELOAD_WORKSPACE", -1), mock.patch(
+            "dagster.daemon.sensor.MIN_INTERVAL_LOOP_TIME", 0
+        ), mock.patch.object(workspace, "cleanup", _cleanup):
+            list(
+                execute_sensor_iteration_loop(
+                    instance,
+                    workspace,
+                    get_default_daemon_logger("SensorDaemon"),
+                    until=pendulum.now("UTC").timestamp() + 3,
+                )
+            )
+
+        # the workspace is only cleaned up once the in-flight tick has finished
+        assert cleanup_tick_statuses
+        assert [TickStatus.SUCCESS] in cleanup_tick_statuses
+        for tick_statuses in cleanup_tick_statuses:
+            assert TickStatus.STARTED not in tick_statuses
+
+
+def test_sensor_timeout():
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with instance_with_sensors(overrides={"sensors": {"timeout_seconds": 0.5}}) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        with pendulum.test(freeze_datetime):
+            external_sensor = external_repo.get_external_sensor("slow_sensor")
+            instance.start_sensor(external_sensor)
+
+            evaluate_sensors(instance, workspace)
+
+            assert instance.get_runs_count() == 0
+            ticks = instance.get_ticks(external_sensor.get_external_origin_id())
+            assert len(ticks) == 1
+            validate_tick(
+                ticks[0],
+                external_sensor,
+                freeze_datetime,
+                TickStatus.FAILURE,
+                [],
+                "Deadline Exceeded",
+            )
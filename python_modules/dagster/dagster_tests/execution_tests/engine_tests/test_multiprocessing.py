@@ -103,6 +103,110 @@ def test_forkserver_preload():
         assert result.result_for_solid("adder").output_value() == 11
 
 
+def _step_pids(result):
+    step_pids = {}
+    for event in result.event_list:
+        if event.is_engine_event and event.message.endswith("in subprocess"):
+            pid_entry, step_key_entry = event.event_specific_data.metadata_entries
+            step_pids[step_key_entry.entry_data.text] = pid_entry.entry_data.text
+    return step_pids
+
+
+def test_reuse_processes():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {"max_concurrent": 1, "reuse_processes": {"enabled": {}}}
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        step_pids = _step_pids(result)
+        assert len(step_pids) == 4
+        assert len(set(step_pids.values())) == 1
+        assert str(os.getpid()) not in step_pids.values()
+
+
+def test_reuse_processes_max_steps():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {
+                            "max_concurrent": 1,
+                            "reuse_processes": {"enabled": {"max_steps_per_process": 2}},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        step_pids = _step_pids(result)
+        assert len(step_pids) == 4
+        assert len(set(step_pids.values())) == 2
+
+
+def test_reuse_processes_max_memory():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {
+                            "max_concurrent": 1,
+                            # every worker exceeds this limit, so each step gets a new process
+                            "reuse_processes": {"enabled": {"max_process_memory_mb": 1}},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        step_pids = _step_pids(result)
+        assert len(step_pids) == 4
+        assert len(set(step_pids.values())) == 4
+
+
+def test_critical_path_step_ordering():
+    with instance_for_test() as instance:
+        run_config = {
+            "execution": {
+                "multiprocess": {
+                    "config": {
+                        "max_concurrent": 1,
+                        "reuse_processes": {"enabled": {}},
+                        "step_ordering": {"critical_path": {"history_run_limit": 1}},
+                    }
+                }
+            },
+        }
+
+        # the first run has no history to weight the plan with, the second uses the first run's
+        for _ in range(2):
+            result = execute_pipeline(
+                reconstructable(define_diamond_pipeline),
+                run_config=run_config,
+                instance=instance,
+            )
+            assert result.success
+            assert result.result_for_solid("adder").output_value() == 11
+
+
 def define_diamond_pipeline():
     @lambda_solid
     def return_two():
@@ -511,3 +615,20 @@ def test_crash_hard_multiprocessing():
         #     ).data
         #     is None
         # )
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_reuse_processes():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(sys_exit_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"reuse_processes": {"enabled": {}}}}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        failure_data = result.result_for_solid("sys_exit").failure_data
+        assert failure_data
+        assert failure_data.error.cls_name == "ChildProcessCrashException"
@@ -1,4 +1,5 @@
 import subprocess
+import time
 from typing import List
 
 from dagster import executor, pipeline, reconstructable, solid
@@ -76,6 +77,7 @@ def test_step_delegating_executor(exc_init):
         check_step_health_interval_seconds=exc_init.executor_config.get(
             "check_step_health_interval_seconds"
         ),
+        max_sleep_seconds=exc_init.executor_config.get("max_sleep_seconds"),
     )
 
 
@@ -220,6 +222,29 @@ def test_execute_intervals():
     assert TestStepHandler.check_step_health_count >= 3
 
 
+def test_execute_watches_event_log():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        start = time.time()
+        result = execute_pipeline(
+            reconstructable(foo_pipline),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "test_step_delegating_executor": {
+                        "config": {"sleep_seconds": 60.0, "max_sleep_seconds": 60.0}
+                    }
+                }
+            },
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.launch_step_count == 3
+    # the executor is woken up by new events, rather than waiting out the sleep between polls
+    assert time.time() - start < 60
+
+
 @executor(
     name="test_step_delegating_executor_verify_step",
     requirements=multiple_process_executor_requirements(),
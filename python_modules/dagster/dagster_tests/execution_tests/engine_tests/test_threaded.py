@@ -0,0 +1,214 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from dagster import (
+    DagsterEventType,
+    Field,
+    RetryPolicy,
+    String,
+    execute_pipeline,
+    execute_pipeline_iterator,
+    job,
+    mem_io_manager,
+    op,
+    seven,
+    threaded_executor,
+)
+from dagster.check import CheckError
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.test_utils import instance_for_test
+from dagster.utils import send_interrupt
+
+
+def _run_config(**executor_config):
+    return {"execution": {"config": executor_config}}
+
+
+@op
+def wait():
+    # sleeping releases the GIL, like NumPy, pyarrow or database drivers do
+    time.sleep(0.5)
+    return 1
+
+
+@op
+def make_lock():
+    # can not be pickled, so can only be handed to the next step in memory
+    return threading.Lock()
+
+
+@op
+def check_lock(lock, values):
+    assert isinstance(lock, type(threading.Lock()))
+    return sum(values)
+
+
+@job(executor_def=threaded_executor, resource_defs={"io_manager": mem_io_manager})
+def wait_job():
+    check_lock(make_lock(), [wait.alias(f"wait_{i}")() for i in range(4)])
+
+
+def test_threaded_executor():
+    start = time.time()
+    result = execute_pipeline(wait_job, run_config=_run_config(max_concurrent=4))
+    assert result.success
+    assert result.result_for_solid("check_lock").output_value() == 4
+    # the waiting ops execute at the same time, rather than one after the other
+    assert time.time() - start < 1.5
+
+
+def test_threaded_executor_tag_concurrency_limits():
+    running = []
+    max_running = []
+    lock = threading.Lock()
+
+    @op(tags={"database": "warehouse"})
+    def query_warehouse():
+        with lock:
+            running.append(1)
+            max_running.append(len(running))
+        time.sleep(0.1)
+        with lock:
+            running.pop()
+
+    @op
+    def compute():
+        time.sleep(0.1)
+
+    @job(executor_def=threaded_executor)
+    def tagged_job():
+        for i in range(6):
+            query_warehouse.alias(f"query_warehouse_{i}")()
+            compute.alias(f"compute_{i}")()
+
+    result = execute_pipeline(
+        tagged_job,
+        run_config=_run_config(
+            max_concurrent=8,
+            tag_concurrency_limits=[{"key": "database", "value": "warehouse", "limit": 2}],
+        ),
+    )
+    assert result.success
+    assert max(max_running) == 2
+
+    with pytest.raises(CheckError, match="must be at least 1"):
+        execute_pipeline(
+            tagged_job,
+            run_config=_run_config(
+                tag_concurrency_limits=[{"key": "database", "value": "warehouse", "limit": 0}],
+            ),
+        )
+
+
+def test_threaded_executor_compute_logs():
+    @op(config_schema={"message": Field(String)})
+    def log_message(context):
+        for _ in range(5):
+            print(context.op_config["message"])  # pylint: disable=print-call
+            time.sleep(0.05)
+
+    @job(executor_def=threaded_executor)
+    def log_job():
+        log_message.alias("log_a")()
+        log_message.alias("log_b")()
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            log_job,
+            run_config={
+                "execution": {"config": {"max_concurrent": 2}},
+                "ops": {
+                    "log_a": {"config": {"message": "from_a"}},
+                    "log_b": {"config": {"message": "from_b"}},
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        compute_log_manager = instance.compute_log_manager
+        log_a = compute_log_manager.read_logs_file(result.run_id, "log_a", ComputeIOType.STDOUT)
+        log_b = compute_log_manager.read_logs_file(result.run_id, "log_b", ComputeIOType.STDOUT)
+        assert log_a.data.split() == ["from_a"] * 5
+        assert log_b.data.split() == ["from_b"] * 5
+
+
+def test_threaded_executor_failure_and_retries():
+    attempts = []
+
+    @op(retry_policy=RetryPolicy(max_retries=2))
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise Exception("flaky")
+        return len(attempts)
+
+    @op
+    def fail():
+        raise Exception("failure")
+
+    @op
+    def downstream(_value):
+        pass
+
+    @op
+    async def async_value():
+        await asyncio.sleep(0.01)
+        return 1
+
+    @job(executor_def=threaded_executor)
+    def failure_job():
+        flaky()
+        downstream(fail())
+        async_value()
+
+    result = execute_pipeline(failure_job, raise_on_error=False)
+    assert not result.success
+    assert result.result_for_solid("flaky").output_value() == 3
+    assert not result.result_for_solid("fail").success
+    assert result.result_for_solid("downstream").skipped
+    assert result.result_for_solid("async_value").output_value() == 1
+
+
+@pytest.mark.skipif(seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
+def test_threaded_executor_interrupt():
+    @op(config_schema={"tempfile": Field(String)})
+    def write_a_file(context):
+        with open(context.op_config["tempfile"], "w") as ff:
+            ff.write("yup")
+        # threads can not be interrupted, so running steps are left to finish
+        time.sleep(0.5)
+
+    @op
+    def should_not_start(_after):
+        assert False
+
+    @job(executor_def=threaded_executor)
+    def write_files_job():
+        should_not_start(write_a_file())
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        file_path = os.path.join(tempdir, "file")
+
+        def _send_interrupt():
+            while not os.path.exists(file_path):
+                time.sleep(0.1)
+            send_interrupt()
+
+        threading.Thread(target=_send_interrupt).start()
+
+        event_types = [
+            event.event_type
+            for event in execute_pipeline_iterator(
+                write_files_job,
+                run_config={"ops": {"write_a_file": {"config": {"tempfile": file_path}}}},
+            )
+        ]
+        assert DagsterEventType.STEP_SUCCESS in event_types
+        assert event_types.count(DagsterEventType.STEP_START) == 1
+        assert DagsterEventType.PIPELINE_FAILURE in event_types
@@ -1,6 +1,22 @@
 import asyncio
+import time
 
-from dagster import Output, execute_solid, solid
+import pytest
+
+from dagster import (
+    Field,
+    Output,
+    RetryPolicy,
+    String,
+    execute_pipeline,
+    execute_solid,
+    job,
+    op,
+    solid,
+)
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.tags import PRIORITY_TAG
+from dagster.core.test_utils import instance_for_test
 
 
 def test_aio_solid():
@@ -21,3 +37,216 @@ async def aio_gen(_):
 
     result = execute_solid(aio_gen)
     assert result.output_value() == "done"
+
+
+def _asyncio_run_config(max_concurrent=100):
+    return {
+        "execution": {"config": {"in_process": {"asyncio": {"max_concurrent": max_concurrent}}}}
+    }
+
+
+def test_asyncio_concurrent_ops():
+    @op
+    async def wait(context):
+        await asyncio.sleep(0.5)
+        context.log.info("waited")
+        return 1
+
+    @op
+    async def wait_gen():
+        await asyncio.sleep(0.5)
+        yield Output(1)
+
+    @op
+    def add(values):
+        return sum(values)
+
+    @job
+    def concurrent_job():
+        add([wait.alias(f"wait_{i}")() for i in range(10)] + [wait_gen()])
+
+    start = time.time()
+    result = execute_pipeline(concurrent_job, run_config=_asyncio_run_config())
+    assert result.success
+    assert result.result_for_solid("add").output_value() == 11
+    # the ops wait concurrently, rather than one after the other
+    assert time.time() - start < 5
+
+    for step_key in [f"wait_{i}" for i in range(10)] + ["wait_gen"]:
+        step_events = [
+            event.event_type_value
+            for event in result.event_list
+            if event.step_key == step_key and event.is_step_event
+        ]
+        assert step_events[0] == "STEP_START"
+        assert step_events[-1] == "STEP_SUCCESS"
+        assert step_events.index("STEP_OUTPUT") < step_events.index("HANDLED_OUTPUT")
+
+
+def test_asyncio_max_concurrent():
+    running = []
+    max_running = []
+
+    @op
+    async def wait():
+        running.append(1)
+        max_running.append(len(running))
+        await asyncio.sleep(0.1)
+        running.pop()
+
+    @job
+    def bounded_job():
+        for i in range(6):
+            wait.alias(f"wait_{i}")()
+
+    result = execute_pipeline(bounded_job, run_config=_asyncio_run_config(max_concurrent=2))
+    assert result.success
+    assert max(max_running) == 2
+
+
+def test_asyncio_max_concurrent_with_sync_ops():
+    running = []
+    max_running = []
+
+    @op(tags={PRIORITY_TAG: "1"})
+    async def wait_async():
+        running.append(1)
+        max_running.append(len(running))
+        await asyncio.sleep(0.2)
+        running.pop()
+
+    @op
+    def wait_sync():
+        running.append(1)
+        max_running.append(len(running))
+        time.sleep(0.1)
+        running.pop()
+
+    @job
+    def mixed_job():
+        wait_async()
+        wait_sync()
+
+    # the synchronous op does not start while the higher priority async op is running
+    result = execute_pipeline(mixed_job, run_config=_asyncio_run_config(max_concurrent=1))
+    assert result.success
+    assert max(max_running) == 1
+
+
+def test_asyncio_failure():
+    @op
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise Exception("async failure")
+
+    @op
+    def downstream(_value):
+        pass
+
+    @op
+    async def succeed():
+        return 1
+
+    @job
+    def failure_job():
+        downstream(fail())
+        succeed()
+
+    result = execute_pipeline(failure_job, run_config=_asyncio_run_config(), raise_on_error=False)
+    assert not result.success
+    assert "async failure" in result.result_for_solid("fail").failure_data.error.cause.message
+    assert result.result_for_solid("downstream").skipped
+    assert result.result_for_solid("succeed").success
+
+    with pytest.raises(Exception, match="async failure"):
+        execute_pipeline(failure_job, run_config=_asyncio_run_config())
+
+
+def test_asyncio_retries():
+    attempts = []
+
+    @op(retry_policy=RetryPolicy(max_retries=2))
+    async def flaky():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        if len(attempts) < 3:
+            raise Exception("flaky")
+        return len(attempts)
+
+    @job
+    def retry_job():
+        flaky()
+
+    result = execute_pipeline(retry_job, run_config=_asyncio_run_config())
+    assert result.success
+    assert result.result_for_solid("flaky").output_value() == 3
+
+
+def test_asyncio_compute_logs():
+    @op(config_schema={"message": Field(String)})
+    async def log_message(context):
+        for _ in range(5):
+            print(context.op_config["message"])  # pylint: disable=print-call
+            await asyncio.sleep(0.05)
+
+    @job
+    def log_job():
+        log_message.alias("log_a")()
+        log_message.alias("log_b")()
+
+    with instance_for_test() as instance:
+        run_config = _asyncio_run_config()
+        run_config["ops"] = {
+            "log_a": {"config": {"message": "from_a"}},
+            "log_b": {"config": {"message": "from_b"}},
+        }
+        result = execute_pipeline(log_job, run_config=run_config, instance=instance)
+        assert result.success
+
+        # the ops run concurrently, but each captures only what its own coroutine printed
+        compute_log_manager = instance.compute_log_manager
+        log_a = compute_log_manager.read_logs_file(result.run_id, "log_a", ComputeIOType.STDOUT)
+        log_b = compute_log_manager.read_logs_file(result.run_id, "log_b", ComputeIOType.STDOUT)
+        assert log_a.data.split() == ["from_a"] * 5
+        assert log_b.data.split() == ["from_b"] * 5
+
+
+def test_asyncio_sync_op_compute_logs():
+    @op
+    async def log_slowly():
+        for _ in range(5):
+            print("from_async")  # pylint: disable=print-call
+            await asyncio.sleep(0.1)
+
+    @op
+    async def start():
+        return 1
+
+    @op
+    def log_sync(_value):
+        for _ in range(3):
+            print("from_sync")  # pylint: disable=print-call
+            time.sleep(0.1)
+
+    @job
+    def mixed_log_job():
+        log_slowly()
+        log_sync(start())
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            mixed_log_job, run_config=_asyncio_run_config(), instance=instance
+        )
+        assert result.success
+
+        # the synchronous op executes while the async op is still printing, but captures only
+        # what it printed itself
+        compute_log_manager = instance.compute_log_manager
+        log_sync = compute_log_manager.read_logs_file(
+            result.run_id, "log_sync", ComputeIOType.STDOUT
+        )
+        log_slowly = compute_log_manager.read_logs_file(
+            result.run_id, "log_slowly", ComputeIOType.STDOUT
+        )
+        assert log_sync.data.split() == ["from_sync"] * 3
+        assert log_slowly.data.split() == ["from_async"] * 5
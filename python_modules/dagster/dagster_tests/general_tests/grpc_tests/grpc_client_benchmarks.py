@@ -0,0 +1,75 @@
+"""
+Compares the latency of pinging a gRPC server when every call opens its own channel, as the
+client used to, and when calls share the client's long-lived channel, with and without gzip
+compression of the requests.
+
+Pings are sent one after the other, like the heartbeat thread does, and from several threads at
+once, like the sensor daemon does when it evaluates sensors in parallel.
+
+cd python_modules/dagster && python -m dagster_tests.general_tests.grpc_tests.grpc_client_benchmarks
+"""
+
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+
+from dagster.grpc import DagsterGrpcClient, ephemeral_grpc_api_client
+from dagster.grpc.__generated__ import api_pb2
+
+NUM_PINGS = 2000
+NUM_THREADS = 8
+
+
+def ping_seconds(api_client, compression, new_channel_per_call):
+    """Returns the seconds taken by a single ping, including opening a channel if needed"""
+    start = time.perf_counter()
+    if new_channel_per_call:
+        api_client = DagsterGrpcClient(
+            port=api_client.port, socket=api_client.socket, host=api_client.host
+        )
+    api_client._query(  # pylint: disable=protected-access
+        "Ping", api_pb2.PingRequest, compression=compression, echo="ping"
+    )
+    if new_channel_per_call:
+        api_client.close()
+    return time.perf_counter() - start
+
+
+def run_workload(api_client, compression, new_channel_per_call, num_threads):
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        start = time.perf_counter()
+        latencies = list(
+            executor.map(
+                lambda _: ping_seconds(api_client, compression, new_channel_per_call),
+                range(NUM_PINGS),
+            )
+        )
+        total_seconds = time.perf_counter() - start
+    return latencies, total_seconds
+
+
+def run_grpc_client_benchmarks():
+    print(  # pylint: disable=print-call
+        f"{'channel':>10} {'compression':>14} {'threads':>8} {'p50 (ms)':>9} {'p99 (ms)':>9} "
+        f"{'pings/s':>8}"
+    )
+    with ephemeral_grpc_api_client() as api_client:
+        for new_channel_per_call in [True, False]:
+            for compression in [grpc.Compression.Gzip, grpc.Compression.NoCompression]:
+                for num_threads in [1, NUM_THREADS]:
+                    latencies, total_seconds = run_workload(
+                        api_client, compression, new_channel_per_call, num_threads
+                    )
+                    percentiles = statistics.quantiles(latencies, n=100)
+                    print(  # pylint: disable=print-call
+                        f"{'per call' if new_channel_per_call else 'shared':>10} "
+                        f"{compression.name:>14} {num_threads:>8} "
+                        f"{percentiles[49] * 1000:>9.2f} {percentiles[98] * 1000:>9.2f} "
+                        f"{NUM_PINGS / total_seconds:>8.0f}"
+                    )
+
+
+if __name__ == "__main__":
+    run_grpc_client_benchmarks()
@@ -1,6 +1,7 @@
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -188,3 +189,62 @@ def test_detect_server_restart():
         interrupt_ipc_subprocess_pid(server_process.pid)
 
     assert server_id_one != server_id_two
+
+
+def test_client_reuses_channel():
+    with ephemeral_grpc_api_client() as api_client:
+        assert api_client.ping("foo") == "foo"
+        channel = api_client._grpc_channel  # pylint: disable=protected-access
+
+        # calls from many threads share the one channel
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            echoes = list(executor.map(api_client.ping, [str(i) for i in range(50)]))
+        assert echoes == [str(i) for i in range(50)]
+        assert api_client._grpc_channel is channel  # pylint: disable=protected-access
+
+        # a stream that is not read to the end does not affect later calls
+        stream = api_client.streaming_ping(sequence_length=10, echo="foo")
+        assert next(stream)["sequence_number"] == 0
+        stream.close()
+        assert api_client.ping("bar") == "bar"
+
+
+def test_client_reconnects_after_server_restart():
+    port, server_process = create_server_process()
+    api_client = DagsterGrpcClient(port=port)
+    try:
+        server_id_one = api_client.get_server_id()
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
+
+    seven.wait_for_process(server_process, timeout=5)
+    with pytest.raises(DagsterUserCodeUnreachableError):
+        api_client.get_server_id()
+
+    # the same client connects to a new server on the same port without backing off
+    server_process = open_server_process(port=port, socket=None)
+    try:
+        start_time = time.time()
+        server_id_two = api_client.get_server_id()
+        assert time.time() - start_time < 5
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
+        api_client.close()
+
+    assert server_id_one != server_id_two
+
+
+def test_client_close_lets_calls_finish():
+    with ephemeral_grpc_api_client() as api_client:
+        stream = api_client.streaming_ping(sequence_length=10, echo="foo")
+        assert next(stream)["sequence_number"] == 0
+
+        # the stream in flight is not cancelled, and its channel is closed once it ends
+        api_client.close()
+        assert [event["sequence_number"] for event in stream] == list(range(1, 10))
+        assert api_client._grpc_channel_calls == {}  # pylint: disable=protected-access
+
+        # a closed client opens a channel for each call, and closes it when the call ends
+        assert api_client.ping("bar") == "bar"
+        assert api_client._grpc_channel is None  # pylint: disable=protected-access
+        assert api_client._grpc_channel_calls == {}  # pylint: disable=protected-access
@@ -0,0 +1,117 @@
+"""
+Benchmarks comparing the compiled serdes paths against the descent path tracking implementation,
+and the binary serialization format against json, using the serialized pipeline snapshots and
+external repository data checked in as snapshot test fixtures.
+
+cd python_modules/dagster && python -m dagster_tests.general_tests.serdes_benchmarks
+"""
+
+import importlib
+import timeit
+import zlib
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+from dagster import seven
+from dagster.serdes import serdes
+from dagster.serdes.serdes import (
+    _WHITELIST_MAP,
+    _deserialize_json,
+    _serialize_dagster_namedtuple,
+    deserialize_payload,
+    serialize_value_to_bytes,
+)
+
+FIXTURE_MODULES = [
+    "dagster_tests.core_tests.snap_tests.snapshots.snap_test_active_data",
+    "dagster_tests.core_tests.snap_tests.snapshots.snap_test_execution_plan",
+    "dagster_tests.core_tests.snap_tests.snapshots.snap_test_pipeline_snap",
+]
+
+
+@contextmanager
+def compiled_serdes(enabled: bool) -> Iterator[None]:
+    prev = serdes._COMPILED_SERDES_ENABLED  # pylint: disable=protected-access
+    serdes._COMPILED_SERDES_ENABLED = enabled  # pylint: disable=protected-access
+    try:
+        yield
+    finally:
+        serdes._COMPILED_SERDES_ENABLED = prev  # pylint: disable=protected-access
+
+
+def load_serdes_fixtures() -> List[Tuple[str, str]]:
+    """Returns (name, json_str) pairs for every serialized whitelisted object in the fixtures"""
+    fixtures = []
+    for module_name in FIXTURE_MODULES:
+        snapshots = importlib.import_module(module_name).snapshots
+        for name, value in snapshots.items():
+            if isinstance(value, str) and value.startswith("{") and '"__class__"' in value:
+                fixtures.append((name, value))
+    return fixtures
+
+
+def _time(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number
+
+
+def run_compiled_benchmarks(number: int = 20):
+    print(  # pylint: disable=print-call
+        f"{'fixture':<60} {'op':<12} {'path (ms)':>10} {'compiled (ms)':>14} {'speedup':>8}"
+    )
+    for name, json_str in load_serdes_fixtures():
+        value = _deserialize_json(json_str, _WHITELIST_MAP)
+        packed_json = seven.json.dumps(seven.json.loads(json_str))
+
+        def _serialize(value=value):
+            return _serialize_dagster_namedtuple(value, _WHITELIST_MAP)
+
+        def _deserialize(packed_json=packed_json):
+            return _deserialize_json(packed_json, _WHITELIST_MAP)
+
+        for op, fn in [("serialize", _serialize), ("deserialize", _deserialize)]:
+            with compiled_serdes(False):
+                path_time = _time(fn, number)
+                expected = fn()
+            with compiled_serdes(True):
+                compiled_time = _time(fn, number)
+                assert fn() == expected
+
+            print(  # pylint: disable=print-call
+                f"{name[:60]:<60} {op:<12} {path_time * 1000:>10.3f} "
+                f"{compiled_time * 1000:>14.3f} {path_time / compiled_time:>7.2f}x"
+            )
+
+
+def run_binary_format_benchmarks(number: int = 20):
+    print(  # pylint: disable=print-call
+        f"{'fixture':<60} {'format':<8} {'bytes':>9} {'zlib bytes':>11} "
+        f"{'encode (ms)':>12} {'decode (ms)':>12}"
+    )
+    for name, json_str in load_serdes_fixtures():
+        value = _deserialize_json(json_str, _WHITELIST_MAP)
+        json_bytes = _serialize_dagster_namedtuple(value, _WHITELIST_MAP).encode("utf-8")
+        binary_bytes = serialize_value_to_bytes(value)
+        assert deserialize_payload(binary_bytes) == value
+
+        for fmt, payload, encode in [
+            (
+                "json",
+                json_bytes,
+                lambda value=value: _serialize_dagster_namedtuple(value, _WHITELIST_MAP).encode(
+                    "utf-8"
+                ),
+            ),
+            ("binary", binary_bytes, lambda value=value: serialize_value_to_bytes(value)),
+        ]:
+            encode_time = _time(encode, number)
+            decode_time = _time(lambda payload=payload: deserialize_payload(payload), number)
+            print(  # pylint: disable=print-call
+                f"{name[:60]:<60} {fmt:<8} {len(payload):>9} {len(zlib.compress(payload)):>11} "
+                f"{encode_time * 1000:>12.3f} {decode_time * 1000:>12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    run_compiled_benchmarks()
+    print()  # pylint: disable=print-call
+    run_binary_format_benchmarks()
@@ -10,6 +10,9 @@
 from dagster.check import ParameterCheckError, inst_param, set_param
 from dagster.serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster.serdes.serdes import (
+    BINARY_SERDES_MAGIC,
+    BINARY_SERDES_VERSION,
+    _WHITELIST_MAP,
     DefaultEnumSerializer,
     DefaultNamedTupleSerializer,
     EnumSerializer,
@@ -17,16 +20,22 @@
     _deserialize_json,
     _serialize_dagster_namedtuple,
     _whitelist_for_serdes,
+    deserialize_dagster_namedtuple,
     deserialize_json_to_dagster_namedtuple,
+    deserialize_payload,
     deserialize_value,
+    is_binary_serdes_payload,
     pack_inner_value,
     register_serdes_enum_fallbacks,
     register_serdes_tuple_fallbacks,
     serialize_value,
+    serialize_value_to_bytes,
     unpack_inner_value,
 )
 from dagster.serdes.utils import create_snapshot_id, hash_str
 
+from .serdes_benchmarks import compiled_serdes, load_serdes_fixtures
+
 
 def test_deserialize_value_ok():
     unpacked_tuple = deserialize_value('{"foo": "bar"}')
@@ -720,3 +729,137 @@ class Thing(NamedTuple):
 
     assert wmap.get_serialized_name("Thing") == "SerializedThing"
     assert wmap.get_deserialized_name("SerializedThing") == "Thing"
+
+
+def test_compiled_serdes_matches_path_tracking():
+    fixtures = load_serdes_fixtures()
+    assert fixtures
+
+    for _name, json_str in fixtures:
+        with compiled_serdes(False):
+            expected_value = _deserialize_json(json_str, whitelist_map=_WHITELIST_MAP)
+            expected_json = _serialize_dagster_namedtuple(
+                expected_value, whitelist_map=_WHITELIST_MAP
+            )
+
+        with compiled_serdes(True):
+            value = _deserialize_json(json_str, whitelist_map=_WHITELIST_MAP)
+            assert value == expected_value
+            assert _serialize_dagster_namedtuple(value, whitelist_map=_WHITELIST_MAP) == (
+                expected_json
+            )
+
+
+def test_compiled_serdes_custom_serializers():
+    test_map = WhitelistMap.create()
+
+    class SkipWhenEmptySerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def skip_when_empty(cls) -> Set[str]:
+            return {"bar"}
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=SkipWhenEmptySerializer)
+    class Inner(NamedTuple("_Inner", [("foo", str), ("bar", list)])):
+        def __new__(cls, foo, bar=None):
+            return super(Inner, cls).__new__(cls, foo, bar or [])
+
+    class OuterSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def value_to_storage_dict(cls, value, whitelist_map, descent_path):
+            storage = super().value_to_storage_dict(value, whitelist_map, descent_path)
+            storage["legacy"] = True
+            return storage
+
+        @classmethod
+        def value_from_storage_dict(
+            cls, storage_dict, klass, args_for_class, whitelist_map, descent_path
+        ):
+            assert "__class__" not in storage_dict
+            return klass(
+                inners=unpack_inner_value(
+                    storage_dict["inners"], whitelist_map, f"{descent_path}.inners"
+                )
+            )
+
+    @_whitelist_for_serdes(
+        whitelist_map=test_map, serializer=OuterSerializer, storage_name="OldOuter"
+    )
+    class Outer(NamedTuple):
+        inners: list
+
+    value = {"a": Outer([Inner("x"), Inner("y", [frozenset({1, 2})])]), "b": {3}}
+
+    with compiled_serdes(False):
+        expected = _serialize_dagster_namedtuple(value, whitelist_map=test_map)
+
+    with compiled_serdes(True):
+        serialized = _serialize_dagster_namedtuple(value, whitelist_map=test_map)
+        assert serialized == expected
+        assert '"bar"' not in seven.json.loads(serialized)["a"]["inners"][0]
+        assert seven.json.loads(serialized)["a"]["__class__"] == "OldOuter"
+
+        test_map.register_deserialized_name("OldOuter", "Outer")
+        assert _deserialize_json(serialized, whitelist_map=test_map) == value
+
+
+def test_compiled_serdes_error_does_not_mutate():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Fizz(NamedTuple):
+        buzz: int
+
+    packed = {"a": [{"__class__": "Fizz", "buzz": 1}, {"__class__": "Unknown"}]}
+    with pytest.raises(DeserializationError, match=re.escape("Descent path: .a[1]")):
+        unpack_inner_value(packed, whitelist_map=test_map, descent_path="")
+
+    assert packed == {"a": [{"__class__": "Fizz", "buzz": 1}, {"__class__": "Unknown"}]}
+
+
+def test_binary_format_roundtrip():
+    fixtures = load_serdes_fixtures()
+
+    for _name, json_str in fixtures:
+        value = _deserialize_json(json_str, whitelist_map=_WHITELIST_MAP)
+        payload = serialize_value_to_bytes(value)
+        assert is_binary_serdes_payload(payload)
+        assert len(payload) < len(json_str)
+        assert deserialize_payload(payload) == value
+        assert deserialize_dagster_namedtuple(payload) == value
+
+        # json payloads, as strings or as utf-8 encoded bytes, are detected as well
+        assert deserialize_dagster_namedtuple(json_str) == value
+        assert deserialize_dagster_namedtuple(json_str.encode("utf-8")) == value
+
+
+def test_binary_format_values():
+    value = {"a": {1, 2}, "b": frozenset(["x"]), "c": [None, 1.5, True, b"bytes"]}
+    assert deserialize_payload(serialize_value_to_bytes(value)) == value
+
+    # integers the binary encoding can't represent fall back to json
+    big_value = {"a": 2**70}
+    payload = serialize_value_to_bytes(big_value)
+    assert not is_binary_serdes_payload(payload)
+    assert deserialize_payload(payload) == big_value
+
+
+def test_binary_format_errors():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Fizz(NamedTuple):
+        buzz: int
+
+    payload = serialize_value_to_bytes({"a": [Fizz(1)]}, whitelist_map=test_map)
+
+    with pytest.raises(DeserializationError, match=re.escape("Descent path: <root:dict>.a[0]")):
+        deserialize_payload(payload, whitelist_map=WhitelistMap.create())
+
+    with pytest.raises(DeserializationError, match="Unsupported binary serialization format"):
+        deserialize_payload(BINARY_SERDES_MAGIC + bytes([BINARY_SERDES_VERSION + 1]) + payload[5:])
+
+    with pytest.raises(DeserializationError, match="Could not unpack"):
+        deserialize_payload(payload[:-3], whitelist_map=test_map)
+
+    with pytest.raises(DeserializationError, match="was not expected type of tuple"):
+        deserialize_dagster_namedtuple(serialize_value_to_bytes({"a": 1}))
@@ -2,8 +2,10 @@
 import random
 import string
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
+import mock
 import pendulum
 
 from dagster import (
@@ -29,6 +31,7 @@
     GrpcServerRepositoryLocation,
     GrpcServerRepositoryLocationOrigin,
 )
+from dagster.core.instance import DagsterInstance
 from dagster.core.scheduler.instigation import (
     InstigatorState,
     InstigatorStatus,
@@ -48,7 +51,8 @@
 from dagster.daemon import get_default_daemon_logger
 from dagster.grpc.client import EphemeralDagsterGrpcClient
 from dagster.grpc.server import open_server_process
-from dagster.scheduler.scheduler import launch_scheduled_runs
+from dagster.scheduler import scheduler
+from dagster.scheduler.scheduler import execute_scheduler_iteration_loop, launch_scheduled_runs
 from dagster.seven import wait_for_process
 from dagster.seven.compat.pendulum import create_pendulum_time, to_timezone
 from dagster.utils import find_free_port
@@ -2044,3 +2048,177 @@ def test_change_default_status(instance):
             assert len(ticks[0].run_ids) == 1
             assert ticks[0].timestamp == freeze_datetime.timestamp()
             assert ticks[0].status == TickStatus.SUCCESS
+
+
+def test_catchup_ticks_evaluated_in_batch(instance, workspace, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with pendulum.test(freeze_datetime):
+        external_schedule = external_repo.get_external_schedule("simple_schedule")
+        schedule_origin = external_schedule.get_external_origin()
+        instance.start_schedule(external_schedule)
+
+    freeze_datetime = freeze_datetime.add(days=3)
+    with pendulum.test(freeze_datetime):
+        location = workspace.get_location("test_location")
+        with mock.patch.object(
+            type(location),
+            "get_external_schedule_execution_data",
+            side_effect=Exception("catch-up ticks should be evaluated in one request"),
+        ):
+            list(launch_scheduled_runs(instance, workspace, logger(), pendulum.now("UTC")))
+
+        ticks = instance.get_ticks(schedule_origin.get_id())
+        assert len(ticks) == 3
+        assert all(tick.status == TickStatus.SUCCESS for tick in ticks)
+
+        runs_by_partition = {run.tags[PARTITION_NAME_TAG]: run for run in instance.get_runs()}
+        assert set(runs_by_partition.keys()) == {"2019-02-27", "2019-02-28", "2019-03-01"}
+
+
+def test_catchup_ticks_batch_error(instance, workspace, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=0, minute=0, second=1, tz="UTC"),
+        "US/Central",
+    )
+    with pendulum.test(freeze_datetime):
+        external_schedule = external_repo.get_external_schedule(
+            "bad_should_execute_schedule_on_odd_days"
+        )
+        schedule_origin = external_schedule.get_external_origin()
+        instance.start_schedule(external_schedule)
+
+    freeze_datetime = freeze_datetime.add(days=2)
+    with pendulum.test(freeze_datetime):
+        list(launch_scheduled_runs(instance, workspace, logger(), pendulum.now("UTC")))
+
+        # the tick on the even day launches its run, and the tick on the odd day fails on its own
+        ticks = instance.get_ticks(schedule_origin.get_id())
+        assert [tick.status for tick in ticks] == [TickStatus.FAILURE, TickStatus.SUCCESS]
+        assert "Error occurred during the execution of should_execute" in ticks[0].error.message
+        assert instance.get_runs_count() == 1
+
+
+def test_schedules_evaluated_in_threads(instance, workspace, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with pendulum.test(freeze_datetime):
+        simple_schedule = external_repo.get_external_schedule("simple_schedule")
+        hourly_schedule = external_repo.get_external_schedule("simple_hourly_schedule")
+        instance.start_schedule(simple_schedule)
+        instance.start_schedule(hourly_schedule)
+
+    freeze_datetime = freeze_datetime.add(seconds=2)
+    with pendulum.test(freeze_datetime), ThreadPoolExecutor(max_workers=2) as threadpool_executor:
+        schedule_tick_futures = {}
+        list(
+            launch_scheduled_runs(
+                instance,
+                workspace,
+                logger(),
+                pendulum.now("UTC"),
+                threadpool_executor=threadpool_executor,
+                schedule_tick_futures=schedule_tick_futures,
+            )
+        )
+        assert set(schedule_tick_futures.keys()) == {
+            simple_schedule.get_external_origin_id(),
+            hourly_schedule.get_external_origin_id(),
+        }
+        for future in schedule_tick_futures.values():
+            assert future.result(timeout=10) == []
+
+        assert instance.get_runs_count() == 2
+        for external_schedule in [simple_schedule, hourly_schedule]:
+            ticks = instance.get_ticks(external_schedule.get_external_origin_id())
+            assert len(ticks) == 1
+            assert ticks[0].status == TickStatus.SUCCESS
+
+        # finished schedules are picked up again on the next iteration
+        list(
+            launch_scheduled_runs(
+                instance,
+                workspace,
+                logger(),
+                pendulum.now("UTC"),
+                threadpool_executor=threadpool_executor,
+                schedule_tick_futures=schedule_tick_futures,
+            )
+        )
+        for future in schedule_tick_futures.values():
+            future.result(timeout=10)
+        assert instance.get_runs_count() == 2
+
+
+def test_schedule_threads_workspace_cleanup(instance, workspace, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with pendulum.test(freeze_datetime):
+        instance.start_schedule(external_repo.get_external_schedule("simple_schedule"))
+
+    in_flight = []
+    original_process_schedule = scheduler._process_schedule  # pylint: disable=protected-access
+
+    def _slow_process_schedule(*args, **kwargs):
+        in_flight.append(1)
+        try:
+            time.sleep(1)
+            return original_process_schedule(*args, **kwargs)
+        finally:
+            in_flight.pop()
+
+    original_cleanup = workspace.cleanup
+    in_flight_at_cleanup = []
+
+    def _cleanup():
+        in_flight_at_cleanup.append(len(in_flight))
+        original_cleanup()
+
+    # reload the workspace on every iteration, while the schedule is still being processed
+    with pendulum.test(freeze_datetime.add(seconds=2)), mock.patch.object(
+        DagsterInstance, "schedule_use_threads", new_callable=mock.PropertyMock, return_value=True
+    ), mock.patch("dagster.scheduler.scheduler.RELOAD_WORKSPACE", -1), mock.patch(
+        "dagster.scheduler.scheduler.MIN_INTERVAL_LOOP_TIME", 0
+    ), mock.patch(
+        "dagster.scheduler.scheduler._process_schedule", _slow_process_schedule
+    ), mock.patch.object(
+        workspace, "cleanup", _cleanup
+    ):
+        loop = execute_scheduler_iteration_loop(
+            instance, workspace, logger(), max_catchup_runs=5, max_tick_retries=0
+        )
+        start = time.time()
+        while time.time() - start < 3:
+            next(loop)
+        loop.close()
+
+    # the workspace is only cleaned up once the in-flight schedule has finished
+    assert len(in_flight_at_cleanup) > 1
+    assert set(in_flight_at_cleanup) == {0}
+    assert instance.get_runs_count() == 1
+
+
+def test_tick_lateness(instance, workspace, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    external_schedule = external_repo.get_external_schedule("simple_schedule")
+    with pendulum.test(freeze_datetime):
+        instance.start_schedule(external_schedule)
+
+    # the run of the tick at midnight is submitted 30 seconds late
+    freeze_datetime = freeze_datetime.add(seconds=31)
+    with pendulum.test(freeze_datetime):
+        list(launch_scheduled_runs(instance, workspace, logger(), pendulum.now("UTC")))
+
+        ticks = instance.get_ticks(external_schedule.get_external_origin_id())
+        assert len(ticks) == 1
+        assert ticks[0].status == TickStatus.SUCCESS
+        assert ticks[0].lateness_seconds == 30.0
@@ -92,6 +92,7 @@ def get_version() -> str:
         ],
         extras_require={
             "docker": ["docker"],
+            "msgpack": ["msgpack>=1.0"],
             "test": [
                 "astroid>=2.3.3,<2.5",
                 "coverage==5.3",
@@ -99,6 +100,7 @@ def get_version() -> str:
                 "freezegun>=0.3.15",
                 "grpcio-tools==1.32.0",
                 "mock==3.0.5",
+                "msgpack>=1.0",
                 "objgraph",
                 "protobuf==3.13.0",  # without this, pip will install the most up-to-date protobuf
                 "pytest-cov==2.10.1",
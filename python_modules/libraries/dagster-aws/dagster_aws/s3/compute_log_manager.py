@@ -87,6 +87,14 @@ def _watch_logs(self, pipeline_run, step_key=None):
         ):
             yield
 
+    @contextmanager
+    def _watch_thread_logs(self, pipeline_run, step_key=None):
+        # proxy watching to the local compute log manager, interacting with the filesystem
+        with self.local_manager._watch_thread_logs(  # pylint: disable=protected-access
+            pipeline_run, step_key
+        ):
+            yield
+
     @property
     def inst_data(self):
         return self._inst_data
@@ -231,9 +231,10 @@ def step_events_iterator(self, step_context, step_key: str, databricks_run_id: i
                     all_events = self.get_step_events(step_context.run_id, step_key)
                     # we get all available records on each poll, but we only want to process the
                     # ones we haven't seen before
-                    for event in all_events[processed_events:]:
-                        # write each event from the DataBricks instance to the local instance
-                        step_context.instance.handle_new_event(event)
+                    new_events = all_events[processed_events:]
+                    # write the events from the DataBricks instance to the local instance
+                    step_context.instance.handle_new_events(new_events)
+                    for event in new_events:
                         if event.is_dagster_event:
                             yield event.dagster_event
                     processed_events = len(all_events)
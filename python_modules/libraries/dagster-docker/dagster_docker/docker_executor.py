@@ -9,6 +9,7 @@
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData, MetadataEntry
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.retries import RetryMode, get_retries_config
+from dagster.core.execution.step_ordering import StepOrdering, get_step_ordering_config
 from dagster.core.executor.base import Executor
 from dagster.core.executor.init import InitExecutorContext
 from dagster.core.executor.step_delegating import StepDelegatingExecutor
@@ -24,6 +25,7 @@
         DOCKER_CONFIG_SCHEMA,
         {
             "retries": get_retries_config(),
+            "step_ordering": get_step_ordering_config(),
         },
     ),
     requirements=multiple_process_executor_requirements(),
@@ -83,6 +85,7 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
             container_kwargs,
         ),
         retries=RetryMode.from_config(init_context.executor_config["retries"]),
+        step_ordering=StepOrdering.from_config(init_context.executor_config.get("step_ordering")),
     )
 
 
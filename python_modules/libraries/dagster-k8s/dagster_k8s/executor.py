@@ -7,6 +7,7 @@
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData, MetadataEntry
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.retries import RetryMode, get_retries_config
+from dagster.core.execution.step_ordering import StepOrdering, get_step_ordering_config
 from dagster.core.executor.base import Executor
 from dagster.core.executor.init import InitExecutorContext
 from dagster.core.executor.step_delegating import StepDelegatingExecutor
@@ -30,6 +31,7 @@
         DagsterK8sJobConfig.config_type_job(),
         {"job_namespace": Field(StringSource, is_required=False)},
         {"retries": get_retries_config()},
+        {"step_ordering": get_step_ordering_config()},
     ),
     requirements=multiple_process_executor_requirements(),
 )
@@ -109,6 +111,7 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
         ),
         retries=RetryMode.from_config(init_context.executor_config["retries"]),
         should_verify_step=True,
+        step_ordering=StepOrdering.from_config(init_context.executor_config.get("step_ordering")),
     )
 
 
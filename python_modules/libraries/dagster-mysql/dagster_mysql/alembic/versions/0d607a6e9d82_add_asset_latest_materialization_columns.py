@@ -0,0 +1,25 @@
+"""add asset latest materialization columns
+
+Revision ID: 0d607a6e9d82
+Revises: 995b35ba2d37
+Create Date: 2022-02-16 09:41:39.904762
+
+"""
+from dagster.core.storage.migration.utils import (
+    add_asset_latest_materialization_columns,
+    drop_asset_latest_materialization_columns,
+)
+
+# revision identifiers, used by Alembic.
+revision = "0d607a6e9d82"
+down_revision = "995b35ba2d37"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_asset_latest_materialization_columns()
+
+
+def downgrade():
+    drop_asset_latest_materialization_columns()
@@ -0,0 +1,25 @@
+"""add run stats rollup tables
+
+Revision ID: 995b35ba2d37
+Revises: 130b087bc274
+Create Date: 2022-02-14 10:15:31.774209
+
+"""
+from dagster.core.storage.migration.utils import (
+    create_run_stats_rollup_tables,
+    drop_run_stats_rollup_tables,
+)
+
+# revision identifiers, used by Alembic.
+revision = "995b35ba2d37"
+down_revision = "130b087bc274"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_stats_rollup_tables()
+
+
+def downgrade():
+    drop_run_stats_rollup_tables()
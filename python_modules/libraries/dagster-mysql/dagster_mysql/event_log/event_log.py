@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 import sqlalchemy as db
 
 from dagster import check, seven
@@ -137,31 +139,36 @@ def store_asset_observation(self, event):
                     )
                 )
 
-    def store_asset_materialization(self, event):
+    def store_asset_materialization(self, event, storage_id=None):
         # last_materialization_timestamp is updated upon observation or materialization
         # See store_asset method in SqlEventLogStorage for more details
         materialization = event.dagster_event.step_materialization_data.materialization
 
         if self.has_secondary_index(ASSET_KEY_INDEX_COLS):
+            # store the full event record, so that the latest materialization events can be read
+            # from the asset_keys table
+            latest_materialization_values = self.latest_materialization_values(event, storage_id)
             with self.index_connection() as conn:
                 conn.execute(
                     db.dialects.mysql.insert(AssetKeyTable)
                     .values(
                         asset_key=event.dagster_event.asset_key.to_string(),
-                        last_materialization=serialize_dagster_namedtuple(materialization),
+                        last_materialization=serialize_dagster_namedtuple(event),
                         last_materialization_timestamp=utc_datetime_from_timestamp(event.timestamp),
                         last_run_id=event.run_id,
                         tags=seven.json.dumps(materialization.tags)
                         if materialization.tags
                         else None,
+                        **latest_materialization_values,
                     )
                     .on_duplicate_key_update(
-                        last_materialization=serialize_dagster_namedtuple(materialization),
+                        last_materialization=serialize_dagster_namedtuple(event),
                         last_materialization_timestamp=utc_datetime_from_timestamp(event.timestamp),
                         last_run_id=event.run_id,
                         tags=seven.json.dumps(materialization.tags)
                         if materialization.tags
                         else None,
+                        **latest_materialization_values,
                     )
                 )
         else:
@@ -182,6 +189,14 @@ def store_asset_materialization(self, event):
     def _connect(self):
         return create_mysql_connection(self._engine, __file__, "event log")
 
+    @contextmanager
+    def event_write_transaction(self, conn):
+        # the engine autocommits every statement, so the connection has to leave autocommit mode
+        # for the transaction to take effect
+        conn = conn.execution_options(isolation_level="READ COMMITTED")
+        with conn.begin():
+            yield conn
+
     def run_connection(self, run_id=None):
         return self._connect()
 
@@ -0,0 +1,25 @@
+"""add asset latest materialization columns
+
+Revision ID: 0222cebd11eb
+Revises: f27d2f9adc92
+Create Date: 2022-02-16 09:41:27.118490
+
+"""
+from dagster.core.storage.migration.utils import (
+    add_asset_latest_materialization_columns,
+    drop_asset_latest_materialization_columns,
+)
+
+# revision identifiers, used by Alembic.
+revision = "0222cebd11eb"
+down_revision = "f27d2f9adc92"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_asset_latest_materialization_columns()
+
+
+def downgrade():
+    drop_asset_latest_materialization_columns()
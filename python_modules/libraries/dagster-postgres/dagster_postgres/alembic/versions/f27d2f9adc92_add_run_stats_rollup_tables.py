@@ -0,0 +1,25 @@
+"""add run stats rollup tables
+
+Revision ID: f27d2f9adc92
+Revises: 9c5f00e80ef2
+Create Date: 2022-02-14 10:14:02.519873
+
+"""
+from dagster.core.storage.migration.utils import (
+    create_run_stats_rollup_tables,
+    drop_run_stats_rollup_tables,
+)
+
+# revision identifiers, used by Alembic.
+revision = "f27d2f9adc92"
+down_revision = "9c5f00e80ef2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_stats_rollup_tables()
+
+
+def downgrade():
+    drop_run_stats_rollup_tables()
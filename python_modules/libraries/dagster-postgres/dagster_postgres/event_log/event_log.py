@@ -1,6 +1,7 @@
 import logging
 import threading
 from collections import defaultdict
+from contextlib import contextmanager
 from typing import Callable, List, MutableMapping, Optional
 
 import sqlalchemy as db
@@ -15,11 +16,12 @@
 )
 from dagster.core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster.core.storage.event_log.polling_event_watcher import CallbackAfterCursor
+from dagster.core.storage.event_log.sql_event_log import group_events_by_run_id
 from dagster.core.storage.sql import create_engine, run_alembic_upgrade, stamp_alembic_rev
 from dagster.serdes import (
     ConfigurableClass,
     ConfigurableClassData,
-    deserialize_json_to_dagster_namedtuple,
+    deserialize_dagster_namedtuple,
     serialize_dagster_namedtuple,
 )
 from dagster.utils import utc_datetime_from_timestamp
@@ -149,17 +151,20 @@ def store_event(self, event):
         check.inst_param(event, "event", EventLogEntry)
         insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
         with self._connect() as conn:
-            result = conn.execute(
-                insert_event_statement.returning(
-                    SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+            with self.event_write_transaction(conn) as conn:
+                result = conn.execute(
+                    insert_event_statement.returning(
+                        SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                    )
+                )
+                res = result.fetchone()
+                result.close()
+                self.update_run_stats(conn, event.run_id, [event])
+                # delivered to listeners once the transaction commits
+                conn.execute(
+                    """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
+                    (res[0] + "_" + str(res[1]),),
                 )
-            )
-            res = result.fetchone()
-            result.close()
-            conn.execute(
-                """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
-                (res[0] + "_" + str(res[1]),),
-            )
 
         if (
             event.is_dagster_event
@@ -169,7 +174,43 @@ def store_event(self, event):
             )
             and event.dagster_event.asset_key
         ):
-            self.store_asset(event)
+            self.store_asset(event, res[1])
+
+    def store_events(self, events):
+        """Store a batch of events corresponding to one or more pipeline runs.
+
+        The events of each run are written with a single multi-row insert, followed by a single
+        NOTIFY covering the range of inserted ids.
+
+        Args:
+            events (List[EventLogEntry]): The events to store, in order.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+
+        asset_events_with_ids = []
+        for run_id, run_events in group_events_by_run_id(events).items():
+            with self._connect() as conn:
+                with self.event_write_transaction(conn) as conn:
+                    result = conn.execute(
+                        SqlEventLogStorageTable.insert()  # pylint: disable=no-value-for-parameter
+                        .values([self.prepare_insert_event_values(event) for event in run_events])
+                        .returning(SqlEventLogStorageTable.c.id)
+                    )
+                    ids = [row[0] for row in result.fetchall()]
+                    result.close()
+                    self.update_run_stats(conn, run_id, run_events)
+                    conn.execute(
+                        """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
+                        ("{}_{}_{}".format(run_id, min(ids), max(ids)),),
+                    )
+                asset_events_with_ids.extend(
+                    (event, storage_id)
+                    for event, storage_id in zip(run_events, ids)
+                    if event.is_dagster_event and event.dagster_event.asset_key
+                )
+
+        for event, storage_id in sorted(asset_events_with_ids, key=lambda pair: pair[1]):
+            self.store_asset(event, storage_id)
 
     def store_asset_observation(self, event):
         # last_materialization_timestamp is updated upon observation or materialization
@@ -192,27 +233,31 @@ def store_asset_observation(self, event):
                     )
                 )
 
-    def store_asset_materialization(self, event):
+    def store_asset_materialization(self, event, storage_id=None):
         # last_materialization_timestamp is updated upon observation or materialization
         # See store_asset method in SqlEventLogStorage for more details
         materialization = event.dagster_event.step_materialization_data.materialization
         if self.has_secondary_index(ASSET_KEY_INDEX_COLS):
+            # store the full event record, so that the latest materialization events can be read
+            # from the asset_keys table
+            latest_materialization_values = self.latest_materialization_values(event, storage_id)
             with self.index_connection() as conn:
                 conn.execute(
                     db.dialects.postgresql.insert(AssetKeyTable)
                     .values(
                         asset_key=event.dagster_event.asset_key.to_string(),
-                        last_materialization=serialize_dagster_namedtuple(materialization),
+                        last_materialization=serialize_dagster_namedtuple(event),
                         last_materialization_timestamp=utc_datetime_from_timestamp(event.timestamp),
                         last_run_id=event.run_id,
                         tags=seven.json.dumps(materialization.tags)
                         if materialization.tags
                         else None,
+                        **latest_materialization_values,
                     )
                     .on_conflict_do_update(
                         index_elements=[AssetKeyTable.c.asset_key],
                         set_=dict(
-                            last_materialization=serialize_dagster_namedtuple(materialization),
+                            last_materialization=serialize_dagster_namedtuple(event),
                             last_materialization_timestamp=utc_datetime_from_timestamp(
                                 event.timestamp
                             ),
@@ -220,6 +265,7 @@ def store_asset_materialization(self, event):
                             tags=seven.json.dumps(materialization.tags)
                             if materialization.tags
                             else None,
+                            **latest_materialization_values,
                         ),
                     )
                 )
@@ -245,6 +291,14 @@ def store_asset_materialization(self, event):
     def _connect(self):
         return create_pg_connection(self._engine, __file__, "event log")
 
+    @contextmanager
+    def event_write_transaction(self, conn):
+        # the engine autocommits every statement, so the connection has to leave autocommit mode
+        # for the transaction to take effect
+        conn = conn.execution_options(isolation_level="READ COMMITTED")
+        with conn.begin():
+            yield conn
+
     def run_connection(self, run_id=None):
         return self._connect()
 
@@ -289,51 +343,61 @@ def watcher_thread(
     watcher_thread_exit: threading.Event,
     watcher_thread_started: threading.Event,
 ):
-    for notif in await_pg_notifications(
-        conn_string,
-        channels=[CHANNEL_NAME],
-        timeout=POLLING_CADENCE,
-        yield_on_timeout=True,
-        exit_event=watcher_thread_exit,
-        started_event=watcher_thread_started,
-    ):
-        if notif is None:
-            if watcher_thread_exit.is_set():
-                break
-        else:
-            run_id, index_str = notif.payload.split("_")
-            with dict_lock:
-                if run_id not in handlers_dict:
-                    continue
-
-            index = int(index_str)
-            with dict_lock:
-                handlers = handlers_dict.get(run_id, [])
+    # a single engine is shared by every notification handled by this thread, so that each batch
+    # of new events is fetched with one query and fanned out to all of the run's subscribers. Only
+    # this thread uses the engine, so its pool holds one connection open between notifications,
+    # checked before each use since the thread can go a long time without notifications
+    engine = create_engine(
+        conn_string, isolation_level="AUTOCOMMIT", pool_size=1, max_overflow=0, pool_pre_ping=True
+    )
+    try:
+        for notif in await_pg_notifications(
+            conn_string,
+            channels=[CHANNEL_NAME],
+            timeout=POLLING_CADENCE,
+            yield_on_timeout=True,
+            exit_event=watcher_thread_exit,
+            started_event=watcher_thread_started,
+        ):
+            if notif is None:
+                if watcher_thread_exit.is_set():
+                    break
+            else:
+                # payloads are either `<run_id>_<id>` for a single event, or
+                # `<run_id>_<first_id>_<last_id>` for a batch of events stored by `store_events`
+                run_id, *index_strs = notif.payload.split("_")
+                with dict_lock:
+                    if run_id not in handlers_dict:
+                        continue
+
+                first_index, last_index = int(index_strs[0]), int(index_strs[-1])
+                with dict_lock:
+                    handlers = handlers_dict.get(run_id, [])
 
-            engine = create_engine(
-                conn_string, isolation_level="AUTOCOMMIT", poolclass=db.pool.NullPool
-            )
-            try:
                 with engine.connect() as conn:
                     cursor_res = conn.execute(
-                        db.select([SqlEventLogStorageTable.c.event]).where(
-                            SqlEventLogStorageTable.c.id == index
-                        ),
-                    )
-                    dagster_event: EventLogEntry = deserialize_json_to_dagster_namedtuple(
-                        cursor_res.scalar()
+                        db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+                        .where(SqlEventLogStorageTable.c.run_id == run_id)
+                        .where(SqlEventLogStorageTable.c.id >= first_index)
+                        .where(SqlEventLogStorageTable.c.id <= last_index)
+                        .order_by(SqlEventLogStorageTable.c.id.asc()),
                     )
-            finally:
-                engine.dispose()
-
-            for callback_with_cursor in handlers:
-                if callback_with_cursor.start_cursor < index:
-                    try:
-                        callback_with_cursor.callback(dagster_event)
-                    except Exception:
-                        logging.exception(
-                            "Exception in callback for event watch on run %s.", run_id
-                        )
+                    indexed_events = [
+                        (index, deserialize_dagster_namedtuple(json_str))
+                        for index, json_str in cursor_res.fetchall()
+                    ]
+
+                for index, dagster_event in indexed_events:
+                    for callback_with_cursor in handlers:
+                        if callback_with_cursor.start_cursor < index:
+                            try:
+                                callback_with_cursor.callback(dagster_event)
+                            except Exception:
+                                logging.exception(
+                                    "Exception in callback for event watch on run %s.", run_id
+                                )
+    finally:
+        engine.dispose()
 
 
 class PostgresEventWatcher: